@@ -0,0 +1,455 @@
+"""
+Block selector compiled from EFL_BLOCK_SELECTOR_v1_3_2.json.
+
+The selector spec is compiled once at load into an executable decision
+table:
+
+- Every input field is integer-coded. Enum fields map to their index in
+  the spec's enum values (-1 = null/unknown). Numeric fields are floats
+  (NaN = null). Each injury flag a rule tests becomes its own boolean
+  column.
+- Every rule condition of deny_rules, season_type_computation and
+  microsession_pre_rules is compiled from its expression string into a
+  vectorized predicate over those columns. Rules are evaluated
+  first-match, in spec order.
+- Block choice is a dense lookup table indexed by (service_line,
+  population, season_type, readiness_flag, r2p_stage, sport family). It is
+  precomputed from the EFL_MESOMACRO_BLOCK_MANIFEST blocks and the
+  readiness_block_routing policy.
+
+select_blocks(states) classifies a whole roster with one pass of array
+operations. select_block(state) runs the same compiled predicates on
+Python scalars, which is faster than numpy for a single state.
+
+Decision order (first DENY wins):
+    1. Missing or unknown required input (default-deny)
+    2. deny_rules, in spec order
+    3. season_type_computation (no matching rule -> DENY)
+    4. Block table lookup (no legal block for the profile -> DENY)
+
+Usage:
+    selector = default_block_selector()
+    decisions = selector.select_blocks(roster)
+"""
+
+import operator
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .spec_registry import default_registry
+
+
+SELECTOR_SPEC = "EFL_BLOCK_SELECTOR_v1_3_2"
+MANIFEST_SPEC = "EFL_MESOMACRO_BLOCK_MANIFEST_v1.0"
+
+INPUT_SECTIONS = ("client_profile", "season_context", "red_flags")
+
+# Inputs that must be present and valid or the selector denies
+REQUIRED_ENUMS = ("service_line", "population", "readiness_flag", "season_phase", "session_type")
+
+# Manifest block tags the readiness routing treats specially
+RECOVERY_TAGS = frozenset({"RESTORATION", "EARLY_RECOVERY"})
+CONSERVATIVE_TAGS = frozenset({"MAINTENANCE", "DEVELOPMENT_MAINT", "RESTORATION"})
+
+# Manifest block tag -> selector population
+POPULATION_TAGS = {"YOUTH_8_12": "Youth_8_12", "YOUTH_13_17": "Youth_13_17", "ADULT": "Adult"}
+
+# Manifest "season" -> season_type, for blocks without an explicit season_type
+MANIFEST_SEASONS = {
+    "Off_Season": "OFF_SEASON",
+    "Pre_Season": "PRE_SEASON",
+    "In_Season": "IN_SEASON_TIER_1",
+    "Post_Season": "POST_SEASON",
+}
+
+# Sport families with their own manifest blocks; everything else is DEFAULT
+FAMILIES = ("DEFAULT", "BASKETBALL")
+
+NO_BLOCK = -1
+
+_ATOM_COMPARE = re.compile(r"^(\w+)\s*(==|!=|>=|<=|>|<)\s*(null|'[^']*'|-?\d+(?:\.\d+)?)$")
+_ATOM_IN = re.compile(r"^(\w+)\s+in\s+\[(.*)\]$")
+_ATOM_CONTAINS = re.compile(r"^(\w+)\s+contains\s+'([^']*)'$")
+_LITERAL = re.compile(r"'([^']*)'")
+
+# Work elementwise on arrays and on plain floats alike; NaN (null) compares False
+_NUMERIC_OPS = {
+    "==": operator.eq, "!=": operator.ne, ">=": operator.ge,
+    "<=": operator.le, ">": operator.gt, "<": operator.lt,
+}
+
+# Predicates take encoded columns: arrays for a batch, Python scalars for one state
+Predicate = Callable[[Dict[str, Any]], Any]
+
+
+def _flatten(state: Dict) -> Dict:
+    """Input fields of a nested (client_profile/season_context/red_flags) or flat state"""
+    flat = dict(state)
+    for section in INPUT_SECTIONS:
+        values = state.get(section)
+        if isinstance(values, dict):
+            flat.update(values)
+    return flat
+
+
+class CompiledBlockSelector:
+    """EFL block selector as integer-coded columns, compiled rules and a block table"""
+
+    def __init__(self, registry=None):
+        self.registry = registry or default_registry()
+        spec = self.registry.get(SELECTOR_SPEC)
+        self.version = spec["meta"]["version"]
+
+        # Field schema: enums, numbers/booleans and flag arrays; free-text strings are not coded
+        self.enums: Dict[str, Tuple[str, ...]] = {}
+        self.numeric: List[str] = []
+        self.arrays: List[str] = []
+        for section in INPUT_SECTIONS:
+            for name, field in spec["inputs"]["required"][section].items():
+                if field["type"] == "enum":
+                    self.enums[name] = tuple(v for v in field["values"] if v is not None)
+                elif field["type"] == "array":
+                    self.arrays.append(name)
+                elif field["type"] in ("number", "boolean"):
+                    self.numeric.append(name)
+        self.codes = {name: {v: i for i, v in enumerate(values)} for name, values in self.enums.items()}
+        self.flags: Dict[str, List[str]] = {name: [] for name in self.arrays}
+        self.season_type_values = tuple(spec["outputs"]["required_fields"]["season_type"]["values"])
+
+        routing = spec["routing_logic"]
+        self.deny_rules = [
+            (rule["name"], self._compile(rule["condition"]), rule["reason"])
+            for rule in routing["deny_rules"]["rules"]
+        ]
+        self.season_types = self._compile_season_types(routing["season_type_computation"]["rules"])
+        self.microsession_rules = [
+            (name, self._compile(rule["applies_when"]), dict(rule["guidance"]))
+            for name, rule in routing["microsession_pre_rules"].items()
+            if isinstance(rule, dict) and "applies_when" in rule
+        ]
+        self.deny_names = (
+            [("MISSING_REQUIRED_INPUT", "Required selector input missing or not a known value.")]
+            + [(name, reason) for name, _, reason in self.deny_rules]
+            + [("SEASON_TYPE_UNRESOLVED", "No season_type_computation rule matches season_phase + games_per_week."),
+               ("NO_BLOCK_FOR_PROFILE", "No manifest block is legal for this service line, population and season.")]
+        )
+        self.readiness_routing = {
+            flag: routing["readiness_block_routing"][flag]["phase_shift"] for flag in self.enums["readiness_flag"]
+        }
+
+        self.blocks = self._manifest_blocks()
+        self.block_ids = [block["block_id"] for block in self.blocks]
+        self.table = self._compile_table()
+
+    # ------------------------------------------------------------------
+    # Condition compiler
+    # ------------------------------------------------------------------
+
+    def _compile(self, condition: str) -> Predicate:
+        """Condition expression -> predicate over encoded columns (atoms joined by &&)"""
+        atoms = [self._compile_atom(atom.strip()) for atom in condition.split("&&")]
+        if len(atoms) == 1:
+            return atoms[0]
+
+        def conjunction(cols, atoms=atoms):
+            result = atoms[0](cols)
+            for atom in atoms[1:]:
+                result = result & atom(cols)
+            return result
+        return conjunction
+
+    def _compile_atom(self, atom: str) -> Predicate:
+        match = _ATOM_CONTAINS.match(atom)
+        if match:
+            name, flag = match.groups()
+            if name not in self.flags:
+                raise ValueError(f"Selector condition '{atom}': {name} is not an array input")
+            if flag not in self.flags[name]:
+                self.flags[name].append(flag)
+            column = f"{name}:{flag}"
+            return lambda cols: cols[column]
+
+        match = _ATOM_IN.match(atom)
+        if match:
+            name, values = match.groups()
+            # Membership table indexed by code + 1 (slot 0 is null/unknown)
+            member = np.zeros(len(self.enums[name]) + 1, dtype=bool)
+            for value in _LITERAL.findall(values):
+                member[self._code(name, value, atom) + 1] = True
+            return lambda cols: member[cols[name] + 1]
+
+        match = _ATOM_COMPARE.match(atom)
+        if not match:
+            raise ValueError(f"Selector condition '{atom}' is not a supported expression")
+        name, op, operand = match.groups()
+        if operand == "null":
+            if op not in ("==", "!="):
+                raise ValueError(f"Selector condition '{atom}': null only supports == and !=")
+            if name in self.enums:
+                return (lambda cols: cols[name] < 0) if op == "==" else (lambda cols: cols[name] >= 0)
+            if name in self.numeric:
+                # NaN is the only value unequal to itself
+                return (lambda cols: cols[name] != cols[name]) if op == "==" else (lambda cols: cols[name] == cols[name])
+            raise ValueError(f"Selector condition '{atom}': unknown input {name}")
+        if operand.startswith("'"):
+            if op not in ("==", "!="):
+                raise ValueError(f"Selector condition '{atom}': enums only support == and !=")
+            code = self._code(name, operand[1:-1], atom)
+            return (lambda cols: cols[name] == code) if op == "==" else (lambda cols: cols[name] != code)
+        if name not in self.numeric:
+            raise ValueError(f"Selector condition '{atom}': {name} is not a numeric input")
+        compare, value = _NUMERIC_OPS[op], float(operand)
+        return lambda cols: compare(cols[name], value)
+
+    def _code(self, name: str, value: str, atom: str) -> int:
+        try:
+            return self.codes[name][value]
+        except KeyError:
+            raise ValueError(f"Selector condition '{atom}': '{value}' is not a {name} value") from None
+
+    def _compile_season_types(self, rules: List[Dict]) -> List[Tuple[str, Predicate, int]]:
+        """Flattened first-match rules: a rule with subrouting expands to its subrules"""
+        season_codes = {value: i for i, value in enumerate(self.season_type_values)}
+        compiled = []
+        for rule in rules:
+            outer = self._compile(rule["condition"])
+            for sub in rule.get("subrouting", [None]):
+                if sub is None:
+                    compiled.append((rule["name"], outer, season_codes[rule["output"]]))
+                    continue
+                inner = self._compile(sub["condition"])
+                compiled.append((sub["name"], lambda cols, a=outer, b=inner: a(cols) & b(cols),
+                                 season_codes[sub["output"]]))
+        return compiled
+
+    # ------------------------------------------------------------------
+    # Block table
+    # ------------------------------------------------------------------
+
+    def _manifest_blocks(self) -> List[Dict]:
+        """Manifest blocks in declaration order; a restated block_id replaces the earlier one in place"""
+        blocks: Dict[str, Dict] = {}
+        for document in self.registry.documents(MANIFEST_SPEC):
+            for block in document.get("blocks", []):
+                blocks[block["block_id"]] = block
+        return list(blocks.values())
+
+    def _block_profile(self, block: Dict) -> Dict:
+        tags = set(block.get("block_tags", []))
+        return {
+            "service_line": block.get("service_line"),
+            "population": next((p for tag, p in POPULATION_TAGS.items() if tag in tags), None),
+            "season_type": block.get("season_type") or MANIFEST_SEASONS.get(block.get("season")),
+            "r2p_stage": block.get("r2p_stage"),
+            "family": next((f for f in FAMILIES if f in tags), FAMILIES[0]),
+            "recovery": bool(tags & RECOVERY_TAGS),
+            "conservative": bool(tags & CONSERVATIVE_TAGS),
+        }
+
+    def _choose(self, profiles: List[Dict], service_line: str, population: str, season_type: str,
+                readiness: str, r2p_stage: Optional[str], family: str) -> int:
+        """Block index for one profile, or NO_BLOCK"""
+
+        def legal(p, season_bound=True):
+            return (p["service_line"] == service_line
+                    and p["population"] in (None, population)
+                    and (not season_bound or p["season_type"] in (None, season_type))
+                    and p["r2p_stage"] in (None, r2p_stage))
+
+        shift = self.readiness_routing.get(readiness)
+        if shift == "regress_to_foundation_or_recovery":
+            # Recovery blocks only; season and stage no longer bind
+            candidates = [i for i, p in enumerate(profiles)
+                          if p["recovery"] and p["service_line"] == service_line
+                          and p["population"] in (None, population)]
+        else:
+            candidates = [i for i, p in enumerate(profiles) if legal(p)]
+            if shift == "optional_downshift":
+                candidates.sort(key=lambda i: not profiles[i]["conservative"])
+        if not candidates:
+            return NO_BLOCK
+        # The sport's own family first, then the default family
+        for wanted in (family, FAMILIES[0]):
+            for i in candidates:
+                if profiles[i]["family"] == wanted:
+                    return i
+        return NO_BLOCK
+
+    def _compile_table(self) -> np.ndarray:
+        profiles = [self._block_profile(block) for block in self.blocks]
+        r2p_stages = (None,) + self.enums["r2p_stage"]
+        shape = (len(self.enums["service_line"]), len(self.enums["population"]), len(self.season_type_values),
+                 len(self.enums["readiness_flag"]), len(r2p_stages), len(FAMILIES))
+        table = np.full(shape, NO_BLOCK, dtype=np.int16)
+        for index in np.ndindex(*shape):
+            sl, pop, st, rd, r2p, fam = index
+            table[index] = self._choose(
+                profiles, self.enums["service_line"][sl], self.enums["population"][pop],
+                self.season_type_values[st], self.enums["readiness_flag"][rd], r2p_stages[r2p], FAMILIES[fam]
+            )
+        table.flags.writeable = False
+        return table
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def encode(self, states: Sequence[Dict]) -> Dict[str, np.ndarray]:
+        """Integer-coded input columns for a batch of states"""
+        n = len(states)
+        flat = [_flatten(state) for state in states]
+        cols: Dict[str, np.ndarray] = {}
+        for name, codes in self.codes.items():
+            cols[name] = np.fromiter((codes.get(f.get(name), -1) for f in flat), dtype=np.int16, count=n)
+        for name in self.numeric:
+            values = (f.get(name) for f in flat)
+            cols[name] = np.fromiter((np.nan if v is None else float(v) for v in values), dtype=np.float64, count=n)
+        for name, flags in self.flags.items():
+            present = [set(f.get(name) or ()) for f in flat]
+            for flag in flags:
+                cols[f"{name}:{flag}"] = np.fromiter((flag in p for p in present), dtype=bool, count=n)
+        cols["family"] = np.fromiter((self._family(f) for f in flat), dtype=np.int16, count=n)
+        return cols
+
+    def encode_one(self, state: Dict) -> Dict[str, Any]:
+        """Integer-coded inputs of one state, as Python scalars"""
+        f = _flatten(state)
+        cols: Dict[str, Any] = {name: codes.get(f.get(name), -1) for name, codes in self.codes.items()}
+        for name in self.numeric:
+            value = f.get(name)
+            cols[name] = float("nan") if value is None else float(value)
+        for name, flags in self.flags.items():
+            present = set(f.get(name) or ())
+            for flag in flags:
+                cols[f"{name}:{flag}"] = flag in present
+        cols["family"] = self._family(f)
+        return cols
+
+    @staticmethod
+    def _family(fields: Dict) -> int:
+        return FAMILIES.index("BASKETBALL") if "BASKETBALL" in str(fields.get("icp_primary") or "").upper() else 0
+
+    # ------------------------------------------------------------------
+    # Selection
+    # ------------------------------------------------------------------
+
+    def classify(self, cols: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        First-match evaluation over encoded columns.
+
+        Returns arrays: block (index or NO_BLOCK), season_type (code or -1),
+        deny (index into deny_names or -1) and microsession (index into
+        microsession_rules or -1).
+        """
+        n = len(cols["service_line"])
+        deny = np.full(n, -1, dtype=np.int16)
+        undecided = np.ones(n, dtype=bool)
+
+        missing = np.zeros(n, dtype=bool)
+        for name in REQUIRED_ENUMS:
+            missing |= cols[name] < 0
+        deny[missing] = 0
+        undecided &= ~missing
+
+        for i, (_, predicate, _) in enumerate(self.deny_rules, start=1):
+            hit = undecided & predicate(cols)
+            deny[hit] = i
+            undecided &= ~hit
+
+        season = np.full(n, -1, dtype=np.int16)
+        pending = undecided.copy()
+        for _, predicate, code in self.season_types:
+            hit = pending & predicate(cols)
+            season[hit] = code
+            pending &= ~hit
+        unresolved = len(self.deny_rules) + 1
+        deny[pending] = unresolved
+        undecided &= ~pending
+
+        block = np.full(n, NO_BLOCK, dtype=np.int16)
+        rows = np.flatnonzero(undecided)
+        if len(rows):
+            found = self.table[
+                cols["service_line"][rows], cols["population"][rows], season[rows],
+                cols["readiness_flag"][rows], cols["r2p_stage"][rows] + 1, cols["family"][rows]
+            ]
+            block[rows] = found
+            deny[rows[found == NO_BLOCK]] = unresolved + 1
+
+        microsession = np.full(n, -1, dtype=np.int16)
+        pending = np.ones(n, dtype=bool)
+        for i, (_, predicate, _) in enumerate(self.microsession_rules):
+            hit = pending & predicate(cols)
+            microsession[hit] = i
+            pending &= ~hit
+
+        return {"block": block, "season_type": season, "deny": deny, "microsession": microsession}
+
+    def classify_one(self, cols: Dict[str, Any]) -> Tuple[int, int, int, int]:
+        """classify() for one state encoded by encode_one: (block, season_type, deny, microsession)"""
+        microsession = next((i for i, (_, predicate, _) in enumerate(self.microsession_rules) if predicate(cols)), -1)
+        if any(cols[name] < 0 for name in REQUIRED_ENUMS):
+            return NO_BLOCK, -1, 0, microsession
+        for i, (_, predicate, _) in enumerate(self.deny_rules, start=1):
+            if predicate(cols):
+                return NO_BLOCK, -1, i, microsession
+        season = next((code for _, predicate, code in self.season_types if predicate(cols)), -1)
+        unresolved = len(self.deny_rules) + 1
+        if season < 0:
+            return NO_BLOCK, -1, unresolved, microsession
+        block = self.table.item(cols["service_line"], cols["population"], season, cols["readiness_flag"],
+                                cols["r2p_stage"] + 1, cols["family"])
+        return block, season, (unresolved + 1 if block == NO_BLOCK else -1), microsession
+
+    def _decision(self, state: Dict, block: int, season: int, deny: int, microsession: int) -> Dict:
+        fields = _flatten(state)
+        season_type = self.season_type_values[season] if season >= 0 else None
+        population = fields.get("population")
+        decision = {
+            "decision": "DENY" if deny >= 0 else "SELECT",
+            "block_tag": None,
+            "season_type": season_type,
+            "session_type": fields.get("session_type"),
+            "population": population,
+            "readiness_flag": fields.get("readiness_flag"),
+            "r2p_stage": fields.get("r2p_stage"),
+            "deny_rule": None,
+            "deny_reason": None,
+            "advisory_fields": {
+                "seasonal_operating_range_tag": f"{population}_{season_type}" if season_type else None,
+            },
+            "microsession_guidance": dict(self.microsession_rules[microsession][2]) if microsession >= 0 else None,
+        }
+        if deny >= 0:
+            decision["deny_rule"], decision["deny_reason"] = self.deny_names[deny]
+        else:
+            block = self.blocks[block]
+            decision["block_tag"] = block["block_id"]
+            decision["advisory_fields"]["recommended_max_sessions_this_week"] = block.get("sessions_per_week")
+        return decision
+
+    def select_blocks(self, states: Sequence[Dict]) -> List[Dict]:
+        """Block decision for every state of a roster"""
+        if not states:
+            return []
+        result = self.classify(self.encode(states))
+        rows = zip(result["block"].tolist(), result["season_type"].tolist(),
+                   result["deny"].tolist(), result["microsession"].tolist())
+        return [self._decision(state, *row) for state, row in zip(states, rows)]
+
+    def select_block(self, state: Dict) -> Dict:
+        """Block decision for one state, without array overhead"""
+        return self._decision(state, *self.classify_one(self.encode_one(state)))
+
+
+_DEFAULT: Optional[CompiledBlockSelector] = None
+
+
+def default_block_selector() -> CompiledBlockSelector:
+    """Process-wide selector over the package's own specs"""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = CompiledBlockSelector()
+    return _DEFAULT
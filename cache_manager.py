@@ -0,0 +1,297 @@
+"""
+Memory-budgeted cache manager: named caches under one byte budget.
+
+Every process-wide cache (library snapshots, mapper masks, candidate pools,
+EPA results, idempotent artifacts) registers with the manager instead of
+keeping its own unbounded dict. Each named cache is LRU-ordered, with an
+optional per-cache byte budget, entry limit and TTL; the manager enforces
+a global byte budget across all of them by evicting the least recently
+used entry of any cache. Entry sizes are approximate (see approx_size) and
+measured once, when the entry is stored.
+
+A ManagedCache supports the dict operations the existing ad-hoc caches use
+(get, [], in, len, pop, clear), so it is a drop-in replacement for them.
+
+Usage:
+    engines = get_cache_manager().register("sport_scoring.engines", max_entries=4)
+    engine = engines.get_or_compute(version, lambda: SportScoringEngine(df))
+    get_cache_manager().snapshot()   # per-cache counters for dashboards
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+# Global budget unless configured (EFL_CACHE_BUDGET_MB)
+DEFAULT_BUDGET_MB = 256
+
+_MISSING = object()
+
+
+def approx_size(value: Any, _seen: Optional[set] = None) -> int:
+    """
+    Approximate bytes held by value: containers recursively, NumPy arrays and
+    pandas frames by their buffers, other objects by their __dict__/__slots__.
+    Objects shared within one value are counted once; objects shared with the
+    rest of the process (library strings, cached templates) are counted in
+    every value that holds them, so estimates err high.
+    """
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return sys.getsizeof(value) if getattr(value, "base", None) is not None else max(sys.getsizeof(value), nbytes)
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage) and hasattr(value, "columns"):
+        return int(memory_usage(index=True, deep=True).sum())
+
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, bytearray, int, float, bool, type(None))):
+        return size
+    if isinstance(value, dict):
+        return size + sum(approx_size(k, seen) + approx_size(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(approx_size(item, seen) for item in value)
+    if hasattr(value, "__dict__"):
+        size += approx_size(vars(value), seen)
+    for slot in getattr(type(value), "__slots__", ()):
+        attr = getattr(value, slot, None)
+        if attr is not None:
+            size += approx_size(attr, seen)
+    return size
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: Any
+    size: int
+    expires: float
+    last_used: float
+
+
+class ManagedCache:
+    """One named LRU cache; created through CacheManager.register()"""
+
+    def __init__(self, manager: "CacheManager", name: str, max_bytes: Optional[int],
+                 max_entries: Optional[int], ttl_s: Optional[float], sizer: Callable[[Any], int]):
+        self.manager = manager
+        self.name = name
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.sizer = sizer
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.rejected = 0
+        self.evictions = {"lru": 0, "ttl": 0, "global": 0}
+
+    # ------------------------------------------------------------------
+    # Dict interface
+    # ------------------------------------------------------------------
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self.manager._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                now = self.manager.clock()
+                if entry.expires <= now:
+                    self._remove(key, "ttl")
+                else:
+                    entry.last_used = now
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry.value
+            self.misses += 1
+            return default
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.put(key, value)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self.manager._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.expires > self.manager.clock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self.manager._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            self._remove(key, None)
+            return entry.value
+
+    def clear(self) -> None:
+        with self.manager._lock:
+            self.manager.used_bytes -= self.bytes
+            self._entries.clear()
+            self.bytes = 0
+
+    # ------------------------------------------------------------------
+    # Caching
+    # ------------------------------------------------------------------
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None) -> bool:
+        """Store value (sized now unless size is given); False if it can never fit the budgets"""
+        size = self.sizer(value) if size is None else size
+        limit = min(b for b in (self.max_bytes, self.manager.budget_bytes) if b is not None)
+        with self.manager._lock:
+            if key in self._entries:
+                self._remove(key, None)
+            if size > limit:
+                self.rejected += 1
+                return False
+            now = self.manager.clock()
+            expires = now + self.ttl_s if self.ttl_s is not None else float("inf")
+            self._entries[key] = _Entry(value, size, expires, now)
+            self.bytes += size
+            self.manager.used_bytes += size
+            self.stores += 1
+            while self._entries and ((self.max_bytes is not None and self.bytes > self.max_bytes)
+                                     or (self.max_entries is not None and len(self._entries) > self.max_entries)):
+                self._remove(next(iter(self._entries)), "lru")
+            self.manager._enforce_budget(keep=(self, key))
+        return True
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Cached value for key, computing and storing it on a miss (compute runs unlocked)"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def expire(self) -> int:
+        """Drop expired entries now (they are otherwise dropped when next read); returns the count"""
+        if self.ttl_s is None:
+            return 0
+        with self.manager._lock:
+            now = self.manager.clock()
+            expired = [key for key, entry in self._entries.items() if entry.expires <= now]
+            for key in expired:
+                self._remove(key, "ttl")
+        return len(expired)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+            "ttl_s": self.ttl_s,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "stores": self.stores,
+            "rejected": self.rejected,
+            "evictions": dict(self.evictions),
+        }
+
+    def _remove(self, key: Hashable, reason: Optional[str]) -> None:
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
+        self.manager.used_bytes -= entry.size
+        if reason:
+            self.evictions[reason] += 1
+
+
+class CacheManager:
+    """Registry of named caches sharing one global byte budget"""
+
+    def __init__(self, budget_bytes: int, clock: Callable[[], float] = time.monotonic):
+        if budget_bytes <= 0:
+            raise ValueError(f"Cache budget must be positive, got {budget_bytes}")
+        self.budget_bytes = budget_bytes
+        self.clock = clock
+        self.used_bytes = 0
+        self.caches: Dict[str, ManagedCache] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, max_bytes: Optional[int] = None, max_entries: Optional[int] = None,
+                 ttl_s: Optional[float] = None, sizer: Callable[[Any], int] = approx_size) -> ManagedCache:
+        """Named cache, created on first registration; later registrations return the same cache"""
+        with self._lock:
+            cache = self.caches.get(name)
+            if cache is None:
+                for label, limit in (("max_bytes", max_bytes), ("max_entries", max_entries), ("ttl_s", ttl_s)):
+                    if limit is not None and limit <= 0:
+                        raise ValueError(f"Cache {name}: {label} must be positive, got {limit}")
+                cache = self.caches[name] = ManagedCache(self, name, max_bytes, max_entries, ttl_s, sizer)
+            return cache
+
+    def cache(self, name: str) -> ManagedCache:
+        """A registered cache; ValueError if nothing registered it"""
+        cache = self.caches.get(name)
+        if cache is None:
+            raise ValueError(f"Unknown cache '{name}' (registered: {sorted(self.caches)})")
+        return cache
+
+    def clear(self) -> None:
+        with self._lock:
+            for cache in self.caches.values():
+                cache.clear()
+
+    def expire(self) -> int:
+        return sum(cache.expire() for cache in list(self.caches.values()))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Budget, usage and per-cache counters (a JSON-ready dict)"""
+        with self._lock:
+            caches = {name: cache.stats() for name, cache in sorted(self.caches.items())}
+        hits = sum(c["hits"] for c in caches.values())
+        lookups = hits + sum(c["misses"] for c in caches.values())
+        return {
+            "budget_bytes": self.budget_bytes,
+            "used_bytes": self.used_bytes,
+            "used_pct": round(self.used_bytes / self.budget_bytes, 4),
+            "entries": sum(c["entries"] for c in caches.values()),
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+            "evictions": sum(sum(c["evictions"].values()) for c in caches.values()),
+            "caches": caches,
+        }
+
+    def _enforce_budget(self, keep) -> None:
+        """Evict the least recently used entry of any cache until under the global budget"""
+        while self.used_bytes > self.budget_bytes:
+            victim = None
+            for cache in self.caches.values():
+                for key, entry in cache._entries.items():
+                    if (cache, key) != keep:
+                        if victim is None or entry.last_used < victim[2]:
+                            victim = (cache, key, entry.last_used)
+                        break
+            if victim is None:
+                return
+            victim[0]._remove(victim[1], "global")
+
+
+_DEFAULT: Optional[CacheManager] = None
+
+
+def get_cache_manager() -> CacheManager:
+    """Process-wide cache manager, budgeted by EFL_CACHE_BUDGET_MB (default 256)"""
+    global _DEFAULT
+    if _DEFAULT is None:
+        budget_mb = float(os.getenv("EFL_CACHE_BUDGET_MB", DEFAULT_BUDGET_MB))
+        _DEFAULT = CacheManager(int(budget_mb * 1024 * 1024))
+    return _DEFAULT
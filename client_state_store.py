@@ -0,0 +1,478 @@
+"""
+Embedded global client state store (EFL_GLOBAL_CLIENT_STATE v1.0.2).
+
+One row per client holding the clientid / lastupdated / stateheader / inputs /
+derived / decisions partitions as canonical JSON, plus the header fields the
+coach tools filter on (activeproject, readinessflag, lastupdated) as indexed
+columns.
+
+Write paths follow the partition ownership rules:
+    put_inputs()          intake/update flows only (INV-002)
+    write_router_output() lastupdated + stateheader + derived + decisions in
+                          one UPDATE statement (INV-004); inputs untouched
+    apply_input_updates() intake update plus incremental re-derivation of
+                          only the partitions it reaches, in one transaction
+
+Backend: local SQLite (WAL journal, synchronous=FULL). Point reads are served
+from an in-process cache of decoded states that every write through this store
+invalidates, so a hot read is a dict probe.
+"""
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS client_state (
+    client_id TEXT PRIMARY KEY,
+    lastupdated TEXT,
+    activeproject TEXT,
+    readinessflag TEXT,
+    seasontype TEXT,
+    routerversion TEXT,
+    eligible INTEGER,
+    inputs_revision INTEGER NOT NULL,
+    stateheader TEXT,
+    inputs TEXT NOT NULL,
+    derived TEXT,
+    decisions TEXT
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_client_state_activeproject ON client_state (activeproject);
+CREATE INDEX IF NOT EXISTS idx_client_state_readinessflag ON client_state (readinessflag);
+CREATE INDEX IF NOT EXISTS idx_client_state_lastupdated ON client_state (lastupdated);
+"""
+
+_SELECT_STATE = (
+    "SELECT client_id, lastupdated, stateheader, inputs, derived, decisions, inputs_revision "
+    "FROM client_state"
+)
+
+# Router population -> EPA population
+_EPA_POPULATION = {
+    "Youth812": "Youth_8_12",
+    "Youth1316": "Youth_13_17",
+    "Youth17Advanced": "Youth_13_17",
+    "Adult_GENERAL": "Adult",
+    "Adult_ATHLETE": "Adult",
+}
+
+# System-1 R2P stage -> EPA R2P population
+_EPA_R2P_STAGE = {
+    "S1": "R2P_Stage_1",
+    "S2": "R2P_Stage_2",
+    "S25": "R2P_Stage_2",
+    "S3": "R2P_Stage_3",
+    "S4": "R2P_Stage_4",
+    "S5": "R2P_Stage_4",
+}
+
+# Client-state seasontype -> EPA season_type. The client state carries no
+# in-season tier, so INSEASON maps to the most restrictive tier.
+_EPA_SEASON = {
+    "OFFSEASON": "OFF_SEASON",
+    "PRESEASON": "PRE_SEASON",
+    "INSEASON": "IN_SEASON_TIER_1",
+    "POSTSEASON": "POST_SEASON",
+}
+
+
+def _encode(value) -> Optional[str]:
+    """Canonical JSON (stable key order, compact) so equal partitions compare equal as text"""
+    if value is None:
+        return None
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def _decode(text: Optional[str]):
+    return None if text is None else json.loads(text)
+
+
+class ClientStateStore:
+    """
+    Indexed client state store with atomic router writes.
+
+    States returned by get()/get_many() are shared with the read cache and
+    must be treated as read-only; write through put_inputs() or
+    write_router_output().
+    """
+
+    def __init__(self, db_path: str = ":memory:", cache_size: int = 4096):
+        self.db_path = db_path
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self._revisions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the underlying database"""
+        with self._lock:
+            self._conn.close()
+            self._cache.clear()
+            self._revisions.clear()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put_inputs(self, client_id: str, inputs: Dict) -> int:
+        """
+        Intake/update flow: replace the inputs partition of one client.
+
+        Creates the client (with null header, derived and decisions) if it is
+        new. Router-owned partitions are left as they are until the next
+        routing. Returns the new inputs revision.
+        """
+        return self.put_inputs_many({client_id: inputs})[client_id]
+
+    def put_inputs_many(self, inputs_by_client: Dict[str, Dict]) -> Dict[str, int]:
+        """put_inputs() for many clients in one transaction; client_id -> new revision"""
+        if not all(inputs_by_client):
+            raise ValueError("client_id is required")
+
+        revisions = {}
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for client_id, inputs in inputs_by_client.items():
+                    revisions[client_id] = conn.execute(
+                        "INSERT INTO client_state (client_id, inputs_revision, inputs) VALUES (?, 1, ?) "
+                        "ON CONFLICT (client_id) DO UPDATE SET "
+                        "inputs = excluded.inputs, inputs_revision = inputs_revision + 1 "
+                        "RETURNING inputs_revision",
+                        (client_id, _encode(inputs))
+                    ).fetchone()[0]
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            for client_id in revisions:
+                self._forget(client_id)
+
+        return revisions
+
+    def write_router_output(self, output: Dict) -> bool:
+        """
+        Router flow: write one routed state atomically (INV-004).
+
+        lastupdated, stateheader, derived and decisions land in a single
+        statement. The output must be coherent and must carry exactly the
+        stored inputs (INV-002); if inputs changed since the state was read
+        for routing, nothing is written and False is returned.
+        """
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                written = self._write_output(output)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return written
+
+    def _write_output(self, output: Dict, check_inputs: bool = True) -> bool:
+        """
+        Validate and write one router output; caller holds the lock and transaction.
+
+        check_inputs=False skips the stored-inputs comparison, for outputs
+        routed from inputs read inside the same transaction.
+        """
+        client_id = output["clientid"]
+        header = output["stateheader"]
+        decisions = output["decisions"]
+        if (header["clientid"] != client_id
+                or header["lastupdated"] != output["lastupdated"]
+                or header["activeproject"] != decisions["activeproject"]
+                or header["routerversion"] != decisions["routerversion"]
+                or header["eligible_for_training_today"] != decisions["eligible_for_training_today"]):
+            raise ValueError(f"Incoherent router output for {client_id}: stateheader does not match decisions")
+
+        sql = (
+            "UPDATE client_state SET lastupdated = ?, activeproject = ?, readinessflag = ?, "
+            "seasontype = ?, routerversion = ?, eligible = ?, stateheader = ?, derived = ?, decisions = ? "
+            "WHERE client_id = ?"
+        )
+        params = (output["lastupdated"], header["activeproject"], header["readinessflag"],
+                  header["seasontype"], header["routerversion"], int(header["eligible_for_training_today"]),
+                  _encode(header), _encode(output["derived"]), _encode(decisions), client_id)
+        if check_inputs:
+            sql += " AND inputs = ?"
+            params += (_encode(output["inputs"]),)
+
+        cursor = self._conn.execute(sql, params)
+        self._forget(client_id)
+        return cursor.rowcount == 1
+
+    def route_clients(self, router, client_ids: Optional[Iterable[str]] = None,
+                      now: Optional[str] = None) -> List[Dict]:
+        """
+        Route stored clients (all if client_ids is None) and persist the results.
+
+        Read, route and write happen in one write transaction, so no intake
+        update can slip between a client's read and its write.
+        """
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                states = self._fetch(client_ids)
+                outputs = router.route_roster(states, now)
+                for output in outputs:
+                    self._write_output(output, check_inputs=False)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return outputs
+
+    def apply_input_updates(self, engine, updates_by_client: Dict[str, Dict],
+                            now: Optional[str] = None) -> Dict[str, tuple]:
+        """
+        Intake updates plus incremental re-derivation, in one transaction.
+
+        updates_by_client maps client_id -> {"inputs.<path>": value}. engine is
+        an IncrementalRouter; only the partitions it recomputed are rewritten
+        (inputs and stateheader always, derived and decisions only when
+        touched). Unknown clients are skipped. Returns client_id -> recomputed
+        targets.
+        """
+        recomputed_by_client = {}
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                states = {client_id: self._cache[client_id]
+                          for client_id in updates_by_client if client_id in self._cache}
+                missing = [client_id for client_id in updates_by_client if client_id not in states]
+                if missing:
+                    states.update((state["clientid"], state) for state in self._fetch(missing))
+                items = [(states[client_id], updates)
+                         for client_id, updates in updates_by_client.items() if client_id in states]
+                results = engine.apply_roster(items, now)
+
+                for (state, _), (new_state, recomputed) in zip(items, results):
+                    client_id = state["clientid"]
+                    recomputed_by_client[client_id] = recomputed
+                    if not recomputed:
+                        continue
+                    header = new_state["stateheader"]
+                    sets = ("inputs = ?, inputs_revision = inputs_revision + 1, lastupdated = ?, "
+                            "activeproject = ?, readinessflag = ?, seasontype = ?, routerversion = ?, "
+                            "eligible = ?, stateheader = ?")
+                    params = [_encode(new_state["inputs"]), new_state["lastupdated"], header["activeproject"],
+                              header["readinessflag"], header["seasontype"], header["routerversion"],
+                              int(header["eligible_for_training_today"]), _encode(header)]
+                    if new_state["derived"] is not state["derived"]:
+                        sets += ", derived = ?"
+                        params.append(_encode(new_state["derived"]))
+                    if new_state["decisions"] is not state["decisions"]:
+                        sets += ", decisions = ?"
+                        params.append(_encode(new_state["decisions"]))
+                    params.append(client_id)
+                    revision = conn.execute(
+                        f"UPDATE client_state SET {sets} WHERE client_id = ? RETURNING inputs_revision", params
+                    ).fetchone()[0]
+                    self._remember(client_id, new_state, revision)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                for client_id in updates_by_client:
+                    self._forget(client_id)
+                raise
+        return recomputed_by_client
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, client_id: str) -> Optional[Dict]:
+        """Full client state, or None for an unknown client (read-only)"""
+        state = self._cache.get(client_id)
+        if state is not None:
+            self._touch(client_id)
+            return state
+        with self._lock:
+            states = self._fetch([client_id])
+        return states[0] if states else None
+
+    def get_many(self, client_ids: Iterable[str]) -> Dict[str, Dict]:
+        """client_id -> state for the known clients among client_ids (read-only)"""
+        found = {}
+        misses = []
+        for client_id in client_ids:
+            state = self._cache.get(client_id)
+            if state is None:
+                misses.append(client_id)
+            else:
+                self._touch(client_id)
+                found[client_id] = state
+        if misses:
+            with self._lock:
+                for state in self._fetch(misses):
+                    found[state["clientid"]] = state
+        return found
+
+    def inputs_revision(self, client_id: str) -> Optional[int]:
+        """Number of intake writes to this client's inputs (None if unknown)"""
+        if client_id not in self._revisions:
+            self.get(client_id)
+        return self._revisions.get(client_id)
+
+    def _fetch(self, client_ids: Optional[Iterable[str]]) -> List[Dict]:
+        """Load and cache states; caller holds the lock"""
+        if client_ids is None:
+            rows = self._conn.execute(f"{_SELECT_STATE} ORDER BY client_id").fetchall()
+        else:
+            client_ids = list(client_ids)
+            rows = []
+            for start in range(0, len(client_ids), 500):
+                chunk = client_ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(self._conn.execute(
+                    f"{_SELECT_STATE} WHERE client_id IN ({placeholders})", chunk
+                ).fetchall())
+
+        states = []
+        for client_id, lastupdated, header, inputs, derived, decisions, revision in rows:
+            state = {
+                "clientid": client_id,
+                "lastupdated": lastupdated,
+                "stateheader": _decode(header),
+                "inputs": _decode(inputs),
+                "derived": _decode(derived),
+                "decisions": _decode(decisions)
+            }
+            self._remember(client_id, state, revision)
+            states.append(state)
+        return states
+
+    # ------------------------------------------------------------------
+    # Read cache (LRU, cache_size states)
+    # ------------------------------------------------------------------
+
+    def _remember(self, client_id: str, state: Dict, revision: int) -> None:
+        """Cache a state and its inputs revision as most recent, evicting the least recent; caller holds the lock"""
+        self._cache[client_id] = state
+        self._cache.move_to_end(client_id)
+        self._revisions[client_id] = revision
+        while len(self._cache) > self.cache_size:
+            evicted, _ = self._cache.popitem(last=False)
+            self._revisions.pop(evicted, None)
+
+    def _forget(self, client_id: str) -> None:
+        """Drop a cached state together with its revision; caller holds the lock"""
+        self._cache.pop(client_id, None)
+        self._revisions.pop(client_id, None)
+
+    def _touch(self, client_id: str) -> None:
+        """Mark a cache hit as most recent (it may have been evicted meanwhile)"""
+        try:
+            self._cache.move_to_end(client_id)
+        except KeyError:
+            pass
+
+    def _client_ids(self, where: str, params: tuple) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                f"SELECT client_id FROM client_state WHERE {where} ORDER BY client_id", params
+            )]
+
+    def clients_by_project(self, activeproject: str) -> List[str]:
+        """Clients whose stored stateheader.activeproject matches"""
+        return self._client_ids("activeproject = ?", (activeproject,))
+
+    def clients_by_readiness(self, readinessflag: str) -> List[str]:
+        """Clients whose stored stateheader.readinessflag matches"""
+        return self._client_ids("readinessflag = ?", (readinessflag,))
+
+    def clients_updated_since(self, lastupdated: str) -> List[str]:
+        """Clients routed at or after an ISO8601 timestamp (string order)"""
+        return self._client_ids("lastupdated >= ?", (lastupdated,))
+
+    def unrouted_clients(self) -> List[str]:
+        """Clients with inputs but no router output yet"""
+        return self._client_ids("stateheader IS NULL", ())
+
+    # ------------------------------------------------------------------
+    # Generator / EPA context
+    # ------------------------------------------------------------------
+
+    def session_context(self, client_id: str) -> Dict:
+        """
+        Generator context for one client (generator_adapter contract).
+
+        Empty dict for an unknown client, so generators fall back to their
+        own defaults exactly as with a caller-supplied empty context.
+        """
+        state = self.get(client_id)
+        if state is None:
+            return {}
+
+        inputs = state["inputs"] or {}
+        profile = inputs.get("athleteprofile") or {}
+        context = inputs.get("trainingcontext_global") or {}
+        header = state["stateheader"] or {}
+        derived = state["derived"] or {}
+        readiness = context.get("readinessflag") or header.get("readinessflag") or "YELLOW"
+
+        session_context = {
+            "client_state": state,
+            "active_project": header.get("activeproject"),
+            "eligible_for_training_today": header.get("eligible_for_training_today"),
+            "season_type": context.get("seasontype"),
+            "readiness": readiness,
+            "population_enforced": (derived.get("populationoverrides") or {}).get("population_enforced")
+        }
+        if profile.get("age") is not None:
+            session_context["age"] = profile["age"]
+        if profile.get("sport"):
+            session_context["sport"] = profile["sport"].title()
+        return session_context
+
+    def epa_context(self, client_id: str) -> Dict:
+        """
+        EPA input-contract fields derivable from the stored state.
+
+        population comes from the routed derived partition (R2P clients map
+        their System-1 stage onto the EPA R2P stages); fields that cannot be
+        derived are omitted.
+        """
+        state = self.get(client_id)
+        if state is None:
+            return {}
+
+        inputs = state["inputs"] or {}
+        profile = inputs.get("athleteprofile") or {}
+        medical = inputs.get("medicalstatus") or {}
+        context = inputs.get("trainingcontext_global") or {}
+        derived = state["derived"] or {}
+
+        epa = {}
+        if medical.get("isinr2pservice"):
+            stage = (derived.get("r2p_systemone_output") or {}).get("stage")
+            if stage in _EPA_R2P_STAGE:
+                epa["population"] = _EPA_R2P_STAGE[stage]
+        else:
+            population = (derived.get("populationoverrides") or {}).get("population_enforced")
+            if population in _EPA_POPULATION:
+                epa["population"] = _EPA_POPULATION[population]
+
+        if profile.get("sport"):
+            epa["sport"] = profile["sport"].title()
+        if context.get("seasontype") in _EPA_SEASON:
+            epa["season_type"] = _EPA_SEASON[context["seasontype"]]
+        epa["readiness_flag"] = context.get("readinessflag") or "YELLOW"
+
+        injury_flags = list((medical.get("hardstopstatus") or {}).get("hardstopreasons") or [])
+        if medical.get("injurytype") not in (None, "NONE"):
+            injury_flags.insert(0, medical["injurytype"])
+        epa["injury_flags"] = injury_flags
+        return epa
@@ -2,8 +2,30 @@
 Court Sport exercise pattern mapper v2 - adjusted for Exercise Library v2.5 reality.
 """
 
-from typing import List, Dict, Optional
-import pandas as pd
+import csv
+import re
+import sys
+from typing import TYPE_CHECKING, List, Dict, Optional, Sequence, Union
+
+from .cache_manager import get_cache_manager
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from .shared_library import ColumnarLibrary
+
+_BAND = re.compile(r"Band_(\d+)")
+
+
+_LIBRARY_ROWS = get_cache_manager().register("court_sport_exercise_map.library_rows", max_entries=4)
+
+
+def load_library_rows(csv_path: str) -> tuple:
+    """Library CSV as plain row dicts (str values, '' for blanks), read once per path"""
+    def read():
+        with open(str(csv_path), newline="", encoding="utf-8") as f:
+            return tuple(csv.DictReader(f))
+    return _LIBRARY_ROWS.get_or_compute(str(csv_path), read)
+
 
 class CourtSportExerciseMapper:
     """Map Court Sport patterns to Exercise Library exercises (reality-based)"""
@@ -81,18 +103,28 @@ class CourtSportExerciseMapper:
     
     @staticmethod
     def find_exercises(
-        df: pd.DataFrame,
+        df: Union["pd.DataFrame", Sequence[Dict], "ColumnarLibrary"],
         court_pattern: str,
         readiness_band_override: Optional[int] = None,
         readiness_enode_override: Optional[str] = None,
         exclude_youth: bool = True,
         limit: int = 10
     ) -> List[Dict]:
-        """Find exercises for a Court Sport pattern"""
+        """Find exercises for a Court Sport pattern (df: a library frame, load_library_rows rows or a ColumnarLibrary)"""
         
         if court_pattern not in CourtSportExerciseMapper.PATTERN_MAP:
             return []
         
+        if isinstance(df, (list, tuple)):
+            return CourtSportExerciseMapper.find_rows(
+                df, court_pattern, readiness_band_override, readiness_enode_override, exclude_youth, limit)
+        # A ColumnarLibrary only exists once shared_library (and numpy) is loaded
+        shared = sys.modules.get(f"{__package__}.shared_library")
+        if shared is not None and isinstance(df, shared.ColumnarLibrary):
+            return CourtSportExerciseMapper.find_columnar(
+                df, court_pattern, readiness_band_override, readiness_enode_override, exclude_youth, limit)
+        
+        import pandas as pd
         rules = CourtSportExerciseMapper.PATTERN_MAP[court_pattern]
         
         # Start with all exercises
@@ -102,17 +134,17 @@ class CourtSportExerciseMapper:
         if rules.get("movement_pattern"):
             mask &= df['movement_pattern'] == rules["movement_pattern"]
         
-        # Filter by name includes
+        # Filter by name includes (keywords are literal, as in find_rows)
         if rules.get("name_include"):
             name_mask = pd.Series([False] * len(df))
             for keyword in rules["name_include"]:
-                name_mask |= df['exercise_name'].str.contains(keyword, case=False, na=False)
+                name_mask |= df['exercise_name'].str.contains(keyword, case=False, na=False, regex=False)
             mask &= name_mask
         
         # Filter by name excludes
         if rules.get("name_exclude"):
             for keyword in rules["name_exclude"]:
-                mask &= ~df['exercise_name'].str.contains(keyword, case=False, na=False)
+                mask &= ~df['exercise_name'].str.contains(keyword, case=False, na=False, regex=False)
         
         # Filter by band ceiling (use override if provided, else use rule default)
         band_max = readiness_band_override if readiness_band_override is not None else rules.get("band_max")
@@ -127,11 +159,105 @@ class CourtSportExerciseMapper:
         
         # Exclude youth contraindications
         if exclude_youth:
-            mask &= ~df['contraindicated_populations'].str.contains('Youth', case=False, na=False)
+            mask &= ~df['contraindicated_populations'].str.contains('Youth', case=False, na=False, regex=False)
         
         # Get results
         results = df[mask].head(limit)
         return results.to_dict('records')
+    
+    @staticmethod
+    def find_rows(
+        rows: Sequence[Dict],
+        court_pattern: str,
+        readiness_band_override: Optional[int] = None,
+        readiness_enode_override: Optional[str] = None,
+        exclude_youth: bool = True,
+        limit: int = 10
+    ) -> List[Dict]:
+        """find_exercises over plain row dicts: same rules and order, no pandas"""
+        rules = CourtSportExerciseMapper.PATTERN_MAP.get(court_pattern)
+        if rules is None:
+            return []
+        
+        movement = rules.get("movement_pattern")
+        include = [k.lower() for k in rules.get("name_include", [])]
+        exclude = [k.lower() for k in rules.get("name_exclude", [])]
+        band_max = readiness_band_override if readiness_band_override is not None else rules.get("band_max")
+        enode = readiness_enode_override if readiness_enode_override else rules.get("enode_required")
+        
+        results = []
+        for row in rows:
+            if movement and row["movement_pattern"] != movement:
+                continue
+            if enode and row["e_node"] != enode:
+                continue
+            if band_max is not None:
+                band = _band_number(row["load_band_primary"])
+                if band is None or band > band_max:
+                    continue
+            if exclude_youth and "youth" in (row["contraindicated_populations"] or "").lower():
+                continue
+            name = (row["exercise_name"] or "").lower()
+            if include and not any(k in name for k in include):
+                continue
+            if any(k in name for k in exclude):
+                continue
+            results.append(row)
+            if len(results) >= limit:
+                break
+        return results
+
+    @staticmethod
+    def find_columnar(
+        library: "ColumnarLibrary",
+        court_pattern: str,
+        readiness_band_override: Optional[int] = None,
+        readiness_enode_override: Optional[str] = None,
+        exclude_youth: bool = True,
+        limit: int = 10
+    ) -> List[Dict]:
+        """find_rows over a shared ColumnarLibrary: array masks on the mapped columns, names decoded per candidate"""
+        import numpy as np
+        
+        rules = CourtSportExerciseMapper.PATTERN_MAP.get(court_pattern)
+        if rules is None:
+            return []
+        
+        movement = rules.get("movement_pattern")
+        include = [k.lower() for k in rules.get("name_include", [])]
+        exclude = [k.lower() for k in rules.get("name_exclude", [])]
+        band_max = readiness_band_override if readiness_band_override is not None else rules.get("band_max")
+        enode = readiness_enode_override if readiness_enode_override else rules.get("enode_required")
+        
+        mask = np.ones(len(library), dtype=bool)
+        if movement:
+            mask &= library.mask("movement_pattern", movement)
+        if enode:
+            mask &= library.mask("e_node", enode)
+        if band_max is not None:
+            band = library.array("band")
+            mask &= (band >= 0) & (band <= band_max)
+        if exclude_youth:
+            codes, categories = library.codes("contraindicated_populations")
+            mask &= ~np.isin(codes, [i for i, value in enumerate(categories) if "youth" in value.lower()])
+        
+        results = []
+        for i in np.flatnonzero(mask).tolist():
+            name = library.value("exercise_name", i).lower()
+            if include and not any(k in name for k in include):
+                continue
+            if any(k in name for k in exclude):
+                continue
+            results.append(library.row(i))
+            if len(results) >= limit:
+                break
+        return results
+
+
+def _band_number(band: str) -> Optional[int]:
+    """'Band_2' -> 2, as the frame path's Band_(\\d+) extract"""
+    match = _BAND.search(band or "")
+    return int(match.group(1)) if match else None
 
 
 def get_court_sport_mapper():
@@ -20,8 +20,11 @@ Authority Stack:
 
 import json
 import csv
+import re
+import time
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 
 
@@ -73,6 +76,7 @@ class Exercise:
     is_sprint: bool
     intensity_percent_vmax: float
     equipment: str
+    zones: frozenset = frozenset()
 
 
 @dataclass
@@ -106,15 +110,43 @@ class ClientState:
 # EXERCISE LIBRARY LOADER
 # ============================================================================
 
+ZONE_TOKEN = re.compile(r"Zone_(\d+)")
+
+
+def parse_fv_zones(raw: str) -> Tuple[frozenset, List[str]]:
+    """({"Zone_N", ...}, malformed tokens) from a comma-separated fv_zones cell"""
+    zones, malformed = set(), []
+    for token in raw.split(','):
+        token = token.strip()
+        if not token:
+            continue
+        if ZONE_TOKEN.fullmatch(token):
+            zones.add(token)
+        else:
+            malformed.append(token)
+    return frozenset(zones), malformed
+
+
 class ExerciseLibrary:
     """Loads and manages Exercise Library v2.5"""
     
     def __init__(self, csv_path: str):
+        self.version = Path(csv_path).stem
         self.exercises: Dict[str, Exercise] = {}
+        # F-V zone -> ids of the exercises that train it (inverted index over fv_zones)
+        self.zone_postings: Dict[str, frozenset] = {}
+        self.malformed_zones: Dict[str, List[str]] = {}
+        self._zone_unions: Dict[frozenset, frozenset] = {}
         self.load_library(csv_path)
     
     def load_library(self, csv_path: str):
-        """Load exercises from CSV"""
+        """
+        Load exercises from CSV.
+        
+        Library v2.5 renamed several columns (e_node, load_band_primary,
+        intensity_vmax) and left load_standard_band mostly blank or in the
+        old "Band1" form; the older names are read first, then the v2.5 ones.
+        """
         with open(csv_path, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
@@ -125,17 +157,78 @@ class ExerciseLibrary:
                     aether_pattern=row['aether_pattern'],
                     aether_node=row['aether_node'],
                     aether_difficulty=row.get('aether_difficulty', ''),
-                    load_standard_band=row['load_standard_band'],
+                    load_standard_band=self._band(row),
                     contraindicated_populations=row.get('contraindicated_populations', ''),
                     fv_zones=row.get('fv_zones', ''),
-                    e_node_classification=row.get('e_node_classification', ''),
+                    e_node_classification=row.get('e_node_classification') or row.get('e_node', ''),
                     plyo_contacts=float(row.get('plyo_contacts', 0) or 0),
                     is_plyometric=row.get('is_plyometric', 'false').lower() == 'true',
                     is_sprint=row.get('is_sprint', 'false').lower() == 'true',
-                    intensity_percent_vmax=float(row.get('intensity_percent_vmax', 0) or 0),
+                    intensity_percent_vmax=float(
+                        row.get('intensity_percent_vmax') or row.get('intensity_vmax') or 0
+                    ),
                     equipment=row.get('equipment', '')
                 )
+                exercise.zones, malformed = parse_fv_zones(exercise.fv_zones)
+                if malformed:
+                    self.malformed_zones[exercise.exercise_id] = malformed
                 self.exercises[exercise.exercise_id] = exercise
+        
+        postings: Dict[str, set] = {}
+        for ex in self.exercises.values():
+            for zone in ex.zones:
+                postings.setdefault(zone, set()).add(ex.exercise_id)
+        self.zone_postings = {zone: frozenset(ids) for zone, ids in postings.items()}
+        self._zone_unions = {}
+    
+    def zone_members(self, target_zones: List[str]) -> frozenset:
+        """Ids of exercises training any of target_zones (exact zone match)"""
+        key = frozenset(target_zones)
+        members = self._zone_unions.get(key)
+        if members is None:
+            members = frozenset().union(*(self.zone_postings.get(z, frozenset()) for z in key))
+            self._zone_unions[key] = members
+        return members
+    
+    def zone_coverage(self) -> Dict:
+        """Per-zone exercise counts (plyometric, sprint, by band) for this library version"""
+        def zone_number(zone):
+            return int(ZONE_TOKEN.fullmatch(zone).group(1))
+        
+        zones = {}
+        for zone in sorted(self.zone_postings, key=zone_number):
+            members = [self.exercises[i] for i in self.zone_postings[zone]]
+            bands: Dict[str, int] = {}
+            for ex in members:
+                bands[ex.load_standard_band or "UNBANDED"] = bands.get(ex.load_standard_band or "UNBANDED", 0) + 1
+            zones[zone] = {
+                "exercises": len(members),
+                "plyometric": sum(ex.is_plyometric for ex in members),
+                "sprint": sum(ex.is_sprint for ex in members),
+                "bands": dict(sorted(bands.items()))
+            }
+        
+        numbers = [zone_number(z) for z in zones]
+        return {
+            "library_version": self.version,
+            "total_exercises": len(self.exercises),
+            "zones": zones,
+            "missing_zones": [f"Zone_{n}" for n in range(1, max(numbers, default=0) + 1)
+                              if f"Zone_{n}" not in zones],
+            "unzoned_exercises": sum(1 for ex in self.exercises.values() if not ex.zones),
+            "malformed_zone_tokens": dict(self.malformed_zones)
+        }
+    
+    @staticmethod
+    def _band(row: Dict) -> str:
+        """Load band as "Band_N" from load_standard_band or v2.5 load_band_primary"""
+        band = row.get('load_standard_band') or ''
+        if band.startswith('Band_'):
+            return band
+        primary = row.get('load_band_primary') or ''
+        if primary:
+            return primary
+        return band.replace('Band', 'Band_') if band else ''
     
     def get(self, exercise_id: str) -> Optional[Exercise]:
         """Get exercise by ID"""
@@ -199,6 +292,12 @@ class ClientStateEngine:
         }
     }
     
+    @classmethod
+    def seasonal_range(cls, population: Population, season_type: SeasonType) -> Dict:
+        """Weekly plyo/sprint operating range for a population and season (active Load Standard)"""
+        from .epa_v2_2_full import LimitManager
+        return LimitManager.active_standard().seasonal_range_for(population.value, season_type.value)
+    
     @classmethod
     def compute_state(cls, 
                       client_id: str,
@@ -288,39 +387,49 @@ class ExerciseRouter:
         
         return pools
     
+    def narrow(self, pools: Dict[str, List[Exercise]], client_state: ClientState) -> Dict[str, List[Exercise]]:
+        """
+        Pools for client_state, derived from pools routed for a client state
+        with the same or looser ceilings (same result as route(), without a
+        library pass)
+        """
+        is_legal = self._legality_check(client_state)
+        return {block: [ex for ex in pool if is_legal(ex)] for block, pool in pools.items()}
+    
     def _apply_global_filters(self, client_state: ClientState) -> List[Exercise]:
         """Global filters: Band/Node/E-Node ceilings, injuries"""
-        legal = []
-        
+        is_legal = self._legality_check(client_state)
+        return [ex for ex in self.library.exercises.values() if is_legal(ex)]
+    
+    def _legality_check(self, client_state: ClientState):
+        """Predicate for the Band/Node/E-Node ceilings and injury contraindications"""
         max_band_level = self.BAND_ORDER.get(client_state.max_band_allowed, 0)
         max_node_level = self.NODE_ORDER.get(client_state.max_node_allowed, 0)
         max_e_level = self.E_NODE_ORDER.get(client_state.max_e_node_allowed, 0)
+        injury_flags = client_state.injury_flags
         
-        for ex in self.library.exercises.values():
+        def is_legal(ex: Exercise) -> bool:
             # Check band ceiling
-            ex_band_level = self.BAND_ORDER.get(ex.load_standard_band, 0)
-            if ex_band_level > max_band_level:
-                continue
+            if self.BAND_ORDER.get(ex.load_standard_band, 0) > max_band_level:
+                return False
             
             # Check node ceiling
-            ex_node_level = self.NODE_ORDER.get(ex.aether_node, 0)
-            if ex_node_level > max_node_level:
-                continue
+            if self.NODE_ORDER.get(ex.aether_node, 0) > max_node_level:
+                return False
             
             # Check E-node ceiling
-            ex_e_level = self.E_NODE_ORDER.get(ex.e_node_classification, 0)
-            if ex_e_level > max_e_level:
-                continue
+            if self.E_NODE_ORDER.get(ex.e_node_classification, 0) > max_e_level:
+                return False
             
             # Check injury contraindications
-            if client_state.injury_flags:
+            if injury_flags:
                 contraindicated = ex.contraindicated_populations.split(',')
-                if any(flag in contraindicated for flag in client_state.injury_flags):
-                    continue
+                if any(flag in contraindicated for flag in injury_flags):
+                    return False
             
-            legal.append(ex)
+            return True
         
-        return legal
+        return is_legal
     
     def _filter_prime(self, exercises: List[Exercise]) -> List[Exercise]:
         """PRIME block: Mobility, activation, breathing (E0, Band_0-1)"""
@@ -381,6 +490,163 @@ class ExerciseRouter:
         ]
 
 
+# ============================================================================
+# WORK BLOCK OPTIMIZER
+# ============================================================================
+
+class WorkBlockOptimizer:
+    """
+    Chooses WORK exercises as a small group knapsack under a time budget.
+    
+    At most one exercise per base movement pattern and MAX_EXERCISES in
+    total, with WORK plyo contacts within the session cap. Each exercise is
+    worth ITEM_VALUE (pattern coverage), plus ZONE_VALUE per target F-V zone
+    it trains (scaled by that zone's sport emphasis weight), plus its share
+    of the session contact cap times BUDGET_VALUE (budget use).
+    
+    Each pattern keeps only its Pareto-best (contacts, value) candidates and
+    a DP runs over the reachable (exercise count, contacts) states, so a
+    solve is a few thousand steps. If the deadline passes first, the
+    selection falls back to the first-fit greedy pick. Ties go to the
+    earlier library exercises, so selections are deterministic.
+    """
+    
+    MAX_EXERCISES = 4
+    ITEM_VALUE = 1.0
+    ZONE_VALUE = 1.0
+    BUDGET_VALUE = 1.0
+    
+    def __init__(self, time_budget_s: float = 0.005):
+        self.time_budget_s = time_budget_s
+        self._features: Dict[str, Tuple[str, int, frozenset]] = {}
+    
+    def warm(self, exercises) -> None:
+        """Precompute features so the first selections are not spent on them"""
+        for ex in exercises:
+            self.features(ex)
+    
+    def features(self, ex: Exercise) -> Tuple[str, int, frozenset]:
+        """(base pattern, WORK plyo contacts, F-V zones) of an exercise, cached"""
+        cached = self._features.get(ex.exercise_id)
+        if cached is None:
+            base_pattern = ex.movement_pattern.split('-')[0] if '-' in ex.movement_pattern else ex.movement_pattern
+            contacts = int(3 * 8 * ex.plyo_contacts) if ex.is_plyometric else 0
+            zones = ex.zones or parse_fv_zones(ex.fv_zones)[0]
+            cached = self._features[ex.exercise_id] = (base_pattern, contacts, zones)
+        return cached
+    
+    def select(self, candidates: List[Exercise], contacts_cap: int,
+               target_zones: List[str] = None,
+               zone_weights: Dict[str, float] = None) -> Tuple[List[Exercise], str]:
+        """(selected exercises in library order, "OPTIMAL" or "GREEDY_FALLBACK")"""
+        deadline = time.perf_counter() + self.time_budget_s
+        selected = self._solve(candidates, contacts_cap, target_zones, zone_weights or {}, deadline)
+        if selected is None:
+            return self.greedy(candidates, contacts_cap), "GREEDY_FALLBACK"
+        return selected, "OPTIMAL"
+    
+    def greedy(self, candidates: List[Exercise], contacts_cap: int) -> List[Exercise]:
+        """First fit in candidate order with pattern variety and the contact budget"""
+        selected = []
+        patterns_used = set()
+        plyo_contacts_accumulated = 0
+        
+        for ex in candidates:
+            # Skip if pattern already used (ensure variety)
+            base_pattern, contacts, _ = self.features(ex)
+            if base_pattern in patterns_used:
+                continue
+            
+            # Check plyo contact budget
+            if ex.is_plyometric:
+                if plyo_contacts_accumulated + contacts > contacts_cap:
+                    continue
+                plyo_contacts_accumulated += contacts
+            
+            selected.append(ex)
+            patterns_used.add(base_pattern)
+            
+            if len(selected) >= self.MAX_EXERCISES:
+                break
+        
+        return selected
+    
+    def value(self, ex: Exercise, contacts_cap: int, targets: frozenset, zone_weights: Dict[str, float]) -> float:
+        """Objective contribution of one exercise"""
+        _, contacts, zones = self.features(ex)
+        value = self.ITEM_VALUE
+        if targets:
+            value += self.ZONE_VALUE * sum(zone_weights.get(z, 1.0) for z in zones & targets)
+        if contacts_cap > 0:
+            value += self.BUDGET_VALUE * contacts / contacts_cap
+        return value
+    
+    def _solve(self, candidates: List[Exercise], contacts_cap: int, target_zones: Optional[List[str]],
+               zone_weights: Dict[str, float], deadline: float) -> Optional[List[Exercise]]:
+        targets = frozenset(target_zones or ())
+        
+        # Exercises with equal (pattern, contacts, zones) are interchangeable; keep the earliest
+        features = self._features
+        keys = [features.get(ex.exercise_id) or self.features(ex) for ex in candidates]
+        earliest = {key: order for order, key in reversed(list(enumerate(keys)))}
+        if time.perf_counter() > deadline:
+            return None
+        
+        # Pareto frontier per base pattern: more contacts only if it is worth more
+        groups: Dict[str, List[Tuple[int, float, int]]] = {}
+        zone_values: Dict[frozenset, float] = {}
+        for (base_pattern, contacts, zones), order in earliest.items():
+            if contacts > contacts_cap:
+                continue
+            zone_value = zone_values.get(zones)
+            if zone_value is None:
+                zone_value = zone_values[zones] = self.ZONE_VALUE * sum(
+                    zone_weights.get(z, 1.0) for z in zones & targets
+                )
+            value = self.ITEM_VALUE + zone_value
+            if contacts_cap > 0:
+                value += self.BUDGET_VALUE * contacts / contacts_cap
+            groups.setdefault(base_pattern, []).append((contacts, value, order))
+        
+        # DP over (exercise count, contacts) -> (value, picks)
+        states: Dict[Tuple[int, int], Tuple[float, Tuple[int, ...]]] = {(0, 0): (0.0, ())}
+        for items in groups.values():
+            if time.perf_counter() > deadline:
+                return None
+            frontier = []
+            for contacts, value, order in sorted(items, key=lambda item: (item[0], -item[1], item[2])):
+                if not frontier or value > frontier[-1][1]:
+                    frontier.append((contacts, value, order))
+            
+            updated = dict(states)
+            for (count, used), (value, picks) in states.items():
+                if count >= self.MAX_EXERCISES:
+                    continue
+                for contacts, item_value, order in frontier:
+                    if used + contacts > contacts_cap:
+                        break
+                    key = (count + 1, used + contacts)
+                    candidate = (value + item_value, picks + (order,))
+                    if self._better(candidate, updated.get(key)):
+                        updated[key] = candidate
+            states = updated
+        
+        best = None
+        for candidate in states.values():
+            if self._better(candidate, best):
+                best = candidate
+        return [candidates[order] for order in sorted(best[1])]
+    
+    @staticmethod
+    def _better(candidate: Tuple[float, Tuple[int, ...]], incumbent) -> bool:
+        """Higher value wins; equal values go to the earlier library exercises"""
+        if incumbent is None:
+            return True
+        if abs(candidate[0] - incumbent[0]) > 1e-9:
+            return candidate[0] > incumbent[0]
+        return sorted(candidate[1]) < sorted(incumbent[1])
+
+
 # ============================================================================
 # EXERCISE SELECTION ALGORITHM v1.1
 # ============================================================================
@@ -388,14 +654,23 @@ class ExerciseRouter:
 class SessionBuilder:
     """Builds complete PRIME-PREP-WORK-CLEAR sessions with volume control"""
     
-    def __init__(self, router: ExerciseRouter):
+    def __init__(self, router: ExerciseRouter, optimizer: Optional[WorkBlockOptimizer] = None):
         self.router = router
+        self.optimizer = optimizer or WorkBlockOptimizer()
+        self.optimizer.warm(router.library.exercises.values())
     
-    def build_session(self, client_state: ClientState, target_zones: List[str] = None) -> Dict:
+    def build_session(self, client_state: ClientState, target_zones: List[str] = None,
+                      zone_weights: Dict[str, float] = None) -> Dict:
         """Build complete session"""
         
         # Get candidate pools
         pools = self.router.route(client_state)
+        return self.build_from_pools(pools, client_state, target_zones, zone_weights)
+    
+    def build_from_pools(self, pools: Dict[str, List[Exercise]], client_state: ClientState,
+                         target_zones: List[str] = None,
+                         zone_weights: Dict[str, float] = None) -> Dict:
+        """Build complete session from already routed candidate pools"""
         
         # Check if we have enough exercises
         if not all(pools.values()):
@@ -406,10 +681,11 @@ class SessionBuilder:
             }
         
         # Build each block
+        work, work_selection = self._select_work(pools["WORK"], client_state, target_zones, zone_weights)
         session = {
             "PRIME": self._build_prime_block(pools["PRIME"]),
             "PREP": self._build_prep_block(pools["PREP"]),
-            "WORK": self._build_work_block(pools["WORK"], client_state, target_zones),
+            "WORK": self._work_items(work),
             "CLEAR": self._build_clear_block(pools["CLEAR"])
         }
         
@@ -431,7 +707,8 @@ class SessionBuilder:
             "session_plan": session,
             "total_plyo_contacts": total_plyo_contacts,
             "total_sprint_meters": total_sprint_meters,
-            "pools_used": {k: len(v) for k, v in pools.items()}
+            "pools_used": {k: len(v) for k, v in pools.items()},
+            "work_selection": work_selection
         }
     
     def _build_prime_block(self, candidates: List[Exercise]) -> List[Dict]:
@@ -476,41 +753,24 @@ class SessionBuilder:
             for ex in selected
         ]
     
-    def _build_work_block(self, candidates: List[Exercise], 
-                          client_state: ClientState,
-                          target_zones: List[str] = None) -> List[Dict]:
-        """Build WORK block (25-35 min): 3-5 exercises with volume control"""
-        
-        # Filter by target zones if specified
+    def _select_work(self, candidates: List[Exercise],
+                     client_state: ClientState,
+                     target_zones: List[str] = None,
+                     zone_weights: Dict[str, float] = None) -> Tuple[List[Exercise], str]:
+        """WORK exercises with pattern variety within the session contact cap"""
+        candidates = self._work_candidates(candidates, target_zones)
+        return self.optimizer.select(candidates, client_state.plyo_contacts_cap_session,
+                                     target_zones, zone_weights)
+    
+    def _work_candidates(self, candidates: List[Exercise], target_zones: List[str] = None) -> List[Exercise]:
+        """WORK pool restricted to the target zones, if any (zone index union, pool order kept)"""
         if target_zones:
-            candidates = [
-                ex for ex in candidates
-                if any(zone in ex.fv_zones for zone in target_zones)
-            ]
-        
-        # Select exercises ensuring pattern variety
-        selected = []
-        patterns_used = set()
-        plyo_contacts_accumulated = 0
-        
-        for ex in candidates:
-            # Skip if pattern already used (ensure variety)
-            base_pattern = ex.movement_pattern.split('-')[0] if '-' in ex.movement_pattern else ex.movement_pattern
-            if base_pattern in patterns_used:
-                continue
-            
-            # Check plyo contact budget
-            if ex.is_plyometric:
-                potential_contacts = int(3 * 8 * ex.plyo_contacts)
-                if plyo_contacts_accumulated + potential_contacts > client_state.plyo_contacts_cap_session:
-                    continue
-                plyo_contacts_accumulated += potential_contacts
-            
-            selected.append(ex)
-            patterns_used.add(base_pattern)
-            
-            if len(selected) >= 4:
-                break
+            members = self.router.library.zone_members(target_zones)
+            candidates = [ex for ex in candidates if ex.exercise_id in members]
+        return candidates
+    
+    def _work_items(self, selected: List[Exercise]) -> List[Dict]:
+        """Prescribe sets/reps/rest for the selected WORK exercises"""
         
         # Build items
         items = []
@@ -597,6 +857,155 @@ class SessionBuilder:
             return ["Quality movement", "Full ROM", "Control breathing"]
 
 
+# ============================================================================
+# WEEKLY PLANNER
+# ============================================================================
+
+class WeeklyPlanner:
+    """
+    Plans all of a client's sessions for one week jointly.
+    
+    The library is routed once for the week; sessions with tighter ceilings
+    (e.g. a YELLOW day) narrow those shared pools instead of re-routing. The
+    weekly plyo/sprint budget is the weekly cap, lowered to the top of the
+    seasonal operating range, minus what is already accumulated. Sessions are
+    built in order, each given an even share of what is left across itself and
+    the sessions after it (bounded by its own session cap), so contacts a
+    session does not use roll forward. The allowance covers PREP contacts as
+    well as WORK, so every session passes EPA Gate 5 as planned.
+    """
+    
+    def __init__(self, builder: SessionBuilder):
+        self.builder = builder
+        self.router = builder.router
+    
+    def plan_week(self, week_id: str, session_states: List[ClientState],
+                  target_zones: List[str] = None,
+                  seasonal_range: Optional[Dict] = None,
+                  zone_weights: Dict[str, float] = None) -> Dict:
+        """
+        Build every session of a week.
+        
+        Args:
+            week_id: Week identifier, echoed in the result
+            session_states: One client state per session, in session order
+                (same client, population and season; readiness may differ).
+                Weekly caps and accumulators are read from the first state.
+            target_zones: F-V zones for the WORK blocks
+            seasonal_range: plyo_min/plyo_max/sprint_min/sprint_max weekly
+                operating range; defaults to the active Load Standard
+            zone_weights: Sport emphasis weight per F-V zone for WORK selection
+        """
+        if not session_states:
+            raise ValueError("plan_week needs at least one session")
+        base = session_states[0]
+        if seasonal_range is None:
+            seasonal_range = ClientStateEngine.seasonal_range(base.population, base.season_type)
+        
+        plyo_budget = max(0, min(base.plyo_contacts_cap_weekly, seasonal_range["plyo_max"])
+                          - base.weekly_contacts_accumulated)
+        sprint_budget = max(0, min(base.sprint_meters_cap_weekly, seasonal_range["sprint_max"])
+                            - base.weekly_sprint_meters_accumulated)
+        
+        # One library pass, routed at the loosest ceilings of the week
+        widest = self._widest(session_states)
+        shared_pools = self.router.route(widest)
+        
+        sessions = []
+        plyo_used = sprint_used = 0
+        for i, state in enumerate(session_states):
+            remaining = session_states[i:]
+            plyo_allowance = self._share(plyo_budget - plyo_used,
+                                         [s.plyo_contacts_cap_session for s in remaining])
+            sprint_allowance = self._share(sprint_budget - sprint_used,
+                                           [s.sprint_meters_cap_session for s in remaining])
+            
+            pools = shared_pools
+            if (self._ceiling_levels(state) != self._ceiling_levels(widest)
+                    or set(state.injury_flags) != set(widest.injury_flags)):
+                pools = self.router.narrow(shared_pools, state)
+            
+            # PREP contacts count against the allowance; drop plyo PREP work if they would not fit
+            prep_contacts = sum(item["total_contacts"] for item in self.builder._build_prep_block(pools["PREP"]))
+            if prep_contacts > plyo_allowance:
+                pools = dict(pools, PREP=[ex for ex in pools["PREP"] if not ex.is_plyometric])
+                prep_contacts = 0
+            
+            session_state = replace(
+                state,
+                plyo_contacts_cap_session=plyo_allowance - prep_contacts,
+                sprint_meters_cap_session=sprint_allowance,
+                completed_sessions_this_week=state.completed_sessions_this_week + i,
+                weekly_contacts_accumulated=base.weekly_contacts_accumulated + plyo_used,
+                weekly_sprint_meters_accumulated=base.weekly_sprint_meters_accumulated + sprint_used
+            )
+            result = self.builder.build_from_pools(pools, session_state, target_zones, zone_weights)
+            result["session_index"] = i
+            result["plyo_allowance"] = plyo_allowance
+            result["sprint_allowance"] = sprint_allowance
+            if result["status"] == "SUCCESS":
+                plyo_used += result["total_plyo_contacts"]
+                sprint_used += result["total_sprint_meters"]
+            sessions.append(result)
+        
+        week_plyo = base.weekly_contacts_accumulated + plyo_used
+        week_sprint = base.weekly_sprint_meters_accumulated + sprint_used
+        return {
+            "week_id": week_id,
+            "status": "SUCCESS" if all(s["status"] == "SUCCESS" for s in sessions) else "PARTIAL",
+            "sessions": sessions,
+            "total_plyo_contacts": plyo_used,
+            "total_sprint_meters": sprint_used,
+            "weekly_plyo_budget": plyo_budget,
+            "weekly_sprint_budget": sprint_budget,
+            "seasonal_operating_range": dict(seasonal_range),
+            # Below-range weeks are legal; the range minimum is a target, not a gate
+            "below_operating_range": week_plyo < seasonal_range["plyo_min"]
+                                     or week_sprint < seasonal_range["sprint_min"]
+        }
+    
+    def _widest(self, session_states: List[ClientState]) -> ClientState:
+        """
+        State at least as loose as every session's: the highest band, node and
+        E-node ceilings (taken per component) and only the injury flags all
+        sessions share, so narrow() can derive each session's pools
+        """
+        orders = (self.router.BAND_ORDER, self.router.NODE_ORDER, self.router.E_NODE_ORDER)
+        ceilings = [max((getattr(s, name) for s in session_states), key=lambda label: order.get(label, 0))
+                    for name, order in zip(("max_band_allowed", "max_node_allowed", "max_e_node_allowed"), orders)]
+        shared_flags = [flag for flag in session_states[0].injury_flags
+                        if all(flag in s.injury_flags for s in session_states[1:])]
+        return replace(session_states[0], max_band_allowed=ceilings[0], max_node_allowed=ceilings[1],
+                       max_e_node_allowed=ceilings[2], injury_flags=shared_flags)
+    
+    def _ceiling_levels(self, state: ClientState) -> Tuple[int, int, int]:
+        return (
+            self.router.BAND_ORDER.get(state.max_band_allowed, 0),
+            self.router.NODE_ORDER.get(state.max_node_allowed, 0),
+            self.router.E_NODE_ORDER.get(state.max_e_node_allowed, 0)
+        )
+    
+    @staticmethod
+    def _share(budget: int, session_caps: List[int]) -> int:
+        """
+        The first session's part of an even split of budget over
+        session_caps (water-filling: capped sessions hand their excess to
+        the others)
+        """
+        budget = max(0, budget)
+        first_cap = session_caps[0]
+        caps = sorted(session_caps)
+        left = len(caps)
+        level = 0
+        for cap in caps:
+            level = budget // left
+            if cap >= level:
+                break
+            budget -= cap
+            left -= 1
+        return min(first_cap, level) if left else first_cap
+
+
 # ============================================================================
 # MAIN SESSION GENERATOR
 # ============================================================================
@@ -608,6 +1017,7 @@ class EFLSessionGenerator:
         self.library = ExerciseLibrary(library_path)
         self.router = ExerciseRouter(self.library)
         self.builder = SessionBuilder(self.router)
+        self.planner = WeeklyPlanner(self.builder)
     
     def generate_session(self,
                         client_id: str,
@@ -618,6 +1028,7 @@ class EFLSessionGenerator:
                         session_type: str = "FULL_SESSION",
                         injury_flags: List[str] = None,
                         target_zones: List[str] = None,
+                        zone_weights: Dict[str, float] = None,
                         **kwargs) -> Dict:
         """Generate complete session"""
         
@@ -640,7 +1051,7 @@ class EFLSessionGenerator:
         )
         
         # Build session
-        result = self.builder.build_session(client_state, target_zones)
+        result = self.builder.build_session(client_state, target_zones, zone_weights)
         
         # Add client context to result
         result["client_state"] = {
@@ -656,6 +1067,43 @@ class EFLSessionGenerator:
         }
         
         return result
+    
+    def generate_week(self,
+                      client_id: str,
+                      population: str,
+                      sport: str,
+                      season_type: str,
+                      week_id: str,
+                      sessions: List[Dict],
+                      injury_flags: List[str] = None,
+                      target_zones: List[str] = None,
+                      weekly_contacts_accumulated: int = 0,
+                      weekly_sprint_meters_accumulated: int = 0) -> Dict:
+        """
+        Generate all sessions of a week with a shared weekly budget.
+        
+        sessions lists each session's readiness_flag and session_type
+        (defaults GREEN / FULL_SESSION), in order.
+        """
+        pop_enum = Population(population)
+        season_enum = SeasonType(season_type)
+        
+        session_states = [
+            ClientStateEngine.compute_state(
+                client_id=client_id,
+                population=pop_enum,
+                sport=sport,
+                season_type=season_enum,
+                readiness_flag=ReadinessFlag(session.get("readiness_flag", "GREEN")),
+                injury_flags=injury_flags or [],
+                session_type=SessionType(session.get("session_type", "FULL_SESSION")),
+                weekly_contacts_accumulated=weekly_contacts_accumulated,
+                weekly_sprint_meters_accumulated=weekly_sprint_meters_accumulated
+            )
+            for session in sessions
+        ]
+        
+        return self.planner.plan_week(week_id, session_states, target_zones)
 
 
 # ============================================================================
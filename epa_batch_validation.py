@@ -0,0 +1,357 @@
+"""
+Vectorized EPA v2.2 validation kernel for large batch audits.
+
+Flattens many EPA input contracts into NumPy columns (one row per exercise
+item, one row per session) and evaluates Gates 0-6 with array operations and
+np.add.reduceat segment sums. Gate statuses, fail-fast order and response
+status match ValidationGates / EFLProgramArchitect.process() exactly; reason
+strings are not produced - re-run the per-session path for the (few) failing
+sessions when the text is needed.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .epa_v2_2_full import ExerciseLibrary, InputValidator, LibraryMetadataFlag, LimitManager, ResponseStatus
+
+
+BAND_ORDER = {"Band_0": 0, "Band_1": 1, "Band_2": 2, "Band_3": 3, "Band_4": 4}
+E_NODE_ORDER = {"E0": 0, "E1": 1, "E2": 2, "E3": 3, "E4": 4}
+
+GATE_IDS = ("0", "1", "2", "3", "4", "5", "6")
+
+# Gate status codes
+PASS, FAIL, SKIP, NOT_RUN = 0, 1, 2, 3
+STATUS_NAMES = ("PASS", "FAIL", "SKIP", "NOT_RUN")
+
+
+@dataclass
+class FlatBatch:
+    """Column-oriented view of a batch of EPA inputs"""
+    # Per item (exercise instance)
+    item_session: np.ndarray        # int64 session row of each item
+    item_library: np.ndarray        # int64 library row, -1 if missing
+    sets: np.ndarray                # int64
+    reps: np.ndarray                # int64
+    distance_m: np.ndarray          # float64, 0 if absent
+    intensity_vmax: np.ndarray      # float64, NaN if absent
+
+    # Per session
+    item_offsets: np.ndarray        # int64 first item row of each session
+    item_counts: np.ndarray         # int64
+    has_plan: np.ndarray            # bool, input carried "blocks"
+    input_valid: np.ndarray         # bool, InputValidator passed
+    population: np.ndarray          # int64 population row (last row = unknown)
+    session_type: np.ndarray        # int64 0 FULL_SESSION, 1 other
+    is_microsession: np.ndarray     # bool, session_type == MICROSESSION
+    is_adult: np.ndarray            # bool
+    is_youth_13_17: np.ndarray      # bool
+    readiness: np.ndarray           # int64 0 GREEN, 1 YELLOW, 2 RED, 3 other
+    season_in_season: np.ndarray    # bool, "IN_SEASON" in season_type
+    season_tier_1: np.ndarray       # bool
+    tracked_plyo: np.ndarray        # float64
+    tracked_sprint: np.ndarray      # float64
+    completed_sprint_sessions: np.ndarray  # float64
+
+
+@dataclass
+class BatchValidationResult:
+    """Per-session outcome of a batch validation"""
+    gate_status: np.ndarray         # (n_sessions, 7) status codes
+    first_failed_gate: np.ndarray   # -1 if no gate failed
+    total_plyo_contacts: np.ndarray
+    total_sprint_meters: np.ndarray
+    statuses: List[str]
+
+    def gate_results(self, index: int) -> List[Tuple[str, str]]:
+        """(gate_id, status) pairs of the gates that ran, as ValidationGates reports them"""
+        return [
+            (GATE_IDS[g], STATUS_NAMES[code])
+            for g, code in enumerate(self.gate_status[index])
+            if code != NOT_RUN
+        ]
+
+
+class BatchValidationKernel:
+    """Compiled library columns + vectorized Gates 0-6"""
+
+    def __init__(self, library: ExerciseLibrary, limits: Optional[LimitManager] = None):
+        self.library = library
+        self.limits = limits or LimitManager()
+
+        exercises = list(library.exercises.values())
+        self.exercise_index = {ex.exercise_id: i for i, ex in enumerate(exercises)}
+
+        # E-node strings coded for the Adult MicroSession allowed-set test
+        self.e_node_codes: Dict[str, int] = {}
+        for ex in exercises:
+            if ex.e_node and ex.e_node not in self.e_node_codes:
+                self.e_node_codes[ex.e_node] = len(self.e_node_codes)
+
+        self.lib_band_level = np.array(
+            [BAND_ORDER.get(ex.load_standard_band, -1) for ex in exercises], dtype=np.int64
+        )
+        self.lib_has_e_node = np.array([bool(ex.e_node) for ex in exercises], dtype=bool)
+        self.lib_e_level = np.array(
+            [E_NODE_ORDER.get(ex.e_node, -1) if ex.e_node else -1 for ex in exercises], dtype=np.int64
+        )
+        self.lib_e_code = np.array(
+            [self.e_node_codes[ex.e_node] if ex.e_node else -1 for ex in exercises], dtype=np.int64
+        )
+        self.lib_is_plyometric = np.array([ex.is_plyometric for ex in exercises], dtype=bool)
+        self.lib_plyo_contacts = np.array([ex.plyo_contacts or 0.0 for ex in exercises], dtype=np.float64)
+
+        # Gate 0 reads the load-time metadata bitmap, as ValidationGates does
+        metadata_flags = np.array(
+            [library.metadata_flags.get(ex.exercise_id, 0) for ex in exercises], dtype=np.int64
+        )
+        self.lib_plyo_metadata_missing = (metadata_flags & LibraryMetadataFlag.PLYO_CONTACTS_MISSING) != 0
+        self.lib_requires_intensity = (metadata_flags & LibraryMetadataFlag.REQUIRES_INTENSITY) != 0
+
+    # ------------------------------------------------------------------
+    # Flattening
+    # ------------------------------------------------------------------
+
+    def flatten(self, inputs: Sequence[Dict], standard) -> FlatBatch:
+        """Flatten EPA input contracts into columns"""
+        population_index = standard.population_index
+        unknown_population = len(standard.populations)
+        readiness_index = standard.readiness_index
+        exercise_index = self.exercise_index
+
+        item_session, item_library, sets, reps, distance, intensity = [], [], [], [], [], []
+        offsets, counts, has_plan, input_valid = [], [], [], []
+        population, session_type, readiness = [], [], []
+        is_microsession, is_adult, is_youth_13_17 = [], [], []
+        in_season, tier_1 = [], []
+        tracked_plyo, tracked_sprint, completed_sprint = [], [], []
+
+        for row, data in enumerate(inputs):
+            offsets.append(len(item_library))
+            input_valid.append(InputValidator.validate(data)[0])
+            has_plan.append("blocks" in data)
+
+            population.append(population_index.get(data.get("population"), unknown_population))
+            session_type.append(0 if data.get("session_type") == "FULL_SESSION" else 1)
+            is_microsession.append(data.get("session_type") == "MICROSESSION")
+            is_adult.append(data.get("population") == "Adult")
+            is_youth_13_17.append(data.get("population") == "Youth_13_17")
+            readiness.append(readiness_index.get(data.get("readiness_flag"), 3))
+            season = data.get("season_type") or ""
+            in_season.append("IN_SEASON" in season)
+            tier_1.append(season == "IN_SEASON_TIER_1")
+
+            practice_exposure = data.get("practice_exposure", {})
+            tracked_plyo.append(practice_exposure.get("tracked_plyo_contacts_this_week", 0))
+            tracked_sprint.append(practice_exposure.get("tracked_true_sprint_meters_this_week", 0))
+            completed_sprint.append(data.get("completed_sprint_sessions_this_week", 0))
+
+            for block in data.get("blocks", []):
+                for item in block.get("items", []):
+                    item_session.append(row)
+                    item_library.append(exercise_index.get(item.get("exercise_id", ""), -1))
+                    sets.append(item.get("sets", 0))
+                    reps.append(item.get("reps", 0))
+                    distance.append(item.get("distance_m") or 0.0)
+                    vmax = item.get("intensity_percent_vmax")
+                    intensity.append(np.nan if vmax is None else vmax)
+
+            counts.append(len(item_library) - offsets[-1])
+
+        return FlatBatch(
+            item_session=np.array(item_session, dtype=np.int64),
+            item_library=np.array(item_library, dtype=np.int64),
+            sets=np.array(sets, dtype=np.int64),
+            reps=np.array(reps, dtype=np.int64),
+            distance_m=np.array(distance, dtype=np.float64),
+            intensity_vmax=np.array(intensity, dtype=np.float64),
+            item_offsets=np.array(offsets, dtype=np.int64),
+            item_counts=np.array(counts, dtype=np.int64),
+            has_plan=np.array(has_plan, dtype=bool),
+            input_valid=np.array(input_valid, dtype=bool),
+            population=np.array(population, dtype=np.int64),
+            session_type=np.array(session_type, dtype=np.int64),
+            is_microsession=np.array(is_microsession, dtype=bool),
+            is_adult=np.array(is_adult, dtype=bool),
+            is_youth_13_17=np.array(is_youth_13_17, dtype=bool),
+            readiness=np.array(readiness, dtype=np.int64),
+            season_in_season=np.array(in_season, dtype=bool),
+            season_tier_1=np.array(tier_1, dtype=bool),
+            tracked_plyo=np.array(tracked_plyo, dtype=np.float64),
+            tracked_sprint=np.array(tracked_sprint, dtype=np.float64),
+            completed_sprint_sessions=np.array(completed_sprint, dtype=np.float64)
+        )
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+
+    def validate(self, inputs: Sequence[Dict]) -> BatchValidationResult:
+        """Validate a batch of EPA input contracts"""
+        standard = self.limits.standard
+        batch = self.flatten(inputs, standard)
+        n = len(batch.item_offsets)
+
+        segment_sum = _SegmentSum(batch.item_offsets, batch.item_counts, len(batch.item_library))
+
+        found = batch.item_library >= 0
+        lib = np.where(found, batch.item_library, 0)
+        band_level = np.where(found, self.lib_band_level[lib], -1)
+        has_e_node = found & self.lib_has_e_node[lib]
+        e_level = np.where(has_e_node, self.lib_e_level[lib], -1)
+        e_code = np.where(has_e_node, self.lib_e_code[lib], -1)
+
+        # Item totals (SessionBuilder._build_exercise)
+        reps_total = batch.sets * batch.reps
+        is_plyometric = found & self.lib_is_plyometric[lib]
+        item_contacts = np.where(
+            is_plyometric, np.trunc(reps_total * self.lib_plyo_contacts[lib]), 0.0
+        ).astype(np.int64)
+        counts_sprint = (batch.distance_m != 0) & (batch.intensity_vmax >= 90)
+        item_sprint = np.where(counts_sprint, reps_total * batch.distance_m, 0.0)
+
+        total_plyo = segment_sum(item_contacts)
+        total_sprint = segment_sum(item_sprint)
+
+        item_pop = batch.population[batch.item_session]
+        item_session_type = batch.session_type[batch.item_session]
+        item_readiness = batch.readiness[batch.item_session]
+
+        fail = np.zeros((n, len(GATE_IDS)), dtype=bool)
+        skip = np.zeros((n, len(GATE_IDS)), dtype=bool)
+
+        # Gate 0: library metadata
+        gate_0_items = (
+            ~found
+            | (found & self.lib_plyo_metadata_missing[lib])
+            | (found & self.lib_requires_intensity[lib] & np.isnan(batch.intensity_vmax))
+        )
+        fail[:, 0] = segment_sum(gate_0_items) > 0
+
+        # Gate 1: population band / E-node ceiling
+        max_band, max_e = self._ceiling_tables(standard)
+        cell = (item_pop * 2 + item_session_type) * 4 + item_readiness
+        item_max_band = max_band[cell]
+        item_max_e = max_e[cell]
+        band_exceeded = (band_level >= 0) & (item_max_band >= 0) & (band_level > item_max_band)
+        e_exceeded = has_e_node & (e_level >= 0) & (item_max_e >= 0) & (e_level > item_max_e)
+        fail[:, 1] = segment_sum(band_exceeded | e_exceeded) > 0
+
+        # Gate 2: season legality (Tier 1 forbids E3/E4)
+        tier_3_item = has_e_node & (e_level >= 3)
+        fail[:, 2] = batch.season_tier_1 & (segment_sum(tier_3_item) > 0)
+
+        # Gate 3: readiness modifiers
+        red = batch.readiness == 2
+        yellow = batch.readiness == 1
+        above_e2 = has_e_node & (e_level > 2)
+        fail[:, 3] = (
+            (red & ((total_plyo > 0) | (total_sprint > 0)))
+            | (yellow & (segment_sum(above_e2) > 0))
+        )
+
+        # Gate 4: Adult MicroSession rules
+        ms_rules = self.limits.get_microsession_adult_rules()
+        adult_ms = batch.is_microsession & batch.is_adult
+        allowed_codes = [self.e_node_codes[e] for e in ms_rules["allowed_e_nodes"] if e in self.e_node_codes]
+        e_node_illegal = has_e_node & ~np.isin(e_code, allowed_codes)
+        fail[:, 4] = adult_ms & (
+            (total_plyo > ms_rules["max_contacts"])
+            | (segment_sum(e_node_illegal) > 0)
+            | (total_sprint > 0)
+        )
+
+        # Gate 5: weekly caps projection
+        plyo_cap, sprint_cap, sprint_sessions_cap = self._weekly_cap_tables(standard)
+        projected_sprint_sessions = batch.completed_sprint_sessions + (total_sprint > 0)
+        fail[:, 5] = (
+            (batch.tracked_plyo + total_plyo > plyo_cap[batch.population])
+            | (batch.tracked_sprint + total_sprint > sprint_cap[batch.population])
+            | (projected_sprint_sessions > sprint_sessions_cap[batch.population])
+        )
+
+        # Gate 6: Tier 3 percentage (Youth 13-17 only)
+        tier_3_contacts = segment_sum(np.where(tier_3_item, item_contacts, 0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tier_3_pct = tier_3_contacts / total_plyo
+        skip[:, 6] = ~batch.is_youth_13_17
+        fail[:, 6] = ~skip[:, 6] & (total_plyo > 0) & (tier_3_pct > self.limits.get_tier_3_percentage_cap())
+
+        # No session plan: every gate skips
+        skip[~batch.has_plan, :] = True
+        fail[~batch.has_plan, :] = False
+
+        # Fail-fast: gates after the first failure never run
+        any_fail = fail.any(axis=1)
+        first_failed = np.where(any_fail, fail.argmax(axis=1), -1)
+        gate_status = np.where(fail, FAIL, np.where(skip, SKIP, PASS))
+        not_run = np.arange(len(GATE_IDS))[None, :] > np.where(any_fail, first_failed, len(GATE_IDS))[:, None]
+        gate_status[not_run] = NOT_RUN
+        gate_status[~batch.input_valid, :] = NOT_RUN
+        first_failed[~batch.input_valid] = -1
+
+        statuses = []
+        for valid, first in zip(batch.input_valid.tolist(), first_failed.tolist()):
+            if not valid:
+                statuses.append(ResponseStatus.REJECTED_MISSING_FIELDS.value)
+            elif first == 0:
+                statuses.append(ResponseStatus.QUARANTINED_REVIEW.value)
+            elif first > 0:
+                statuses.append(ResponseStatus.REJECTED_ILLEGAL.value)
+            else:
+                statuses.append(ResponseStatus.SUCCESS.value)
+
+        return BatchValidationResult(
+            gate_status=gate_status,
+            first_failed_gate=first_failed,
+            total_plyo_contacts=total_plyo,
+            total_sprint_meters=total_sprint,
+            statuses=statuses
+        )
+
+    def _ceiling_tables(self, standard) -> Tuple[np.ndarray, np.ndarray]:
+        """Band / E-node ceiling levels per (population, session_type, readiness) cell"""
+        max_band, max_e = [], []
+        for population in list(standard.populations) + [None]:
+            for session_type in standard.SESSION_TYPES:
+                for readiness in list(standard.READINESS_FLAGS) + [None]:
+                    caps = standard.session_caps_for(population, session_type, readiness)
+                    max_band.append(BAND_ORDER.get(caps.get("max_band", "Band_4"), -1))
+                    max_e.append(E_NODE_ORDER.get(caps.get("max_e_node", "E4"), -1))
+        return np.array(max_band, dtype=np.int64), np.array(max_e, dtype=np.int64)
+
+    def _weekly_cap_tables(self, standard) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Weekly caps per population row (last row = unknown population defaults)"""
+        plyo, sprint, sessions = [], [], []
+        for population in list(standard.populations) + [None]:
+            caps = standard.weekly_caps_for(population)
+            plyo.append(caps.get("plyo_contacts_per_week", 999999))
+            sprint.append(caps.get("sprint_meters_per_week", 999999))
+            sessions.append(caps.get("max_sprint_sessions_per_week", 3))
+        return (
+            np.array(plyo, dtype=np.float64),
+            np.array(sprint, dtype=np.float64),
+            np.array(sessions, dtype=np.float64)
+        )
+
+
+class _SegmentSum:
+    """np.add.reduceat over per-session item segments, with empty segments = 0"""
+
+    def __init__(self, offsets: np.ndarray, counts: np.ndarray, n_items: int):
+        self.empty = counts == 0
+        # reduceat needs in-range indices; a trailing zero absorbs empty tail segments
+        self.offsets = np.minimum(offsets, n_items)
+        self.n_items = n_items
+
+    def __call__(self, values: np.ndarray) -> np.ndarray:
+        if values.dtype == bool:
+            values = values.astype(np.int64)
+        padded = np.concatenate([values, np.zeros(1, dtype=values.dtype)])
+        if len(self.offsets) == 0:
+            return padded[:0]
+        sums = np.add.reduceat(padded, self.offsets)
+        sums[self.empty] = 0
+        return sums
@@ -19,9 +19,9 @@ Output: Strict JSON (no markdown)
 
 import json
 import csv
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field, fields, make_dataclass, MISSING
 from typing import List, Dict, Optional, Tuple
-from enum import Enum
+from enum import Enum, IntFlag
 
 
 # ============================================================================
@@ -72,6 +72,36 @@ class BlockType(Enum):
     CLEAR = "CLEAR"
 
 
+class LibraryMetadataFlag(IntFlag):
+    """Per-exercise metadata findings computed once at library load"""
+    # Gate 0 relevant
+    PLYO_CONTACTS_MISSING = 1      # plyometric without contacts-per-rep (quarantine)
+    REQUIRES_INTENSITY = 2         # sprint: each instance must carry intensity_percent_vmax
+    # Lint only (Gate 0 does not fail on these)
+    DUPLICATE_ID = 4               # exercise_id seen on an earlier row (later row wins)
+    BAND_MISSING = 8               # no load_standard_band; Gate 1 cannot enforce band ceiling
+    BAND_UNRECOGNISED = 16         # load_standard_band not Band_0..Band_4
+    E_NODE_UNRESOLVED = 32         # no E-node derived; Gates 1-6 cannot tier this exercise
+    PLYO_FLAG_MISMATCH = 64        # CSV is_plyometric disagrees with derived value
+    SPRINT_FLAG_MISMATCH = 128     # CSV is_sprint disagrees with derived value
+
+
+# Flag -> (reason code, description) for lint reports
+LIBRARY_METADATA_REASONS = {
+    LibraryMetadataFlag.PLYO_CONTACTS_MISSING: ("MISSING_PLYO_CONTACTS", "Plyometric exercise without plyo_contacts"),
+    LibraryMetadataFlag.REQUIRES_INTENSITY: ("REQUIRES_INTENSITY_VMAX", "Sprint exercise; sessions must supply intensity_percent_vmax"),
+    LibraryMetadataFlag.DUPLICATE_ID: ("DUPLICATE_EXERCISE_ID", "exercise_id repeated; earlier row overwritten"),
+    LibraryMetadataFlag.BAND_MISSING: ("MISSING_LOAD_STANDARD_BAND", "No load_standard_band; band ceiling not enforceable"),
+    LibraryMetadataFlag.BAND_UNRECOGNISED: ("UNRECOGNISED_LOAD_STANDARD_BAND", "load_standard_band not one of Band_0..Band_4"),
+    LibraryMetadataFlag.E_NODE_UNRESOLVED: ("UNRESOLVED_E_NODE", "No E-node derived from aether_difficulty"),
+    LibraryMetadataFlag.PLYO_FLAG_MISMATCH: ("PLYO_FLAG_MISMATCH", "CSV is_plyometric disagrees with plyo_contacts"),
+    LibraryMetadataFlag.SPRINT_FLAG_MISMATCH: ("SPRINT_FLAG_MISMATCH", "CSV is_sprint disagrees with derived sprint flag")
+}
+
+# Findings that quarantine an exercise (Gate 0 fails whenever it is referenced)
+LIBRARY_QUARANTINE_FLAGS = LibraryMetadataFlag.PLYO_CONTACTS_MISSING
+
+
 # ============================================================================
 # PHASE 2: DATA MODELS
 # ============================================================================
@@ -104,7 +134,7 @@ class Exercise:
     intensity_percent_vmax: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExerciseInstance:
     """Exercise with session-specific parameters"""
     exercise_id: str
@@ -123,7 +153,7 @@ class ExerciseInstance:
     intensity_percent_vmax: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionBlock:
     """One block of a session (PRIME/PREP/WORK/CLEAR)"""
     block_type: str
@@ -131,7 +161,7 @@ class SessionBlock:
     duration_minutes_target: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionPlan:
     """Complete session plan"""
     session_id: str
@@ -146,7 +176,7 @@ class SessionPlan:
     cns_category: str  # "HIGH" | "MODERATE" | "LOW"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationGateResult:
     """Result from a single validation gate"""
     gate_id: str
@@ -155,7 +185,7 @@ class ValidationGateResult:
     reasons: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklyAggregation:
     """Weekly load tracking"""
     week_id: str
@@ -173,6 +203,68 @@ class WeeklyAggregation:
     weekly_sprint_sessions_cap: int
 
 
+def _frozen_variant(cls):
+    """Frozen, slotted twin of a plan dataclass (same fields, same order)"""
+    specs = []
+    for f in fields(cls):
+        if f.default is MISSING:
+            specs.append((f.name, f.type))
+        else:
+            specs.append((f.name, f.type, field(default=f.default)))
+    
+    frozen_cls = make_dataclass(f"Frozen{cls.__name__}", specs, frozen=True, slots=True)
+    frozen_cls.__module__ = cls.__module__
+    frozen_cls.__doc__ = f"Immutable {cls.__name__}"
+    return frozen_cls
+
+
+# Immutable plan objects for sharing across threads/caches (see freeze_session_plan)
+FrozenExerciseInstance = _frozen_variant(ExerciseInstance)
+FrozenSessionBlock = _frozen_variant(SessionBlock)
+FrozenSessionPlan = _frozen_variant(SessionPlan)
+FrozenValidationGateResult = _frozen_variant(ValidationGateResult)
+FrozenWeeklyAggregation = _frozen_variant(WeeklyAggregation)
+
+def freeze_session_plan(plan: SessionPlan) -> FrozenSessionPlan:
+    """Deep-frozen copy of a SessionPlan (lists become tuples)"""
+    blocks = tuple(
+        FrozenSessionBlock(
+            block_type=block.block_type,
+            exercises=tuple(
+                FrozenExerciseInstance(
+                    exercise_id=ex.exercise_id,
+                    exercise_name=ex.exercise_name,
+                    sets=ex.sets,
+                    reps=ex.reps,
+                    rest_seconds=ex.rest_seconds,
+                    load=ex.load,
+                    rpe_target=ex.rpe_target,
+                    coaching_cues=tuple(ex.coaching_cues),
+                    total_contacts=ex.total_contacts,
+                    total_sprint_meters=ex.total_sprint_meters,
+                    distance_m=ex.distance_m,
+                    intensity_percent_vmax=ex.intensity_percent_vmax
+                )
+                for ex in block.exercises
+            ),
+            duration_minutes_target=block.duration_minutes_target
+        )
+        for block in plan.blocks
+    )
+    return FrozenSessionPlan(
+        session_id=plan.session_id,
+        client_id=plan.client_id,
+        week_id=plan.week_id,
+        session_index=plan.session_index,
+        session_type=plan.session_type,
+        blocks=blocks,
+        total_plyo_contacts=plan.total_plyo_contacts,
+        total_sprint_meters=plan.total_sprint_meters,
+        total_duration_minutes=plan.total_duration_minutes,
+        cns_category=plan.cns_category
+    )
+
+
 # ============================================================================
 # PHASE 3: EXERCISE LIBRARY LOADER
 # ============================================================================
@@ -180,17 +272,96 @@ class WeeklyAggregation:
 class ExerciseLibrary:
     """Loads and queries AETHER Exercise Library CSV"""
     
+    BAND_LEVELS = ("Band_0", "Band_1", "Band_2", "Band_3", "Band_4")
+    
     def __init__(self, csv_path: str):
+        self.csv_path = csv_path
         self.exercises: Dict[str, Exercise] = {}
+        # Per-exercise LibraryMetadataFlag bitmap, computed once at load
+        self.metadata_flags: Dict[str, int] = {}
+        self.rows_read = 0
         self._load_csv(csv_path)
     
     def _load_csv(self, csv_path: str):
-        """Load exercises from CSV"""
+        """Load exercises from CSV and run the metadata validation pass"""
         with open(csv_path, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
                 exercise = self._parse_row(row)
+                flags = self._row_flags(row, exercise)
+                if exercise.exercise_id in self.exercises:
+                    flags |= LibraryMetadataFlag.DUPLICATE_ID
                 self.exercises[exercise.exercise_id] = exercise
+                self.metadata_flags[exercise.exercise_id] = int(flags)
+                self.rows_read += 1
+    
+    def _row_flags(self, row: Dict, exercise: Exercise) -> LibraryMetadataFlag:
+        """Metadata findings for one parsed row"""
+        flags = self._exercise_flags(exercise)
+        
+        csv_plyo = row.get('is_plyometric')
+        if csv_plyo and (csv_plyo.strip().lower() == 'true') != exercise.is_plyometric:
+            flags |= LibraryMetadataFlag.PLYO_FLAG_MISMATCH
+        
+        csv_sprint = row.get('is_sprint')
+        if csv_sprint and (csv_sprint.strip().lower() == 'true') != exercise.is_sprint:
+            flags |= LibraryMetadataFlag.SPRINT_FLAG_MISMATCH
+        
+        return flags
+    
+    def _exercise_flags(self, exercise: Exercise) -> LibraryMetadataFlag:
+        """Metadata findings derivable from the parsed exercise alone"""
+        flags = LibraryMetadataFlag(0)
+        
+        if exercise.is_plyometric and (exercise.plyo_contacts is None or exercise.plyo_contacts == 0):
+            flags |= LibraryMetadataFlag.PLYO_CONTACTS_MISSING
+        if exercise.is_sprint:
+            flags |= LibraryMetadataFlag.REQUIRES_INTENSITY
+        if not exercise.load_standard_band:
+            flags |= LibraryMetadataFlag.BAND_MISSING
+        elif exercise.load_standard_band not in self.BAND_LEVELS:
+            flags |= LibraryMetadataFlag.BAND_UNRECOGNISED
+        if not exercise.e_node:
+            flags |= LibraryMetadataFlag.E_NODE_UNRESOLVED
+        
+        return flags
+    
+    def revalidate(self):
+        """Recompute flags after exercises were modified in place (CSV-only findings are kept)"""
+        csv_only = LibraryMetadataFlag.DUPLICATE_ID | LibraryMetadataFlag.PLYO_FLAG_MISMATCH | LibraryMetadataFlag.SPRINT_FLAG_MISMATCH
+        for exercise_id, exercise in self.exercises.items():
+            kept = self.metadata_flags.get(exercise_id, 0) & csv_only
+            self.metadata_flags[exercise_id] = int(self._exercise_flags(exercise) | kept)
+    
+    def lint_report(self) -> Dict:
+        """Library lint report from the load-time validation pass"""
+        counts = {code: 0 for code, _ in LIBRARY_METADATA_REASONS.values()}
+        findings = []
+        quarantined = []
+        
+        for exercise_id, flags in self.metadata_flags.items():
+            if not flags:
+                continue
+            codes = [code for flag, (code, _) in LIBRARY_METADATA_REASONS.items() if flags & flag]
+            for code in codes:
+                counts[code] += 1
+            findings.append({"exercise_id": exercise_id, "flags": flags, "reasons": codes})
+            if flags & LIBRARY_QUARANTINE_FLAGS:
+                quarantined.append(exercise_id)
+        
+        return {
+            "library_path": str(self.csv_path),
+            "rows_read": self.rows_read,
+            "exercises": len(self.exercises),
+            "exercises_with_findings": len(findings),
+            "quarantined_exercise_ids": quarantined,
+            "finding_counts": counts,
+            "reason_table": {
+                code: {"flag": int(flag), "description": description}
+                for flag, (code, description) in LIBRARY_METADATA_REASONS.items()
+            },
+            "findings": findings
+        }
     
     def _parse_row(self, row: Dict) -> Exercise:
         """Parse CSV row into Exercise object"""
@@ -251,13 +422,116 @@ class ExerciseLibrary:
 
 
 # ============================================================================
-# PHASE 4: LIMIT MANAGER (LOAD STANDARDS v2.1.2)
+# PHASE 4: LIMIT MANAGER (LOAD STANDARDS)
 # ============================================================================
 
+class CompiledLoadStandard:
+    """
+    Load Standards document compiled into dense integer-indexed tables.
+    
+    Cells are laid out over (population, session_type, readiness) for session
+    caps and (population, season) for seasonal operating ranges, so every
+    lookup is one dict probe per axis plus a list index.
+    """
+    
+    SESSION_TYPES = ("FULL_SESSION", "MICROSESSION")
+    # Trailing slot holds the unmodified (1.0x) caps for unknown readiness flags
+    READINESS_FLAGS = ("GREEN", "YELLOW", "RED")
+    SEASONS = tuple(s.value for s in SeasonType)
+    
+    def __init__(self, standard: Dict):
+        self.source = standard
+        self.version = standard["version"]
+        self.inherits_from = standard.get("inherits_from")
+        self.microsession_adult_rules = dict(standard["microsession_adult_rules"])
+        self.readiness_modifiers = dict(standard["readiness_modifiers"])
+        self.tier_3_percentage_cap_youth_13_17 = standard["tier_3_percentage_cap_youth_13_17"]
+        
+        session_caps = standard["population_session_caps"]
+        weekly_caps = standard["population_weekly_caps"]
+        seasonal_ranges = standard["seasonal_operating_ranges"]
+        
+        self.populations = tuple(session_caps)
+        self.population_index = {p: i for i, p in enumerate(self.populations)}
+        self.readiness_index = {r: i for i, r in enumerate(self.READINESS_FLAGS)}
+        self.season_index = {s: i for i, s in enumerate(self.SEASONS)}
+        
+        multipliers = [
+            self.readiness_modifiers.get(r, {}).get("multiplier", 1.0)
+            for r in self.READINESS_FLAGS
+        ] + [1.0]
+        
+        self._n_session_types = len(self.SESSION_TYPES)
+        self._n_readiness = len(multipliers)
+        self._n_seasons = len(self.SEASONS)
+        
+        self.session_caps: List[Dict] = []
+        self.weekly_caps: List[Dict] = []
+        self.seasonal_ranges: List[Dict] = []
+        
+        for population in self.populations:
+            base = session_caps[population]
+            for session_type in self.SESSION_TYPES:
+                plyo_cap = self._base_plyo_cap(population, session_type, base)
+                for multiplier in multipliers:
+                    self.session_caps.append({
+                        "plyo_contacts_cap": int(plyo_cap * multiplier),
+                        "sprint_meters_cap": int(base["sprint_meters_per_session"] * multiplier),
+                        "max_band": base["max_band"],
+                        "max_node": base["max_node"],
+                        "max_e_node": base["max_e_node"]
+                    })
+            
+            self.weekly_caps.append(dict(weekly_caps.get(population, {})))
+            
+            ranges = seasonal_ranges.get(population, {})
+            for season in self.SEASONS:
+                self.seasonal_ranges.append(dict(ranges.get(season, {})))
+    
+    def _base_plyo_cap(self, population: str, session_type: str, base: Dict) -> int:
+        """Session plyo cap before readiness modifiers"""
+        if session_type == "FULL_SESSION":
+            return base["plyo_contacts_per_session_full"]
+        if population == "Adult":
+            # Special rule: Adult MS = 60 contacts (not 0.7x)
+            return self.microsession_adult_rules["max_contacts"]
+        # Athlete MS = 70% of full session cap
+        return base["plyo_contacts_per_session_microsession"]
+    
+    def session_caps_for(self, population: str, session_type: str, readiness: str) -> Dict:
+        """Session caps cell; anything other than FULL_SESSION is a MicroSession"""
+        p = self.population_index.get(population)
+        if p is None:
+            return {}
+        s = 0 if session_type == "FULL_SESSION" else 1
+        r = self.readiness_index.get(readiness, self._n_readiness - 1)
+        return dict(self.session_caps[(p * self._n_session_types + s) * self._n_readiness + r])
+    
+    def weekly_caps_for(self, population: str) -> Dict:
+        """Weekly caps cell"""
+        p = self.population_index.get(population)
+        if p is None:
+            return {}
+        return dict(self.weekly_caps[p])
+    
+    def seasonal_range_for(self, population: str, season_type: str) -> Dict:
+        """Seasonal operating range cell"""
+        p = self.population_index.get(population)
+        n = self.season_index.get(season_type)
+        if p is None or n is None:
+            return {}
+        return dict(self.seasonal_ranges[p * self._n_seasons + n])
+
+
 class LimitManager:
     """
-    Authoritative source for all caps, ceilings, and operating ranges
-    from Load Standards v2.1.2
+    Authoritative source for all caps, ceilings, and operating ranges.
+    
+    The class tables below are Load Standards v2.1.2 (Layer 2 dose control).
+    They are compiled once into a CompiledLoadStandard. A LimitManager built
+    with a standard (JSON path, document or compiled) keeps it on the
+    instance; one built without follows the process-wide standard, which
+    activate_standard() swaps at runtime without a restart.
     """
     
     # Population-specific session caps
@@ -307,31 +581,32 @@ class LimitManager:
         }
     }
     
-    # Seasonal operating ranges (weekly targets)
+    # Seasonal operating ranges (weekly targets), by population then season
     SEASONAL_OPERATING_RANGES = {
-        # Youth 8-12
-        "Youth_8_12_OFF_SEASON": {"plyo_min": 80, "plyo_max": 160, "sprint_min": 150, "sprint_max": 300},
-        "Youth_8_12_PRE_SEASON": {"plyo_min": 120, "plyo_max": 200, "sprint_min": 200, "sprint_max": 400},
-        "Youth_8_12_IN_SEASON_TIER_1": {"plyo_min": 40, "plyo_max": 100, "sprint_min": 100, "sprint_max": 250},
-        "Youth_8_12_IN_SEASON_TIER_2": {"plyo_min": 60, "plyo_max": 140, "sprint_min": 150, "sprint_max": 300},
-        "Youth_8_12_IN_SEASON_TIER_3": {"plyo_min": 80, "plyo_max": 180, "sprint_min": 200, "sprint_max": 350},
-        "Youth_8_12_POST_SEASON": {"plyo_min": 20, "plyo_max": 80, "sprint_min": 50, "sprint_max": 150},
-        
-        # Youth 13-17
-        "Youth_13_17_OFF_SEASON": {"plyo_min": 120, "plyo_max": 240, "sprint_min": 200, "sprint_max": 500},
-        "Youth_13_17_PRE_SEASON": {"plyo_min": 160, "plyo_max": 240, "sprint_min": 300, "sprint_max": 500},
-        "Youth_13_17_IN_SEASON_TIER_1": {"plyo_min": 60, "plyo_max": 140, "sprint_min": 150, "sprint_max": 300},
-        "Youth_13_17_IN_SEASON_TIER_2": {"plyo_min": 100, "plyo_max": 180, "sprint_min": 200, "sprint_max": 400},
-        "Youth_13_17_IN_SEASON_TIER_3": {"plyo_min": 120, "plyo_max": 220, "sprint_min": 250, "sprint_max": 450},
-        "Youth_13_17_POST_SEASON": {"plyo_min": 40, "plyo_max": 100, "sprint_min": 100, "sprint_max": 200},
-        
-        # Adult
-        "Adult_OFF_SEASON": {"plyo_min": 150, "plyo_max": 300, "sprint_min": 250, "sprint_max": 600},
-        "Adult_PRE_SEASON": {"plyo_min": 200, "plyo_max": 300, "sprint_min": 400, "sprint_max": 600},
-        "Adult_IN_SEASON_TIER_1": {"plyo_min": 80, "plyo_max": 180, "sprint_min": 200, "sprint_max": 400},
-        "Adult_IN_SEASON_TIER_2": {"plyo_min": 120, "plyo_max": 220, "sprint_min": 300, "sprint_max": 500},
-        "Adult_IN_SEASON_TIER_3": {"plyo_min": 150, "plyo_max": 270, "sprint_min": 350, "sprint_max": 550},
-        "Adult_POST_SEASON": {"plyo_min": 60, "plyo_max": 120, "sprint_min": 150, "sprint_max": 300}
+        "Youth_8_12": {
+            "OFF_SEASON": {"plyo_min": 80, "plyo_max": 160, "sprint_min": 150, "sprint_max": 300},
+            "PRE_SEASON": {"plyo_min": 120, "plyo_max": 200, "sprint_min": 200, "sprint_max": 400},
+            "IN_SEASON_TIER_1": {"plyo_min": 40, "plyo_max": 100, "sprint_min": 100, "sprint_max": 250},
+            "IN_SEASON_TIER_2": {"plyo_min": 60, "plyo_max": 140, "sprint_min": 150, "sprint_max": 300},
+            "IN_SEASON_TIER_3": {"plyo_min": 80, "plyo_max": 180, "sprint_min": 200, "sprint_max": 350},
+            "POST_SEASON": {"plyo_min": 20, "plyo_max": 80, "sprint_min": 50, "sprint_max": 150}
+        },
+        "Youth_13_17": {
+            "OFF_SEASON": {"plyo_min": 120, "plyo_max": 240, "sprint_min": 200, "sprint_max": 500},
+            "PRE_SEASON": {"plyo_min": 160, "plyo_max": 240, "sprint_min": 300, "sprint_max": 500},
+            "IN_SEASON_TIER_1": {"plyo_min": 60, "plyo_max": 140, "sprint_min": 150, "sprint_max": 300},
+            "IN_SEASON_TIER_2": {"plyo_min": 100, "plyo_max": 180, "sprint_min": 200, "sprint_max": 400},
+            "IN_SEASON_TIER_3": {"plyo_min": 120, "plyo_max": 220, "sprint_min": 250, "sprint_max": 450},
+            "POST_SEASON": {"plyo_min": 40, "plyo_max": 100, "sprint_min": 100, "sprint_max": 200}
+        },
+        "Adult": {
+            "OFF_SEASON": {"plyo_min": 150, "plyo_max": 300, "sprint_min": 250, "sprint_max": 600},
+            "PRE_SEASON": {"plyo_min": 200, "plyo_max": 300, "sprint_min": 400, "sprint_max": 600},
+            "IN_SEASON_TIER_1": {"plyo_min": 80, "plyo_max": 180, "sprint_min": 200, "sprint_max": 400},
+            "IN_SEASON_TIER_2": {"plyo_min": 120, "plyo_max": 220, "sprint_min": 300, "sprint_max": 500},
+            "IN_SEASON_TIER_3": {"plyo_min": 150, "plyo_max": 270, "sprint_min": 350, "sprint_max": 550},
+            "POST_SEASON": {"plyo_min": 60, "plyo_max": 120, "sprint_min": 150, "sprint_max": 300}
+        }
     }
     
     # MicroSession special rules (Adult only)
@@ -354,47 +629,116 @@ class LimitManager:
     # Youth 13-17 Tier 3 percentage cap
     TIER_3_PERCENTAGE_CAP_YOUTH_13_17 = 0.40  # 40% max
     
-    @staticmethod
-    def get_session_caps(population: str, session_type: str, readiness: str) -> Dict:
-        """Get session-level caps for a given context"""
-        base_caps = LimitManager.POPULATION_SESSION_CAPS.get(population, {})
-        
-        if not base_caps:
-            return {}
-        
-        # Determine plyo contact cap based on session type
-        if session_type == "FULL_SESSION":
-            plyo_cap = base_caps["plyo_contacts_per_session_full"]
-        else:  # MICROSESSION
-            if population == "Adult":
-                # Special rule: Adult MS = 60 contacts (not 0.7x)
-                plyo_cap = LimitManager.MICROSESSION_ADULT_RULES["max_contacts"]
-            else:
-                # Athlete MS = 70% of full session cap
-                plyo_cap = base_caps["plyo_contacts_per_session_microsession"]
-        
-        # Apply readiness modifier
-        readiness_mod = LimitManager.READINESS_MODIFIERS.get(readiness, {})
-        multiplier = readiness_mod.get("multiplier", 1.0)
-        
+    # Dose-control keys a standard document may restate; absent keys are inherited
+    DOSE_CONTROL_KEYS = (
+        "population_session_caps",
+        "population_weekly_caps",
+        "seasonal_operating_ranges",
+        "microsession_adult_rules",
+        "readiness_modifiers",
+        "tier_3_percentage_cap_youth_13_17"
+    )
+    
+    _active: Optional[CompiledLoadStandard] = None
+    
+    @classmethod
+    def baseline_standard(cls) -> Dict:
+        """Load Standards v2.1.2 as a standard document"""
         return {
-            "plyo_contacts_cap": int(plyo_cap * multiplier),
-            "sprint_meters_cap": int(base_caps["sprint_meters_per_session"] * multiplier),
-            "max_band": base_caps["max_band"],
-            "max_node": base_caps["max_node"],
-            "max_e_node": base_caps["max_e_node"]
+            "version": "2.1.2",
+            "population_session_caps": cls.POPULATION_SESSION_CAPS,
+            "population_weekly_caps": cls.POPULATION_WEEKLY_CAPS,
+            "seasonal_operating_ranges": cls.SEASONAL_OPERATING_RANGES,
+            "microsession_adult_rules": cls.MICROSESSION_ADULT_RULES,
+            "readiness_modifiers": cls.READINESS_MODIFIERS,
+            "tier_3_percentage_cap_youth_13_17": cls.TIER_3_PERCENTAGE_CAP_YOUTH_13_17
         }
     
-    @staticmethod
-    def get_weekly_caps(population: str) -> Dict:
+    @classmethod
+    def standard_from_json(cls, json_path: str) -> Dict:
+        """
+        Read a Load Standards JSON (e.g. EFL_LOAD_STANDARDS_v2_2_0.json).
+        
+        v2.2.0 adds Layer 3 (F-V bias) and keeps every earlier safety gate, so
+        it does not restate the dose-control tables. Tables found under a
+        "doseControl" section override the v2.1.2 baseline; the rest are
+        inherited from it, so the result does not depend on what was loaded
+        before.
+        """
+        with open(json_path, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+        
+        standard = cls.baseline_standard()
+        dose_control = document.get("doseControl", {})
+        for key in cls.DOSE_CONTROL_KEYS:
+            if key in dose_control:
+                standard[key] = dose_control[key]
+        
+        standard["version"] = document.get("meta", {}).get("version", standard["version"])
+        standard["inherits_from"] = "2.1.2"
+        return standard
+    
+    @classmethod
+    def compile_standard(cls, source) -> CompiledLoadStandard:
+        """Compile a standard (JSON path, standard document or compiled standard) without activating it"""
+        if isinstance(source, CompiledLoadStandard):
+            return source
+        standard = cls.standard_from_json(source) if isinstance(source, str) else source
+        return CompiledLoadStandard(standard)
+    
+    @classmethod
+    def activate_standard(cls, source) -> CompiledLoadStandard:
+        """
+        Compile a standard and make it the process-wide standard.
+        
+        Affects every LimitManager built without its own standard. Compilation
+        happens before the swap, so concurrent lookups see either the old or
+        the new tables, never a partial state.
+        """
+        compiled = cls.compile_standard(source)
+        cls._active = compiled
+        return compiled
+    
+    @classmethod
+    def active_standard(cls) -> CompiledLoadStandard:
+        """Process-wide compiled standard (v2.1.2 until activate_standard is called)"""
+        compiled = cls._active
+        if compiled is None:
+            compiled = cls.activate_standard(cls.baseline_standard())
+        return compiled
+    
+    def __init__(self, standard=None):
+        """
+        Args:
+            standard: Optional standard (JSON path, document or compiled) this
+                manager keeps; None follows the process-wide standard
+        """
+        self._standard = self.compile_standard(standard) if standard is not None else None
+    
+    @property
+    def standard(self) -> CompiledLoadStandard:
+        """Compiled standard this manager enforces"""
+        return self._standard if self._standard is not None else self.active_standard()
+    
+    def get_session_caps(self, population: str, session_type: str, readiness: str) -> Dict:
+        """Get session-level caps for a given context"""
+        return self.standard.session_caps_for(population, session_type, readiness)
+    
+    def get_weekly_caps(self, population: str) -> Dict:
         """Get weekly caps for a population"""
-        return LimitManager.POPULATION_WEEKLY_CAPS.get(population, {})
+        return self.standard.weekly_caps_for(population)
     
-    @staticmethod
-    def get_seasonal_range(population: str, season_type: str) -> Dict:
+    def get_seasonal_range(self, population: str, season_type: str) -> Dict:
         """Get seasonal operating range"""
-        key = f"{population}_{season_type}"
-        return LimitManager.SEASONAL_OPERATING_RANGES.get(key, {})
+        return self.standard.seasonal_range_for(population, season_type)
+    
+    def get_microsession_adult_rules(self) -> Dict:
+        """Get Adult MicroSession special rules"""
+        return self.standard.microsession_adult_rules
+    
+    def get_tier_3_percentage_cap(self) -> float:
+        """Get Youth 13-17 Tier 3 percentage cap"""
+        return self.standard.tier_3_percentage_cap_youth_13_17
 
 
 # ============================================================================
@@ -511,23 +855,23 @@ class ValidationGates:
             )
         
         reasons = []
+        metadata_flags = self.library.metadata_flags
         
         for block in session_plan.blocks:
             for ex in block.exercises:
-                # Check exercise exists in library
-                library_ex = self.library.get_exercise(ex.exercise_id)
+                # Flags precomputed at library load; absent = not in library
+                flags = metadata_flags.get(ex.exercise_id)
                 
-                if not library_ex:
+                if flags is None:
                     reasons.append(f"MISSING_EXERCISE: {ex.exercise_id} not found in library")
                     continue
                 
                 # Check for required metadata (plyometric exercises)
-                if library_ex.is_plyometric:
-                    if library_ex.plyo_contacts is None or library_ex.plyo_contacts == 0:
-                        reasons.append(f"MISSING_PLYO_CONTACTS: {ex.exercise_id}")
+                if flags & LibraryMetadataFlag.PLYO_CONTACTS_MISSING:
+                    reasons.append(f"MISSING_PLYO_CONTACTS: {ex.exercise_id}")
                 
                 # Check for sprint intensity metadata
-                if library_ex.is_sprint and ex.intensity_percent_vmax is None:
+                if flags & LibraryMetadataFlag.REQUIRES_INTENSITY and ex.intensity_percent_vmax is None:
                     reasons.append(f"MISSING_INTENSITY_VMAX: {ex.exercise_id} (sprint requires intensity)")
         
         status = "FAIL" if reasons else "PASS"
@@ -672,7 +1016,7 @@ class ValidationGates:
         if session_type == "MICROSESSION":
             # Adult MicroSession special rules
             if population == "Adult":
-                ms_rules = self.limits.MICROSESSION_ADULT_RULES
+                ms_rules = self.limits.get_microsession_adult_rules()
                 
                 # Check contacts (60 max)
                 if session_plan.total_plyo_contacts > ms_rules["max_contacts"]:
@@ -796,7 +1140,7 @@ class ValidationGates:
         
         if total_plyo_contacts > 0:
             tier_3_percentage = tier_3_contacts / total_plyo_contacts
-            max_percentage = self.limits.TIER_3_PERCENTAGE_CAP_YOUTH_13_17
+            max_percentage = self.limits.get_tier_3_percentage_cap()
             
             if tier_3_percentage > max_percentage:
                 reasons.append(
@@ -1048,7 +1392,12 @@ class ResponseBuilder:
     
     @staticmethod
     def _serialize_session(session: SessionPlan) -> Dict:
-        """Serialize session plan to dict"""
+        """
+        Serialize session plan to dict.
+        
+        Explicit field-by-field literals (no asdict/__dict__ reflection) - the
+        fastest form in CPython, and works unchanged on the Frozen* variants.
+        """
         return {
             "session_id": session.session_id,
             "client_id": session.client_id,
@@ -1126,9 +1475,24 @@ class EFLProgramArchitect:
     Coordinates all phases: validation â†’ session building â†’ gate checking â†’ response
     """
     
-    def __init__(self, library_csv_path: str):
+    def __init__(self, library_csv_path: str, load_standards_path: Optional[str] = None, ledger=None,
+                 state_store=None):
+        """
+        Args:
+            library_csv_path: Exercise Library CSV
+            load_standards_path: Optional Load Standards JSON this architect
+                enforces (other architects keep their own standard)
+            ledger: Optional ExposureLedger; when set, each weekly exposure field
+                is the larger of the caller's value and the ledger's, and approved
+                sessions are recorded
+            state_store: Optional ClientStateStore; when set, client context the
+                caller omits (population, sport, season, readiness, injury flags)
+                is read from the stored client state
+        """
         self.library = ExerciseLibrary(library_csv_path)
-        self.limits = LimitManager()
+        self.limits = LimitManager(load_standards_path)
+        self.ledger = ledger
+        self.state_store = state_store
         self.gates = ValidationGates(self.library, self.limits)
         self.session_builder = SessionBuilder(self.library)
     
@@ -1151,6 +1515,12 @@ class EFLProgramArchitect:
                 "weekly_aggregation": None
             }, indent=2)
         
+        # Step 0: Client context (caller-supplied values win) and weekly exposure from the stores
+        if self.state_store is not None:
+            input_data = self._apply_client_state(input_data)
+        if self.ledger is not None:
+            input_data = self._apply_ledger_totals(input_data)
+        
         # Step 1: Validate input contract
         is_valid, missing_fields = InputValidator.validate(input_data)
         if not is_valid:
@@ -1192,8 +1562,59 @@ class EFLProgramArchitect:
             computed_limits
         )
         
+        # Step 8: Record the approved session so later sessions see it in Gate 5
+        if self.ledger is not None and session_plan is not None:
+            self.ledger.record_session(
+                client_id=input_data["client_id"],
+                week_id=input_data["week_id"],
+                session_id=session_plan.session_id or f"{input_data['week_id']}#{input_data['session_index']}",
+                plyo_contacts=session_plan.total_plyo_contacts,
+                sprint_meters=session_plan.total_sprint_meters
+            )
+        
         return json.dumps(response, indent=2)
     
+    def _apply_client_state(self, input_data: Dict) -> Dict:
+        """Fill client context fields the caller did not supply from the state store"""
+        client_id = input_data.get("client_id")
+        if not client_id:
+            return input_data
+        
+        merged = dict(input_data)
+        for field, value in self.state_store.epa_context(client_id).items():
+            if merged.get(field) is None:
+                merged[field] = value
+        
+        return merged
+    
+    def _apply_ledger_totals(self, input_data: Dict) -> Dict:
+        """
+        Take each weekly exposure field as the larger of the caller's value and the ledger's.
+        
+        Both are running totals over the same week: clients that predate the
+        ledger send tracked totals that already cover the approved sessions
+        the ledger recorded, so summing them would count those sessions twice.
+        A total can only have grown since either side last saw it, so the
+        larger one is the most complete.
+        """
+        client_id = input_data.get("client_id")
+        week_id = input_data.get("week_id")
+        if not client_id or not week_id:
+            return input_data
+        
+        ledger_inputs = self.ledger.gate_5_inputs(client_id, week_id)
+        merged = dict(input_data)
+        
+        practice_exposure = dict(input_data.get("practice_exposure") or {})
+        for field, value in ledger_inputs.pop("practice_exposure").items():
+            practice_exposure[field] = max(practice_exposure.get(field) or 0, value)
+        merged["practice_exposure"] = practice_exposure
+        
+        for field, value in ledger_inputs.items():
+            merged[field] = value if merged.get(field) is None else max(merged[field], value)
+        
+        return merged
+    
     def _compute_limits(self, input_data: Dict) -> Dict:
         """Compute all applicable limits for this context"""
         population = input_data.get("population")
@@ -1201,9 +1622,10 @@ class EFLProgramArchitect:
         season_type = input_data.get("season_type")
         readiness = input_data.get("readiness_flag")
         
-        session_caps = self.limits.get_session_caps(population, session_type, readiness)
-        weekly_caps = self.limits.get_weekly_caps(population)
-        seasonal_range = self.limits.get_seasonal_range(population, season_type)
+        standard = self.limits.standard
+        session_caps = standard.session_caps_for(population, session_type, readiness)
+        weekly_caps = standard.weekly_caps_for(population)
+        seasonal_range = standard.seasonal_range_for(population, season_type)
         
         return {
             "population": population,
@@ -1212,7 +1634,8 @@ class EFLProgramArchitect:
             "readiness_flag": readiness,
             "session_caps": session_caps,
             "weekly_caps": weekly_caps,
-            "seasonal_operating_range": seasonal_range
+            "seasonal_operating_range": seasonal_range,
+            "load_standards_version": standard.version
         }
     
     def _build_weekly_aggregation(self, input_data: Dict, session_plan: Optional[SessionPlan]) -> WeeklyAggregation:
@@ -1254,6 +1677,14 @@ class EFLProgramArchitect:
 # ============================================================================
 
 if __name__ == "__main__":
+    import sys
+    
+    # Library lint: python epa_v2_2_full.py path/to/library.csv
+    if len(sys.argv) > 1:
+        print(json.dumps(ExerciseLibrary(sys.argv[1]).lint_report(), indent=2))
+        sys.exit(0)
+    
     print("EFL Program Architect v2.2 - Loaded")
     print("Use: epa = EFLProgramArchitect('path/to/library.csv')")
     print("Then: response = epa.process(json_string)")
+    print("Lint: python epa_v2_2_full.py path/to/library.csv")
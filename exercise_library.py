@@ -12,7 +12,7 @@ class ExerciseLibrary:
     
     def __init__(self, csv_path: str = None):
         if csv_path is None:
-            csv_path = Path(__file__).parent.parent / "data" / "EFL_Exercise_Library_v2_5.csv"
+            csv_path = Path(__file__).parent / "EFL_Exercise_Library_v2_5.csv"
         
         self.df = pd.read_csv(csv_path)
         print(f"✅ Loaded {len(self.df)} exercises from Exercise Library v2.5")
@@ -0,0 +1,252 @@
+"""
+Per-athlete weekly exposure ledger for EPA Gate 5.
+
+Append-only record of approved sessions and tracked practice exposure keyed by
+(client_id, week_id), with running weekly totals maintained in the same
+transaction so Gate 5 projection reads one row instead of re-scanning history.
+
+Backend: local SQLite (WAL journal, synchronous=FULL) - every append and its
+totals update commit atomically, so a crash leaves either both or neither.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+
+# Reserved session_id for rows folded together by compact()
+COMPACTED_SESSION_ID = "__COMPACTED__"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS exposure_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    client_id TEXT NOT NULL,
+    week_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    source TEXT NOT NULL,
+    plyo_contacts INTEGER NOT NULL,
+    sprint_meters REAL NOT NULL,
+    sessions INTEGER NOT NULL,
+    sprint_sessions INTEGER NOT NULL,
+    recorded_at TEXT NOT NULL,
+    UNIQUE (client_id, week_id, session_id, source)
+);
+CREATE TABLE IF NOT EXISTS weekly_totals (
+    client_id TEXT NOT NULL,
+    week_id TEXT NOT NULL,
+    plyo_contacts INTEGER NOT NULL,
+    sprint_meters REAL NOT NULL,
+    sessions INTEGER NOT NULL,
+    sprint_sessions INTEGER NOT NULL,
+    PRIMARY KEY (client_id, week_id)
+) WITHOUT ROWID;
+"""
+
+
+class ExposureLedger:
+    """Append-only weekly exposure ledger with O(1) running totals"""
+
+    def __init__(self, db_path: str = ":memory:"):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the underlying database"""
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record_session(self,
+                       client_id: str,
+                       week_id: str,
+                       session_id: str,
+                       plyo_contacts: int,
+                       sprint_meters: float) -> bool:
+        """
+        Record an approved session.
+
+        Idempotent per (client_id, week_id, session_id): replaying the same
+        approval does not double-count. Returns True if the row was new.
+        """
+        return self._append(
+            client_id, week_id, session_id, "SESSION",
+            plyo_contacts, sprint_meters,
+            sessions=1,
+            sprint_sessions=1 if sprint_meters > 0 else 0
+        )
+
+    def record_practice(self,
+                        client_id: str,
+                        week_id: str,
+                        practice_id: str,
+                        plyo_contacts: int,
+                        sprint_meters: float) -> bool:
+        """Record tracked practice exposure (counts toward load, not sessions)"""
+        return self._append(
+            client_id, week_id, practice_id, "PRACTICE",
+            plyo_contacts, sprint_meters,
+            sessions=0,
+            sprint_sessions=0
+        )
+
+    def _append(self, client_id: str, week_id: str, session_id: str, source: str,
+                plyo_contacts: int, sprint_meters: float,
+                sessions: int, sprint_sessions: int) -> bool:
+        """Append one event and fold it into the weekly totals atomically"""
+        recorded_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO exposure_events "
+                    "(client_id, week_id, session_id, source, plyo_contacts, sprint_meters, "
+                    "sessions, sprint_sessions, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (client_id, week_id, session_id, source, int(plyo_contacts), float(sprint_meters),
+                     sessions, sprint_sessions, recorded_at)
+                )
+                inserted = cursor.rowcount == 1
+                if inserted:
+                    conn.execute(
+                        "INSERT INTO weekly_totals "
+                        "(client_id, week_id, plyo_contacts, sprint_meters, sessions, sprint_sessions) "
+                        "VALUES (?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT (client_id, week_id) DO UPDATE SET "
+                        "plyo_contacts = plyo_contacts + excluded.plyo_contacts, "
+                        "sprint_meters = sprint_meters + excluded.sprint_meters, "
+                        "sessions = sessions + excluded.sessions, "
+                        "sprint_sessions = sprint_sessions + excluded.sprint_sessions",
+                        (client_id, week_id, int(plyo_contacts), float(sprint_meters),
+                         sessions, sprint_sessions)
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        return inserted
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def weekly_totals(self, client_id: str, week_id: str) -> Dict:
+        """Running totals for one athlete-week (zeros if nothing recorded)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT plyo_contacts, sprint_meters, sessions, sprint_sessions "
+                "FROM weekly_totals WHERE client_id = ? AND week_id = ?",
+                (client_id, week_id)
+            ).fetchone()
+
+        if row is None:
+            row = (0, 0.0, 0, 0)
+
+        return {
+            "client_id": client_id,
+            "week_id": week_id,
+            "plyo_contacts": row[0],
+            "sprint_meters": row[1],
+            "sessions": row[2],
+            "sprint_sessions": row[3]
+        }
+
+    def gate_5_inputs(self, client_id: str, week_id: str) -> Dict:
+        """
+        Weekly totals in EPA input-contract form.
+
+        Practice exposure and previously approved sessions both count toward
+        the tracked weekly load that Gate 5 projects the current session onto.
+        """
+        totals = self.weekly_totals(client_id, week_id)
+        return {
+            "practice_exposure": {
+                "tracked_plyo_contacts_this_week": totals["plyo_contacts"],
+                "tracked_true_sprint_meters_this_week": totals["sprint_meters"]
+            },
+            "completed_sessions_this_week": totals["sessions"],
+            "completed_sprint_sessions_this_week": totals["sprint_sessions"]
+        }
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def compact(self, before_week_id: Optional[str] = None) -> int:
+        """
+        Fold the events of each athlete-week into a single summary row.
+
+        Only weeks sorting before before_week_id are compacted (all weeks if
+        None). Totals are unchanged, but replaying an individual session of a
+        compacted week is no longer recognised as a duplicate. Returns the
+        number of event rows removed.
+        """
+        where = "" if before_week_id is None else "WHERE week_id < ?"
+        params = () if before_week_id is None else (before_week_id,)
+        recorded_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                groups = conn.execute(
+                    "SELECT client_id, week_id, COUNT(*), SUM(plyo_contacts), SUM(sprint_meters), "
+                    "SUM(sessions), SUM(sprint_sessions) FROM exposure_events "
+                    f"{where} GROUP BY client_id, week_id HAVING COUNT(*) > 1",
+                    params
+                ).fetchall()
+
+                removed = 0
+                for client_id, week_id, count, plyo, sprint, sessions, sprint_sessions in groups:
+                    conn.execute(
+                        "DELETE FROM exposure_events WHERE client_id = ? AND week_id = ?",
+                        (client_id, week_id)
+                    )
+                    conn.execute(
+                        "INSERT INTO exposure_events "
+                        "(client_id, week_id, session_id, source, plyo_contacts, sprint_meters, "
+                        "sessions, sprint_sessions, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (client_id, week_id, COMPACTED_SESSION_ID, "COMPACTED",
+                         plyo, sprint, sessions, sprint_sessions, recorded_at)
+                    )
+                    removed += count - 1
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+            if removed:
+                conn.execute("VACUUM")
+
+        return removed
+
+    def rebuild_totals(self) -> int:
+        """Recompute weekly_totals from the event log; returns athlete-weeks written"""
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM weekly_totals")
+                cursor = conn.execute(
+                    "INSERT INTO weekly_totals "
+                    "(client_id, week_id, plyo_contacts, sprint_meters, sessions, sprint_sessions) "
+                    "SELECT client_id, week_id, SUM(plyo_contacts), SUM(sprint_meters), "
+                    "SUM(sessions), SUM(sprint_sessions) FROM exposure_events "
+                    "GROUP BY client_id, week_id"
+                )
+                written = cursor.rowcount
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        return written
@@ -5,8 +5,45 @@ Routes to appropriate generator based on project_id.
 This is the PRODUCTION entrypoint. Tests should import generator_fake directly.
 """
 
-import uuid
-from .timeutil import utc_now_z
+
+from importlib import import_module
+from typing import Callable, Dict, Tuple, Union
+
+
+PROJECT_REGISTRY_SPEC = "EFL_PROJECT_REGISTRY_v1.0"
+
+# projectid -> (module, function, takes_project_id); resolved on first use
+GENERATOR_PLUGINS: Dict[str, Tuple[str, str, bool]] = {
+    "R2P_ACL": ("generator_r2p_acl", "generate_r2p_acl_session", False),
+    "COURT_SPORT_FOUNDATIONS": ("generator_court", "generate_court_sport_session", False),
+    "ELASTIC_SPECIALIZATION": ("generator_specialization", "generate_specialization_session", True),
+    "DECEL_SPECIALIZATION": ("generator_specialization", "generate_specialization_session", True),
+}
+
+# Spellings callers use that don't normalize to a registry projectid
+PROJECT_ALIASES = {
+    "COURT": "COURT_SPORT_FOUNDATIONS",
+    "ELASTIC": "ELASTIC_SPECIALIZATION",
+    "DECEL": "DECEL_SPECIALIZATION",
+    "DECELERATION_SPECIALIZATION": "DECEL_SPECIALIZATION",
+}
+
+# Optional ClientStateStore the adapter pulls client context from
+_STATE_STORE = None
+
+_PROJECTS: Dict[str, dict] = {}
+_RESOLVED: Dict[str, Callable[[str, str, dict], dict]] = {}
+
+
+def configure_state_store(store) -> None:
+    """
+    Set (or clear, with None) the client state store used for context.
+
+    When set, generate_session() starts from store.session_context(client_id)
+    and overlays whatever context the caller passed.
+    """
+    global _STATE_STORE
+    _STATE_STORE = store
 
 
 def generate_session(client_id: str, project_id: str, session_date: str, context: dict = None) -> dict:
@@ -19,8 +56,10 @@ def generate_session(client_id: str, project_id: str, session_date: str, context
     Args:
         client_id: Unique athlete/client identifier
         project_id: Project enum value from schema ('R2P_ACL', 'COURT_SPORT_FOUNDATIONS', etc.)
+            or an alias such as 'R2P-ACL' / 'Court'
         session_date: ISO date when session is scheduled (YYYY-MM-DD)
         context: Optional dict with client_state, readiness, provider_notes, etc.
+            Keys given here override those read from the configured state store.
     
     Returns:
         dict: Schema-compliant SESSION artifact
@@ -29,96 +68,77 @@ def generate_session(client_id: str, project_id: str, session_date: str, context
         ValueError: If project_id is not supported
         RuntimeError: If generator fails
     """
-    context = context or {}
+    if _STATE_STORE is not None:
+        context = {**_STATE_STORE.session_context(client_id), **(context or {})}
+    else:
+        context = context or {}
     
-    # Project routing
-    if project_id in ("R2P-ACL", "R2P_ACL"):
-        return _generate_r2p_acl_session(client_id, session_date, context)
-    elif project_id in ("Court", "COURT_SPORT_FOUNDATIONS"):
-        return _generate_court_sport_session(client_id, session_date, context)
+    return resolve_generator(project_id)(client_id, session_date, context)
+
+
+def normalize_project_id(project_id: str) -> str:
+    """Registry projectid for any accepted spelling ('R2P-ACL', 'Court', 'r2p_acl', ...)"""
+    key = str(project_id).strip().upper().replace("-", "_").replace(" ", "_")
+    return PROJECT_ALIASES.get(key, key)
+
+
+def registered_projects() -> Dict[str, dict]:
+    """Projects of EFL_PROJECT_REGISTRY keyed by projectid (loaded once)"""
+    if not _PROJECTS:
+        from .spec_registry import default_registry
+        _PROJECTS.update(default_registry().get(PROJECT_REGISTRY_SPEC)["projects"])
+    return _PROJECTS
+
+
+def register_generator(project_id: str, target: Union[str, Callable], takes_project_id: bool = False) -> None:
+    """
+    Bind a registry project to its session generator.
+
+    target is either a callable or "module:function" (relative to this
+    package unless the module is dotted), imported on first use.
+    The callable is called as fn(client_id, session_date, context), or as
+    fn(project_id, client_id, session_date, context) when takes_project_id.
+    """
+    canonical = normalize_project_id(project_id)
+    if canonical not in registered_projects():
+        raise ValueError(f"Project '{project_id}' is not in {PROJECT_REGISTRY_SPEC}")
+    _RESOLVED.pop(canonical, None)
+    if callable(target):
+        GENERATOR_PLUGINS.pop(canonical, None)
+        _RESOLVED[canonical] = _bind(canonical, target, takes_project_id)
     else:
+        module, _, function = target.partition(":")
+        GENERATOR_PLUGINS[canonical] = (module, function, takes_project_id)
+
+
+def resolve_generator(project_id: str) -> Callable[[str, str, dict], dict]:
+    """Session generator for a project, imported on first use and cached"""
+    canonical = normalize_project_id(project_id)
+    generator = _RESOLVED.get(canonical)
+    if generator is not None:
+        return generator
+    if canonical not in registered_projects():
         raise ValueError(
             f"Unsupported project_id: '{project_id}'. "
-            f"Valid: R2P-ACL, R2P_ACL, Court, COURT_SPORT_FOUNDATIONS"
+            f"Valid: {', '.join(sorted(registered_projects()))}"
         )
+    plugin = GENERATOR_PLUGINS.get(canonical)
+    if plugin is None:
+        raise ValueError(
+            f"Unsupported project_id: '{project_id}' has no session generator yet. "
+            f"Valid: {', '.join(sorted(GENERATOR_PLUGINS))}"
+        )
+    module, function, takes_project_id = plugin
+    package = __name__.rpartition(".")[0] or None
+    imported = import_module(module if "." in module else f".{module}", package)
+    generator = _RESOLVED[canonical] = _bind(canonical, getattr(imported, function), takes_project_id)
+    return generator
 
 
-def _generate_r2p_acl_session(client_id: str, session_date: str, context: dict) -> dict:
-    """
-    Generate R2P-ACL session artifact.
-    
-    TODO: Wire to real R2P-ACL stage-based generator.
-    Currently returns minimal stub for testing adapter flow.
-    """
-    now = utc_now_z()
-    
-    # STUB: Replace with real R2P-ACL generator
-    # Expected inputs from context:
-    #   - client_state (stage, weeks_post_surgery, readiness, etc.)
-    #   - provider_clearances
-    #   - hardstop_flags
-    
-    return {
-        "header": {
-            "client_id": client_id,
-            "artifact_id": str(uuid.uuid4()),
-            "artifact_class": "SESSION",
-            "target": "COACH_SHEET",
-            "generated_at": now,
-            "project_id": "R2P_ACL",
-            "router_version": "ADAPTER_v0.0.1",
-            "state_last_updated": now,
-            "season_type": "OFF_SEASON",
-            "eligible_for_training_today": True,
-            "reason_codes": ["ADAPTER_STUB"]
-        },
-        "legality_snapshot": {
-            "active_project": "R2P_ACL",
-            "eligible": True,
-            "reason_codes": ["ADAPTER_STUB"]
-        },
-        "cap_proof": {
-            "caps_exist": True,
-            "population_enforced": "Youth_13_16",
-            "readiness_flag": "GREEN",
-            "weekly_multiplier": 1.0,
-            "session_multiplier": 1.0,
-            "weekly_contacts_cap_base": 150,
-            "weekly_contacts_cap_applied": 150,
-            "session_contacts_cap_base": 60,
-            "session_contacts_cap_applied": 60,
-            "enode_accent_cap_pct": 0.40,
-            "max_band_allowed_population": "Band3",
-            "max_enode_allowed_population": "E3"
-        },
-        "exposure_summary": {
-            "total_contacts": 0,  # STUB
-            "total_sets": 0
-        },
-        "content_payload": {
-            "session": {
-                "session_id": str(uuid.uuid4()),
-                "name": f"R2P-ACL Session - {client_id}",
-                "session_date": session_date,
-                "blocks": [],  # STUB: Real generator populates WORK blocks
-                "total_sets": 0
-            }
-        },
-        "metadata": {
-            "generator_version": "ADAPTER_R2P_v0.0.1",
-            "wrapper_version": "v1.1",
-            "outputspec_version": "v1.0",
-            "global_contract_version": "1.0.1",
-            "validation_timestamp": now
-        }
-    }
-
-
-def _generate_court_sport_session(client_id: str, session_date: str, context: dict) -> dict:
-    """
-    Generate Court Sport Foundations session artifact.
-    Routes to real Court Sport generator.
-    """
-    from .generator_court import generate_court_sport_session
-    return generate_court_sport_session(client_id, session_date, context)
+def _bind(project_id: str, fn: Callable, takes_project_id: bool) -> Callable[[str, str, dict], dict]:
+    if not takes_project_id:
+        return fn
 
+    def generate(client_id: str, session_date: str, context: dict) -> dict:
+        return fn(project_id, client_id, session_date, context)
+    return generate
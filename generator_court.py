@@ -10,11 +10,25 @@ References:
 - EFL_Exercise_Library_v2_5.csv
 """
 
+import os
 import uuid
-import pandas as pd
 from pathlib import Path
+from typing import Dict, Sequence
 from .timeutil import utc_now_z
-from .court_sport_exercise_map import CourtSportExerciseMapper
+from .court_sport_exercise_map import CourtSportExerciseMapper, load_library_rows
+
+LIBRARY_CSV = Path(__file__).parent / "EFL_Exercise_Library_v2_5.csv"
+
+
+def court_library():
+    """
+    Library to select from: the columnar library a pre-fork parent published
+    (one mapped copy for all its workers), else this process's CSV rows.
+    """
+    if os.environ.get("EFL_SHARED_LIBRARY"):  # checked here so plain processes never load numpy
+        from .shared_library import published_library
+        return published_library()
+    return load_library_rows(str(LIBRARY_CSV))
 
 
 def generate_court_sport_session(client_id: str, session_date: str, context: dict) -> dict:
@@ -38,8 +52,7 @@ def generate_court_sport_session(client_id: str, session_date: str, context: dic
     now = utc_now_z()
     
     # Load Exercise Library
-    lib_path = Path(__file__).parent.parent / "data" / "EFL_Exercise_Library_v2_5.csv"
-    df = pd.read_csv(lib_path)
+    library = court_library()
     mapper = CourtSportExerciseMapper()
     
     # Extract context with safe defaults (Input Gate v1.0 Section 3.2)
@@ -83,7 +96,7 @@ def generate_court_sport_session(client_id: str, session_date: str, context: dic
     
     # Generate WORK blocks with real exercises
     work_blocks = _generate_court_sport_work_blocks(
-        df=df,
+        library=library,
         mapper=mapper,
         day_type=day_type,
         week=week,
@@ -246,7 +259,7 @@ def _generate_prep_block(sport: str, readiness: str) -> dict:
 
 
 def _generate_court_sport_work_blocks(
-    df: pd.DataFrame,
+    library: Sequence[Dict],
     mapper: CourtSportExerciseMapper,
     day_type: str,
     week: int,
@@ -260,10 +273,10 @@ def _generate_court_sport_work_blocks(
     
     # RED readiness: Minimal strength only, no plyos
     if readiness == "RED":
-        squat_ex = mapper.find_exercises(df, "bilateral_squat", readiness_band_override=band_allowed, limit=1)[0]
-        hinge_ex = mapper.find_exercises(df, "hip_hinge", readiness_band_override=band_allowed, limit=1)[0]
-        row_ex = mapper.find_exercises(df, "horizontal_pull", readiness_band_override=2, limit=1)[0]  # Rows are all Band_2
-        plank_ex = mapper.find_exercises(df, "trunk_anti_ext", readiness_band_override=band_allowed, limit=1)[0]
+        squat_ex = mapper.find_exercises(library, "bilateral_squat", readiness_band_override=band_allowed, limit=1)[0]
+        hinge_ex = mapper.find_exercises(library, "hip_hinge", readiness_band_override=band_allowed, limit=1)[0]
+        row_ex = mapper.find_exercises(library, "horizontal_pull", readiness_band_override=2, limit=1)[0]  # Rows are all Band_2
+        plank_ex = mapper.find_exercises(library, "trunk_anti_ext", readiness_band_override=band_allowed, limit=1)[0]
         
         blocks.append({
             "block_id": str(uuid.uuid4()),
@@ -314,8 +327,8 @@ def _generate_court_sport_work_blocks(
     
     # Day A: Squat-bias + Vertical Plyos
     if day_type == "A":
-        squat_ex = mapper.find_exercises(df, "bilateral_squat", readiness_band_override=band_allowed, limit=1)[0]
-        lunge_ex = mapper.find_exercises(df, "unilateral_knee", readiness_band_override=band_allowed, limit=1)[0]
+        squat_ex = mapper.find_exercises(library, "bilateral_squat", readiness_band_override=band_allowed, limit=1)[0]
+        lunge_ex = mapper.find_exercises(library, "unilateral_knee", readiness_band_override=band_allowed, limit=1)[0]
         
         blocks.append({
             "block_id": str(uuid.uuid4()),
@@ -348,9 +361,9 @@ def _generate_court_sport_work_blocks(
         
         # Plyos - use E1 or E2 based on readiness
         if enode_allowed == "E1":
-            plyo_ex = mapper.find_exercises(df, "plyo_e1_pogo", readiness_enode_override="E1", limit=2)
+            plyo_ex = mapper.find_exercises(library, "plyo_e1_pogo", readiness_enode_override="E1", limit=2)
         else:
-            plyo_ex = mapper.find_exercises(df, "plyo_e2_vertical", readiness_enode_override="E2", limit=2)
+            plyo_ex = mapper.find_exercises(library, "plyo_e2_vertical", readiness_enode_override="E2", limit=2)
         
         plyo_contacts = 60 if readiness == "GREEN" else 40
         
@@ -384,8 +397,8 @@ def _generate_court_sport_work_blocks(
         })
         
         # Upper + Trunk
-        row_ex = mapper.find_exercises(df, "horizontal_pull", readiness_band_override=band_allowed, limit=1)[0]
-        plank_ex = mapper.find_exercises(df, "trunk_anti_ext", readiness_band_override=min(band_allowed, 1), limit=1)[0]
+        row_ex = mapper.find_exercises(library, "horizontal_pull", readiness_band_override=band_allowed, limit=1)[0]
+        plank_ex = mapper.find_exercises(library, "trunk_anti_ext", readiness_band_override=min(band_allowed, 1), limit=1)[0]
         
         blocks.append({
             "block_id": str(uuid.uuid4()),
@@ -416,8 +429,8 @@ def _generate_court_sport_work_blocks(
     
     # Day B: Hinge-bias + Lateral Plyos (similar pattern)
     elif day_type == "B":
-        hinge_ex = mapper.find_exercises(df, "hip_hinge", readiness_band_override=band_allowed, limit=1)[0]
-        sl_hinge_ex = mapper.find_exercises(df, "unilateral_hip", readiness_band_override=band_allowed, limit=1)[0]
+        hinge_ex = mapper.find_exercises(library, "hip_hinge", readiness_band_override=band_allowed, limit=1)[0]
+        sl_hinge_ex = mapper.find_exercises(library, "unilateral_hip", readiness_band_override=band_allowed, limit=1)[0]
         
         blocks.append({
             "block_id": str(uuid.uuid4()),
@@ -448,9 +461,9 @@ def _generate_court_sport_work_blocks(
         
         # Lateral plyos
         if enode_allowed == "E2":
-            plyo_ex = mapper.find_exercises(df, "plyo_e2_lateral", readiness_enode_override="E2", limit=2)
+            plyo_ex = mapper.find_exercises(library, "plyo_e2_lateral", readiness_enode_override="E2", limit=2)
         else:
-            plyo_ex = mapper.find_exercises(df, "plyo_e1_pogo", readiness_enode_override="E1", limit=2)
+            plyo_ex = mapper.find_exercises(library, "plyo_e1_pogo", readiness_enode_override="E1", limit=2)
         
         plyo_contacts = 50 if readiness == "GREEN" else 35
         
@@ -474,8 +487,8 @@ def _generate_court_sport_work_blocks(
         })
         
         # Push + Trunk
-        push_ex = mapper.find_exercises(df, "horizontal_push", readiness_band_override=band_allowed, limit=1)[0]
-        antirot_ex = mapper.find_exercises(df, "trunk_anti_rot", readiness_band_override=min(band_allowed, 1), limit=1)[0]
+        push_ex = mapper.find_exercises(library, "horizontal_push", readiness_band_override=band_allowed, limit=1)[0]
+        antirot_ex = mapper.find_exercises(library, "trunk_anti_rot", readiness_band_override=min(band_allowed, 1), limit=1)[0]
         
         blocks.append({
             "block_id": str(uuid.uuid4()),
@@ -506,9 +519,9 @@ def _generate_court_sport_work_blocks(
     
     # Day C: Recovery (no plyos, tempo work)
     elif day_type == "C":
-        squat_ex = mapper.find_exercises(df, "bilateral_squat", readiness_band_override=band_allowed, limit=1)[0]
-        row_ex = mapper.find_exercises(df, "horizontal_pull", readiness_band_override=band_allowed, limit=1)[0]
-        calf_ex = mapper.find_exercises(df, "calf_ankle", readiness_band_override=min(band_allowed, 1), limit=1)[0]
+        squat_ex = mapper.find_exercises(library, "bilateral_squat", readiness_band_override=band_allowed, limit=1)[0]
+        row_ex = mapper.find_exercises(library, "horizontal_pull", readiness_band_override=band_allowed, limit=1)[0]
+        calf_ex = mapper.find_exercises(library, "calf_ankle", readiness_band_override=min(band_allowed, 1), limit=1)[0]
         
         blocks.append({
             "block_id": str(uuid.uuid4()),
@@ -0,0 +1,629 @@
+"""
+R2P-ACL session generator for EFL governance layer.
+Implements the stage envelopes of the R2P-ACL Stage Permission Matrix v1.0.
+
+References:
+- EFL_R2P_ACL_STAGE_PERMISSION_MATRIX_v1_0.md (sections 1-9)
+- EFL_R2P_ACL_STAGE_CHAIN_INDEX_v1_0.md (hardstop routing, readiness rules)
+- EFL_Exercise_Library_v2_5.csv
+
+The matrix is compiled once per library into bitsets (Python ints, bit i =
+library row i):
+
+- exposure and ceiling bitsets per exercise attribute (band, node, E-node,
+  running, decel, COD, reactive SSC, ...)
+- slot bitsets for the session template (squat, hinge, plyo, run, ...)
+- one legal-exercise bitset per envelope (stage x readiness x clearances)
+
+A session is then an AND of the envelope bitset with each template slot
+(cached per envelope), a rotation through the legal rows, and the contact
+fill. Hardstop, medical lock and RED persistence are set lookups on the
+context that run before any selection.
+
+Usage:
+    artifact = generate_r2p_acl_session("C1", "2026-03-02", {
+        "stage": "S2", "readiness": "GREEN",
+        "provider_clearances": {"resistance": True},
+    })
+"""
+
+import csv
+import re
+import uuid
+from dataclasses import dataclass, replace
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .cache_manager import get_cache_manager
+from .progression_law import ProgressionLaw
+from .timeutil import utc_now_z
+
+
+GENERATOR_VERSION = "R2P_ACL_GENERATOR_v1.0.0"
+LIBRARY_CSV = Path(__file__).parent / "EFL_Exercise_Library_v2_5.csv"
+
+STAGES = ("S1", "S2", "S2.5", "S3", "S4", "S5")
+
+# Manifest r2p_stage / legacy names -> matrix stage
+STAGE_ALIASES = {
+    "R2P_Stage_1": "S1", "R2P_Stage_2": "S2", "R2P_Stage_3": "S3", "R2P_Stage_4": "S4",
+    "STAGE1": "S1", "STAGE2": "S2", "STAGE2.5": "S2.5", "STAGE3": "S3", "STAGE4": "S4", "STAGE5": "S5",
+    "S25": "S2.5",  # client state r2p_systemone_output.stage
+}
+
+# Exposure levels (matrix section 1)
+RUN_NONE, RUN_JOG, RUN_SPRINT = 0, 1, 2
+DECEL_NONE, DECEL_LINEAR, DECEL_ALL = 0, 1, 2
+COD_NONE, COD_PLANNED, COD_REACTIVE = 0, 1, 2
+SSC_NO, SSC_LIMITED, SSC_YES = 0, 1, 2
+
+BANDS = ("Band_0", "Band_1", "Band_2", "Band_3", "Band_4")
+NODES = ("A", "B", "C", "D")
+E_NODES = ("E0", "E1", "E2", "E3", "E4")
+
+# Section 7 hardstop symptoms; chain index 5: >=2 hardstops within 14 days = medical lock
+HARDSTOP_SYMPTOMS = frozenset({"effusion_increase", "giving_way", "sharp_pain", "limp", "pain_spike"})
+MEDICAL_LOCK_HARDSTOPS = 2
+MEDICAL_LOCK_WINDOW_DAYS = 14
+RED_PERSISTENCE_SESSIONS = 2
+
+# Section 5 readiness modifiers: (weekly, session) cap multipliers
+READINESS_MULTIPLIERS = {"GREEN": (1.0, 1.0), "YELLOW": (0.75, 0.8), "RED": (0.0, 0.0)}
+
+# Section 8 S2.5 E2 exception
+E2_EXCEPTION_WEEK = 3
+E2_EXCEPTION_DAY = 3
+E2_EXCEPTION_MAX_PCT = 0.15
+
+YOUTH_RTS_ADVISORY_WEEKS = 52
+
+
+@dataclass(frozen=True, slots=True)
+class StageEnvelope:
+    """One row of the permission matrix: exposures, ceilings and contact caps"""
+    stage: str
+    name: str
+    running: int
+    decel: int
+    cod: int
+    reactive_ssc: int
+    max_band: int
+    max_node: int
+    max_e_node: int
+    session_contacts: int
+    weekly_contacts: int
+    required_clearances: Tuple[str, ...]
+
+
+# Sections 1-4; contact caps are the top of the matrix's typical GREEN ranges
+STAGE_MATRIX = {
+    "S1": StageEnvelope("S1", "Reactivation", RUN_NONE, DECEL_NONE, COD_NONE, SSC_NO,
+                        0, 0, 0, 0, 0, ("resistance",)),
+    "S2": StageEnvelope("S2", "Progressive Loading", RUN_NONE, DECEL_NONE, COD_NONE, SSC_NO,
+                        1, 1, 1, 40, 100, ("resistance",)),
+    "S2.5": StageEnvelope("S2.5", "Consolidation", RUN_JOG, DECEL_LINEAR, COD_PLANNED, SSC_NO,
+                          2, 2, 1, 50, 120, ("resistance",)),
+    "S3": StageEnvelope("S3", "Sport Integration", RUN_JOG, DECEL_LINEAR, COD_NONE, SSC_LIMITED,
+                        2, 2, 2, 50, 120, ("resistance", "running")),
+    "S4": StageEnvelope("S4", "Full Return", RUN_SPRINT, DECEL_ALL, COD_REACTIVE, SSC_LIMITED,
+                        3, 3, 3, 60, 150, ("resistance", "running", "cod")),
+    "S5": StageEnvelope("S5", "RTS Complete", RUN_SPRINT, DECEL_ALL, COD_REACTIVE, SSC_YES,
+                        3, 3, 3, 80, 180, ("resistance", "running", "cod", "full_sport")),
+}
+
+# Session template: block -> slots (slot, exercises); a slot is filled only if its stage allows it
+TEMPLATE = (
+    ("PRIME", "WARMUP", (("mobility", 2), ("activation", 1))),
+    ("WORK - Strength", "STRENGTH", (("squat", 1), ("hinge", 1), ("unilateral", 1), ("calf_foot", 1))),
+    ("WORK - Upper + Trunk", "STRENGTH", (("pull", 1), ("push", 1), ("trunk", 1))),
+    ("WORK - Plyos", "PLYOMETRIC", (("plyo_vertical", 2), ("plyo_lateral", 1), ("plyo_reactive", 1))),
+    ("WORK - Running", "RUNNING", (("run", 1),)),
+    ("WORK - Decel + COD", "AGILITY", (("decel", 1), ("cod", 1))),
+    ("CLEAR", "COOLDOWN", (("mobility", 1),)),
+)
+
+# First stage at which each slot appears in the template
+SLOT_FROM_STAGE = {
+    "mobility": "S1", "activation": "S1", "squat": "S1", "hinge": "S1", "calf_foot": "S1",
+    "pull": "S1", "push": "S1", "trunk": "S1",
+    "unilateral": "S2", "plyo_vertical": "S2",
+    "run": "S2.5", "decel": "S2.5",
+    "plyo_lateral": "S3", "plyo_reactive": "S3",
+    "cod": "S4",
+}
+
+# (sets, reps) per stage for strength slots
+STRENGTH_DOSE = {"S1": (2, "12"), "S2": (3, "10"), "S2.5": (3, "8"), "S3": (3, "8"), "S4": (4, "6"), "S5": (4, "6")}
+
+_MOVEMENT_SLOTS = {
+    "mobility": {"Joint_Mobility", "Mobility", "Mobility_Activation", "Breathing_Work", "Stretch"},
+    "activation": {"Bridge", "Isometric_Hold", "Shoulder_Health", "Balance"},
+    "squat": {"Squat"},
+    "hinge": {"Deadlift"},
+    "unilateral": {"Lunge"},
+    "pull": {"Row", "Pull"},
+    "push": {"Press", "Push"},
+    "trunk": {"Plank", "Core"},
+}
+_PLYO_MOVEMENTS = {"Jump", "Hop", "Bound", "Skip"}
+_STRENGTH_MOVEMENTS = {"Squat", "Lunge", "Deadlift", "Press", "Push", "Row", "Pull", "Bridge"}
+
+# Exposure name heuristics; the library's movement_pattern and is_sprint are
+# too coarse (crunches, flys and trunk rotations are flagged as running)
+_RUNNING = re.compile(r"\bruns?\b|running|sprint|jog|acceleration|build ups|shuttle|fly in", re.I)
+_NOT_RUNNING = re.compile(r"plank|pillar|crunch|trunk|stretch|get ups - down", re.I)
+_JOG = re.compile(r"jog|in place|step over run|high knee|build ups|run - curve|2 inch runs? - ", re.I)
+_INTENSE = re.compile(r"sprint|acceleration|decel|resisted|load and release", re.I)
+_DECEL = re.compile(r"decel|jump stop|snap down|stop and stick", re.I)
+_COD = re.compile(r"\bcut|zig zag|star drill|crossover drill|crossover (?:and|to) sprint|agility|ladder|"
+                  r"shuffle(?! with jump rope)|mirror drill|pro shuttle|reactive box", re.I)
+_COD_REACTIVE = re.compile(r"mirror|reactive|partner", re.I)
+_DRILL = re.compile(r"drill|hurdle", re.I)
+
+
+def _bits(rows: Iterable[int]) -> int:
+    value = 0
+    for i in rows:
+        value |= 1 << i
+    return value
+
+
+def _rows(bits: int) -> Tuple[int, ...]:
+    """Set bit positions, ascending"""
+    rows = []
+    while bits:
+        low = bits & -bits
+        rows.append(low.bit_length() - 1)
+        bits ^= low
+    return tuple(rows)
+
+
+def _stage(context: dict) -> str:
+    client_state = context.get("client_state") or {}
+    system_one = (client_state.get("derived") or {}).get("r2p_systemone_output") or {}
+    raw = (context.get("effective_stage") or context.get("stage") or client_state.get("stage")
+           or system_one.get("stage"))
+    if raw is None:
+        return "S1"
+    stage = STAGE_ALIASES.get(str(raw).upper().replace("_", "") if str(raw).upper().startswith("STAGE") else raw, raw)
+    if stage not in STAGE_MATRIX:
+        raise ValueError(f"Unknown R2P-ACL stage '{raw}' (expected one of {list(STAGES)})")
+    return stage
+
+
+def _flags(value) -> frozenset:
+    if isinstance(value, dict):
+        return frozenset(k for k, v in value.items() if v)
+    return frozenset(value or ())
+
+
+class R2PACLGenerator:
+    """Permission matrix compiled to library bitsets, plus the templated session fill"""
+
+    def __init__(self, library_path: Optional[str] = None):
+        self.library_path = str(library_path or LIBRARY_CSV)
+        with open(self.library_path, newline="", encoding="utf-8") as f:
+            self.rows = list(csv.DictReader(f))
+        self._compile_features()
+        # Shared by generators over the same library; keys lead with the library path
+        self._legal = get_cache_manager().register("generator_r2p_acl.legal_bits")
+        self._slots = get_cache_manager().register("generator_r2p_acl.slot_rows")
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def classify(row: Dict) -> Tuple[int, int, int, frozenset]:
+        """(band, node, E-node) levels and exposure / slot features of one library row"""
+        name = row["exercise_name"]
+        movement = row["movement_pattern"]
+        labels = ProgressionLaw.derive(row)
+        plyo = row["is_plyometric"] == "True"
+        band = BANDS.index(row["load_band_primary"]) if row["load_band_primary"] in BANDS else len(BANDS)
+        node = NODES.index(row["aether_node"]) if row["aether_node"] in NODES else len(NODES)
+        e_node = E_NODES.index(row["e_node"]) if row["e_node"] in E_NODES else len(E_NODES)
+
+        features = set()
+        if e_node == 2:
+            features.add("e2")
+        if "R2P1" in (row["contraindicated_populations"] or ""):
+            features.add("contraindicated_s1")
+
+        running = bool(_RUNNING.search(name)) and not _NOT_RUNNING.search(name)
+        decel = bool(_DECEL.search(name))
+        cod = bool(_COD.search(name)) and movement not in _STRENGTH_MOVEMENTS
+        reactive = plyo and labels["reactivity"] == "Reactive_Minimal_Contact"
+        if running and not cod:
+            features.add("jog" if _JOG.search(name) and not _INTENSE.search(name) else "sprint")
+            features.add("slot:run")
+        if decel and not cod:
+            features.add("decel_linear" if labels["direction"] == "Linear_Sagittal" and not running else "decel_multi")
+            features.add("slot:decel")
+        if cod:
+            features.add("cod_reactive" if _COD_REACTIVE.search(name) else "cod_planned")
+            features.add("slot:cod")
+        if reactive:
+            features.update(("reactive_ssc", "slot:plyo_reactive"))
+        if plyo:
+            features.add("plyo")
+
+        # Template slots; strength slots take no plyos, sprints or drills
+        dynamic = plyo or running or decel or cod or bool(_DRILL.search(name))
+        if not dynamic:
+            features.update(f"slot:{slot}" for slot, movements in _MOVEMENT_SLOTS.items() if movement in movements)
+            if row["aether_pattern"] == "Foot-Ankle-Work":
+                features.add("slot:calf_foot")
+        if plyo and movement in _PLYO_MOVEMENTS and not reactive:
+            if labels["direction"] == "Linear_Sagittal":
+                features.add("slot:plyo_vertical")
+                if labels["stance"] == "Bilateral" and labels["reactivity"] == "Continuous_Rhythm":
+                    features.add("e2_exception_pattern")
+            elif labels["direction"] == "Lateral_Frontal":
+                features.add("slot:plyo_lateral")
+        return band, node, e_node, frozenset(features)
+
+    def _compile_features(self) -> None:
+        rows: Dict[str, List[int]] = {}
+        for i, row in enumerate(self.rows):
+            band, node, e_node, features = self.classify(row)
+            names = [f"band<={level}" for level in range(band, len(BANDS))]
+            names += [f"node<={level}" for level in range(node, len(NODES))]
+            names += [f"e_node<={level}" for level in range(e_node, len(E_NODES))]
+            for feature in names + list(features):
+                rows.setdefault(feature, []).append(i)
+        self.features: Dict[str, int] = {feature: _bits(indices) for feature, indices in rows.items()}
+
+    def feature(self, name: str) -> int:
+        return self.features.get(name, 0)
+
+    def legal_bits(self, envelope: StageEnvelope) -> int:
+        """Library rows legal under an envelope (cached per envelope)"""
+        key = (self.library_path, envelope)
+        bits = self._legal.get(key)
+        if bits is None:
+            f = self.feature
+            bits = f(f"band<={envelope.max_band}") & f(f"node<={envelope.max_node}") & f(f"e_node<={envelope.max_e_node}")
+            if envelope.running < RUN_SPRINT:
+                bits &= ~f("sprint")
+            if envelope.running < RUN_JOG:
+                bits &= ~f("jog")
+            if envelope.decel < DECEL_ALL:
+                bits &= ~f("decel_multi")
+            if envelope.decel < DECEL_LINEAR:
+                bits &= ~f("decel_linear")
+            if envelope.cod < COD_REACTIVE:
+                bits &= ~f("cod_reactive")
+            if envelope.cod < COD_PLANNED:
+                bits &= ~f("cod_planned")
+            if envelope.reactive_ssc == SSC_NO:
+                bits &= ~f("reactive_ssc")
+            if envelope.stage == "S1":
+                bits &= ~f("contraindicated_s1")
+            self._legal[key] = bits
+        return bits
+
+    def slot_rows(self, envelope: StageEnvelope, slot: str) -> Tuple[int, ...]:
+        """Legal rows for a template slot: envelope bitset AND slot bitset (cached)"""
+        key = (self.library_path, envelope, slot)
+        rows = self._slots.get(key)
+        if rows is None:
+            if STAGES.index(envelope.stage) < STAGES.index(SLOT_FROM_STAGE[slot]):
+                rows = ()
+            else:
+                rows = _rows(self.legal_bits(envelope) & self.feature(f"slot:{slot}"))
+            self._slots[key] = rows
+        return rows
+
+    # ------------------------------------------------------------------
+    # Envelope
+    # ------------------------------------------------------------------
+
+    def envelope(self, stage: str, readiness: str, clearances: frozenset) -> Tuple[StageEnvelope, List[str]]:
+        """Stage envelope after provider clearances and readiness; reason codes for every restriction"""
+        reasons = []
+        if stage == "S5" and "full_sport" not in clearances:
+            # S5 is only entered with full sport clearance; hold the S4 envelope until then
+            stage = "S4"
+            reasons.append("GATE_PROVIDER_FULL_SPORT_MISSING_S4_ENVELOPE")
+        envelope = STAGE_MATRIX[stage]
+        if stage == "S5" and "e4" in clearances:
+            envelope = replace(envelope, max_e_node=4)
+        if envelope.running and "running" not in clearances:
+            envelope = replace(envelope, running=RUN_NONE)
+            reasons.append("GATE_PROVIDER_RUNNING_MISSING_RUNNING_NONE")
+        if envelope.cod and "cod" not in clearances:
+            envelope = replace(envelope, cod=COD_NONE)
+            reasons.append("GATE_PROVIDER_COD_MISSING_COD_NONE")
+
+        weekly, session = READINESS_MULTIPLIERS[readiness]
+        if readiness == "YELLOW":
+            # Tighten exposures: no sprint-intensity running, no reactive SSC
+            envelope = replace(envelope, running=min(envelope.running, RUN_JOG), reactive_ssc=SSC_NO)
+        elif readiness == "RED":
+            envelope = replace(envelope, running=RUN_NONE, cod=COD_NONE, decel=DECEL_NONE,
+                               reactive_ssc=SSC_NO, max_e_node=0)
+        envelope = replace(envelope,
+                           session_contacts=int(envelope.session_contacts * session),
+                           weekly_contacts=int(envelope.weekly_contacts * weekly))
+        return envelope, reasons
+
+    @staticmethod
+    def collapsed(stage: str) -> StageEnvelope:
+        """Section 7: hardstop collapses every exposure and ceiling to the minimum, stage preserved"""
+        return StageEnvelope(stage, "Symptom Control", RUN_NONE, DECEL_NONE, COD_NONE, SSC_NO,
+                             0, 0, 0, 0, 0, STAGE_MATRIX[stage].required_clearances)
+
+    # ------------------------------------------------------------------
+    # Session
+    # ------------------------------------------------------------------
+
+    def generate_session(self, client_id: str, session_date: str, context: dict) -> dict:
+        """SESSION artifact for one R2P-ACL client"""
+        now = utc_now_z()
+        stage = _stage(context)
+        readiness = context.get("readiness") or context.get("readiness_flag") or "YELLOW"
+        if readiness not in READINESS_MULTIPLIERS:
+            raise ValueError(f"Unknown readiness '{readiness}' (expected GREEN, YELLOW or RED)")
+        clearances = _flags(context.get("provider_clearances"))
+        symptoms = _flags(context.get("hardstop_flags")) & HARDSTOP_SYMPTOMS
+        age = context.get("age")
+        population = context.get("population") or ("Youth_13_17" if age is not None and age < 18 else "Adult")
+        weekly_used = int(context.get("weekly_contacts_to_date", 0))
+        week = int(context.get("week", 1))
+        day = int(context.get("day", 1))
+
+        reasons = ["R2P_ACL_PERMISSION_MATRIX_v1.0", f"STAGE_{stage}", f"READINESS_{readiness}"]
+        eligible = True
+        symptom_control = False
+        if "resistance" not in clearances:
+            eligible = False
+            reasons.append("GATE_PROVIDER_RESISTANCE_MISSING")
+        if self._medical_lock(session_date, context.get("hardstop_dates", ())):
+            eligible = False
+            reasons.append("MEDICAL_LOCK_REPEATED_HARDSTOP")
+        if symptoms or context.get("hardstop"):
+            symptom_control = True
+            reasons.append("HARDSTOP_OVERRIDES_STAGE")
+        elif readiness == "RED" and int(context.get("red_session_count", 0)) + 1 >= RED_PERSISTENCE_SESSIONS:
+            symptom_control = True
+            reasons.append("RED_PERSISTENCE_ROLLBACK_OR_MEDICAL_REVIEW")
+
+        if not eligible:
+            envelope, blocks = self.collapsed(stage), []
+        elif symptom_control:
+            envelope = self.collapsed(stage)
+            blocks = self._fill(envelope, (("SYMPTOM CONTROL", "RECOVERY", (("mobility", 3), ("activation", 1))),),
+                                week, day)
+        else:
+            envelope, restrictions = self.envelope(stage, readiness, clearances)
+            reasons.extend(restrictions)
+            remaining = envelope.weekly_contacts - weekly_used
+            if remaining < envelope.session_contacts:
+                envelope = replace(envelope, session_contacts=max(0, remaining))
+                reasons.append("WEEKLY_CONTACT_CAP_LIMITS_SESSION")
+            blocks = self._fill(envelope, TEMPLATE, week, day)
+            if (envelope.stage == "S2.5" and readiness == "GREEN"
+                    and week == E2_EXCEPTION_WEEK and day == E2_EXCEPTION_DAY):
+                if self._add_e2_exception(blocks, envelope, week, day):
+                    reasons.append("S2_5_E2_EXCEPTION_APPLIED")
+
+        contacts = sum(block["contacts"] for block in blocks)
+        total_sets = sum(block["sets"] for block in blocks)
+        e2_contacts = sum(ex["sets"] * int(ex["reps"]) for block in blocks
+                          for ex in block["exercises"] if ex.get("e2_exception"))
+
+        advisories = []
+        youth = population.startswith("Youth")
+        weeks_post_op = context.get("weeks_post_op")
+        if youth and stage == "S5" and weeks_post_op is not None and weeks_post_op < YOUTH_RTS_ADVISORY_WEEKS:
+            advisories.append({
+                "code": "YOUTH_RTS_ADVISORY",
+                "severity": "WARNING",
+                "message": (f"Youth athlete at S5 {weeks_post_op} weeks post-op (<{YOUTH_RTS_ADVISORY_WEEKS}): "
+                            "elevated re-injury risk; family discussion recommended."),
+            })
+            reasons.append("YOUTH_RTS_ADVISORY_SURFACED")
+
+        base = STAGE_MATRIX[stage]
+        weekly_multiplier, session_multiplier = READINESS_MULTIPLIERS[readiness]
+        return {
+            "header": {
+                "client_id": client_id,
+                "artifact_id": str(uuid.uuid4()),
+                "artifact_class": "SESSION",
+                "target": "COACH_SHEET",
+                "generated_at": now,
+                "project_id": "R2P_ACL",
+                "router_version": GENERATOR_VERSION,
+                "state_last_updated": now,
+                "season_type": "OFF_SEASON",
+                "eligible_for_training_today": eligible and not symptom_control,
+                "reason_codes": reasons
+            },
+            "legality_snapshot": {
+                "active_project": "R2P_ACL",
+                "eligible": eligible,
+                "effective_stage": stage,
+                "envelope_stage": envelope.stage,
+                "exposure_permissions": {
+                    "running": ("NONE", "WALK_JOG", "INTENSITY")[envelope.running],
+                    "decel": ("NONE", "LINEAR_PLANNED", "REACTIVE")[envelope.decel],
+                    "cod": ("NONE", "PLANNED", "PLANNED_AND_REACTIVE")[envelope.cod],
+                    "reactive_ssc": ("NO", "LIMITED", "YES")[envelope.reactive_ssc],
+                    "max_e_node": E_NODES[envelope.max_e_node],
+                },
+                "reason_codes": reasons
+            },
+            "cap_proof": {
+                "caps_exist": True,
+                "population_enforced": population,
+                "readiness_flag": readiness,
+                "weekly_multiplier": weekly_multiplier,
+                "session_multiplier": session_multiplier,
+                "weekly_contacts_cap_base": base.weekly_contacts,
+                "weekly_contacts_cap_applied": envelope.weekly_contacts,
+                "session_contacts_cap_base": base.session_contacts,
+                "session_contacts_cap_applied": envelope.session_contacts,
+                "max_band_allowed_population": BANDS[envelope.max_band],
+                "max_node_allowed_population": f"Node_{NODES[envelope.max_node]}",
+                "max_enode_allowed_population": E_NODES[envelope.max_e_node]
+            },
+            "exposure_summary": {
+                "total_contacts": contacts,
+                "total_sets": total_sets,
+                "weekly_contacts_to_date": weekly_used + contacts,
+                "e2_exception_contacts": e2_contacts,
+                "e2_exception_pct": round(e2_contacts / contacts, 3) if contacts else 0.0
+            },
+            "advisories": advisories,
+            "content_payload": {
+                "session": {
+                    "session_id": str(uuid.uuid4()),
+                    "name": f"R2P-ACL {stage} {base.name} - Week {week} Day {day}",
+                    "session_date": session_date,
+                    "blocks": blocks,
+                    "total_sets": total_sets
+                }
+            },
+            "metadata": {
+                "generator_version": GENERATOR_VERSION,
+                "wrapper_version": "v1.1",
+                "permission_matrix_version": "v1.0",
+                "outputspec_version": "v1.0",
+                "exercise_library_version": "v2.5",
+                "global_contract_version": "1.0.1",
+                "validation_timestamp": now
+            }
+        }
+
+    def generate_caseload(self, sessions: Sequence[Tuple[str, str, dict]]) -> List[dict]:
+        """Artifacts for many (client_id, session_date, context) requests over the shared tables"""
+        return [self.generate_session(client_id, session_date, context)
+                for client_id, session_date, context in sessions]
+
+    @staticmethod
+    def _medical_lock(session_date: str, hardstop_dates: Iterable[str]) -> bool:
+        if not hardstop_dates:
+            return False
+        today = date.fromisoformat(session_date)
+        recent = sum(0 <= (today - date.fromisoformat(d)).days < MEDICAL_LOCK_WINDOW_DAYS for d in hardstop_dates)
+        return recent >= MEDICAL_LOCK_HARDSTOPS
+
+    def _fill(self, envelope: StageEnvelope, template, week: int, day: int) -> List[dict]:
+        """Templated fill: rotate through each slot's legal rows by session, then dose"""
+        cursor = {}
+        sets, reps = STRENGTH_DOSE[envelope.stage]
+        blocks = []
+        for block_name, block_type, slots in template:
+            exercises = []
+            for slot, count in slots:
+                rows = self.slot_rows(envelope, slot)
+                if slot.startswith("plyo") and envelope.session_contacts <= 0:
+                    rows = ()
+                if slot == "plyo_reactive" and envelope.reactive_ssc == SSC_LIMITED:
+                    count = min(count, 1)
+                start = cursor.get(slot, week * 3 + day)
+                count = min(count, len(rows))
+                for k in range(count):
+                    row = self.rows[rows[(start + k) % len(rows)]]
+                    exercises.append(self._exercise(row, slot, sets, reps))
+                cursor[slot] = start + count
+            if not exercises:
+                continue
+            block = {
+                "block_id": str(uuid.uuid4()),
+                "block_name": block_name,
+                "block_type": block_type,
+                "exercises": exercises,
+                "contacts": 0,
+                "sets": sum(ex["sets"] for ex in exercises)
+            }
+            if block_type == "PLYOMETRIC":
+                self._dose_contacts(block, envelope.session_contacts)
+            blocks.append(block)
+        return blocks
+
+    @staticmethod
+    def _exercise(row: Dict, slot: str, sets: int, reps: str) -> dict:
+        exercise = {
+            "exercise_id": row["exercise_id"],
+            "name": row["exercise_name"],
+            "slot": slot,
+            "band": row["load_band_primary"],
+            "enode": row["e_node"],
+            "sets": sets,
+            "reps": reps,
+            "rest_sec": 90,
+        }
+        if slot in ("mobility", "activation"):
+            exercise.update(sets=1, reps="8", rest_sec=0)
+        elif slot == "run":
+            exercise.update(sets=4, reps="40m", rest_sec=60)
+        elif slot in ("decel", "cod"):
+            exercise.update(sets=3, reps="4", rest_sec=60)
+        return exercise
+
+    @staticmethod
+    def _dose_contacts(block: dict, session_cap: int) -> None:
+        """Spread the session contact cap over the block's plyo drills (2 sets each, 4-10 reps)"""
+        drills = block["exercises"]
+        reps = max(0, min(10, session_cap // (2 * len(drills))))
+        if reps < 4:
+            drills[:] = drills[:max(1, session_cap // 8)]
+            reps = min(10, session_cap // (2 * len(drills)))
+        for ex in drills:
+            ex.update(sets=2, reps=str(reps), rest_sec=60)
+        block["sets"] = 2 * len(drills)
+        block["contacts"] = 2 * reps * len(drills)
+
+    def _add_e2_exception(self, blocks: List[dict], envelope: StageEnvelope, week: int, day: int) -> bool:
+        """Section 8: one bilateral vertical continuous E2 drill, at most 15% of session contacts"""
+        plyo = next((block for block in blocks if block["block_type"] == "PLYOMETRIC"), None)
+        if plyo is None:
+            return False
+        widened = replace(envelope, max_e_node=2)
+        rows = _rows(self.legal_bits(widened) & self.feature("e2") & self.feature("e2_exception_pattern"))
+        if not rows:
+            return False
+        # One set of c E2 contacts with c <= 15% of (base + c)
+        limit = int(E2_EXCEPTION_MAX_PCT * plyo["contacts"] / (1 - E2_EXCEPTION_MAX_PCT))
+        if limit < 1:
+            return False
+        row = self.rows[rows[(week * 3 + day) % len(rows)]]
+        exercise = self._exercise(row, "plyo_vertical", 1, str(limit))
+        exercise.update(rest_sec=60, e2_exception=True, label="E2-EXCEPTION (S2.5 constrained)")
+        plyo["exercises"].append(exercise)
+        plyo["sets"] += 1
+        plyo["contacts"] += limit
+        return True
+
+
+_DEFAULT: Optional[R2PACLGenerator] = None
+
+
+def get_r2p_acl_generator() -> R2PACLGenerator:
+    """Process-wide generator; the library bitsets are compiled on first use"""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = R2PACLGenerator()
+    return _DEFAULT
+
+
+def generate_r2p_acl_session(client_id: str, session_date: str, context: dict) -> dict:
+    """
+    Generate an R2P-ACL SESSION artifact.
+
+    Args:
+        client_id: Athlete identifier
+        session_date: ISO date (YYYY-MM-DD)
+        context: Dict with stage (S1-S5 or R2P_Stage_n), readiness (default
+            YELLOW), provider_clearances, hardstop_flags, hardstop_dates,
+            red_session_count, weekly_contacts_to_date, age/population,
+            weeks_post_op, week, day
+
+    Returns:
+        Schema-compliant SESSION artifact
+    """
+    return get_r2p_acl_generator().generate_session(client_id, session_date, context)
@@ -16,6 +16,8 @@ from pathlib import Path
 from .timeutil import utc_now_z
 from .court_sport_exercise_map import CourtSportExerciseMapper
 
+LIBRARY_CSV = Path(__file__).parent / "EFL_Exercise_Library_v2_5.csv"
+
 
 def generate_court_sport_session(client_id: str, session_date: str, context: dict) -> dict:
     """
@@ -38,8 +40,7 @@ def generate_court_sport_session(client_id: str, session_date: str, context: dic
     now = utc_now_z()
     
     # Load Exercise Library
-    lib_path = Path(__file__).parent.parent / "data" / "EFL_Exercise_Library_v2_5.csv"
-    df = pd.read_csv(lib_path)
+    df = pd.read_csv(LIBRARY_CSV)
     mapper = CourtSportExerciseMapper()
     
     # Extract context with safe defaults (Input Gate v1.0 Section 3.2)
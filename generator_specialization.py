@@ -0,0 +1,606 @@
+"""
+Specialization block generator for EFL governance layer.
+Compiles a specialization block spec into session templates once; sessions
+and whole blocks are then template instantiations.
+
+References:
+- EFL_SPECIALIZATION_BLOCK_ELASTIC_BASKETBALL_v1_0_1.json
+- EFL_SPECIALIZATION_BLOCK_DECELERATION_BASKETBALL_v1_0.json
+- EFL_EXERCISE_PROGRESSION_LAW_v1_0_1.json (stance / reactivity / direction labels)
+- EFL_Exercise_Library_v2_5.csv
+
+Compilation per spec:
+
+- entry_requirements -> hard / soft gate checks (readiness, season,
+  population, movement quality, prerequisites, contraindications)
+- weekly_structure -> one WeekPlan per week: volume targets per population,
+  e-node / stance / reactivity / direction distributions (inherited from
+  the previous week where a week omits them), the sample session's block
+  layout and the readiness regression protocol
+- exercise pools per (week, population, slot), ranked once by how well
+  each library row fits the week's distributions and named patterns
+
+A session for (week, population, day) is the pools' rotation plus the
+contact allocation; it is cached, so a block for a new athlete only stamps
+ids and dates onto compiled templates.
+
+Usage:
+    artifacts = generate_specialization_block("ELASTIC_SPECIALIZATION", "C1", "2026-06-01", context)
+"""
+
+import copy
+import csv
+import re
+import uuid
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .cache_manager import get_cache_manager
+from .progression_law import ProgressionLaw
+from .spec_registry import default_registry
+from .timeutil import utc_now_z
+
+
+GENERATOR_VERSION = "SPECIALIZATION_GENERATOR_v1.0.0"
+LIBRARY_CSV = Path(__file__).parent / "EFL_Exercise_Library_v2_5.csv"
+
+# Registry project -> block spec
+SPECIALIZATION_SPECS = {
+    "ELASTIC_SPECIALIZATION": "EFL_SPECIALIZATION_BLOCK_ELASTIC_BASKETBALL_v1_0_1",
+    "DECEL_SPECIALIZATION": "EFL_SPECIALIZATION_BLOCK_DECELERATION_BASKETBALL_v1_0",
+}
+
+E_NODES = ("E0", "E1", "E2", "E3", "E4")
+TIER_3 = (3, 4)
+
+# Registry router_binding population / season names -> block spec names
+POPULATION_ALIASES = {"Youth17Advanced": "Youth_13_17", "Adult_ATHLETE": "Adult"}
+SEASON_ALIASES = {"OFFSEASON": "OFF_SEASON", "PRESEASON": "PREP_SEASON"}
+
+# Spec distribution keys -> Progression Law labels
+DISTRIBUTION_LABELS = {
+    "Bilateral": "Bilateral", "Split": "Split_Stance", "Unilateral": "Unilateral",
+    "Sagittal": "Linear_Sagittal", "Linear": "Linear_Sagittal",
+    "Frontal": "Lateral_Frontal", "Lateral": "Lateral_Frontal",
+    "Combined": "Multi_Directional_Combined", "Multi_Directional": "Multi_Directional_Combined",
+}
+
+# Pattern token words that only qualify the movement
+_QUALIFIERS = {"and", "bilateral", "continuous", "moderate", "alternating", "horizontal", "vertical",
+               "reactive", "unilateral", "controlled", "elastic", "capacity", "robustness"}
+
+# Non-contact slots: movement patterns the pool is drawn from
+_SLOT_MOVEMENTS = {
+    "prime": {"Joint_Mobility", "Mobility", "Mobility_Activation", "Bridge"},
+    "strength": {"Squat", "Lunge", "Deadlift"},
+    "upper": {"Press", "Push", "Plank", "Core"},
+    "clear": {"Stretch", "Breathing_Work"},
+}
+_SLOT_BLOCKS = {"PRIME": "prime", "WORK_B": "upper", "CLEAR": "clear"}
+_TERM_STOPWORDS = {"with", "and", "the", "per", "side", "each", "leg", "sec", "min", "contacts", "sequence",
+                   "standard", "extended", "emphasis", "tempo", "planned", "speed", "approach", "assessment"}
+NON_CONTACT_DRILLS = 2
+CONTACTS_PER_DRILL = 24
+MIN_DRILL_CONTACTS = 6
+POOL_DEPTH = 12
+
+
+def _pct(text) -> Optional[float]:
+    """Midpoint of '30-40% ...' / '60% ...' as a fraction"""
+    match = re.match(r"\s*(\d+(?:\.\d+)?)(?:\s*-\s*(\d+(?:\.\d+)?))?\s*%", str(text))
+    if not match:
+        return None
+    lo = float(match.group(1))
+    hi = float(match.group(2) or lo)
+    return (lo + hi) / 200.0
+
+
+def _weights(distribution: Optional[Dict]) -> Dict[str, float]:
+    weights = {}
+    for key, text in (distribution or {}).items():
+        share = _pct(text)
+        if share is not None:
+            weights[DISTRIBUTION_LABELS.get(key, key)] = share
+    return weights
+
+
+def _terms(exercises) -> frozenset:
+    """Significant words of sample-session exercise names ('Glute Bridge 2x12' -> glute, bridge)"""
+    terms = set()
+    for exercise in exercises or ():
+        name = exercise if isinstance(exercise, str) else exercise.get("exercise_name", "")
+        name = re.sub(r"\(.*?\)|\d+\S*", " ", name.split(" - ")[0])
+        for word in re.findall(r"[a-z]{3,}", name.lower()):
+            if word not in _TERM_STOPWORDS:
+                terms.add(word[:-1] if word.endswith("s") and len(word) > 4 else word)
+    return frozenset(terms)
+
+
+def _pattern(token: str) -> Optional[re.Pattern]:
+    """Name regex for a spec pattern token ('box_jumps' -> box ... jump)"""
+    words = [w[:-1] if w.endswith("s") and len(w) > 3 else w
+             for w in token.lower().split("_") if w not in _QUALIFIERS]
+    if not words:
+        return None
+    return re.compile("".join(f"(?=.*{re.escape(w)})" for w in words), re.I)
+
+
+@dataclass(frozen=True, slots=True)
+class Volume:
+    """Week volume targets for one population"""
+    session_min: int
+    session_max: int
+    weekly_min: int
+    weekly_max: int
+    session_count: int
+    tier_3_max_pct: float
+
+    @property
+    def session_target(self) -> int:
+        # Both ranges are targets; the weekly range is the one gate_3 enforces
+        weekly = (self.weekly_min + self.weekly_max) // 2 // self.session_count
+        return min(self.session_max, (self.session_min + self.session_max) // 2, weekly)
+
+
+@dataclass(frozen=True)
+class WeekPlan:
+    """One compiled week of a specialization block"""
+    week: int
+    focus: str
+    volume: Dict[str, Volume]
+    e_node_shares: Tuple[float, ...]
+    stance: Dict[str, float]
+    reactivity: Dict[str, float]
+    direction: Dict[str, float]
+    primary: Tuple[re.Pattern, ...]
+    secondary: Tuple[re.Pattern, ...]
+    blocks: Tuple[str, ...]
+    terms: Dict[str, frozenset]
+    eccentric_tempo: Optional[str]
+    yellow_week: Optional[int]
+    assessments: Tuple[str, ...]
+
+
+class SpecializationBlockGenerator:
+    """One specialization block spec compiled into week plans and ranked library pools"""
+
+    def __init__(self, spec_name: str, registry=None, library_path: Optional[str] = None):
+        self.spec_name = spec_name
+        self.registry = registry or default_registry()
+        self.spec = self.registry.get(spec_name)
+        definition = self.spec["block_definition"]
+        self.block_id = definition["block_id"]
+        self.display_name = definition["display_name"]
+        self.legal_seasons = frozenset(definition["legal_seasons"])
+        self.legal_populations = frozenset(definition["legal_populations"])
+        self.version = self.spec["meta"]["version"]
+
+        self.band_max = self._band_ceilings()
+        self.contact_ceiling = self._contact_ceilings()
+        self.gates = self._compile_gates()
+        self.weeks = self._compile_weeks()
+
+        self.library_path = str(library_path or LIBRARY_CSV)
+        with open(self.library_path, newline="", encoding="utf-8") as f:
+            self.rows = list(csv.DictReader(f))
+        self.labels = [self.classify(row) for row in self.rows]
+        # Shared by generators of the same spec version and library; keys lead with _cache_key
+        self._cache_key = (spec_name, self.version, self.library_path)
+        self._pools = get_cache_manager().register("generator_specialization.pools")
+        self._sessions = get_cache_manager().register("generator_specialization.templates")
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    def _band_ceilings(self) -> Dict[str, int]:
+        enforcement = self.spec["integration_with_exercise_progression_law"]["population_ceiling_enforcement"]
+        return {population: int(re.search(r"Band_(\d)", rules["load_band_max"]).group(1))
+                for population, rules in enforcement.items()}
+
+    def _contact_ceilings(self) -> Dict[str, int]:
+        """gate_1: 'Total contacts <= population ceiling (Youth 13-17: 120, Adult: 140)'"""
+        gate = self.spec["epa_integration_specifications"]["session_validation_gates"]["gate_1"]
+        ceilings = {}
+        for label, value in re.findall(r"(Youth [\d-]+|Adult):\s*(\d+)", gate):
+            ceilings["Adult" if label == "Adult" else "Youth_" + label.split()[1].replace("-", "_")] = int(value)
+        return ceilings
+
+    def _compile_gates(self) -> List[Tuple[str, str, str, object, Optional[int]]]:
+        """(section, key, kind, threshold, hard_from_week) for every quantitative entry gate"""
+        gates = []
+        requirements = self.spec["entry_requirements"]
+        for section, items in requirements.items():
+            if not section.endswith(("_gates", "_prerequisites")):
+                continue
+            for key, rule in items.items():
+                enforcement = str(rule.get("enforcement", ""))
+                if enforcement.startswith("HARD_GATE for weeks"):
+                    hard_from = int(re.search(r"weeks (\d)", enforcement).group(1))
+                else:
+                    hard_from = 1 if enforcement.startswith("HARD_GATE") else None
+                for kind in ("minimum", "minimum_score", "minimum_degrees"):
+                    if kind in rule:
+                        gates.append((section, key, "min", rule[kind], hard_from))
+                        break
+                else:
+                    if "maximum_percent_difference" in rule:
+                        gates.append((section, key, "max", rule["maximum_percent_difference"], hard_from))
+                    elif "required" in rule or "required_status" in rule:
+                        gates.append((section, key, "eq", rule.get("required", rule.get("required_status")), hard_from))
+        return gates
+
+    def _compile_weeks(self) -> Dict[int, WeekPlan]:
+        weeks = {}
+        previous = None
+        structure = self.spec["weekly_structure"]
+        for name in sorted((k for k in structure if k.startswith("week_")), key=lambda k: int(k.split("_")[1])):
+            week = structure[name]
+            number = int(week["week_number"])
+            rules = week.get("exercise_selection_rules", {})
+            shares = tuple(_pct(rules.get("e_node_distribution", {}).get(node, "0%")) or 0.0 for node in E_NODES)
+            volume = {}
+            for population, targets in week["volume_targets"].items():
+                volume[population] = Volume(
+                    targets["contacts_per_session"]["min"], targets["contacts_per_session"]["max"],
+                    targets["contacts_per_week"]["min"], targets["contacts_per_week"]["max"],
+                    int(targets["session_count"]), targets["tier_3_max_percent"] / 100.0)
+            sample = next((week[k] for k in week if k.startswith("sample_session")), {})
+            layout = sample.get("structure", {})
+            terms = {slot: _terms(layout.get(block, {}).get("exercises")) for block, slot in _SLOT_BLOCKS.items()}
+            terms["contact"] = _terms(layout.get("PREP", {}).get("exercises", []) + layout.get("WORK_A", {}).get("exercises", []))
+            for slot, words in terms.items():
+                if not words and previous:
+                    terms[slot] = previous.terms[slot]
+            regression = (week.get("intensity_management") or {})
+            regression = regression.get("regression_protocol", {}) if isinstance(regression, dict) else {}
+            yellow = re.search(r"week (\d)", regression.get("if_readiness_yellow", ""))
+            direction = rules.get("direction_emphasis") or rules.get("direction_complexity")
+            plan = WeekPlan(
+                week=number,
+                focus=week["focus"],
+                volume=volume,
+                e_node_shares=shares,
+                stance=_weights(rules.get("stance_distribution")) or (previous.stance if previous else {}),
+                reactivity=_weights(rules.get("reactivity_emphasis")) or (previous.reactivity if previous else {}),
+                direction=_weights(direction) or (previous.direction if previous else {}),
+                primary=tuple(p for p in map(_pattern, week.get("primary_patterns") or ()) if p),
+                secondary=tuple(p for p in map(_pattern, week.get("secondary_patterns") or ()) if p),
+                blocks=tuple(b for b in layout if b != "ASSESSMENT") or ("PRIME", "PREP", "WORK_A", "WORK_B", "CLEAR"),
+                terms=terms,
+                eccentric_tempo=(rules.get("tempo_emphasis") or {}).get("eccentric_tempo") or (
+                    previous.eccentric_tempo if previous else None),
+                yellow_week=int(yellow.group(1)) if yellow else None,
+                assessments=tuple(a["test"] for a in (week.get("assessment_protocol") or {}).get("assessments", ())),
+            )
+            weeks[number] = previous = plan
+        return weeks
+
+    @staticmethod
+    def classify(row: Dict) -> Dict:
+        """Library row labels the pools are ranked on"""
+        labels = ProgressionLaw.derive(row)
+        band = row["load_band_primary"]
+        return {
+            "name": row["exercise_name"],
+            "words": _terms((row["exercise_name"],)),
+            "movement": row["movement_pattern"],
+            "plyometric": row["is_plyometric"] == "True",
+            "e_node": E_NODES.index(row["e_node"]) if row["e_node"] in E_NODES else -1,
+            "band": int(band.split("_")[1]) if band.startswith("Band_") else 9,
+            "stance": labels["stance"],
+            "reactivity": labels["reactivity"],
+            "direction": labels["direction"],
+        }
+
+    def score(self, plan: WeekPlan, labels: Dict, slot: str) -> float:
+        """
+        Fit of one library row to a week slot: distribution weights, named
+        patterns and words shared with the spec's sample session.
+        """
+        words = labels["words"]
+        if slot in _SLOT_MOVEMENTS and slot != "strength":
+            return float(len(words & plan.terms[slot]))
+        score = (plan.stance.get(labels["stance"], 0.0) + plan.direction.get(labels["direction"], 0.0)
+                 + plan.reactivity.get(labels["reactivity"], 0.0) + 0.5 * len(words & plan.terms["contact"]))
+        name = labels["name"]
+        if any(p.search(name) for p in plan.primary):
+            score += 1.0
+        if any(p.search(name) for p in plan.secondary):
+            score += 0.5
+        return score
+
+    def eligible(self, labels: Dict, slot: str, band_max: int) -> bool:
+        if labels["band"] > band_max:
+            return False
+        if slot.startswith("E"):
+            return labels["plyometric"] and labels["e_node"] == E_NODES.index(slot)
+        return not labels["plyometric"] and labels["e_node"] == 0 and labels["movement"] in _SLOT_MOVEMENTS[slot]
+
+    def pool(self, week: int, population: str, slot: str) -> Tuple[int, ...]:
+        """Top library rows for a slot (an e-node or a non-contact slot), best fit first (cached)"""
+        key = self._cache_key + (week, population, slot)
+        rows = self._pools.get(key)
+        if rows is None:
+            plan = self.weeks[week]
+            band_max = self.band_max[population]
+            scored = [(-self.score(plan, labels, slot), i) for i, labels in enumerate(self.labels)
+                      if self.eligible(labels, slot, band_max)]
+            scored.sort()
+            rows = self._pools[key] = tuple(i for _, i in scored[:POOL_DEPTH])
+        return rows
+
+    # ------------------------------------------------------------------
+    # Templates
+    # ------------------------------------------------------------------
+
+    def allocate(self, week: int, population: str) -> Dict[int, int]:
+        """Session contacts per e-node: week shares over e-nodes with exercises, Tier 3 capped"""
+        volume = self.weeks[week].volume[population]
+        shares = {e: share for e, share in enumerate(self.weeks[week].e_node_shares)
+                  if e > 0 and share > 0 and self.pool(week, population, E_NODES[e])}
+        total = sum(shares.values())
+        if not total:
+            return {}
+        target = min(volume.session_target, self.contact_ceiling.get(population, volume.session_target))
+        contacts = {e: int(target * share / total) for e, share in shares.items()}
+        tier_3 = sum(contacts.get(e, 0) for e in TIER_3)
+        cap = int(volume.tier_3_max_pct * target)
+        if tier_3 > cap:
+            scale = cap / tier_3
+            for e in TIER_3:
+                if e in contacts:
+                    contacts[e] = int(contacts[e] * scale)
+        return {e: c for e, c in contacts.items() if c >= MIN_DRILL_CONTACTS}
+
+    def template(self, week: int, population: str, day: int) -> Tuple[dict, ...]:
+        """Compiled session blocks for (week, population, day) (cached)"""
+        key = self._cache_key + (week, population, day)
+        blocks = self._sessions.get(key)
+        if blocks is not None:
+            return blocks
+        plan = self.weeks[week]
+        drills: Dict[str, List[dict]] = {name: [] for name in plan.blocks}
+        work = "WORK_A" if "WORK_A" in drills else plan.blocks[-1]
+        prep = "PREP" if "PREP" in drills else work
+
+        for e_node, contacts in sorted(self.allocate(week, population).items()):
+            pool = self.pool(week, population, E_NODES[e_node])
+            n = max(1, min(len(pool), round(contacts / CONTACTS_PER_DRILL)))
+            per_drill = contacts // n
+            sets = min(4 if per_drill >= 20 else 3, max(1, per_drill // 3))
+            reps = max(1, per_drill // sets)
+            for k in range(n):
+                row = pool[((day - 1) * n + k) % len(pool)]
+                target = prep if e_node == 1 else work
+                drills[target].append(self._exercise(row, sets, reps, contacts=sets * reps,
+                                                     rest_sec=120 if e_node in TIER_3 else 90))
+
+        if plan.e_node_shares[0] > 0:
+            pool = self.pool(week, population, "strength")
+            if pool:
+                exercise = self._exercise(pool[(day - 1) % len(pool)], 4, 6, contacts=0, rest_sec=90)
+                if plan.eccentric_tempo:
+                    exercise["notes"] = f"Eccentric tempo {plan.eccentric_tempo}"
+                drills[work].insert(0, exercise)
+
+        for block, slot in _SLOT_BLOCKS.items():
+            if block in drills:
+                pool = self.pool(week, population, slot)
+                for k in range(min(NON_CONTACT_DRILLS, len(pool))):
+                    row = pool[((day - 1) * NON_CONTACT_DRILLS + k) % len(pool)]
+                    drills[block].append(self._exercise(row, 2 if block != "WORK_B" else 3, 10, contacts=0, rest_sec=30))
+
+        blocks = self._sessions[key] = tuple(
+            {
+                "block_name": name.replace("_", " "),
+                "block_type": name,
+                "exercises": exercises,
+                "contacts": sum(ex["contacts"] for ex in exercises),
+                "sets": sum(ex["sets"] for ex in exercises),
+            }
+            for name, exercises in drills.items() if exercises
+        )
+        return blocks
+
+    def _exercise(self, row: int, sets: int, reps: int, contacts: int, rest_sec: int) -> dict:
+        source = self.rows[row]
+        return {
+            "exercise_id": source["exercise_id"],
+            "name": source["exercise_name"],
+            "sets": sets,
+            "reps": reps,
+            "rest_sec": rest_sec,
+            "band": source["load_band_primary"],
+            "enode": source["e_node"],
+            "contacts": contacts,
+        }
+
+    # ------------------------------------------------------------------
+    # Gates
+    # ------------------------------------------------------------------
+
+    def check_entry(self, context: dict, week: int = 1) -> Tuple[List[str], List[str]]:
+        """(hard failures, soft warnings) as reason codes; hard failures reject the block"""
+        population = self.population(context)
+        season = SEASON_ALIASES.get(context.get("season_type"), context.get("season_type"))
+        hard, soft = [], []
+        if population not in self.legal_populations:
+            hard.append(f"POPULATION_NOT_LEGAL_{population}")
+        if season not in self.legal_seasons:
+            hard.append(f"SEASON_NOT_LEGAL_{season}")
+        if context.get("contraindications"):
+            hard.append("ABSOLUTE_CONTRAINDICATION_PRESENT")
+        values = {**(context.get("movement_quality") or {}), **(context.get("prerequisites") or {})}
+        for _, key, kind, threshold, hard_from in self.gates:
+            value = values.get(key)
+            if value is None:
+                passed = False
+            elif kind == "min":
+                passed = value >= threshold
+            elif kind == "max":
+                passed = value <= threshold
+            else:
+                passed = value == threshold
+            if not passed:
+                code = f"{key.upper()}_{'NOT_ASSESSED' if value is None else 'FAILED'}"
+                (hard if hard_from is not None and week >= hard_from else soft).append(code)
+        return hard, soft
+
+    @staticmethod
+    def population(context: dict) -> str:
+        population = context.get("population")
+        if population:
+            return POPULATION_ALIASES.get(population, population)
+        age = context.get("age", 15)
+        return "Youth_8_12" if age < 13 else "Youth_13_17" if age < 18 else "Adult"
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+
+    def generate_session(self, client_id: str, session_date: str, context: dict,
+                         entry: Optional[Tuple[List[str], List[str]]] = None) -> dict:
+        """SESSION artifact for one day of the block"""
+        now = utc_now_z()
+        week = int(context.get("week", 1))
+        if week not in self.weeks:
+            raise ValueError(f"{self.block_id} has weeks {sorted(self.weeks)}, got week {week}")
+        population = self.population(context)
+        readiness = context.get("readiness", "YELLOW")
+        hard, soft = entry if entry is not None else self.check_entry(context, week)
+        reasons = [f"{self.spec_name}", f"WEEK_{week}", f"READINESS_{readiness}"] + hard
+
+        template_week = week
+        eligible = not hard
+        if eligible and readiness == "YELLOW" and self.weeks[week].yellow_week:
+            template_week = self.weeks[week].yellow_week
+            reasons.append(f"READINESS_YELLOW_CONVERTED_TO_WEEK_{template_week}")
+        elif eligible and readiness != "GREEN":
+            eligible = False
+            reasons.append("READINESS_GATE_REQUIRES_GREEN" if readiness == "YELLOW" else "READINESS_RED_SESSION_SKIPPED")
+
+        plan = self.weeks[template_week]
+        volume = plan.volume.get(population)
+        day = (int(context.get("day", 1)) - 1) % (volume.session_count if volume else 1) + 1
+        blocks = copy.deepcopy(self.template(template_week, population, day)) if eligible else []
+        for block in blocks:
+            block["block_id"] = str(uuid.uuid4())
+        contacts = sum(block["contacts"] for block in blocks)
+        tier_3 = sum(ex["contacts"] for block in blocks for ex in block["exercises"]
+                     if ex["enode"] in ("E3", "E4"))
+        total_sets = sum(block["sets"] for block in blocks)
+
+        return {
+            "header": {
+                "client_id": client_id,
+                "artifact_id": str(uuid.uuid4()),
+                "artifact_class": "SESSION",
+                "target": "COACH_SHEET",
+                "generated_at": now,
+                "project_id": context.get("project_id", self.block_id.upper()),
+                "router_version": GENERATOR_VERSION,
+                "state_last_updated": now,
+                "season_type": context.get("season_type"),
+                "eligible_for_training_today": eligible,
+                "reason_codes": reasons
+            },
+            "legality_snapshot": {
+                "active_project": self.block_id,
+                "eligible": eligible,
+                "block_week": week,
+                "template_week": template_week,
+                "soft_gate_warnings": soft,
+                "reason_codes": reasons
+            },
+            "cap_proof": {
+                "caps_exist": True,
+                "population_enforced": population,
+                "readiness_flag": readiness,
+                "session_contacts_ceiling": self.contact_ceiling.get(population),
+                "session_contacts_range": [volume.session_min, volume.session_max] if volume else None,
+                "weekly_contacts_range": [volume.weekly_min, volume.weekly_max] if volume else None,
+                "tier_3_max_pct": volume.tier_3_max_pct if volume else None,
+                "max_band_allowed_population": f"Band_{self.band_max[population]}" if population in self.band_max else None
+            },
+            "exposure_summary": {
+                "total_contacts": contacts,
+                "tier_3_contacts": tier_3,
+                "tier_3_pct": round(tier_3 / contacts, 3) if contacts else 0.0,
+                "total_sets": total_sets
+            },
+            "content_payload": {
+                "session": {
+                    "session_id": str(uuid.uuid4()),
+                    "name": f"{self.display_name} - Week {week} Day {day}: {plan.focus}",
+                    "session_date": session_date,
+                    "blocks": blocks,
+                    "assessments": list(plan.assessments) if eligible else [],
+                    "total_sets": total_sets
+                }
+            },
+            "metadata": {
+                "generator_version": GENERATOR_VERSION,
+                "block_spec": self.spec_name,
+                "block_spec_version": self.version,
+                "exercise_library_version": "v2.5",
+                "global_contract_version": "1.0.1",
+                "validation_timestamp": now
+            }
+        }
+
+    def generate_block(self, client_id: str, start_date: str, context: dict) -> List[dict]:
+        """Every session of the block, spaced at least 48h apart within each week"""
+        start = date.fromisoformat(start_date)
+        entry = self.check_entry(context, week=1)
+        sessions = []
+        population = self.population(context)
+        for week, plan in sorted(self.weeks.items()):
+            volume = plan.volume.get(population)
+            count = volume.session_count if volume else 1
+            week_entry = entry if week == 1 else self.check_entry(context, week)
+            for day in range(1, count + 1):
+                session_date = start + timedelta(weeks=week - 1, days=(day - 1) * (6 // count))
+                sessions.append(self.generate_session(
+                    client_id, session_date.isoformat(), {**context, "week": week, "day": day}, entry=week_entry))
+        return sessions
+
+
+_GENERATORS: Dict[str, SpecializationBlockGenerator] = {}
+
+
+def get_specialization_generator(project_id: str) -> SpecializationBlockGenerator:
+    """Process-wide generator per specialization project, compiled on first use"""
+    generator = _GENERATORS.get(project_id)
+    if generator is None:
+        if project_id not in SPECIALIZATION_SPECS:
+            raise ValueError(f"Unknown specialization project '{project_id}' (expected one of {sorted(SPECIALIZATION_SPECS)})")
+        generator = _GENERATORS[project_id] = SpecializationBlockGenerator(SPECIALIZATION_SPECS[project_id])
+    return generator
+
+
+def generate_specialization_session(project_id: str, client_id: str, session_date: str, context: dict) -> dict:
+    """
+    Generate one specialization block SESSION artifact.
+
+    Args:
+        project_id: ELASTIC_SPECIALIZATION or DECEL_SPECIALIZATION
+        client_id: Athlete identifier
+        session_date: ISO date (YYYY-MM-DD)
+        context: Dict with week, day, population (or age), season_type,
+            readiness (default YELLOW), movement_quality, prerequisites,
+            contraindications
+
+    Returns:
+        Schema-compliant SESSION artifact
+    """
+    return get_specialization_generator(project_id).generate_session(
+        client_id, session_date, {**context, "project_id": project_id})
+
+
+def generate_specialization_block(project_id: str, client_id: str, start_date: str, context: dict) -> List[dict]:
+    """All SESSION artifacts of a specialization block starting on start_date"""
+    return get_specialization_generator(project_id).generate_block(
+        client_id, start_date, {**context, "project_id": project_id})
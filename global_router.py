@@ -0,0 +1,800 @@
+"""
+EFL Global Router - compiled legality engine.
+
+Executable form of EFL_ROUTER_DECISION_MATRIX v1.0 over client states shaped
+by EFL_GLOBAL_CLIENT_STATE v1.0.2. The precedence ladder is compiled once into
+an ordered, short-circuiting program:
+
+    1  version gate            -> collapse DEFAULTDENY_VERSION_MISMATCH
+    -  critical inputs (C-01)  -> collapse DEFAULTDENY_MISSING_CRITICAL_INPUTS
+    2  input domain check      -> collapse ROUTEROUTPUTINCOMPLETE
+    3  stored-state coherence  -> collapse DEFAULTDENY_STATEHEADER_MISMATCH
+    4  medical lock            -> collapse DEFAULTDENY_MEDICAL_LOCK
+    5  hardstop (non-R2P)      -> collapse YOUTH_HARDSTOP_NONR2P_DENY_AND_REFER /
+                                           DEFAULTDENY_HARDSTOP_NO_ROUTE
+    6  R2P enrollment          -> R2P_ACL only
+    7-10 population / season / exit gates / macro caps, per project
+    11 default allow           -> first legal project in registry order
+
+Each client state is first flattened into a FlatClientState record. Priorities
+7-8 depend only on (population, season, sport) and are precomputed as a table;
+exit gates and macro caps are checked only for the projects that declare them.
+route_roster() decides a whole roster per call and evaluates each distinct
+decision key once.
+
+The router never mutates inputs (INV-002) and never raises: any internal error
+becomes a ROUTEROUTPUTINCOMPLETE collapse.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .spec_registry import default_registry
+from .timeutil import utc_now_z
+
+
+ROUTER_VERSION = "EFL_GLOBAL_ROUTER_WRAPPER_v1.0"
+
+SCHEMA_PATH = Path(__file__).parent / "EFL_GLOBAL_CLIENT_STATE_v1.0.2.json"
+FIXTURES_PATH = Path(__file__).parent / "EFL_ROUTER_TEST_FIXTURES_v1.0.json"
+
+POPULATIONS = ("Youth812", "Youth1316", "Youth17Advanced", "Adult_GENERAL", "Adult_ATHLETE")
+SEASONS = ("OFFSEASON", "PRESEASON", "INSEASON", "POSTSEASON")
+READINESS_FLAGS = ("GREEN", "YELLOW", "RED")
+
+HIGH_CNS_PROJECTS = frozenset({
+    "ELASTIC_SPECIALIZATION",
+    "DECEL_SPECIALIZATION",
+    "FORCE_SPECIALIZATION",
+    "ICP_BASKETBALL_INSEASON",
+    "ICP_VOLLEYBALL_INSEASON"
+})
+
+
+# ============================================================================
+# DECISION MATRIX TABLES
+# ============================================================================
+
+# Matrix 4.2: population -> derived.populationoverrides (minus population_enforced)
+POPULATION_CONSTRAINTS = {
+    "Youth812": ("Band2", "E2", 0.40, "BALANCED_ONLY", 60, 20),
+    "Youth1316": ("Band2", "E2", 0.40, "BALANCED_ONLY", 80, 30),
+    "Youth17Advanced": ("Band3", "E3", None, "BALANCED_OR_FORCE", 100, 40),
+    "Adult_GENERAL": ("Band4", "E4", None, "ALL", 120, 50),
+    "Adult_ATHLETE": ("Band4", "E4", None, "ALL", 140, 60),
+}
+
+# Matrix 8.2: readiness -> (weeklymultiplier, sessionmultiplier)
+READINESS_MULTIPLIERS = {
+    "GREEN": (1.0, 1.0),
+    "YELLOW": (0.75, 0.8),
+    "RED": (0.0, 0.0),
+}
+
+_YOUTH = ("Youth812", "Youth1316", "Youth17Advanced")
+_YOUTH_13_PLUS = ("Youth1316", "Youth17Advanced")
+_SPECIALIZATION_POPULATIONS = ("Youth17Advanced", "Adult_ATHLETE")
+_ADULT = ("Adult_GENERAL", "Adult_ATHLETE")
+_DEVELOPMENTAL_SEASONS = ("OFFSEASON", "PRESEASON")
+
+# Matrices 4.3 and 5.1: project -> (legal populations, legal seasons)
+PROJECT_LEGALITY = {
+    "R2P_ACL": (POPULATIONS, SEASONS),
+    "COURT_SPORT_FOUNDATIONS": (_YOUTH, _DEVELOPMENTAL_SEASONS),
+    "ELASTIC_RELOAD": (_YOUTH, _DEVELOPMENTAL_SEASONS),
+    "ELASTIC_SPECIALIZATION": (_SPECIALIZATION_POPULATIONS, _DEVELOPMENTAL_SEASONS),
+    "DECEL_SPECIALIZATION": (_SPECIALIZATION_POPULATIONS, _DEVELOPMENTAL_SEASONS),
+    "FORCE_SPECIALIZATION": (_SPECIALIZATION_POPULATIONS, _DEVELOPMENTAL_SEASONS),
+    "ICP_BASKETBALL_INSEASON": (_YOUTH_13_PLUS, ("INSEASON",)),
+    "ICP_VOLLEYBALL_INSEASON": (_YOUTH_13_PLUS, ("INSEASON",)),
+    "ICP_BASKETBALL_POSTSEASON": (_YOUTH_13_PLUS, ("POSTSEASON",)),
+    "ICP_VOLLEYBALL_POSTSEASON": (_YOUTH_13_PLUS, ("POSTSEASON",)),
+    "OFF_SEASON_BASELINE_COURT_VERTICAL": (_YOUTH_13_PLUS, _DEVELOPMENTAL_SEASONS),
+    "ADULT_STRENGTH": (_ADULT, SEASONS),
+    "ADULT_MOBILITY": (_ADULT, SEASONS),
+    "ADULT_ERL": (_ADULT, SEASONS),
+}
+
+# ICP projects are sport-specific (matrix 5.1 summary); evaluated at the season layer
+ICP_SPORT = {
+    "ICP_BASKETBALL_INSEASON": "BASKETBALL",
+    "ICP_BASKETBALL_POSTSEASON": "BASKETBALL",
+    "ICP_VOLLEYBALL_INSEASON": "VOLLEYBALL",
+    "ICP_VOLLEYBALL_POSTSEASON": "VOLLEYBALL",
+}
+
+# Matrix 6.1: project -> required performancegates.exitflagssp flag
+EXIT_GATES = {
+    "ELASTIC_SPECIALIZATION": "elasticreloadexitpassed",
+    "DECEL_SPECIALIZATION": "foundationsexitpassed",
+    "FORCE_SPECIALIZATION": "foundationsexitpassed",
+}
+
+# Matrix 7.1: counter -> population cap (None = not applicable); denied when counter >= cap
+MACRO_CAPS = {
+    "elasticspecialization_blocks_used": {
+        "Youth812": 0, "Youth1316": 0, "Youth17Advanced": 2, "Adult_GENERAL": None, "Adult_ATHLETE": 3},
+    "forcebias_specialization_blocks_used": {
+        "Youth812": 0, "Youth1316": 0, "Youth17Advanced": 1, "Adult_GENERAL": None, "Adult_ATHLETE": 2},
+    "decel_specialization_blocks_used": {
+        "Youth812": 0, "Youth1316": 0, "Youth17Advanced": 2, "Adult_GENERAL": None, "Adult_ATHLETE": 3},
+    "consecutive_highcns_blocks": {
+        "Youth812": 2, "Youth1316": 3, "Youth17Advanced": 4, "Adult_GENERAL": None, "Adult_ATHLETE": 5},
+    "weekssincelastunload": {
+        "Youth812": 4, "Youth1316": 6, "Youth17Advanced": 8, "Adult_GENERAL": 8, "Adult_ATHLETE": 8},
+}
+
+# Project -> macro counters that gate it
+PROJECT_MACRO_COUNTERS = {
+    "ELASTIC_SPECIALIZATION": ("elasticspecialization_blocks_used",),
+    "FORCE_SPECIALIZATION": ("forcebias_specialization_blocks_used",),
+    "DECEL_SPECIALIZATION": ("decel_specialization_blocks_used",),
+}
+_HIGH_CNS_COUNTERS = ("consecutive_highcns_blocks", "weekssincelastunload")
+
+# Projecthistory project -> block counter it increments (trailing 365 days)
+_HISTORY_COUNTERS = {
+    "ELASTIC_SPECIALIZATION": "elasticspecialization_blocks_used",
+    "FORCE_SPECIALIZATION": "forcebias_specialization_blocks_used",
+    "DECEL_SPECIALIZATION": "decel_specialization_blocks_used",
+}
+
+
+# ============================================================================
+# FLAT CLIENT STATE
+# ============================================================================
+
+@dataclass(slots=True)
+class FlatClientState:
+    """One client state flattened to the fields the decision program reads"""
+    clientid: Optional[str]
+    age: Optional[int]
+    sport: Optional[str]
+    athletetrack: Optional[str]
+    isinr2pservice: Optional[bool]
+    injurytype: Optional[str]
+    seasontype: Optional[str]
+    readinessflag: Optional[str]
+    hardstoptriggered: bool
+    medicallocktriggered: bool
+    daysuntilnextgame: Optional[int]
+    practicegamesperweek: Optional[int]
+    foundationsexitpassed: bool
+    elasticreloadexitpassed: bool
+    macrocounters: Tuple[Tuple[str, int], ...]
+    coherent: bool
+
+
+def _prior_coherent(state: Dict) -> bool:
+    """
+    Coherence of the stored (prior) state: stateheader against lastupdated and
+    decisions, i.e. the fields an atomic router write (INV-004) keeps equal.
+
+    The header-vs-inputs rules are only enforced on router output: intake
+    legitimately changes inputs (season, readiness) between routings. A fresh
+    intake state without stateheader/decisions has nothing to check.
+    """
+    header = state.get("stateheader")
+    if not header:
+        return True
+
+    decisions = state.get("decisions") or {}
+    return (
+        header.get("lastupdated") == state.get("lastupdated")
+        and header.get("clientid") == state.get("clientid")
+        and header.get("activeproject") == decisions.get("activeproject")
+        and header.get("routerversion") == decisions.get("routerversion")
+        and header.get("eligible_for_training_today") == decisions.get("eligible_for_training_today")
+    )
+
+
+def _macro_counters(derived: Optional[Dict], now_date: Optional[date]) -> Dict[str, int]:
+    """
+    Macro counters from the prior derived partition.
+
+    Explicit derived.macrocounters win; otherwise block counts are rebuilt
+    from projecthistory entries started within the trailing 365 days.
+    """
+    if not derived:
+        return {}
+    counters = derived.get("macrocounters")
+    if counters:
+        return dict(counters)
+
+    history = derived.get("projecthistory") or []
+    if not history:
+        return {}
+
+    rebuilt: Dict[str, int] = {}
+    for entry in history:
+        counter = _HISTORY_COUNTERS.get(entry.get("projectid"))
+        if counter is None:
+            continue
+        if now_date is not None:
+            try:
+                if (now_date - date.fromisoformat(entry["startdate"])).days > 365:
+                    continue
+            except (KeyError, TypeError, ValueError):
+                pass
+        rebuilt[counter] = rebuilt.get(counter, 0) + 1
+
+    streak = 0
+    for entry in sorted(history, key=lambda e: e.get("startdate") or "", reverse=True):
+        if entry.get("projectid") not in HIGH_CNS_PROJECTS:
+            break
+        streak += 1
+    if streak:
+        rebuilt["consecutive_highcns_blocks"] = streak
+    return rebuilt
+
+
+def flatten_client_state(state: Dict, now_date: Optional[date] = None) -> FlatClientState:
+    """Project a nested client state onto a FlatClientState record"""
+    inputs = state.get("inputs") or {}
+    profile = inputs.get("athleteprofile") or {}
+    medical = inputs.get("medicalstatus") or {}
+    hardstop = medical.get("hardstopstatus") or {}
+    context = inputs.get("trainingcontext_global") or {}
+    exit_flags = (inputs.get("performancegates") or {}).get("exitflagssp") or {}
+
+    return FlatClientState(
+        clientid=state.get("clientid"),
+        age=profile.get("age"),
+        sport=profile.get("sport"),
+        athletetrack=profile.get("athletetrack"),
+        isinr2pservice=medical.get("isinr2pservice"),
+        injurytype=medical.get("injurytype"),
+        seasontype=context.get("seasontype"),
+        readinessflag=context.get("readinessflag"),
+        hardstoptriggered=hardstop.get("hardstoptriggered") is True,
+        medicallocktriggered=hardstop.get("medicallocktriggered") is True,
+        daysuntilnextgame=context.get("daysuntilnextgame"),
+        practicegamesperweek=context.get("practicegamesperweek"),
+        foundationsexitpassed=exit_flags.get("foundationsexitpassed") is True,
+        elasticreloadexitpassed=exit_flags.get("elasticreloadexitpassed") is True,
+        macrocounters=tuple(sorted(_macro_counters(state.get("derived"), now_date).items())),
+        coherent=_prior_coherent(state)
+    )
+
+
+def compute_population(age: int, athletetrack: str) -> Optional[str]:
+    """POP-01..POP-05"""
+    if 8 <= age <= 12:
+        return "Youth812"
+    if 13 <= age <= 16:
+        return "Youth1316"
+    if age == 17:
+        return "Youth17Advanced"
+    if age >= 18:
+        return "Adult_ATHLETE" if athletetrack == "ATHLETE" else "Adult_GENERAL"
+    return None
+
+
+# ============================================================================
+# COMPILED ROUTER
+# ============================================================================
+
+@dataclass(slots=True)
+class _Decision:
+    """Shared result of one decision key; expanded per client on output"""
+    activeproject: str
+    legal_projects: Tuple[str, ...]
+    illegal: Tuple[Tuple[str, str], ...]
+    eligible: bool
+    reasoncodes: Tuple[str, ...]
+    rationale: Tuple[Tuple[int, str, str], ...]
+    population: Optional[str]
+    r2p_hardstop: bool
+    collapsed: bool
+
+
+class GlobalRouter:
+    """
+    Compiled EFL Global Router.
+
+    Usage:
+        router = GlobalRouter()
+        outputs = router.route_roster(states)           # whole roster
+        output = router.route_client_state(state)       # one client
+    """
+
+    def __init__(self, schema_path: Optional[str] = None, router_version: str = ROUTER_VERSION):
+        if schema_path is None:
+            schema = default_registry().get(SCHEMA_PATH.stem)
+        else:
+            with open(schema_path, 'r', encoding='utf-8') as f:
+                schema = json.load(f)
+
+        definitions = schema["definitions"]
+        self.router_version = router_version
+        self.projects: Tuple[str, ...] = tuple(definitions["ProjectID"]["enum"])
+        self.reason_codes = frozenset(definitions["ReasonCode"]["enum"])
+        self.allowed_versions = frozenset(schema["versioncoherence"]["allowedrouter_versions"])
+
+        athlete = schema["properties"]["inputs"]["properties"]["athleteprofile"]["properties"]
+        medical = schema["properties"]["inputs"]["properties"]["medicalstatus"]["properties"]
+        self.age_range = (athlete["age"]["minimum"], athlete["age"]["maximum"])
+        self.sports = frozenset(athlete["sport"]["enum"])
+        self.athlete_tracks = frozenset(athlete["athletetrack"]["enum"])
+        self.injury_types = frozenset(medical["injurytype"]["enum"])
+
+        missing = set(self.projects) - set(PROJECT_LEGALITY)
+        if missing:
+            raise ValueError(f"Decision matrix has no legality row for {sorted(missing)}")
+
+        self.version_allowed = router_version in self.allowed_versions
+        self._legality_table = self._compile_legality_table()
+        self._collapses: Dict[str, _Decision] = {}
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    def _compile_legality_table(self) -> Dict[tuple, Tuple[Tuple[str, Optional[str]], ...]]:
+        """
+        (population, season, sport) -> ((project, reason or None), ...) in registry order.
+
+        Covers priorities 6-8 for non-R2P clients; R2P_ACL is routable only
+        under enrollment, so it is denied here with MISSING_DOWNSTREAM_AUTHORITY
+        (System-1 is its legality authority).
+        """
+        table = {}
+        for population in POPULATIONS:
+            for season in SEASONS:
+                for sport in self.sports:
+                    row = []
+                    for project in self.projects:
+                        populations, seasons = PROJECT_LEGALITY[project]
+                        if project == "R2P_ACL":
+                            reason = "MISSING_DOWNSTREAM_AUTHORITY"
+                        elif population not in populations:
+                            reason = "AGE_POPULATION_DENY"
+                        elif season not in seasons or ICP_SPORT.get(project, sport) != sport:
+                            reason = "SEASON_DENY"
+                        else:
+                            reason = None
+                        row.append((project, reason))
+                    table[(population, season, sport)] = tuple(row)
+        return table
+
+    # ------------------------------------------------------------------
+    # Decision program
+    # ------------------------------------------------------------------
+
+    def _collapse(self, reason: str) -> _Decision:
+        decision = self._collapses.get(reason)
+        if decision is None:
+            decision = _Decision(
+                activeproject="NONE",
+                legal_projects=(),
+                illegal=tuple((project, reason) for project in self.projects),
+                eligible=False,
+                reasoncodes=(reason,),
+                rationale=(),
+                population=None,
+                r2p_hardstop=False,
+                collapsed=True
+            )
+            self._collapses[reason] = decision
+        return decision
+
+    def _decide(self, flat: FlatClientState) -> _Decision:
+        """Ordered, short-circuiting evaluation of the precedence ladder"""
+        # 1. Version gate
+        if not self.version_allowed:
+            return self._collapse("DEFAULTDENY_VERSION_MISMATCH")
+
+        # C-01. Never-default inputs
+        if (flat.age is None or flat.sport is None or flat.athletetrack is None
+                or flat.isinr2pservice is None or flat.injurytype is None or flat.seasontype is None):
+            return self._collapse("DEFAULTDENY_MISSING_CRITICAL_INPUTS")
+
+        # 2. Input domains (the schema-typed fields the ladder reads)
+        age_min, age_max = self.age_range
+        if (type(flat.age) is not int or not age_min <= flat.age <= age_max
+                or type(flat.isinr2pservice) is not bool
+                or flat.sport not in self.sports
+                or flat.athletetrack not in self.athlete_tracks
+                or flat.injurytype not in self.injury_types
+                or flat.seasontype not in SEASONS
+                or (flat.readinessflag is not None and flat.readinessflag not in READINESS_FLAGS)):
+            return self._collapse("ROUTEROUTPUTINCOMPLETE")
+
+        # 3. Coherence of the stored state
+        if not flat.coherent:
+            return self._collapse("DEFAULTDENY_STATEHEADER_MISMATCH")
+
+        # 4. Medical lock
+        if flat.medicallocktriggered:
+            return self._collapse("DEFAULTDENY_MEDICAL_LOCK")
+
+        # 5. Hardstop outside R2P
+        if flat.hardstoptriggered and not flat.isinr2pservice:
+            if flat.age < 18:
+                return self._collapse("YOUTH_HARDSTOP_NONR2P_DENY_AND_REFER")
+            return self._collapse("DEFAULTDENY_HARDSTOP_NO_ROUTE")
+
+        # Derived construction and conservative defaults
+        reasoncodes = []
+        rationale = []
+        if flat.readinessflag is None:
+            reasoncodes.append("DEFAULT_READINESS_YELLOW")
+            rationale.append((7, "DEFAULT_READINESS_YELLOW", "readinessflag=YELLOW; multipliers applied"))
+        if flat.seasontype == "INSEASON":
+            if flat.daysuntilnextgame is None:
+                reasoncodes.append("DEFAULT_ASSUME_GAME_PROXIMITY")
+                rationale.append((7, "DEFAULT_ASSUME_GAME_PROXIMITY", "daysuntilnextgame=2"))
+            if flat.practicegamesperweek is None:
+                reasoncodes.append("DEFAULT_ASSUME_PRACTICE_VOLUME")
+                rationale.append((7, "DEFAULT_ASSUME_PRACTICE_VOLUME", "practicegamesperweek=4"))
+        population = compute_population(flat.age, flat.athletetrack)
+
+        # 6. R2P enrollment
+        if flat.isinr2pservice:
+            illegal = tuple((p, "R2P_ENROLLMENT_LOCKS_SP") for p in self.projects if p != "R2P_ACL")
+            rationale.append((6, "R2P_ENROLLMENT_LOCKS_SP",
+                              "activeproject=R2P_ACL; restrict legal_projects to R2P only"))
+            if flat.hardstoptriggered:
+                rationale.append((6, "R2P_HARDSTOP", "r2p_systemone_output.r2pstagestatus=HARDSTOP"))
+            return _Decision(
+                activeproject="R2P_ACL",
+                legal_projects=("R2P_ACL",),
+                illegal=illegal,
+                eligible=True,
+                reasoncodes=tuple(reasoncodes),
+                rationale=tuple(rationale),
+                population=population,
+                r2p_hardstop=flat.hardstoptriggered,
+                collapsed=False
+            )
+
+        # 7-8. Population and season (precompiled)
+        row = self._legality_table[(population, flat.seasontype, flat.sport)]
+
+        # 9-10. Exit gates and macro caps, only for projects that declare them
+        counters = dict(flat.macrocounters)
+        legal = []
+        illegal = []
+        fired = {}
+        for project, reason in row:
+            if reason is None:
+                gate = EXIT_GATES.get(project)
+                if gate is not None and not getattr(flat, gate):
+                    reason = "EXIT_GATE_NOT_MET"
+                elif project in HIGH_CNS_PROJECTS and self._macro_capped(project, population, counters):
+                    reason = "MACRO_CAP_EXCEEDED"
+            if reason is None:
+                legal.append(project)
+            else:
+                illegal.append((project, reason))
+                fired[reason] = fired.get(reason, 0) + 1
+
+        for priority, reason in ((7, "AGE_POPULATION_DENY"), (8, "SEASON_DENY"),
+                                 (9, "EXIT_GATE_NOT_MET"), (10, "MACRO_CAP_EXCEEDED")):
+            if reason in fired:
+                rationale.append((priority, reason, f"{fired[reason]} projects denied"))
+
+        # 11. Default allow: first legal project in registry order
+        activeproject = legal[0] if legal else "NONE"
+        rationale.append((11, "DEFAULT_ALLOW", f"activeproject={activeproject}"))
+
+        return _Decision(
+            activeproject=activeproject,
+            legal_projects=tuple(legal),
+            illegal=tuple(illegal),
+            eligible=bool(legal),
+            reasoncodes=tuple(reasoncodes),
+            rationale=tuple(rationale),
+            population=population,
+            r2p_hardstop=False,
+            collapsed=False
+        )
+
+    def _decision_key(self, flat: FlatClientState) -> tuple:
+        """
+        Every input the decision depends on, client identity excluded.
+
+        An in-range age enters as its population class and a valid readiness
+        flag as True, which is all the ladder reads from them past the domain
+        check (readiness only decides whether DEFAULT_READINESS_YELLOW fires).
+        """
+        age_min, age_max = self.age_range
+        age = flat.age
+        if type(age) is int and age_min <= age <= age_max:
+            age = compute_population(age, flat.athletetrack)
+        readiness = flat.readinessflag
+        if readiness in READINESS_FLAGS:
+            readiness = True
+        return (
+            age, flat.sport, flat.athletetrack, flat.isinr2pservice, flat.injurytype,
+            flat.seasontype, readiness, flat.hardstoptriggered, flat.medicallocktriggered,
+            flat.daysuntilnextgame is None, flat.practicegamesperweek is None,
+            flat.foundationsexitpassed, flat.elasticreloadexitpassed, flat.macrocounters, flat.coherent
+        )
+
+    @staticmethod
+    def _macro_capped(project: str, population: str, counters: Dict[str, int]) -> bool:
+        for counter in PROJECT_MACRO_COUNTERS.get(project, ()) + _HIGH_CNS_COUNTERS:
+            cap = MACRO_CAPS[counter][population]
+            if cap is not None and counters.get(counter, 0) >= cap:
+                return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Output assembly
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def population_overrides(population: str) -> Dict:
+        """derived.populationoverrides for one population (matrix 4.2, INV-001)"""
+        band, enode, accent_cap, fvbias, weekly_cap, session_cap = POPULATION_CONSTRAINTS[population]
+        return {
+            "population_enforced": population,
+            "maxbandallowed_population": band,
+            "maxenodeallowed_population": enode,
+            "enode_accent_cap_pct": accent_cap,
+            "fvbiaslock": fvbias,
+            "weeklycontactscap_population": weekly_cap,
+            "sessioncontactscap_population": session_cap
+        }
+
+    @staticmethod
+    def readiness_multipliers(readiness: str) -> Dict:
+        """derived.readinessmultipliers for an effective readiness flag (matrix 8.2)"""
+        weekly_mult, session_mult = READINESS_MULTIPLIERS[readiness]
+        return {"weeklymultiplier": weekly_mult, "sessionmultiplier": session_mult}
+
+    @staticmethod
+    def effective_readiness(inputs: Optional[Dict]) -> str:
+        """inputs readinessflag ?? 'YELLOW' (stateheader and multiplier source)"""
+        readiness = ((inputs or {}).get("trainingcontext_global") or {}).get("readinessflag")
+        return readiness if readiness in READINESS_FLAGS else "YELLOW"
+
+    def _derived(self, decision: _Decision, readiness: str, prior_derived: Optional[Dict],
+                 macrocounters: Tuple[Tuple[str, int], ...]) -> Dict:
+        prior = prior_derived or {}
+        derived = {
+            "populationoverrides": self.population_overrides(decision.population),
+            "readinessmultipliers": self.readiness_multipliers(readiness),
+            "icp_bridge_allowed": bool(prior.get("icp_bridge_allowed", False))
+        }
+        if macrocounters:
+            derived["macrocounters"] = dict(macrocounters)
+
+        r2p_output = prior.get("r2p_systemone_output")
+        if decision.r2p_hardstop:
+            r2p_output = dict(r2p_output or {}, r2pstagestatus="HARDSTOP")
+        if r2p_output is not None:
+            derived["r2p_systemone_output"] = r2p_output
+        if prior.get("projecthistory") is not None:
+            derived["projecthistory"] = prior["projecthistory"]
+        return derived
+
+    def _decisions_partition(self, decision: _Decision) -> Dict:
+        return {
+            "activeproject": decision.activeproject,
+            "legal_projects": list(decision.legal_projects),
+            "illegal_projects_with_reasons": [
+                {"projectid": project, "reasoncode": reason} for project, reason in decision.illegal
+            ],
+            "eligible_for_training_today": decision.eligible,
+            "router_reasoncodes": list(decision.reasoncodes),
+            "routerversion": self.router_version,
+            "rationale_stack": [
+                {"priority": priority, "rule": rule, "fired": True, "effect": effect}
+                for priority, rule, effect in decision.rationale
+            ]
+        }
+
+    def _stateheader(self, clientid: Optional[str], now: str, inputs: Optional[Dict],
+                     activeproject: str, eligible: bool) -> Dict:
+        return {
+            "clientid": clientid,
+            "lastupdated": now,
+            "activeproject": activeproject,
+            # Never defaulted, even in collapse (guide v1.0.1 patch)
+            "seasontype": ((inputs or {}).get("trainingcontext_global") or {}).get("seasontype"),
+            "readinessflag": self.effective_readiness(inputs),
+            "routerversion": self.router_version,
+            "eligible_for_training_today": eligible
+        }
+
+    def _assemble(self, state: Dict, decision: _Decision, now: str,
+                  macrocounters: Tuple[Tuple[str, int], ...] = ()) -> Dict:
+        """Build the output state; stateheader and decisions are produced together (INV-004)"""
+        clientid = state.get("clientid")
+        inputs = state.get("inputs")
+        return {
+            "clientid": clientid,
+            "lastupdated": now,
+            "stateheader": self._stateheader(clientid, now, inputs, decision.activeproject, decision.eligible),
+            "inputs": inputs,
+            "derived": None if decision.collapsed else self._derived(
+                decision, self.effective_readiness(inputs), state.get("derived"), macrocounters),
+            "decisions": self._decisions_partition(decision)
+        }
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def route_client_state(self, state: Dict, now: Optional[str] = None) -> Dict:
+        """Route one client state"""
+        return self.route_roster([state], now)[0]
+
+    def route_roster(self, states: List[Dict], now: Optional[str] = None) -> List[Dict]:
+        """
+        Route every client state in one call.
+
+        Identical decision keys (same population, sport, season, medical and
+        gate inputs) are decided and validated once and shared across the
+        roster; each client still gets its own output document.
+        """
+        now = now or utc_now_z()
+        try:
+            now_date = date.fromisoformat(now[:10])
+        except ValueError:
+            now_date = None
+
+        decisions: Dict[tuple, _Decision] = {}
+        outputs = []
+        for state in states:
+            try:
+                flat = flatten_client_state(state, now_date)
+                key = self._decision_key(flat)
+                decision = decisions.get(key)
+                if decision is not None:
+                    output = self._assemble(state, decision, now, flat.macrocounters)
+                else:
+                    decision = self._decide(flat)
+                    output = self._assemble(state, decision, now, flat.macrocounters)
+                    if validate_router_output(output, self):
+                        decision = self._collapse("ROUTEROUTPUTINCOMPLETE")
+                        output = self._assemble(state, decision, now)
+                    decisions[key] = decision
+            except Exception:
+                output = self._assemble(
+                    state if isinstance(state, dict) else {},
+                    self._collapse("ROUTEROUTPUTINCOMPLETE"),
+                    now
+                )
+            outputs.append(output)
+        return outputs
+
+
+# ============================================================================
+# OUTPUT VALIDATION (Phases 2-3)
+# ============================================================================
+
+def validate_router_output(output: Dict, router: GlobalRouter) -> List[str]:
+    """Coherence rules and invariants INV-001/003/005/006; returns the violations"""
+    problems = []
+    header = output["stateheader"]
+    decisions = output["decisions"]
+    derived = output["derived"]
+    context = (output.get("inputs") or {}).get("trainingcontext_global") or {}
+    readiness = context.get("readinessflag")
+
+    if header["lastupdated"] != output["lastupdated"]:
+        problems.append("COHERENCE: stateheader.lastupdated")
+    if header["activeproject"] != decisions["activeproject"]:
+        problems.append("COHERENCE: stateheader.activeproject")
+    if header["routerversion"] != decisions["routerversion"]:
+        problems.append("COHERENCE: stateheader.routerversion")
+    if header["seasontype"] != context.get("seasontype"):
+        problems.append("COHERENCE: stateheader.seasontype")
+    if readiness in READINESS_FLAGS and header["readinessflag"] != readiness:
+        problems.append("COHERENCE: stateheader.readinessflag")
+
+    if derived is not None:
+        overrides = derived["populationoverrides"]
+        youth = overrides["population_enforced"] in ("Youth812", "Youth1316")
+        if overrides["enode_accent_cap_pct"] != (0.40 if youth else None):
+            problems.append("INV-001: enode_accent_cap_pct")
+    if decisions["eligible_for_training_today"] and derived is None:
+        problems.append("INV-003: derived missing while eligible")
+    if (derived is not None and readiness is None
+            and not any(r["rule"] == "DEFAULT_READINESS_YELLOW" for r in decisions["rationale_stack"])):
+        problems.append("INV-005: DEFAULT_READINESS_YELLOW not logged")
+
+    codes = set(decisions["router_reasoncodes"])
+    codes.update(item["reasoncode"] for item in decisions["illegal_projects_with_reasons"])
+    unknown = codes - router.reason_codes
+    if unknown:
+        problems.append(f"INV-006: unknown reason codes {sorted(unknown)}")
+    if len(set(decisions["legal_projects"])) != len(decisions["legal_projects"]):
+        problems.append("SCHEMA: legal_projects not unique")
+    return problems
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+# COLLAPSE_01 is described as "missing seasontype" but its state still carries
+# inputs.trainingcontext_global.seasontype; the described input is applied here.
+FIXTURE_ERRATA = {
+    "COLLAPSE_01_MISSING_CRITICAL_INPUTS": ("inputs", "trainingcontext_global", "seasontype"),
+}
+
+
+def fixture_input_state(fixture: Dict) -> Dict:
+    """The routable input state of one fixture (errata applied, original untouched)"""
+    state = json.loads(json.dumps(fixture["state"]))
+    path = FIXTURE_ERRATA.get(fixture["test_id"])
+    if path:
+        node = state
+        for part in path[:-1]:
+            node = node[part]
+        node.pop(path[-1], None)
+    return state
+
+
+def verify_fixtures(fixtures_path: Optional[str] = None,
+                    schema_path: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    Route every fixture and compare with its expected state.
+
+    Each fixture is routed by a router at the fixture's own routerversion and
+    timestamp. Expected illegal_projects_with_reasons entries must be present
+    (fixtures list a subset); every other compared field must match exactly.
+    Returns test_id -> mismatches (empty list when the case passes).
+    """
+    if fixtures_path is None:
+        fixtures = default_registry().get(FIXTURES_PATH.stem)["fixtures"]
+    else:
+        with open(fixtures_path, 'r', encoding='utf-8') as f:
+            fixtures = json.load(f)["fixtures"]
+
+    routers: Dict[str, GlobalRouter] = {}
+    results = {}
+    for fixture in fixtures:
+        expected = fixture["state"]
+        version = expected["stateheader"]["routerversion"]
+        router = routers.get(version)
+        if router is None:
+            router = routers[version] = GlobalRouter(schema_path, router_version=version)
+
+        actual = router.route_client_state(fixture_input_state(fixture), now=expected["lastupdated"])
+        want, got = expected["decisions"], actual["decisions"]
+        mismatches = []
+        for field_name in ("activeproject", "legal_projects", "eligible_for_training_today",
+                           "router_reasoncodes", "routerversion"):
+            if want[field_name] != got[field_name]:
+                mismatches.append(f"decisions.{field_name}: expected {want[field_name]!r}, got {got[field_name]!r}")
+
+        got_illegal = {(i["projectid"], i["reasoncode"]) for i in got["illegal_projects_with_reasons"]}
+        for item in want["illegal_projects_with_reasons"]:
+            if (item["projectid"], item["reasoncode"]) not in got_illegal:
+                mismatches.append(f"decisions.illegal_projects_with_reasons: missing {item}")
+
+        if expected["derived"] is None:
+            if actual["derived"] is not None:
+                mismatches.append("derived: expected null")
+        elif actual["derived"] is None:
+            mismatches.append("derived: expected populated")
+        else:
+            for section in ("populationoverrides", "readinessmultipliers"):
+                if expected["derived"][section] != actual["derived"][section]:
+                    mismatches.append(f"derived.{section}: expected {expected['derived'][section]!r}, "
+                                      f"got {actual['derived'][section]!r}")
+
+        if actual["stateheader"]["activeproject"] != want["activeproject"]:
+            mismatches.append("stateheader.activeproject")
+        results[fixture["test_id"]] = mismatches
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    failures = {test_id: m for test_id, m in verify_fixtures().items() if m}
+    for test_id, mismatches in failures.items():
+        print(test_id)
+        for mismatch in mismatches:
+            print(f"   {mismatch}")
+    print(f"{'FAIL' if failures else 'PASS'}: router fixtures")
+    sys.exit(1 if failures else 0)
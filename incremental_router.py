@@ -0,0 +1,264 @@
+"""
+Incremental derived-state recomputation for the EFL Global Router.
+
+Intake/update flows are the only writers of inputs.* (INV-002); everything
+else in a client state is derived from them. Each derivation below declares
+the input (or upstream derivation) paths it reads. An update recomputes only
+the derivations whose dependencies changed, in declaration order, and stops
+propagating at a derivation whose value comes out unchanged.
+
+The prior state must be a router output for its current inputs (as written by
+ClientStateStore); the result is then identical to routing the updated state
+from scratch with GlobalRouter. States that cannot be patched (never routed,
+routed by another router version, incoherent, or collapsing on either side of
+the update) are re-routed in full.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from .global_router import (
+    GlobalRouter, _prior_coherent, compute_population, flatten_client_state, validate_router_output
+)
+from .cache_manager import get_cache_manager
+from .timeutil import utc_now_z
+
+
+@dataclass(frozen=True)
+class Derivation:
+    """One derived target and the state paths it reads"""
+    target: str
+    depends_on: Tuple[str, ...]
+
+
+# Every input the router decision reads (see GlobalRouter._decision_key)
+DECISION_INPUTS = (
+    "inputs.athleteprofile.age",
+    "inputs.athleteprofile.sport",
+    "inputs.athleteprofile.athletetrack",
+    "inputs.medicalstatus.isinr2pservice",
+    "inputs.medicalstatus.injurytype",
+    "inputs.medicalstatus.hardstopstatus.hardstoptriggered",
+    "inputs.medicalstatus.hardstopstatus.medicallocktriggered",
+    "inputs.trainingcontext_global.seasontype",
+    "inputs.trainingcontext_global.readinessflag",
+    "inputs.trainingcontext_global.daysuntilnextgame",
+    "inputs.trainingcontext_global.practicegamesperweek",
+    "inputs.performancegates.exitflagssp.foundationsexitpassed",
+    "inputs.performancegates.exitflagssp.elasticreloadexitpassed",
+)
+
+# Declaration order is evaluation order; later derivations may read earlier targets
+DERIVATIONS = (
+    Derivation("derived.populationoverrides", (
+        "inputs.athleteprofile.age",
+        "inputs.athleteprofile.athletetrack",
+    )),
+    Derivation("derived.readinessmultipliers", (
+        "inputs.trainingcontext_global.readinessflag",
+    )),
+    Derivation("decisions", DECISION_INPUTS),
+    Derivation("derived.r2p_systemone_output", (
+        "decisions",
+    )),
+    Derivation("stateheader", (
+        "decisions",
+        "inputs.trainingcontext_global.seasontype",
+        "inputs.trainingcontext_global.readinessflag",
+    )),
+)
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """True if one dotted path is the other or contains it"""
+    return a == b or a.startswith(b + ".") or b.startswith(a + ".")
+
+
+def _get_path(state: Dict, path: str, default=None):
+    node = state
+    for part in path.split("."):
+        if not isinstance(node, dict) or part not in node:
+            return default
+        node = node[part]
+    return node
+
+
+def _with_path(state: Dict, path: str, value: Any) -> Dict:
+    """Copy-on-write set: copies only the dicts along path, shares everything else"""
+    head, _, rest = path.partition(".")
+    updated = dict(state)
+    if rest:
+        child = state.get(head)
+        updated[head] = _with_path(child if isinstance(child, dict) else {}, rest, value)
+    else:
+        updated[head] = value
+    return updated
+
+
+_MISSING = object()
+_FULL = object()
+
+
+class IncrementalRouter:
+    """
+    Applies input updates to routed client states, recomputing only what the
+    updated paths reach.
+
+    Usage:
+        engine = IncrementalRouter(GlobalRouter())
+        new_state, recomputed = engine.apply_updates(
+            state, {"inputs.trainingcontext_global.readinessflag": "RED"})
+    """
+
+    def __init__(self, router: Optional[GlobalRouter] = None, derivations: Tuple[Derivation, ...] = DERIVATIONS):
+        self.router = router or GlobalRouter()
+        self.derivations = derivations
+        # Keys lead with a per-router token: derivations differ between routers
+        self._cache_token = object()
+        self._affected_cache = get_cache_manager().register("incremental_router.affected", max_entries=4096)
+
+    def affected(self, changed_paths) -> Tuple[str, ...]:
+        """Targets reached by changed_paths, transitively, in evaluation order"""
+        changed_paths = tuple(changed_paths)
+        key = (self._cache_token, changed_paths)
+        targets = self._affected_cache.get(key)
+        if targets is None:
+            dirty = list(changed_paths)
+            targets = []
+            for derivation in self.derivations:
+                if any(_overlaps(dep, path) for dep in derivation.depends_on for path in dirty):
+                    targets.append(derivation.target)
+                    dirty.append(derivation.target)
+            targets = self._affected_cache[key] = tuple(targets)
+        return targets
+
+    def apply_updates(self, state: Dict, updates: Dict[str, Any],
+                      now: Optional[str] = None) -> Tuple[Dict, Tuple[str, ...]]:
+        """Single-client form of apply_roster()"""
+        return self.apply_roster([(state, updates)], now)[0]
+
+    def apply_roster(self, items: List[Tuple[Dict, Dict[str, Any]]],
+                     now: Optional[str] = None) -> List[Tuple[Dict, Tuple[str, ...]]]:
+        """
+        Apply {path: value} input updates to many client states.
+
+        Returns (new_state, recomputed) per item, where recomputed lists the
+        changed input paths followed by every derived target that was
+        recomputed. Unchanged values are no-ops: the state is returned as is
+        with an empty tuple. Input states are never mutated.
+        """
+        now = now or utc_now_z()
+        try:
+            now_date = date.fromisoformat(now[:10])
+        except ValueError:
+            now_date = None
+
+        decisions_memo: Dict[tuple, Any] = {}
+        results = [self._apply(state, updates, now, now_date, decisions_memo) for state, updates in items]
+
+        # States that cannot be patched are routed together, sharing decisions
+        full = [i for i, (_, recomputed) in enumerate(results) if recomputed and recomputed[-1] is _FULL]
+        if full:
+            outputs = self.router.route_roster([results[i][0] for i in full], now)
+            for i, output in zip(full, outputs):
+                results[i] = (output, results[i][1][:-1] + ("derived", "decisions", "stateheader"))
+        return results
+
+    def _apply(self, state: Dict, updates: Dict[str, Any], now: str,
+               now_date: Optional[date], decisions_memo: Dict) -> Tuple[Dict, Tuple[str, ...]]:
+        for path in updates:
+            if not path.startswith("inputs."):
+                raise ValueError(f"Only inputs.* may be updated (INV-002): {path}")
+
+        changed = [path for path, value in updates.items() if _get_path(state, path, _MISSING) != value]
+        if not changed:
+            return state, ()
+
+        new_state = state
+        for path in changed:
+            new_state = _with_path(new_state, path, updates[path])
+
+        router = self.router
+        decisions = state.get("decisions")
+        if (state.get("derived") is None or not decisions or not state.get("stateheader")
+                or decisions.get("routerversion") != router.router_version or not _prior_coherent(state)):
+            return self._full(new_state, changed)
+
+        targets = self.affected(changed)
+        new_derived = dict(state["derived"])
+        new_decisions = decisions
+        recomputed = []
+        fresh_key = None
+
+        for target in targets:
+            if target == "derived.populationoverrides":
+                profile = new_state["inputs"].get("athleteprofile") or {}
+                age = profile.get("age")
+                if type(age) is not int:
+                    return self._full(new_state, changed)
+                population = compute_population(age, profile.get("athletetrack"))
+                if population is None:
+                    return self._full(new_state, changed)
+                overrides = router.population_overrides(population)
+                if overrides != new_derived.get("populationoverrides"):
+                    new_derived["populationoverrides"] = overrides
+                    recomputed.append(target)
+
+            elif target == "derived.readinessmultipliers":
+                multipliers = router.readiness_multipliers(router.effective_readiness(new_state["inputs"]))
+                if multipliers != new_derived.get("readinessmultipliers"):
+                    new_derived["readinessmultipliers"] = multipliers
+                    recomputed.append(target)
+
+            elif target == "decisions":
+                old_key = router._decision_key(flatten_client_state(state, now_date))
+                new_flat = flatten_client_state(new_state, now_date)
+                if (dict(new_flat.macrocounters) or None) != new_derived.get("macrocounters"):
+                    return self._full(new_state, changed)
+                new_key = router._decision_key(new_flat)
+                if new_key == old_key:
+                    continue
+                decision = decisions_memo.get(new_key)
+                if decision is None:
+                    decision = decisions_memo[new_key] = router._decide(new_flat)
+                    fresh_key = new_key
+                if decision.collapsed:
+                    return self._full(new_state, changed)
+                new_decisions = router._decisions_partition(decision)
+                recomputed.append(target)
+
+                r2p_output = state["derived"].get("r2p_systemone_output")
+                if decision.r2p_hardstop:
+                    r2p_output = dict(r2p_output or {}, r2pstagestatus="HARDSTOP")
+                if r2p_output != new_derived.get("r2p_systemone_output"):
+                    new_derived["r2p_systemone_output"] = r2p_output
+                    recomputed.append("derived.r2p_systemone_output")
+
+            elif target == "stateheader":
+                # Recomputed below: lastupdated moves with every applied update
+                pass
+
+        header = router._stateheader(
+            new_state.get("clientid"), now, new_state["inputs"],
+            new_decisions["activeproject"], new_decisions["eligible_for_training_today"]
+        )
+        recomputed.append("stateheader")
+
+        new_state = dict(new_state)
+        new_state["lastupdated"] = now
+        new_state["stateheader"] = header
+        if any(target.startswith("derived.") for target in recomputed):
+            new_state["derived"] = new_derived
+        new_state["decisions"] = new_decisions
+
+        # Like route_roster, the first output of each new decision is validated
+        if fresh_key is not None and validate_router_output(new_state, router):
+            decisions_memo[fresh_key] = router._collapse("ROUTEROUTPUTINCOMPLETE")
+            return self._full(new_state, changed)
+        return new_state, tuple(changed) + tuple(recomputed)
+
+    @staticmethod
+    def _full(new_state: Dict, changed: List[str]) -> Tuple[Dict, tuple]:
+        """Mark the updated state for a from-scratch route in apply_roster()"""
+        return new_state, tuple(changed) + (_FULL,)
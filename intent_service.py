@@ -0,0 +1,285 @@
+"""
+Local HTTP intent service (asyncio, standard library only).
+
+Serves requests.process_intent over HTTP/1.1 on TCP and/or a Unix domain
+socket, so integrations exchange JSON with one warm process instead of
+embedding the package and paying its startup in every caller.
+
+Endpoints:
+    POST /intents         one intent message -> its response
+    POST /intents/batch   JSON array of intent messages -> array of responses, in order
+    GET  /health          {"status": "OK", "pid", "requests", "connections"}
+
+Intent outcomes (APPROVED / DENIED / FAILED) are answered 200 with the
+status in the body; HTTP errors are reserved for requests that never reach
+the pipeline (400 malformed JSON, 404, 405, 411, 413, 431, 501).
+
+Connections are persistent (HTTP/1.1, or HTTP/1.0 with Connection:
+keep-alive) until the client sends Connection: close or stays idle for
+keepalive_s. Pipelined requests are read from the connection buffer one
+after another and answered in order.
+
+Without an executor, single intents run on the event loop: a warm session
+takes well under a millisecond, less than handing it to a thread would
+cost. Batches and mesocycle intents always run in a thread (the executor,
+else asyncio's default pool) so they cannot stall other connections. With
+an executor (the CLI's --threads) every intent runs in it, which also lets
+identical concurrent session intents coalesce (requests.COALESCE_GENERATION).
+
+Usage:
+    python -m package.intent_service --bind 127.0.0.1:8080 --unix /run/efl-http.sock --threads 8
+    curl --unix-socket /run/efl-http.sock -d @intent.json http://efl/intents
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 8 * 1024 * 1024
+MAX_BATCH = 256
+KEEPALIVE_S = 15.0
+THREADS = 8
+# Intents slow enough (whole mesocycles) to run off the event loop even without an executor
+OFFLOADED_INTENTS = frozenset({"REQUEST_MESOCYCLE_GENERATION"})
+
+
+def _default_handler(message: dict) -> dict:
+    from .requests import process_intent
+    return process_intent(message)
+
+
+class _HTTPError(Exception):
+    """A request answered with an HTTP error; the connection is closed unless keep_alive"""
+
+    def __init__(self, status: int, error: str, keep_alive: bool = False, headers: Optional[Dict[str, str]] = None):
+        super().__init__(error)
+        self.status = status
+        self.error = error
+        self.keep_alive = keep_alive
+        self.headers = headers or {}
+
+
+class IntentService:
+    """HTTP front end for the intent pipeline"""
+
+    def __init__(self, handler: Optional[Callable[[dict], dict]] = None, executor=None,
+                 max_batch: int = MAX_BATCH, max_body_bytes: int = MAX_BODY_BYTES,
+                 keepalive_s: float = KEEPALIVE_S):
+        if max_batch < 1:
+            raise ValueError(f"max_batch must be at least 1, got {max_batch}")
+        self.handler = handler or _default_handler
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_body_bytes = max_body_bytes
+        self.keepalive_s = keepalive_s
+        self.addresses: List[str] = []
+        self.served = 0
+        self.connections = 0
+        self._servers: List[asyncio.AbstractServer] = []
+        self._unix_path: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self, host: Optional[str] = None, port: Optional[int] = None,
+                    unix_path: Optional[str] = None) -> List[str]:
+        """Listen on host:port and/or unix_path (port 0 picks a free port); returns the bound addresses"""
+        if port is None and unix_path is None:
+            raise ValueError("Give a TCP port, a Unix socket path, or both")
+        if port is not None:
+            server = await asyncio.start_server(self._connection, host or "127.0.0.1", port,
+                                                limit=MAX_HEADER_BYTES)
+            self._servers.append(server)
+            bound_host, bound_port = server.sockets[0].getsockname()[:2]
+            self.addresses.append(f"{bound_host}:{bound_port}")
+        if unix_path is not None:
+            if os.path.exists(unix_path):
+                os.unlink(unix_path)  # stale socket from an unclean exit
+            server = await asyncio.start_unix_server(self._connection, unix_path, limit=MAX_HEADER_BYTES)
+            self._servers.append(server)
+            self._unix_path = unix_path
+            self.addresses.append(f"unix:{unix_path}")
+        return self.addresses
+
+    async def close(self) -> None:
+        for server in self._servers:
+            server.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers.clear()
+        if self._unix_path and os.path.exists(self._unix_path):
+            os.unlink(self._unix_path)
+
+    async def serve_forever(self, host: Optional[str] = None, port: Optional[int] = None,
+                            unix_path: Optional[str] = None,
+                            on_ready: Optional[Callable[[List[str]], None]] = None) -> None:
+        """Start, call on_ready(addresses) and serve until SIGTERM / SIGINT"""
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+        try:
+            await self.start(host, port, unix_path)
+            if on_ready is not None:
+                on_ready(self.addresses)
+            await stop.wait()
+        finally:
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                loop.remove_signal_handler(sig)
+            await self.close()
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    async def _connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, path, keep_alive, body = request
+                    status, payload = await self._dispatch(method, path, body)
+                    headers = {}
+                except _HTTPError as exc:
+                    status, payload, headers = exc.status, {"status": "FAILED", "error_code": "HTTP_ERROR",
+                                                            "error": exc.error}, exc.headers
+                    keep_alive = keep_alive and exc.keep_alive
+                writer.write(self._encode(status, payload, keep_alive, headers))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, bool, bytes]]:
+        """(method, path, keep_alive, body) of the next request; None when the client is done or idle"""
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.keepalive_s)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+            return None
+        except asyncio.LimitOverrunError:
+            raise _HTTPError(431, f"Request head exceeds {MAX_HEADER_BYTES} bytes")
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ")
+        if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+            raise _HTTPError(400, f"Malformed request line: {lines[0][:80]!r}")
+        method, target, version = parts
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        if "transfer-encoding" in headers:
+            raise _HTTPError(501, "Transfer-Encoding is not supported; send Content-Length")
+        length = headers.get("content-length")
+        if length is None:
+            if method == "POST":
+                raise _HTTPError(411, "POST requires Content-Length")
+            return method, target.split("?", 1)[0], keep_alive, b""
+        if not length.isdigit():
+            raise _HTTPError(400, f"Invalid Content-Length {length!r}")
+        if int(length) > self.max_body_bytes:
+            raise _HTTPError(413, f"Body exceeds {self.max_body_bytes} bytes")
+        body = await reader.readexactly(int(length))
+        return method, target.split("?", 1)[0], keep_alive, body
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, object]:
+        routes = {"/intents": "POST", "/intents/batch": "POST", "/health": "GET"}
+        if path not in routes:
+            raise _HTTPError(404, f"No route {path} (routes: {sorted(routes)})", keep_alive=True)
+        if method != routes[path]:
+            raise _HTTPError(405, f"{path} accepts {routes[path]}", keep_alive=True,
+                             headers={"Allow": routes[path]})
+        if path == "/health":
+            return 200, {"status": "OK", "pid": os.getpid(), "requests": self.served,
+                         "connections": self.connections}
+
+        try:
+            message = json.loads(body)
+        except ValueError as exc:
+            raise _HTTPError(400, f"Body is not JSON: {exc}", keep_alive=True)
+        if path == "/intents":
+            self.served += 1
+            offload = isinstance(message, dict) and message.get("intent_type") in OFFLOADED_INTENTS
+            return 200, await self._run(self._handle, message, offload)
+        if not isinstance(message, list):
+            raise _HTTPError(400, "Batch body must be a JSON array of intent messages", keep_alive=True)
+        if len(message) > self.max_batch:
+            raise _HTTPError(413, f"Batch of {len(message)} exceeds {self.max_batch} intents", keep_alive=True)
+        self.served += len(message)
+        return 200, await self._run(lambda messages: [self._handle(m) for m in messages], message, offload=True)
+
+    async def _run(self, fn, arg, offload: bool = False):
+        if self.executor is None and not offload:
+            return fn(arg)
+        # executor None: asyncio's default thread pool
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, arg)
+
+    def _handle(self, message) -> dict:
+        try:
+            return self.handler(message)
+        except Exception as exc:  # one failing intent must not fail the connection or its batch
+            return {"status": "FAILED", "error_code": "INTERNAL_ERROR", "error": f"{type(exc).__name__}: {exc}"}
+
+    @staticmethod
+    def _encode(status: int, payload, keep_alive: bool, headers: Dict[str, str]) -> bytes:
+        body = json.dumps(payload, default=str).encode("utf-8")
+        head = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+                "Content-Type: application/json",
+                f"Content-Length: {len(body)}",
+                f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        head.extend(f"{name}: {value}" for name, value in headers.items())
+        return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="EFL intent service (HTTP over TCP / Unix socket)")
+    parser.add_argument("--bind", default=None, help="host:port (default 127.0.0.1:8080 unless --unix is given)")
+    parser.add_argument("--unix", default=None, help="Unix domain socket path")
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH)
+    parser.add_argument("--threads", type=int, default=THREADS,
+                        help=f"intent handler threads (default {THREADS}); 0 runs single intents on the event loop")
+    parser.add_argument("--no-warm", action="store_true", help="skip compiling the generator stack at startup")
+    args = parser.parse_args(argv)
+
+    host = port = None
+    if args.bind or not args.unix:
+        host, _, port = (args.bind or "127.0.0.1:8080").rpartition(":")
+        if not host or not port.isdigit():
+            parser.error(f"--bind must be host:port, got {args.bind!r}")
+        port = int(port)
+    if args.threads < 0:
+        parser.error(f"--threads must not be negative, got {args.threads}")
+    if not args.no_warm:
+        from .prefork_server import warm
+        warm()
+    executor = ThreadPoolExecutor(args.threads, thread_name_prefix="efl-intent") if args.threads else None
+    service = IntentService(executor=executor, max_batch=args.max_batch)
+    try:
+        asyncio.run(service.serve_forever(host, port, args.unix,
+                                          on_ready=lambda addresses: print("Serving on " + ", ".join(addresses))))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,489 @@
+"""
+Mesocycle generation engine (REQUEST_MESOCYCLE_GENERATION).
+
+Expands a block from EFL_MESOMACRO_BLOCK_MANIFEST (e.g. the 12-week, 2x/week
+SP_OFFSEASON_MULTI_13-17_12WK_v1: 24 sessions) into a week-by-week plan and
+generates every session with one warm EFL session generator.
+
+Weekly caps are cumulative, so the sessions of a week are planned together
+by the session generator's WeeklyPlanner, each against what the earlier
+sessions of that week left of the weekly budget. Weeks are independent of each other and are generated concurrently
+when an executor is given. stream() yields SESSION artifacts in session
+order as soon as each week is done; generate() wraps them in the MESOCYCLE
+artifact (weekly cap proofs and operating-range checks per
+EFL_OUTPUT_SPEC_GLOBAL_CONTRACT 14.4).
+
+Usage:
+    engine = MesocycleEngine()
+    with engine.process_pool(4) as pool:
+        for artifact in engine.stream("C1", "SP_OFFSEASON_MULTI_13-17_12WK_v1",
+                                      "2026-01-05", executor=pool):
+            ...
+"""
+
+import dataclasses
+import multiprocessing
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .efl_session_generator_v1_0 import (
+    ClientStateEngine, EFLSessionGenerator, ExerciseRouter, Population,
+    ReadinessFlag, SeasonType, SessionType
+)
+from .spec_registry import default_registry
+from .timeutil import utc_now_z
+
+
+ENGINE_VERSION = "EFL_MESOCYCLE_ENGINE_v1.0"
+MANIFEST_SPEC = "EFL_MESOMACRO_BLOCK_MANIFEST_v1.0"
+LIBRARY_CSV = Path(__file__).parent / "EFL_Exercise_Library_v2_5.csv"
+
+# Manifest block tag -> session generator population
+_POPULATION_TAGS = {
+    "YOUTH_8_12": Population.YOUTH_8_12.value,
+    "YOUTH_13_17": Population.YOUTH_13_17.value,
+    "ADULT": Population.ADULT.value,
+}
+
+# Manifest "season" -> season_type, for blocks without an explicit season_type
+_SEASONS = {
+    "Off_Season": SeasonType.OFF_SEASON.value,
+    "Pre_Season": SeasonType.PRE_SEASON.value,
+    "In_Season": SeasonType.IN_SEASON_TIER_1.value,
+    "Post_Season": SeasonType.POST_SEASON.value,
+}
+
+# Manifest "Zn" -> library fv_zones "Zone_n"
+def _library_zone(zone: str) -> str:
+    return f"Zone_{zone[1:]}" if zone.startswith("Z") and zone[1:].isdigit() else zone
+
+
+@dataclass(frozen=True, slots=True)
+class SessionSlot:
+    """One scheduled session of a mesocycle"""
+    index: int
+    week: int
+    day: str
+    session_date: str
+    cns: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class WeekPlan:
+    """One week of a block with its ceilings and weekly budgets"""
+    block_id: str
+    week: int
+    meso_num: int
+    meso_name: str
+    target_zones: Tuple[str, ...]
+    sprint_intent: Tuple[str, ...]
+    slots: Tuple[SessionSlot, ...]
+    max_band: str
+    max_node: str
+    max_e_node: str
+    plyo_cap_session: int
+    plyo_cap_week: int
+    plyo_range: Tuple[int, int]
+    sprint_range: Optional[Tuple[int, int]]
+
+
+def _lower(order: Dict[str, int], a: str, b: Optional[str]) -> str:
+    """The more restrictive of two ceilings on an ordinal scale"""
+    if b is None or b not in order:
+        return a
+    return b if order[b] < order.get(a, 0) else a
+
+
+def _range(spec) -> Optional[Tuple[int, int]]:
+    if not isinstance(spec, dict) or "max" not in spec:
+        return None
+    return int(spec.get("min", 0)), int(spec["max"])
+
+
+class MesocycleEngine:
+    """Warm, reusable mesocycle generator over the manifest blocks"""
+
+    def __init__(self, library_path: Optional[str] = None, registry=None):
+        self.library_path = str(library_path or LIBRARY_CSV)
+        self.generator = EFLSessionGenerator(self.library_path)
+        self.registry = registry or default_registry()
+        self._blocks: Optional[Dict[str, Dict]] = None
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    def blocks(self) -> Dict[str, Dict]:
+        """block_id -> block; a block restated in a later manifest document replaces the earlier one"""
+        if self._blocks is None:
+            blocks = {}
+            for document in self.registry.documents(MANIFEST_SPEC):
+                for block in document.get("blocks", []):
+                    blocks[block["block_id"]] = block
+            self._blocks = blocks
+        return self._blocks
+
+    def block(self, block_id: str) -> Dict:
+        try:
+            return self.blocks()[block_id]
+        except KeyError:
+            raise ValueError(f"Unknown block_id '{block_id}' (not in {MANIFEST_SPEC})") from None
+
+    def client_profile(self, block: Dict) -> Tuple[str, str]:
+        """(population, season_type) the block is written for"""
+        tags = set(block.get("block_tags", []))
+        if "R2P" in tags:
+            raise ValueError(f"Block {block['block_id']} is an R2P block; use the R2P-ACL stage generator")
+        population = next((p for tag, p in _POPULATION_TAGS.items() if tag in tags), None)
+        season_type = block.get("season_type") or _SEASONS.get(block.get("season"))
+        if population is None or season_type not in SeasonType._value2member_map_:
+            raise ValueError(f"Block {block['block_id']} has no session generator population/season")
+        return population, season_type
+
+    def plan(self, block_id: str, start_date: str, weeks: Optional[int] = None) -> List[WeekPlan]:
+        """Week-by-week plan of the first `weeks` weeks (default: the whole block)"""
+        block = self.block(block_id)
+        duration = int(block["duration_weeks"])
+        weeks = duration if weeks is None else weeks
+        if not 1 <= weeks <= duration:
+            raise ValueError(f"Block {block_id} runs {duration} weeks; cannot plan {weeks}")
+
+        per_week = int(block["sessions_per_week"])
+        legality = block.get("legality_check", {})
+        e_node = legality.get("max_e_node_allowed")
+        start = date.fromisoformat(start_date)
+
+        plans = []
+        index = 0
+        for meso in block["macro_structure"]:
+            plyo_range = _range(meso.get("plyo_contact_range")) or (0, int(legality["plyo_contacts_cap_week"]))
+            cns_per_day = meso.get("cns_per_day", {})
+            for week in meso["weeks"]:
+                if week > weeks:
+                    continue
+                slots = []
+                for i in range(per_week):
+                    index += 1
+                    day = chr(ord("A") + i)
+                    session_date = start + timedelta(days=(week - 1) * 7 + (i * 7) // per_week)
+                    slots.append(SessionSlot(index, week, day, session_date.isoformat(),
+                                             cns_per_day.get(f"day_{day}")))
+                plans.append(WeekPlan(
+                    block_id=block_id,
+                    week=week,
+                    meso_num=meso["meso_num"],
+                    meso_name=meso.get("meso_name", ""),
+                    target_zones=tuple(_library_zone(z) for z in meso.get("fv_zones_allowed", [])),
+                    sprint_intent=tuple(meso.get("sprint_intent", [])),
+                    slots=tuple(slots),
+                    max_band=legality.get("population_ceiling_band", "Band_0"),
+                    max_node=legality.get("population_ceiling_node", "A"),
+                    max_e_node="E0" if e_node in (None, "NONE") else e_node,
+                    plyo_cap_session=int(legality["plyo_contacts_cap_session"]),
+                    plyo_cap_week=min(int(legality["plyo_contacts_cap_week"]), plyo_range[1]),
+                    plyo_range=plyo_range,
+                    sprint_range=_range(meso.get("sprint_meters_range"))
+                ))
+        return sorted(plans, key=lambda p: p.week)
+
+    # ------------------------------------------------------------------
+    # Generation
+    # ------------------------------------------------------------------
+
+    def generate_week(self, client: Dict, week: WeekPlan) -> List[Dict]:
+        """
+        Generate one week's sessions with the session generator's weekly planner.
+
+        The client's ceilings are lowered to the block's, the session cap to
+        the block session cap, and the weekly caps to the block's weekly cap
+        and the meso's operating range, so every planned session fits what
+        the sessions before it left of the week.
+        """
+        state = ClientStateEngine.compute_state(
+            client_id=client["client_id"],
+            population=Population(client["population"]),
+            sport=client["sport"],
+            season_type=SeasonType(client["season_type"]),
+            readiness_flag=ReadinessFlag(client["readiness_flag"]),
+            injury_flags=list(client.get("injury_flags", ())),
+            session_type=SessionType.FULL_SESSION
+        )
+        state = dataclasses.replace(
+            state,
+            max_band_allowed=_lower(ExerciseRouter.BAND_ORDER, state.max_band_allowed, week.max_band),
+            max_node_allowed=_lower(ExerciseRouter.NODE_ORDER, state.max_node_allowed, week.max_node),
+            max_e_node_allowed=_lower(ExerciseRouter.E_NODE_ORDER, state.max_e_node_allowed, week.max_e_node),
+            plyo_contacts_cap_session=min(state.plyo_contacts_cap_session, week.plyo_cap_session),
+            plyo_contacts_cap_weekly=min(state.plyo_contacts_cap_weekly, week.plyo_cap_week)
+        )
+        seasonal_range = dict(ClientStateEngine.seasonal_range(state.population, state.season_type))
+        seasonal_range["plyo_min"], seasonal_range["plyo_max"] = week.plyo_range
+        if week.sprint_range:
+            seasonal_range["sprint_min"], seasonal_range["sprint_max"] = week.sprint_range
+
+        planned = self.generator.planner.plan_week(
+            f"{week.block_id}#W{week.week}", [state] * len(week.slots),
+            list(week.target_zones) or None, seasonal_range
+        )
+        weekly_caps = (planned["weekly_plyo_budget"], planned["weekly_sprint_budget"])
+
+        artifacts = []
+        plyo_used = sprint_used = 0
+        for slot, result in zip(week.slots, planned["sessions"]):
+            artifacts.append(_session_artifact(
+                client, week, slot, state, result, weekly_caps, (plyo_used, sprint_used)
+            ))
+            if result["status"] == "SUCCESS":
+                plyo_used += result["total_plyo_contacts"]
+                sprint_used += result["total_sprint_meters"]
+        return artifacts
+
+    def stream(self, client_id: str, block_id: str, start_date: str, sport: Optional[str] = None,
+               readiness_flag: str = "GREEN", injury_flags: Tuple[str, ...] = (),
+               weeks: Optional[int] = None, executor: Optional[Executor] = None,
+               project_id: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Yield the block's SESSION artifacts in session order.
+
+        Without an executor weeks are generated one after another in this
+        process. With one, every week is submitted up front and each is
+        yielded as soon as it and all earlier weeks are done.
+        """
+        block = self.block(block_id)
+        client = self._client(client_id, block, sport, readiness_flag, injury_flags, project_id)
+        plans = self.plan(block_id, start_date, weeks)
+
+        if executor is None:
+            for week in plans:
+                yield from self.generate_week(client, week)
+            return
+
+        futures = [executor.submit(_generate_week_task, self.library_path, client, week) for week in plans]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def generate(self, client_id: str, block_id: str, start_date: str, project_id: Optional[str] = None,
+                 on_session=None, **options) -> Dict:
+        """
+        Generate the whole mesocycle and return its MESOCYCLE artifact.
+
+        options are passed to stream(); on_session, if given, is called with
+        each SESSION artifact as it streams in.
+        """
+        sessions = []
+        for artifact in self.stream(client_id, block_id, start_date, project_id=project_id, **options):
+            sessions.append(artifact)
+            if on_session is not None:
+                on_session(artifact)
+        return _mesocycle_artifact(client_id, project_id, self.block(block_id), start_date, sessions)
+
+    def process_pool(self, workers: int) -> ProcessPoolExecutor:
+        """
+        Process pool whose workers start with this engine already warm.
+
+        Uses fork where available, so workers inherit the loaded library
+        instead of re-reading it; elsewhere each worker loads it once.
+        """
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return ProcessPoolExecutor(max_workers=workers)
+        # The initializer runs in each forked child, so this process's engine is left alone
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"),
+                                   initializer=_set_worker_engine, initargs=(self,))
+
+    def _client(self, client_id: str, block: Dict, sport: Optional[str], readiness_flag: str,
+                injury_flags: Tuple[str, ...], project_id: Optional[str] = None) -> Dict:
+        population, season_type = self.client_profile(block)
+        tags = set(block.get("block_tags", []))
+        return {
+            "client_id": client_id,
+            "population": population,
+            "sport": sport or ("Basketball" if "BASKETBALL" in tags else "Multi-Sport"),
+            "season_type": season_type,
+            "readiness_flag": ReadinessFlag(readiness_flag).value,
+            "injury_flags": tuple(injury_flags),
+            "project_id": project_id
+        }
+
+
+# Engine used by executor workers (inherited over fork, else built on first task)
+_WORKER_ENGINE: Optional[MesocycleEngine] = None
+
+
+def _set_worker_engine(engine: MesocycleEngine) -> None:
+    """Pool initializer: adopt the engine inherited over fork"""
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = engine
+
+
+def _generate_week_task(library_path: str, client: Dict, week: WeekPlan) -> List[Dict]:
+    global _WORKER_ENGINE
+    engine = _WORKER_ENGINE
+    if engine is None or engine.library_path != library_path:
+        engine = _WORKER_ENGINE = MesocycleEngine(library_path)
+    return engine.generate_week(client, week)
+
+
+# ============================================================================
+# ARTIFACTS
+# ============================================================================
+
+def _session_artifact(client: Dict, week: WeekPlan, slot: SessionSlot, state, result: Dict,
+                      weekly_caps: Tuple[int, int], weekly_before: Tuple[int, int]) -> Dict:
+    now = utc_now_z()
+    approved = result["status"] == "SUCCESS"
+    reason_codes = [f"MESO_BLOCK_{week.block_id}", f"READINESS_{client['readiness_flag']}"]
+    if not approved:
+        reason_codes.append(result["status"])
+    return {
+        "header": {
+            "client_id": client["client_id"],
+            "artifact_id": str(uuid.uuid4()),
+            "artifact_class": "SESSION",
+            "target": "MESOCYCLE",
+            "generated_at": now,
+            "project_id": client.get("project_id"),
+            "router_version": ENGINE_VERSION,
+            "state_last_updated": now,
+            "season_type": client["season_type"],
+            "eligible_for_training_today": approved,
+            "reason_codes": reason_codes
+        },
+        "legality_snapshot": {
+            "block_id": week.block_id,
+            "eligible": approved,
+            "reason_codes": reason_codes
+        },
+        "cap_proof": {
+            "caps_exist": True,
+            "population_enforced": client["population"],
+            "readiness_flag": client["readiness_flag"],
+            "weekly_contacts_cap_applied": weekly_caps[0],
+            "weekly_sprint_meters_cap_applied": weekly_caps[1],
+            "weekly_contacts_before_session": weekly_before[0],
+            "weekly_sprint_meters_before_session": weekly_before[1],
+            "session_contacts_cap_base": state.plyo_contacts_cap_session,
+            "session_contacts_cap_applied": result["plyo_allowance"],
+            "max_band_allowed_population": state.max_band_allowed,
+            "max_enode_allowed_population": state.max_e_node_allowed
+        },
+        "exposure_summary": {
+            "total_contacts": result.get("total_plyo_contacts", 0),
+            "total_sprint_meters": result.get("total_sprint_meters", 0)
+        },
+        "content_payload": {
+            "session": {
+                "session_id": str(uuid.uuid4()),
+                "session_index": slot.index,
+                "session_date": slot.session_date,
+                "week": slot.week,
+                "day": slot.day,
+                "meso_num": week.meso_num,
+                "meso_name": week.meso_name,
+                "cns": slot.cns,
+                "fv_zones": list(week.target_zones),
+                "sprint_intent": list(week.sprint_intent),
+                "status": result["status"],
+                "blocks": result.get("session_plan"),
+                "reason": result.get("reason")
+            }
+        },
+        "metadata": {
+            "generator_version": ENGINE_VERSION,
+            "manifest": MANIFEST_SPEC,
+            "global_contract_version": "1.0.1",
+            "validation_timestamp": now
+        }
+    }
+
+
+def _mesocycle_artifact(client_id: str, project_id: Optional[str], block: Dict, start_date: str,
+                        sessions: List[Dict]) -> Dict:
+    now = utc_now_z()
+    weeks: Dict[int, Dict] = {}
+    for artifact in sessions:
+        session = artifact["content_payload"]["session"]
+        caps = artifact["cap_proof"]
+        week = weeks.setdefault(session["week"], {
+            "week": session["week"],
+            "meso_num": session["meso_num"],
+            "sessions": [],
+            "plyo_contacts": 0,
+            "sprint_meters": 0,
+            "plyo_contacts_cap": caps["weekly_contacts_cap_applied"],
+            "sprint_meters_cap": caps["weekly_sprint_meters_cap_applied"],
+            "eligible": True
+        })
+        week["sessions"].append(artifact["header"]["artifact_id"])
+        week["plyo_contacts"] += artifact["exposure_summary"]["total_contacts"]
+        week["sprint_meters"] += artifact["exposure_summary"]["total_sprint_meters"]
+        week["eligible"] = week["eligible"] and artifact["header"]["eligible_for_training_today"]
+
+    ranges = {w: meso for meso in block["macro_structure"] for w in meso["weeks"]}
+    for number, week in weeks.items():
+        plyo_range = _range(ranges[number].get("plyo_contact_range"))
+        week["plyo_contact_range"] = list(plyo_range) if plyo_range else None
+        # Operating ranges are informational below the minimum (manifest integration notes)
+        week["below_operating_range"] = bool(plyo_range and week["plyo_contacts"] < plyo_range[0])
+        week["within_weekly_caps"] = (week["plyo_contacts"] <= week["plyo_contacts_cap"]
+                                      and week["sprint_meters"] <= week["sprint_meters_cap"])
+
+    weekly = [weeks[n] for n in sorted(weeks)]
+    eligible = all(w["eligible"] and w["within_weekly_caps"] for w in weekly)
+    return {
+        "header": {
+            "client_id": client_id,
+            "artifact_id": str(uuid.uuid4()),
+            "artifact_class": "MESOCYCLE",
+            "target": "MESOCYCLE",
+            "generated_at": now,
+            "project_id": project_id,
+            "router_version": ENGINE_VERSION,
+            "state_last_updated": now,
+            "season_type": sessions[0]["header"]["season_type"] if sessions else None,
+            "eligible_for_training_today": eligible,
+            "reason_codes": [f"MESO_BLOCK_{block['block_id']}"]
+        },
+        "legality_snapshot": {
+            "block_id": block["block_id"],
+            "eligible": eligible,
+            "weeks": [{"week": w["week"], "eligible": w["eligible"]} for w in weekly]
+        },
+        "cap_proof": {
+            "caps_exist": True,
+            "weekly": [
+                {key: w[key] for key in ("week", "plyo_contacts", "plyo_contacts_cap", "sprint_meters",
+                                         "sprint_meters_cap", "within_weekly_caps")}
+                for w in weekly
+            ]
+        },
+        "exposure_summary": {
+            "total_contacts": sum(w["plyo_contacts"] for w in weekly),
+            "total_sprint_meters": sum(w["sprint_meters"] for w in weekly),
+            "total_sessions": len(sessions)
+        },
+        "content_payload": {
+            "mesocycle": {
+                "block_id": block["block_id"],
+                "start_date": start_date,
+                "duration_weeks": len(weekly),
+                "weeks": weekly,
+                "sessions": sessions,
+                "assessment_gates": block.get("assessment_gates", {}),
+                "exit_state": block.get("exit_state", {})
+            }
+        },
+        "metadata": {
+            "generator_version": ENGINE_VERSION,
+            "manifest": MANIFEST_SPEC,
+            "global_contract_version": "1.0.1",
+            "validation_timestamp": now
+        }
+    }
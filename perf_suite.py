@@ -0,0 +1,2539 @@
+"""
+Performance suite for the EFL governance package.
+
+Each benchmark is a plain function registered in BENCHMARKS; it prints one
+report block and returns a dict of its headline numbers. Equivalence checks
+against the reference (per-session) paths run inside the benchmarks, so a
+fast-but-wrong change fails the suite.
+
+Usage (from the directory containing the package):
+    python -m <package>.perf_suite                 # run everything
+    python -m <package>.perf_suite batch_validation
+"""
+
+import gc
+import json
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+
+REPO_ROOT = Path(__file__).parent
+LIBRARY_CSV = REPO_ROOT / "EFL_Exercise_Library_v2_5.csv"
+
+
+def _timed(fn: Callable, *args, **kwargs):
+    """(result, seconds) of one call"""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _best_of(fn: Callable, repeat: int = 5):
+    """(result, best seconds) over repeated calls, with the GC paused while timing"""
+    gc.collect()
+    gc.disable()
+    try:
+        best = None
+        for _ in range(repeat):
+            result, seconds = _timed(fn)
+            best = seconds if best is None else min(best, seconds)
+    finally:
+        gc.enable()
+    return result, best
+
+
+def _report(title: str, rows: List[tuple]):
+    """Print one aligned report block"""
+    print(f"\n== {title}")
+    width = max(len(label) for label, _ in rows)
+    for label, value in rows:
+        print(f"   {label.ljust(width)}  {value}")
+
+
+# ============================================================================
+# EPA BATCH VALIDATION
+# ============================================================================
+
+def _epa_library_with_e_nodes():
+    """
+    EPA library with e_node filled from the CSV e_node column.
+
+    The EPA loader derives e_node from aether_difficulty, which Library v2.5
+    does not carry; filling it here makes the E-node gates do real work.
+    """
+    import csv
+    from .epa_v2_2_full import ExerciseLibrary
+
+    library = ExerciseLibrary(str(LIBRARY_CSV))
+    with open(LIBRARY_CSV, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            ex = library.exercises.get(row["exercise_id"])
+            if ex is not None and row.get("e_node"):
+                ex.e_node = row["e_node"]
+    library.revalidate()
+    return library
+
+
+def synthetic_epa_inputs(library, n_sessions: int, seed: int = 7) -> List[Dict]:
+    """Deterministic mix of legal and illegal EPA inputs over the real library"""
+    rng = random.Random(seed)
+    exercise_ids = list(library.exercises)
+    plyo_ids = [eid for eid, ex in library.exercises.items() if ex.is_plyometric]
+    populations = ["Youth_8_12", "Youth_13_17", "Adult", "R2P_Stage_1"]
+    seasons = ["OFF_SEASON", "PRE_SEASON", "IN_SEASON_TIER_1", "IN_SEASON_TIER_2", "POST_SEASON"]
+
+    inputs = []
+    for i in range(n_sessions):
+        blocks = []
+        for block_name in ("PRIME", "PREP", "WORK", "CLEAR"):
+            items = []
+            for _ in range(rng.randint(0, 4)):
+                pool = plyo_ids if block_name == "WORK" and rng.random() < 0.5 else exercise_ids
+                item = {
+                    "exercise_id": rng.choice(pool) if rng.random() > 0.01 else "EX_MISSING",
+                    "sets": rng.randint(1, 5),
+                    "reps": rng.randint(1, 12)
+                }
+                if rng.random() < 0.1:
+                    item["distance_m"] = rng.choice([10, 20, 30, 40])
+                    item["intensity_percent_vmax"] = rng.choice([80, 90, 95, 100])
+                items.append(item)
+            blocks.append({"name": block_name, "items": items, "duration_minutes_target": 10})
+
+        inputs.append({
+            "client_id": f"CLIENT_{i % 500:04d}",
+            "session_id": f"S{i:06d}",
+            "population": rng.choice(populations),
+            "sport": "Basketball",
+            "season_type": rng.choice(seasons),
+            "readiness_flag": rng.choice(["GREEN", "GREEN", "YELLOW", "RED"]),
+            "injury_flags": [],
+            "week_id": f"2026-W{(i // 500) % 52 + 1:02d}",
+            "planned_sessions_this_week": 3,
+            "completed_sessions_this_week": rng.randint(0, 2),
+            "session_index": rng.randint(1, 3),
+            "session_type": rng.choice(["FULL_SESSION", "FULL_SESSION", "MICROSESSION"]),
+            "planned_sprint_sessions_this_week": 2,
+            "completed_sprint_sessions_this_week": rng.randint(0, 3),
+            "practice_exposure": {
+                "tracked_plyo_contacts_this_week": rng.randint(0, 200),
+                "tracked_true_sprint_meters_this_week": rng.randint(0, 400)
+            },
+            "blocks": blocks
+        })
+    return inputs
+
+
+def bench_batch_validation(n_sessions: int = 20000) -> Dict:
+    """Vectorized kernel vs per-session ValidationGates over a season of inputs"""
+    from .epa_v2_2_full import LimitManager, ValidationGates, SessionBuilder, InputValidator
+    from .epa_batch_validation import BatchValidationKernel
+
+    library = _epa_library_with_e_nodes()
+    limits = LimitManager()
+    inputs = synthetic_epa_inputs(library, n_sessions)
+
+    gates = ValidationGates(library, limits)
+    builder = SessionBuilder(library)
+
+    def per_session():
+        results = []
+        for data in inputs:
+            if not InputValidator.validate(data)[0]:
+                results.append([])
+                continue
+            plan = builder.build_session(data) if "blocks" in data else None
+            results.append([(g.gate_id, g.status) for g in gates.run_all_gates(data, plan)])
+        return results
+
+    reference, reference_s = _timed(per_session)
+
+    kernel, compile_s = _timed(BatchValidationKernel, library, limits)
+    batch, batch_s = _timed(kernel.validate, inputs)
+
+    mismatches = sum(1 for i, ref in enumerate(reference) if batch.gate_results(i) != ref)
+    if mismatches:
+        raise AssertionError(f"batch kernel disagrees with ValidationGates on {mismatches} sessions")
+
+    # Ledger: a client still sending pre-ledger weekly totals (which already cover
+    # the approved sessions the ledger recorded) gets the same Gate 5 result
+    from .epa_v2_2_full import EFLProgramArchitect
+    from .exposure_ledger import ExposureLedger
+
+    architect = EFLProgramArchitect(str(LIBRARY_CSV), ledger=ExposureLedger())
+    for i, data in enumerate(inputs[:2000]):
+        if "blocks" not in data or not InputValidator.validate(data)[0]:
+            continue
+        data = dict(data, week_id=f"{data['week_id']}#{i}")
+        tracked = data["practice_exposure"]
+        completed = data["completed_sessions_this_week"]
+        n_sprint = min(completed, data["completed_sprint_sessions_this_week"])
+        for k in range(completed):
+            architect.ledger.record_session(
+                data["client_id"], data["week_id"], f"S{k}",
+                plyo_contacts=tracked["tracked_plyo_contacts_this_week"] // max(completed, 2),
+                sprint_meters=tracked["tracked_true_sprint_meters_this_week"] // max(n_sprint, 2) if k < n_sprint else 0)
+        plan = builder.build_session(data)
+        alone = gates._gate_5_weekly_caps(data, plan)
+        with_ledger = gates._gate_5_weekly_caps(architect._apply_ledger_totals(data), plan)
+        if (alone.status, alone.reasons) != (with_ledger.status, with_ledger.reasons):
+            raise AssertionError(f"pre-ledger totals changed Gate 5 with a ledger attached: "
+                                 f"{alone.reasons} vs {with_ledger.reasons}")
+
+    _report(f"EPA batch validation ({n_sessions} sessions)", [
+        ("per-session python", f"{reference_s:.3f}s  ({n_sessions / reference_s:,.0f} sessions/s)"),
+        ("kernel compile", f"{compile_s * 1000:.1f}ms"),
+        ("vectorized kernel", f"{batch_s:.3f}s  ({n_sessions / batch_s:,.0f} sessions/s)"),
+        ("speedup", f"{reference_s / batch_s:.1f}x"),
+        ("equivalence", "gate statuses identical"),
+        ("ledger", "pre-ledger weekly totals give the same Gate 5 result with a ledger attached")
+    ])
+    return {"reference_s": reference_s, "batch_s": batch_s, "speedup": reference_s / batch_s}
+
+
+# ============================================================================
+# EPA PLAN OBJECTS
+# ============================================================================
+
+def _dict_backed_variant(cls):
+    """Plain (__dict__) dataclass twin of a slotted plan class, as the baseline"""
+    from dataclasses import MISSING, field, fields, make_dataclass
+
+    specs = [
+        (f.name, f.type) if f.default is MISSING else (f.name, f.type, field(default=f.default))
+        for f in fields(cls)
+    ]
+    return make_dataclass(f"Dict{cls.__name__}", specs)
+
+
+def _copy_plan(plan, exercise_cls, block_cls, plan_cls):
+    """Rebuild a plan with the given classes (leaf values shared)"""
+    from dataclasses import fields
+
+    exercise_fields = [f.name for f in fields(exercise_cls)]
+    blocks = [
+        block_cls(
+            block_type=block.block_type,
+            exercises=[
+                exercise_cls(**{name: getattr(ex, name) for name in exercise_fields})
+                for ex in block.exercises
+            ],
+            duration_minutes_target=block.duration_minutes_target
+        )
+        for block in plan.blocks
+    ]
+    return plan_cls(
+        session_id=plan.session_id,
+        client_id=plan.client_id,
+        week_id=plan.week_id,
+        session_index=plan.session_index,
+        session_type=plan.session_type,
+        blocks=blocks,
+        total_plyo_contacts=plan.total_plyo_contacts,
+        total_sprint_meters=plan.total_sprint_meters,
+        total_duration_minutes=plan.total_duration_minutes,
+        cns_category=plan.cns_category
+    )
+
+
+def _traced_bytes(fn: Callable):
+    """(result, bytes still allocated by fn's result)"""
+    tracemalloc.start()
+    result = fn()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def bench_plan_objects(n_plans: int = 10000) -> Dict:
+    """Memory per plan and serialization time: __dict__ vs slotted vs frozen plans"""
+    from dataclasses import asdict
+    from .epa_v2_2_full import (
+        ExerciseInstance, SessionBlock, SessionPlan, SessionBuilder, ResponseBuilder, freeze_session_plan
+    )
+
+    library = _epa_library_with_e_nodes()
+    builder = SessionBuilder(library)
+    plans = [builder.build_session(data) for data in synthetic_epa_inputs(library, n_plans)]
+
+    dict_classes = tuple(_dict_backed_variant(c) for c in (ExerciseInstance, SessionBlock, SessionPlan))
+    dict_plans, dict_bytes = _traced_bytes(lambda: [_copy_plan(p, *dict_classes) for p in plans])
+    slot_plans, slot_bytes = _traced_bytes(
+        lambda: [_copy_plan(p, ExerciseInstance, SessionBlock, SessionPlan) for p in plans]
+    )
+    frozen_plans, frozen_bytes = _traced_bytes(lambda: [freeze_session_plan(p) for p in plans])
+
+    serialize = ResponseBuilder._serialize_session
+    dict_out, dict_s = _best_of(lambda: [serialize(p) for p in dict_plans])
+    slot_out, slot_s = _best_of(lambda: [serialize(p) for p in slot_plans])
+    frozen_out, frozen_s = _best_of(lambda: [serialize(p) for p in frozen_plans])
+    _, asdict_s = _best_of(lambda: [asdict(p) for p in slot_plans], repeat=1)
+
+    if not (json.dumps(dict_out) == json.dumps(slot_out) == json.dumps(frozen_out)):
+        raise AssertionError("serialized plans differ between plan representations")
+
+    _report(f"EPA plan objects ({n_plans} plans)", [
+        ("memory __dict__", f"{dict_bytes / n_plans:,.0f} B/plan"),
+        ("memory slotted", f"{slot_bytes / n_plans:,.0f} B/plan  ({1 - slot_bytes / dict_bytes:.0%} less)"),
+        ("memory frozen", f"{frozen_bytes / n_plans:,.0f} B/plan  ({1 - frozen_bytes / dict_bytes:.0%} less)"),
+        ("serialize __dict__", f"{dict_s * 1000:.1f}ms"),
+        ("serialize slotted", f"{slot_s * 1000:.1f}ms"),
+        ("serialize frozen", f"{frozen_s * 1000:.1f}ms"),
+        ("dataclasses.asdict", f"{asdict_s * 1000:.1f}ms  (reflection baseline)"),
+        ("equivalence", "serialized output identical")
+    ])
+    return {"dict_bytes": dict_bytes, "slot_bytes": slot_bytes, "slot_s": slot_s, "dict_s": dict_s}
+
+
+# ============================================================================
+# GLOBAL ROUTER
+# ============================================================================
+
+def synthetic_roster(n_clients: int, seed: int = 11) -> List[Dict]:
+    """
+    Roster of client states seeded from the router fixtures.
+
+    Each client starts from a fixture input state and has its age, sport,
+    season, readiness, medical flags and exit gates perturbed, so every layer
+    of the precedence ladder fires somewhere in the roster.
+    """
+    from .global_router import FIXTURES_PATH, fixture_input_state
+
+    with open(FIXTURES_PATH, 'r', encoding='utf-8') as f:
+        seeds = [fixture_input_state(fx) for fx in json.load(f)["fixtures"]]
+    encoded = [json.dumps(state) for state in seeds]
+
+    rng = random.Random(seed)
+    roster = []
+    for i in range(n_clients):
+        state = json.loads(rng.choice(encoded))
+        state["clientid"] = f"CLIENT_{i:06d}"
+        if state.get("stateheader"):
+            state["stateheader"]["clientid"] = state["clientid"]
+        if rng.random() < 0.8:
+            # Fresh intake: no stored header/decisions to check for coherence
+            state.pop("stateheader", None)
+            state.pop("decisions", None)
+            inputs = state["inputs"]
+            profile = inputs["athleteprofile"]
+            profile["age"] = rng.randint(8, 45)
+            profile["sport"] = rng.choice(["BASKETBALL", "VOLLEYBALL", "SOCCER", "GENERAL"])
+            profile["athletetrack"] = rng.choice(["ATHLETE", "GENERAL"])
+            context = inputs["trainingcontext_global"]
+            context["seasontype"] = rng.choice(["OFFSEASON", "PRESEASON", "INSEASON", "POSTSEASON"])
+            context["readinessflag"] = rng.choice(["GREEN", "YELLOW", "RED", None])
+            hardstop = inputs["medicalstatus"]["hardstopstatus"]
+            hardstop["hardstoptriggered"] = rng.random() < 0.05
+            inputs["performancegates"] = {"exitflagssp": {
+                "foundationsexitpassed": rng.random() < 0.5,
+                "elasticreloadexitpassed": rng.random() < 0.5
+            }}
+        roster.append(state)
+    return roster
+
+
+def bench_router(n_clients: int = 50000) -> Dict:
+    """Roster routing vs one route_client_state call per client, plus fixture verification"""
+    from .global_router import GlobalRouter, verify_fixtures
+
+    failures = {test_id: m for test_id, m in verify_fixtures().items() if m}
+    if failures:
+        raise AssertionError(f"router fixtures failed: {failures}")
+
+    roster = synthetic_roster(n_clients)
+    now = "2026-01-15T12:00:00-06:00"
+    router, compile_s = _timed(GlobalRouter)
+
+    per_client, per_client_s = _best_of(lambda: [router.route_client_state(s, now) for s in roster], repeat=3)
+    batch, batch_s = _best_of(lambda: router.route_roster(roster, now), repeat=3)
+
+    if batch != per_client:
+        raise AssertionError("route_roster disagrees with route_client_state")
+
+    active = {}
+    for output in batch:
+        project = output["decisions"]["activeproject"]
+        active[project] = active.get(project, 0) + 1
+
+    _report(f"Global router ({n_clients} clients)", [
+        ("fixtures", "all cases pass"),
+        ("router compile", f"{compile_s * 1000:.1f}ms"),
+        ("per-client calls", f"{per_client_s:.3f}s  ({n_clients / per_client_s:,.0f} clients/s)"),
+        ("route_roster", f"{batch_s:.3f}s  ({n_clients / batch_s:,.0f} clients/s)"),
+        ("speedup", f"{per_client_s / batch_s:.1f}x"),
+        ("active projects", f"{len(active)} distinct; NONE={active.get('NONE', 0)}"),
+        ("equivalence", "outputs identical")
+    ])
+    return {"per_client_s": per_client_s, "batch_s": batch_s, "clients_per_s": n_clients / batch_s}
+
+
+# ============================================================================
+# CLIENT STATE STORE
+# ============================================================================
+
+def bench_state_store(n_clients: int = 20000) -> Dict:
+    """Intake, atomic routed writes, point reads and index queries on the client state store"""
+    import os
+    import tempfile
+    from .client_state_store import ClientStateStore
+    from .global_router import GlobalRouter
+
+    roster = synthetic_roster(n_clients)
+    router = GlobalRouter()
+    now = "2026-01-15T12:00:00-06:00"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ClientStateStore(os.path.join(tmp, "client_state.db"), cache_size=n_clients)
+
+        _, intake_s = _timed(store.put_inputs_many, {s["clientid"]: s["inputs"] for s in roster})
+        outputs, route_s = _timed(store.route_clients, router, None, now)
+
+        expected = {o["clientid"]: json.dumps(o, sort_keys=True) for o in router.route_roster(
+            [{"clientid": s["clientid"], "inputs": s["inputs"]} for s in roster], now)}
+        stored = store.get_many(expected)
+        if any(json.dumps(stored[cid], sort_keys=True) != text for cid, text in expected.items()):
+            raise AssertionError("stored client states differ from router output")
+
+        client_ids = [s["clientid"] for s in roster]
+        sample = client_ids[:5000]
+        _, hot_s = _best_of(lambda: [store.get(cid) for cid in sample])
+        store._cache.clear()
+        _, cold_s = _timed(lambda: [store.get(cid) for cid in sample])
+        _, epa_s = _best_of(lambda: [store.epa_context(cid) for cid in sample])
+        by_project, query_s = _timed(store.clients_by_project, "COURT_SPORT_FOUNDATIONS")
+        store.close()
+
+    # Read cache: revisions follow every write path, hits refresh recency, every insert respects cache_size
+    from .incremental_router import IncrementalRouter
+
+    small = ClientStateStore(cache_size=3)
+    small.put_inputs_many({s["clientid"]: s["inputs"] for s in roster[:5]})
+    small.route_clients(router, None, now)
+    first = roster[0]["clientid"]
+    small.put_inputs(first, roster[0]["inputs"])
+    small.get(first)
+    small.put_inputs_many({first: roster[0]["inputs"]})
+    if small.inputs_revision(first) != 3:
+        raise AssertionError(f"inputs_revision {small.inputs_revision(first)} after 3 intake writes")
+    a, b, c, d = client_ids[1:5]
+    small.get_many([a, b, c])
+    small.get(a)
+    small.get(d)
+    if set(small._cache) != {c, a, d}:
+        raise AssertionError(f"cache is not LRU: kept {sorted(small._cache)}, expected {sorted((c, a, d))}")
+    small.apply_input_updates(IncrementalRouter(router), {
+        cid: {"inputs.trainingcontext_global.readinessflag": "RED"} for cid in client_ids[:5]}, now)
+    if len(small._cache) > small.cache_size or len(small._revisions) > small.cache_size:
+        raise AssertionError(f"apply_input_updates grew the cache to {len(small._cache)} > {small.cache_size}")
+    small.close()
+
+    _report(f"Client state store ({n_clients} clients)", [
+        ("intake writes", f"{intake_s:.3f}s  ({n_clients / intake_s:,.0f} clients/s, one txn)"),
+        ("route + atomic write", f"{route_s:.3f}s  ({n_clients / route_s:,.0f} clients/s, one txn)"),
+        ("point read (cached)", f"{hot_s / len(sample) * 1e6:.2f}us"),
+        ("point read (sqlite)", f"{cold_s / len(sample) * 1e6:.1f}us"),
+        ("epa_context", f"{epa_s / len(sample) * 1e6:.2f}us"),
+        ("clients_by_project", f"{query_s * 1000:.2f}ms  ({len(by_project)} clients)"),
+        ("equivalence", "stored states identical to router output")
+    ])
+    return {"hot_read_us": hot_s / len(sample) * 1e6, "cold_read_us": cold_s / len(sample) * 1e6}
+
+
+def bench_incremental(n_clients: int = 20000, check_in_rate: float = 0.3) -> Dict:
+    """Morning readiness check-ins: incremental re-derivation vs full re-route"""
+    import os
+    import tempfile
+    from .client_state_store import ClientStateStore
+    from .global_router import GlobalRouter
+    from .incremental_router import IncrementalRouter
+
+    router = GlobalRouter()
+    engine = IncrementalRouter(router)
+    routed = router.route_roster(synthetic_roster(n_clients), "2026-01-15T06:00:00-06:00")
+    now = "2026-01-16T07:30:00-06:00"
+
+    rng = random.Random(5)
+    path = "inputs.trainingcontext_global.readinessflag"
+    check_ins = {}
+    for state in routed:
+        if rng.random() < check_in_rate:
+            check_ins[state["clientid"]] = {path: rng.choice(["GREEN", "YELLOW", "RED"])}
+    items = [(state, check_ins[state["clientid"]]) for state in routed if state["clientid"] in check_ins]
+
+    def full_reroute():
+        updated = []
+        for state, updates in items:
+            state = json.loads(json.dumps(state))
+            state["inputs"]["trainingcontext_global"]["readinessflag"] = updates[path]
+            updated.append(state)
+        return router.route_roster(updated, now)
+
+    incremental, incremental_s = _best_of(lambda: engine.apply_roster(items, now), repeat=3)
+    full, full_s = _best_of(full_reroute, repeat=3)
+
+    for (state, _), (new_state, recomputed), expected in zip(items, incremental, full):
+        if recomputed and new_state != expected:
+            raise AssertionError(f"incremental state differs from full re-route for {state['clientid']}")
+        if not recomputed and state["inputs"] != expected["inputs"]:
+            raise AssertionError(f"no-op check-in changed inputs for {state['clientid']}")
+
+    noop = sum(1 for _, recomputed in incremental if not recomputed)
+    redecided = sum(1 for _, recomputed in incremental if "decisions" in recomputed)
+
+    def routed_store(db_path):
+        store = ClientStateStore(db_path, cache_size=n_clients)
+        store.put_inputs_many({s["clientid"]: s["inputs"] for s in routed})
+        store.route_clients(router, None, "2026-01-15T06:00:00-06:00")
+        store._cache.clear()
+        return store
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = routed_store(os.path.join(tmp, "baseline.db"))
+        updated_inputs = {o["clientid"]: o["inputs"] for o in full}
+        _, baseline_s = _timed(lambda: (baseline.put_inputs_many(updated_inputs),
+                                        baseline.route_clients(router, list(updated_inputs), now)))
+        store = routed_store(os.path.join(tmp, "incremental.db"))
+        _, store_s = _timed(store.apply_input_updates, engine, check_ins, now)
+
+        stored = store.get_many(check_ins)
+        store._cache.clear()
+        if store.get_many(check_ins) != stored:
+            raise AssertionError("cached client states differ from the persisted ones")
+        # No-op check-ins are not rewritten, so only the changed clients match the baseline
+        changed = [cid for cid, recomputed in zip(check_ins, (r for _, r in incremental)) if recomputed]
+        if any(stored[cid] != baseline.get(cid) for cid in changed):
+            raise AssertionError("incremental store writes differ from intake + full re-route")
+        baseline.close()
+        store.close()
+
+    _report(f"Incremental re-derivation ({len(items)} check-ins, {n_clients} clients)", [
+        ("full re-route", f"{full_s:.3f}s  ({len(items) / full_s:,.0f} check-ins/s)"),
+        ("incremental", f"{incremental_s:.3f}s  ({len(items) / incremental_s:,.0f} check-ins/s)"),
+        ("speedup", f"{full_s / incremental_s:.1f}x"),
+        ("unchanged (no-op)", f"{noop}"),
+        ("re-decided", f"{redecided}"),
+        ("store intake + route_clients", f"{baseline_s:.3f}s  ({len(items) / baseline_s:,.0f} check-ins/s)"),
+        ("store apply_input_updates", f"{store_s:.3f}s  ({len(items) / store_s:,.0f} check-ins/s, one txn)"),
+        ("equivalence", "outputs identical to full re-route")
+    ])
+    return {"full_s": full_s, "incremental_s": incremental_s}
+
+
+# ============================================================================
+# SPEC REGISTRY
+# ============================================================================
+
+def bench_spec_registry() -> Dict:
+    """Boot-time spec loading: parse every JSON spec vs the hash-keyed compiled cache"""
+    import tempfile
+    from .spec_registry import SpecRegistry, parse_json_documents
+
+    paths = sorted(REPO_ROOT.glob("*.json"))
+    total_kb = sum(p.stat().st_size for p in paths) / 1024
+
+    def parse_all():
+        parsed = {}
+        for path in paths:
+            text = path.read_text(encoding="utf-8")
+            try:
+                parsed[path.stem] = parse_json_documents(text)
+            except ValueError:
+                parsed[path.stem] = None
+        return parsed
+
+    reference, parse_s = _best_of(parse_all, repeat=3)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _, cold_s = _timed(lambda: SpecRegistry(cache_dir=tmp).compile_all())
+        registry, discover_s = _best_of(lambda: SpecRegistry(cache_dir=tmp))
+        _, warm_s = _best_of(lambda: SpecRegistry(cache_dir=tmp).compile_all())
+        _, lazy_s = _best_of(lambda: SpecRegistry(cache_dir=tmp).get("EFL_BLOCK_SELECTOR_v1_3_2"))
+        compiled = registry.compile_all()
+
+    for name, documents in reference.items():
+        if documents and list(compiled[name].documents) != documents:
+            raise AssertionError(f"cached spec {name} differs from a fresh parse")
+    invalid = sorted(name for name, spec in compiled.items() if spec.errors)
+
+    _report(f"Spec registry ({len(paths)} specs, {total_kb:.0f} KB)", [
+        ("parse every spec", f"{parse_s * 1000:.1f}ms"),
+        ("cold compile + cache write", f"{cold_s * 1000:.1f}ms"),
+        ("discover (stat + hash index)", f"{discover_s * 1000:.1f}ms"),
+        ("warm boot, all specs", f"{warm_s * 1000:.1f}ms  ({parse_s / warm_s:.1f}x vs parse)"),
+        ("warm boot, one spec", f"{lazy_s * 1000:.1f}ms"),
+        ("invalid specs", ", ".join(invalid) or "none"),
+        ("equivalence", "cached documents identical to a fresh parse")
+    ])
+    return {"parse_s": parse_s, "warm_s": warm_s, "lazy_s": lazy_s}
+
+
+# ============================================================================
+# WEEKLY PLANNER
+# ============================================================================
+
+def bench_weekly_planner(n_weeks: int = 300, sessions_per_week: int = 3) -> Dict:
+    """Whole-week planning (one library pass, shared budget) vs independent per-session generation"""
+    from .efl_session_generator_v1_0 import (
+        ClientStateEngine, EFLSessionGenerator, Population, ReadinessFlag, SeasonType, SessionType
+    )
+
+    generator = EFLSessionGenerator(str(LIBRARY_CSV))
+    rng = random.Random(5)
+    populations = list(Population)
+    seasons = list(SeasonType)
+    weeks = []
+    for w in range(n_weeks):
+        population, season = rng.choice(populations), rng.choice(seasons)
+        states = [
+            ClientStateEngine.compute_state(
+                f"C{w:05d}", population, "Multi-Sport", season,
+                rng.choices(list(ReadinessFlag), weights=(8, 3, 1))[0], [], SessionType.FULL_SESSION
+            )
+            for _ in range(sessions_per_week)
+        ]
+        weeks.append((f"W{w:05d}", states, rng.choice([None, ["Zone_5", "Zone_6"], ["Zone_3"]])))
+
+    def independent():
+        return [[generator.builder.build_session(state, zones) for state in states] for _, states, zones in weeks]
+
+    def planned():
+        return [generator.planner.plan_week(week_id, states, zones) for week_id, states, zones in weeks]
+
+    baseline, independent_s = _best_of(independent, repeat=3)
+    plans, planned_s = _best_of(planned, repeat=3)
+
+    # Narrowed shared pools must be exactly what a fresh route gives
+    router = generator.router
+    for _, states, _ in weeks[:50]:
+        widest = max(states, key=generator.planner._ceiling_levels)
+        shared = router.route(widest)
+        for state in states:
+            if router.narrow(shared, state) != router.route(state):
+                raise AssertionError("narrowed pools differ from a fresh route")
+
+    over_cap = 0
+    for (_, states, _), sessions in zip(weeks, baseline):
+        cap = states[0].plyo_contacts_cap_weekly
+        if sum(s.get("total_plyo_contacts", 0) for s in sessions) > cap:
+            over_cap += 1
+    for plan in plans:
+        if plan["total_plyo_contacts"] > plan["weekly_plyo_budget"]:
+            raise AssertionError(f"{plan['week_id']} exceeds its weekly plyo budget")
+        for session in plan["sessions"]:
+            if session.get("total_plyo_contacts", 0) > session["plyo_allowance"]:
+                raise AssertionError(f"{plan['week_id']} session over its allowance")
+
+    n_sessions = n_weeks * sessions_per_week
+    _report(f"Weekly planner ({n_weeks} weeks x {sessions_per_week} sessions)", [
+        ("independent sessions", f"{independent_s * 1000:.0f}ms  ({n_sessions} library passes)"),
+        ("planned weeks", f"{planned_s * 1000:.0f}ms  ({n_weeks} library passes, "
+                          f"{independent_s / planned_s:.1f}x)"),
+        ("independent weeks over weekly cap", f"{over_cap}/{n_weeks}"),
+        ("planned weeks over weekly budget", f"0/{n_weeks}"),
+        ("equivalence", "narrowed pools identical to per-session routing")
+    ])
+    return {"independent_s": independent_s, "planned_s": planned_s, "over_cap": over_cap}
+
+
+# ============================================================================
+# WORK BLOCK OPTIMIZER
+# ============================================================================
+
+def bench_work_optimizer(n_sessions: int = 2000) -> Dict:
+    """WORK selection: bounded-time knapsack vs first-fit greedy (quality and latency)"""
+    from .efl_session_generator_v1_0 import (
+        ClientStateEngine, EFLSessionGenerator, Population, ReadinessFlag, SeasonType, SessionType
+    )
+
+    generator = EFLSessionGenerator(str(LIBRARY_CSV))
+    builder, optimizer = generator.builder, generator.builder.optimizer
+    rng = random.Random(37)
+    zone_choices = [None, ["Zone_5", "Zone_6", "Zone_3"], ["Zone_2", "Zone_4"], ["Zone_7"], ["Zone_1", "Zone_8"]]
+
+    routed = {}
+    cases = []
+    for _ in range(n_sessions):
+        key = (rng.choice(list(Population)), rng.choice(list(SeasonType)),
+               rng.choices(list(ReadinessFlag), weights=(8, 3, 1))[0])
+        if key not in routed:
+            state = ClientStateEngine.compute_state("BENCH", key[0], "Multi-Sport", key[1], key[2], [],
+                                                    SessionType.FULL_SESSION)
+            routed[key] = (state, generator.router.route(state)["WORK"])
+        state, pool = routed[key]
+        zones = rng.choice(zone_choices)
+        weights = {zone: rng.choice([0.5, 1.0, 2.0]) for zone in zones or ()}
+        cases.append((builder._work_candidates(pool, zones), state.plyo_contacts_cap_session, zones, weights))
+
+    def objective(selected, cap, zones, weights):
+        targets = frozenset(zones or ())
+        return sum(optimizer.value(ex, cap, targets, weights) for ex in selected)
+
+    def check(selected, cap):
+        patterns = [optimizer.features(ex)[0] for ex in selected]
+        contacts = sum(optimizer.features(ex)[1] for ex in selected)
+        if len(set(patterns)) != len(patterns) or len(selected) > optimizer.MAX_EXERCISES or contacts > cap:
+            raise AssertionError("WORK selection violates pattern/size/contact constraints")
+        return contacts
+
+    greedy_latency, optimal_latency = [], []
+    greedy_score = optimal_score = 0.0
+    greedy_contacts = optimal_contacts = budget = 0
+    fallbacks = 0
+    for candidates, cap, zones, weights in cases:
+        greedy, seconds = _timed(optimizer.greedy, candidates, cap)
+        greedy_latency.append(seconds)
+        (optimal, method), seconds = _timed(optimizer.select, candidates, cap, zones, weights)
+        optimal_latency.append(seconds)
+
+        g_score, o_score = objective(greedy, cap, zones, weights), objective(optimal, cap, zones, weights)
+        if method == "OPTIMAL" and o_score < g_score - 1e-9:
+            raise AssertionError("optimizer selection scores below greedy")
+        fallbacks += method != "OPTIMAL"
+        greedy_score += g_score
+        optimal_score += o_score
+        greedy_contacts += check(greedy, cap)
+        optimal_contacts += check(optimal, cap)
+        budget += cap
+
+    def percentile(values, q):
+        values = sorted(values)
+        return values[min(len(values) - 1, int(q * len(values)))] * 1000
+
+    _report(f"WORK block optimizer ({n_sessions} sessions, budget {optimizer.time_budget_s * 1000:.0f}ms)", [
+        ("greedy p50 / p99", f"{percentile(greedy_latency, 0.5):.3f}ms / {percentile(greedy_latency, 0.99):.3f}ms"),
+        ("optimizer p50 / p99", f"{percentile(optimal_latency, 0.5):.3f}ms / {percentile(optimal_latency, 0.99):.3f}ms"),
+        ("mean objective", f"greedy {greedy_score / n_sessions:.2f} -> optimizer {optimal_score / n_sessions:.2f}"),
+        ("contact budget used", f"greedy {greedy_contacts / max(budget, 1):.0%} -> optimizer "
+                                f"{optimal_contacts / max(budget, 1):.0%}"),
+        ("greedy fallbacks", f"{fallbacks}/{n_sessions}"),
+        ("equivalence", "constraints hold; optimizer never scores below greedy")
+    ])
+    return {"optimal_p99_ms": percentile(optimal_latency, 0.99), "fallbacks": fallbacks,
+            "objective_gain": (optimal_score - greedy_score) / n_sessions}
+
+
+# ============================================================================
+# F-V ZONE INDEX
+# ============================================================================
+
+def bench_zone_index(n_requests: int = 2000) -> Dict:
+    """Target-zone filtering: zone posting-list union vs substring scan of fv_zones"""
+    import dataclasses
+    from .efl_session_generator_v1_0 import EFLSessionGenerator, parse_fv_zones
+
+    generator = EFLSessionGenerator(str(LIBRARY_CSV))
+    library, builder = generator.library, generator.builder
+    pool = list(library.exercises.values())
+    zones = sorted(library.zone_postings)
+    rng = random.Random(38)
+    requests = [rng.sample(zones, rng.randint(1, 3)) for _ in range(n_requests)]
+
+    def substring():
+        return [[ex for ex in pool if any(zone in ex.fv_zones for zone in targets)] for targets in requests]
+
+    def indexed():
+        return [builder._work_candidates(pool, targets) for targets in requests]
+
+    scanned, scan_s = _best_of(substring, repeat=3)
+    filtered, index_s = _best_of(indexed, repeat=3)
+    for targets, result in zip(requests, filtered):
+        exact = [ex for ex in pool if parse_fv_zones(ex.fv_zones)[0] & set(targets)]
+        if result != exact:
+            raise AssertionError(f"zone index differs from exact zone matching for {targets}")
+
+    # A Zone_10 exercise must not match a Zone_1 request
+    zone_10 = dataclasses.replace(pool[0], exercise_id="BENCH_Z10", fv_zones="Zone_10", zones=frozenset({"Zone_10"}))
+    false_match = any(zone in zone_10.fv_zones for zone in ["Zone_1"])
+    if zone_10.exercise_id in library.zone_members(["Zone_1"]):
+        raise AssertionError("zone index matched Zone_10 for Zone_1")
+
+    coverage = library.zone_coverage()
+    _report(f"F-V zone index ({len(pool)} exercises, {n_requests} requests)", [
+        ("substring scan", f"{scan_s * 1000:.0f}ms"),
+        ("posting-list union", f"{index_s * 1000:.0f}ms  ({scan_s / index_s:.1f}x)"),
+        ("Zone_1 vs Zone_10", f"substring {'matches' if false_match else 'ok'}, index ok"),
+        ("coverage", ", ".join(f"{z}={c['exercises']}" for z, c in coverage["zones"].items())),
+        ("equivalence", "index == exact zone-token matching")
+    ])
+    return {"scan_s": scan_s, "index_s": index_s}
+
+
+# ============================================================================
+# SPORT SCORING
+# ============================================================================
+
+def bench_sport_scoring(rounds: int = 20) -> Dict:
+    """Sport-fit ranking: feature-matrix matvec + top-k vs mapper over-fetch and per-row scoring"""
+    import numpy as np
+    import pandas as pd
+    from .court_sport_exercise_map import CourtSportExerciseMapper
+    from .sport_exercise_selector import SLOTS, SportSpecificExerciseSelector
+    from .sport_scoring import SportScoringEngine, engine_for
+
+    df = pd.read_csv(LIBRARY_CSV)
+    engine, build_s = _timed(SportScoringEngine, df)
+    engine_for(df)
+    sports = engine.sports
+    limit = 5
+
+    def reference(sport, pattern, band):
+        # Over-fetch every mapper match, then score rows one by one
+        records = CourtSportExerciseMapper.find_exercises(df, pattern, readiness_band_override=band, limit=len(df))
+        position = {exercise_id: i for i, exercise_id in enumerate(df["exercise_id"])}
+        weights = engine.weights(sport)
+        forbidden = engine.forbidden_mask(sport)
+        scored = []
+        for record in records:
+            row = position[record["exercise_id"]]
+            if forbidden[row]:
+                continue
+            score = sum(float(x) * float(w) for x, w in zip(engine.matrix[row], weights) if x)
+            scored.append((-score, row))
+        return [row for _, row in sorted(scored)[:limit]]
+
+    patterns = sorted({pattern for pattern, _ in SLOTS.values() if not pattern.startswith("plyo_")})
+
+    def mapper_path():
+        return [reference(sport, pattern, 2) for sport in sports for pattern in patterns]
+
+    def engine_path():
+        return [list(engine.top_k(sport, engine.pattern_mask(pattern, 2), limit))
+                for sport in sports for pattern in patterns]
+
+    expected, mapper_s = _timed(mapper_path)
+    ranked, engine_s = _best_of(engine_path, repeat=3)
+    if [list(map(int, rows)) for rows in ranked] != expected:
+        raise AssertionError("engine top-k differs from per-row scoring of the mapper's matches")
+    for pattern in CourtSportExerciseMapper.PATTERN_MAP:
+        mapper_ids = [r["exercise_id"] for r in CourtSportExerciseMapper.find_exercises(df, pattern, limit=len(df))]
+        if df["exercise_id"][engine.pattern_mask(pattern)].tolist() != mapper_ids:
+            raise AssertionError(f"pattern mask for {pattern} differs from the mapper")
+
+    def selections():
+        for _ in range(rounds):
+            for sport in sports:
+                SportSpecificExerciseSelector.select_exercises(df, CourtSportExerciseMapper, sport, 2, "E2", limit)
+
+    _, select_s = _best_of(selections, repeat=3)
+    per_select_ms = select_s / (rounds * len(sports)) * 1000
+
+    _report(f"Sport scoring ({len(df)} exercises x {len(engine.features)} features, {len(sports)} sports)", [
+        ("feature matrix build (once per library)", f"{build_s * 1000:.0f}ms"),
+        ("mapper over-fetch + per-row scoring", f"{mapper_s * 1000:.0f}ms  ({len(sports) * len(patterns)} rankings)"),
+        ("matvec + top-k", f"{engine_s * 1000:.1f}ms  ({mapper_s / engine_s:.0f}x)"),
+        ("select_exercises, all slots", f"{per_select_ms:.2f}ms per sport"),
+        ("equivalence", "top-k == full per-row ranking; masks == mapper matches")
+    ])
+    return {"mapper_s": mapper_s, "engine_s": engine_s, "select_ms": per_select_ms}
+
+
+# ============================================================================
+# BLOCK SELECTOR
+# ============================================================================
+
+def _selector_state(service_line="SP_Performance", population="Youth_13_17", season_phase="OFF_SEASON",
+                    readiness="GREEN", games=None, icp="Blueprint_Competitor", r2p_stage=None,
+                    pain=0, flags=(), session_type="FULL_SESSION") -> Dict:
+    return {
+        "client_profile": {"service_line": service_line, "population": population, "icp_primary": icp,
+                           "training_age_yrs": 2, "current_phase": "Development",
+                           "readiness_flag": readiness, "r2p_stage": r2p_stage},
+        "season_context": {"season_phase": season_phase, "games_per_week": games, "days_to_next_competition": None,
+                           "active_tournament_block": False, "session_type": session_type,
+                           "planned_sessions_this_week": 2, "completed_sessions_this_week": 0},
+        "red_flags": {"pain_gate": pain, "stress_level": 3, "injury_flags": list(flags)},
+    }
+
+
+# Worked examples: (state, expected block_tag or deny rule), one per selector path
+SELECTOR_EXAMPLES = [
+    (_selector_state(), "SP_OFFSEASON_MULTI_13-17_12WK_v1"),
+    (_selector_state(icp="ICP_HS_BASKETBALL_OFFSEASON"), "SP_OFFSEASON_BBALL_13-17_8WK_DEV_v1"),
+    (_selector_state(season_phase="PRE_SEASON", icp="ICP_HS_BASKETBALL_OFFSEASON"), "SP_PRESEASON_BBALL_13-17_6WK_v1"),
+    (_selector_state(season_phase="PEAK_IN_SEASON", games=3), "SP_INSEASON_MULTI_13-17_6WK_MAINT_v1"),
+    (_selector_state(season_phase="PEAK_IN_SEASON", games=2, icp="ICP_HS_BASKETBALL_OFFSEASON"),
+     "SP_INSEASON_BBALL_13-17_6WK_TIER2_v1"),
+    (_selector_state(season_phase="EARLY_IN_SEASON", games=1, icp="ICP_HS_BASKETBALL_OFFSEASON"),
+     "SP_INSEASON_BBALL_13-17_6WK_TIER3_v1"),
+    (_selector_state(season_phase="EARLY_IN_SEASON", games=1), "NO_BLOCK_FOR_PROFILE"),
+    (_selector_state(readiness="YELLOW", icp="ICP_HS_BASKETBALL_OFFSEASON", season_phase="POST_SEASON"),
+     "SP_POSTSEASON_BBALL_13-17_4WK_RESTORE_v1"),
+    (_selector_state(readiness="RED"), "SP_POSTSEASON_MULTI_13-17_6WK_RESTORE_v1"),
+    (_selector_state(population="Youth_8_12", season_phase="PRE_SEASON"), "SP_PRESEASON_MULTI_8-12_6WK_FUN_v1"),
+    (_selector_state(service_line="R2P", population="Adult", r2p_stage="R2P_Stage_3"),
+     "R2P_ACL_STAGE3_PROGRESSIVE_LOADING_4WK_v1"),
+    (_selector_state(service_line="R2P", population="Adult", r2p_stage="R2P_Stage_3", readiness="RED"),
+     "R2P_ACL_STAGE1_EARLY_RECOVERY_4WK_v1"),
+    (_selector_state(season_phase="EARLY_IN_SEASON"), "MISSING_IN_SEASON_FIXTURE_DATA"),
+    (_selector_state(flags=["RF_INJURY_ANKLE", "RF_NO_CLEARANCE"]), "RED_FLAG_NO_CLEARANCE"),
+    (_selector_state(pain=7), "PAIN_CRITICAL"),
+    (_selector_state(season_phase="PEAK_IN_SEASON", games=2.5), "SEASON_TYPE_UNRESOLVED"),
+    (_selector_state(service_line="Adult_Strength", population="Adult", session_type="MICROSESSION"),
+     "NO_BLOCK_FOR_PROFILE"),
+    (_selector_state(readiness=None), "MISSING_REQUIRED_INPUT"),
+]
+
+
+def _reference_block_decision(selector, spec: Dict, state: Dict) -> Dict:
+    """Rule walk over the raw selector JSON: every condition string is evaluated per state"""
+    from .block_selector import INPUT_SECTIONS, FAMILIES, NO_BLOCK, REQUIRED_ENUMS
+
+    fields = {}
+    for section in INPUT_SECTIONS:
+        fields.update(state.get(section, {}))
+
+    def holds(condition):
+        expression = condition.replace("&&", " and ").replace("null", "None")
+        expression = re.sub(r"(\w+) contains ('[^']*')", r"\2 in \1", expression)
+        try:
+            return bool(eval(expression, {}, dict(fields)))
+        except TypeError:
+            return False
+
+    def deny(rule, season_type=None):
+        return {"decision": "DENY", "block_tag": None, "deny_rule": rule, "season_type": season_type}
+
+    inputs = {name: field for section in INPUT_SECTIONS for name, field in spec["inputs"]["required"][section].items()}
+    if any(fields.get(name) not in inputs[name]["values"] or fields.get(name) is None for name in REQUIRED_ENUMS):
+        return deny("MISSING_REQUIRED_INPUT")
+    routing = spec["routing_logic"]
+    for rule in routing["deny_rules"]["rules"]:
+        if holds(rule["condition"]):
+            return deny(rule["name"])
+    season_type = None
+    for rule in routing["season_type_computation"]["rules"]:
+        if holds(rule["condition"]):
+            if "subrouting" not in rule:
+                season_type = rule["output"]
+                break
+            season_type = next((sub["output"] for sub in rule["subrouting"] if holds(sub["condition"])), None)
+            if season_type:
+                break
+    if season_type is None:
+        return deny("SEASON_TYPE_UNRESOLVED")
+    family = "BASKETBALL" if "BASKETBALL" in str(fields.get("icp_primary") or "").upper() else FAMILIES[0]
+    profiles = [selector._block_profile(block) for block in selector.blocks]
+    index = selector._choose(profiles, fields["service_line"], fields["population"], season_type,
+                             fields["readiness_flag"], fields.get("r2p_stage"), family)
+    if index == NO_BLOCK:
+        return deny("NO_BLOCK_FOR_PROFILE", season_type)
+    return {"decision": "SELECT", "block_tag": selector.blocks[index]["block_id"], "deny_rule": None,
+            "season_type": season_type}
+
+
+def bench_block_selector(n_states: int = 5000, seed: int = 11) -> Dict:
+    """Compiled decision table + batch select_blocks vs a per-state walk of the raw selector rules"""
+    from .block_selector import CompiledBlockSelector
+    from .spec_registry import default_registry
+
+    spec = default_registry().get("EFL_BLOCK_SELECTOR_v1_3_2")
+    selector, build_s = _timed(CompiledBlockSelector)
+
+    for state, expected in SELECTOR_EXAMPLES:
+        decision = selector.select_block(state)
+        got = decision["block_tag"] or decision["deny_rule"]
+        if got != expected:
+            raise AssertionError(f"selector example expected {expected}, got {got}")
+
+    rng = random.Random(seed)
+    enums = {name: list(values) for name, values in selector.enums.items()}
+    roster = []
+    for _ in range(n_states):
+        service_line = rng.choice(enums["service_line"] + ["SP_Performance"] * 6 + ["R2P"] * 2 + [None])
+        roster.append(_selector_state(
+            service_line=service_line,
+            population=rng.choice(enums["population"] + ["Youth_13_17"] * 3 + ["Unknown"]),
+            season_phase=rng.choice(enums["season_phase"]),
+            readiness=rng.choice(enums["readiness_flag"] + ["GREEN"] * 3),
+            games=rng.choice([None, 0, 1, 2, 2.5, 3, 4]),
+            icp=rng.choice(["Blueprint_Competitor", "ICP_HS_BASKETBALL_OFFSEASON", "Youth_Mover", None]),
+            r2p_stage=rng.choice(enums["r2p_stage"] + [None]) if service_line == "R2P" else None,
+            pain=rng.choice([0, 0, 0, 2, 5, 6, 7, 9, None]),
+            flags=rng.sample(["RF_INJURY_ANKLE", "RF_NO_CLEARANCE", "RF_KNEE"], rng.choice([0, 0, 0, 1, 2])),
+            session_type=rng.choice(enums["session_type"]),
+        ))
+
+    expected, walk_s = _timed(lambda: [_reference_block_decision(selector, spec, state) for state in roster])
+    decisions, batch_s = _best_of(lambda: selector.select_blocks(roster), repeat=3)
+    keys = ("decision", "block_tag", "deny_rule", "season_type")
+    for want, got in zip(expected, decisions):
+        if any(want[key] != got[key] for key in keys):
+            raise AssertionError(f"compiled selector differs from the rule walk: {want} vs {got}")
+
+    cols = selector.encode(roster)
+    _, classify_s = _best_of(lambda: selector.classify(cols))
+    singles, single_s = _best_of(lambda: [selector.select_block(state) for state in roster], repeat=3)
+    if singles != decisions:
+        raise AssertionError("select_block differs from select_blocks")
+
+    selected = sum(d["decision"] == "SELECT" for d in decisions)
+    _report(f"Block selector ({n_states} states, {len(selector.blocks)} manifest blocks)", [
+        ("compile (rules + block table)", f"{build_s * 1000:.0f}ms  table {selector.table.shape}"),
+        ("per-state rule walk", f"{walk_s * 1000:.0f}ms  ({walk_s / n_states * 1e6:.1f}us/state)"),
+        ("select_blocks (batch)", f"{batch_s * 1000:.1f}ms  ({walk_s / batch_s:.0f}x)"),
+        ("  of which classify (array ops)", f"{classify_s * 1000:.2f}ms"),
+        ("select_block (single state)", f"{single_s / n_states * 1e6:.0f}us/state"),
+        ("decisions", f"{selected} SELECT / {n_states - selected} DENY"),
+        ("equivalence", f"{len(SELECTOR_EXAMPLES)} worked examples; batch == single == rule walk")
+    ])
+    return {"walk_s": walk_s, "batch_s": batch_s, "classify_s": classify_s}
+
+
+# ============================================================================
+# PROGRESSION LAW
+# ============================================================================
+
+def _progression_history(law, n_clients: int, weeks: int, seed: int) -> List[Dict]:
+    """A season of weekly exercise choices per (client, pattern), drifting through each pattern's pool"""
+    import csv
+
+    pools: Dict[str, List[str]] = {}
+    with open(LIBRARY_CSV, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            pools.setdefault(row["aether_pattern"], []).append(row["exercise_id"])
+    patterns = ["Squat-Bilateral", "Lunge-Unilateral", "Hinge-Bilateral", "Plyometric-Landing", "Locomotion-Linear"]
+    populations = ["Youth_8_12", "Youth_13_17", "Youth_13_17", "Adult"]
+    rng = random.Random(seed)
+    entries = []
+    for c in range(n_clients):
+        population = rng.choice(populations)
+        for pattern in patterns:
+            exercise_id = rng.choice(pools[pattern])
+            for week in range(1, weeks + 1):
+                if rng.random() < 0.25:
+                    exercise_id = rng.choice(pools[pattern])
+                entry = {"client_id": f"C{c:04d}", "pattern": pattern, "week": week,
+                         "population": population, "exercise_id": exercise_id}
+                if rng.random() < 0.03:
+                    entry["regression_triggers"] = [rng.choice(sorted(law.triggers))]
+                if rng.random() < 0.1:
+                    entry["readiness_flag"] = rng.choice(["YELLOW", "RED"])
+                if rng.random() < 0.05:
+                    # A label on the entry overrides the library row's level on that axis
+                    a = rng.randrange(1, len(law.fields))
+                    entry[law.fields[a]] = rng.choice(sorted(law.levels[a]))
+                entries.append(entry)
+    rng.shuffle(entries)
+    return entries
+
+
+def bench_progression_law(n_clients: int = 200, weeks: int = 40, seed: int = 3) -> Dict:
+    """Progression Law: vectorized whole-history check vs validate() per transition"""
+    from .progression_law import ProgressionLaw, REASON_CODES
+
+    law = ProgressionLaw()
+    _, build_s = _timed(law.library_levels)
+
+    spec = law.registry.get("EFL_EXERCISE_PROGRESSION_LAW_v1_0_1")
+    for name, steps in spec["basketball_reference_progressions"].items():
+        if not isinstance(steps, list):
+            continue
+        for current, proposed in zip(steps, steps[1:]):
+            verdict = law.validate(current, proposed, "Adult", weeks_at_current=current.get("duration_weeks"))
+            if verdict["legal"] != (proposed.get("status") != "ILLEGAL_PROGRESSION"):
+                raise AssertionError(f"{name} {proposed['exercise_id']}: {verdict}")
+
+    # Library exercise with one axis relabelled on the entry: both paths must read the label
+    current = {"client_id": "C", "pattern": "P", "week": 0, "population": "Adult", "exercise_id": "EX_00001"}
+    proposed = dict(current, week=3, direction="Multi_Directional_Combined")
+    single = law.validate(current, proposed, "Adult", weeks_at_current=3)["reason_code"]
+    history = [code for code, count in law.check_history([current, proposed])["counts"].items() if count]
+    if history != [single]:
+        raise AssertionError(f"partially labelled entry: validate() {single}, check_history() {history}")
+
+    entries = _progression_history(law, n_clients, weeks, seed)
+
+    def per_transition():
+        chains: Dict[tuple, List[Dict]] = {}
+        for entry in entries:
+            chains.setdefault((entry["client_id"], entry["pattern"]), []).append(entry)
+        verdicts = {}
+        for chain in chains.values():
+            chain.sort(key=lambda e: e["week"])
+            level_start = chain[0]["week"]
+            for current, proposed in zip(chain, chain[1:]):
+                verdicts[id(proposed)] = law.validate(
+                    current, proposed, proposed["population"],
+                    weeks_at_current=proposed["week"] - level_start,
+                    triggers=current.get("regression_triggers", ()),
+                    readiness_flag=proposed.get("readiness_flag"))["reason_code"]
+                if law.encode(proposed) != law.encode(current):
+                    level_start = proposed["week"]
+        return verdicts
+
+    expected, loop_s = _timed(per_transition)
+    cols, encode_s = _best_of(lambda: law.encode_history(entries), repeat=3)
+    result, check_s = _best_of(lambda: law.check_columns(cols))
+    report, history_s = _best_of(lambda: law.check_history(entries), repeat=3)
+
+    got = {id(entries[row]): REASON_CODES[code] for row, code in zip(result["row"].tolist(), result["code"].tolist())}
+    if got != expected:
+        raise AssertionError("vectorized history check differs from per-transition validate()")
+
+    counts = report["counts"]
+    _report(f"Progression Law ({n_clients} clients x 5 patterns x {weeks} weeks = {len(entries)} entries)", [
+        ("compile (axes, ceilings, library levels)", f"{build_s * 1000:.0f}ms"),
+        ("validate() per transition", f"{loop_s * 1000:.0f}ms"),
+        ("check_history (encode + check)", f"{history_s * 1000:.0f}ms  ({loop_s / history_s:.1f}x)"),
+        ("  encode_history", f"{encode_s * 1000:.0f}ms"),
+        ("  check_columns (vectorized)", f"{check_s * 1000:.1f}ms  ({loop_s / check_s:.0f}x)"),
+        ("transitions", f"{report['transitions']}: {counts['PROGRESSION_APPROVED']} approved, "
+                        f"{len(report['violations'])} illegal ({counts['PROGRESSION_REJECTED_MULTI_AXIS']} multi-axis)"),
+        ("equivalence", "spec reference progressions; vectorized == per-transition, incl. relabelled entries")
+    ])
+    return {"loop_s": loop_s, "history_s": history_s, "check_s": check_s}
+
+
+# ============================================================================
+# R2P-ACL STAGE GENERATOR
+# ============================================================================
+
+def _reference_r2p_legal(classified: List[tuple], envelope) -> set:
+    """Per-row scan of the classified library against one stage envelope (no bitsets)"""
+    from .generator_r2p_acl import RUN_JOG, RUN_SPRINT, DECEL_LINEAR, DECEL_ALL, COD_PLANNED, COD_REACTIVE, SSC_NO
+
+    blocked = {
+        "sprint": envelope.running < RUN_SPRINT, "jog": envelope.running < RUN_JOG,
+        "decel_multi": envelope.decel < DECEL_ALL, "decel_linear": envelope.decel < DECEL_LINEAR,
+        "cod_reactive": envelope.cod < COD_REACTIVE, "cod_planned": envelope.cod < COD_PLANNED,
+        "reactive_ssc": envelope.reactive_ssc == SSC_NO, "contraindicated_s1": envelope.stage == "S1",
+    }
+    legal = set()
+    for i, (band, node, e_node, features) in enumerate(classified):
+        if band > envelope.max_band or node > envelope.max_node or e_node > envelope.max_e_node:
+            continue
+        if any(blocked.get(feature) for feature in features):
+            continue
+        legal.add(i)
+    return legal
+
+
+def _r2p_caseload(n_clients: int, seed: int) -> List[tuple]:
+    """One session per client across stages, readiness, clearances and hardstops"""
+    import random
+    from .generator_r2p_acl import STAGES
+
+    rng = random.Random(seed)
+    sessions = []
+    for k in range(n_clients):
+        stage = rng.choice(STAGES)
+        clearances = {"resistance": rng.random() < 0.95, "running": rng.random() < 0.8,
+                      "cod": rng.random() < 0.7, "full_sport": rng.random() < 0.6}
+        context = {
+            "stage": stage,
+            "readiness": rng.choice(("GREEN", "GREEN", "YELLOW", "RED")),
+            "provider_clearances": clearances,
+            "week": rng.randint(1, 4),
+            "day": rng.randint(1, 3),
+            "age": rng.choice((15, 16, 24, 31)),
+            "weeks_post_op": rng.randint(4, 60),
+        }
+        if rng.random() < 0.05:
+            context["hardstop_flags"] = {"effusion_increase": True}
+        sessions.append((f"R2P_{k:05d}", "2026-03-02", context))
+    return sessions
+
+
+def bench_r2p_acl(n_clients: int = 2000, seed: int = 5) -> Dict:
+    """R2P-ACL caseload: compiled stage bitsets vs a per-row library scan per session"""
+    from .generator_r2p_acl import R2PACLGenerator, BANDS, NODES, E_NODES, _rows
+
+    generator, build_s = _timed(R2PACLGenerator, LIBRARY_CSV)
+    clear = {"resistance": True, "running": True, "cod": True, "full_sport": True}
+
+    # Section 12 litmus tests
+    def session(**context):
+        context.setdefault("provider_clearances", clear)
+        context.setdefault("readiness", "GREEN")
+        return generator.generate_session("LITMUS", "2026-03-02", context)
+
+    def slots(artifact):
+        return {ex["slot"] for block in artifact["content_payload"]["session"]["blocks"] for ex in block["exercises"]}
+
+    def cod_names(artifact):
+        return [ex["name"] for block in artifact["content_payload"]["session"]["blocks"]
+                for ex in block["exercises"] if ex["slot"] == "cod"]
+
+    litmus = [
+        ("no tempo runs in S2", "run" not in slots(session(stage="S2"))),
+        ("no reactive COD in S3", not cod_names(session(stage="S3"))
+         and not generator.legal_bits(generator.envelope("S3", "GREEN", frozenset(clear))[0])
+         & generator.feature("cod_reactive")),
+        ("no E2 in S2.5 week 1", all(ex["enode"] != "E2" for block in session(stage="S2.5", week=1, day=3)
+                                     ["content_payload"]["session"]["blocks"] for ex in block["exercises"])),
+        ("S4 requires COD clearance", not cod_names(session(stage="S4", provider_clearances=dict(clear, cod=False)))),
+        ("YELLOW caps 0.75x weekly / 0.8x session",
+         session(stage="S4", readiness="YELLOW")["cap_proof"]["weekly_contacts_cap_applied"] == 112
+         and session(stage="S4", readiness="YELLOW")["cap_proof"]["session_contacts_cap_applied"] == 48),
+        ("hardstop collapses to symptom control",
+         not session(stage="S4", hardstop_flags=["giving_way"])["header"]["eligible_for_training_today"]
+         and session(stage="S4", hardstop_flags=["giving_way"])["exposure_summary"]["total_contacts"] == 0),
+        ("youth S5 at 40 weeks gets advisory",
+         session(stage="S5", age=16, weeks_post_op=40)["advisories"][0]["code"] == "YOUTH_RTS_ADVISORY"),
+        ("S2.5 E2 exception <= 15% of contacts",
+         0 < session(stage="S2.5", week=3, day=3)["exposure_summary"]["e2_exception_pct"] <= 0.15),
+    ]
+    failed = [name for name, ok in litmus if not ok]
+    if failed:
+        raise AssertionError(f"permission matrix litmus failed: {failed}")
+
+    # Store-backed clients are generated at their routed System-1 stage
+    from . import generator_adapter
+    from .client_state_store import ClientStateStore
+    from .global_router import GlobalRouter
+
+    store = ClientStateStore()
+    state = next(s for s in synthetic_roster(50) if s["inputs"]["medicalstatus"].get("isinr2pservice"))
+    generator_adapter.configure_state_store(store)
+    try:
+        for stage, expected in (("S3", "S3"), ("S4", "S4"), ("S25", "S2.5")):
+            client_id = f"R2P_{stage}"
+            store.put_inputs(client_id, state["inputs"])
+            store.write_router_output(GlobalRouter().route_client_state(
+                {"clientid": client_id, "inputs": state["inputs"],
+                 "derived": {"r2p_systemone_output": {"stage": stage, "r2pstagestatus": "LEGAL"}}},
+                "2026-01-15T12:00:00-06:00"))
+            got = generator_adapter.generate_session(client_id, "R2P_ACL", "2026-03-02")
+            if got["legality_snapshot"]["envelope_stage"] != expected:
+                raise AssertionError(f"store-backed {stage} client generated at "
+                                     f"{got['legality_snapshot']['envelope_stage']}")
+    finally:
+        generator_adapter.configure_state_store(None)
+        store.close()
+
+    sessions = _r2p_caseload(n_clients, seed)
+    classified = [generator.classify(row) for row in generator.rows]
+    envelopes = []
+    for _, _, context in sessions:
+        clearances = frozenset(k for k, v in context["provider_clearances"].items() if v)
+        envelopes.append(generator.envelope(context["stage"], context["readiness"], clearances)[0])
+
+    def per_row_scan():
+        return [_reference_r2p_legal(classified, envelope) for envelope in envelopes]
+
+    def cold_bits():
+        legal = []
+        for envelope in envelopes:
+            generator._legal.clear()
+            legal.append(generator.legal_bits(envelope))
+        return legal
+
+    scans, scan_s = _timed(per_row_scan)
+    bits, bits_s = _best_of(cold_bits)
+    if any(set(_rows(b)) != scan for b, scan in zip(bits, scans)):
+        raise AssertionError("bitset legality differs from the per-row scan")
+
+    generator._slots.clear()
+    artifacts, caseload_s = _timed(generator.generate_caseload, sessions)
+    _, warm_s = _best_of(lambda: generator.generate_caseload(sessions), repeat=3)
+
+    # Every prescribed exercise sits inside its envelope's ceilings
+    by_id = {row["exercise_id"]: row for row in generator.rows}
+    for artifact in artifacts:
+        proof = artifact["cap_proof"]
+        ceilings = (BANDS.index(proof["max_band_allowed_population"]),
+                    NODES.index(proof["max_node_allowed_population"][-1]),
+                    E_NODES.index(proof["max_enode_allowed_population"]))
+        for block in artifact["content_payload"]["session"]["blocks"]:
+            for ex in block["exercises"]:
+                levels = generator.classify(by_id[ex["exercise_id"]])[:3]
+                if ex.get("e2_exception"):
+                    continue
+                if any(level > ceiling for level, ceiling in zip(levels, ceilings)):
+                    raise AssertionError(f"{ex['name']} exceeds {artifact['legality_snapshot']['envelope_stage']}")
+        summary = artifact["exposure_summary"]
+        if summary["total_contacts"] > proof["session_contacts_cap_applied"]:
+            raise AssertionError("session contact cap exceeded")
+
+    eligible = sum(a["header"]["eligible_for_training_today"] for a in artifacts)
+    _report(f"R2P-ACL stage generator ({len(sessions)} sessions, {len(set(envelopes))} envelopes)", [
+        ("compile (classify library, feature bitsets)", f"{build_s * 1000:.0f}ms"),
+        ("legal set: per-row scan per session", f"{scan_s * 1000:.0f}ms"),
+        ("legal set: bitset AND per session (uncached)", f"{bits_s * 1000:.1f}ms  ({scan_s / bits_s:.0f}x)"),
+        ("generate_caseload (first pass)", f"{caseload_s * 1000:.0f}ms  ({caseload_s / len(sessions) * 1e6:.0f}us/session)"),
+        ("generate_caseload (warm)", f"{warm_s * 1000:.0f}ms  ({warm_s / len(sessions) * 1e6:.0f}us/session)"),
+        ("sessions", f"{eligible} training, {len(sessions) - eligible} held (gate, hardstop, RED)"),
+        ("equivalence", f"{len(litmus)} matrix litmus tests; bitsets == row scan; ceilings + caps hold")
+    ])
+    return {"scan_s": scan_s, "bits_s": bits_s, "caseload_s": caseload_s, "warm_s": warm_s}
+
+
+# ============================================================================
+# SPECIALIZATION BLOCKS
+# ============================================================================
+
+def _specialization_context(generator, seed: int, k: int) -> dict:
+    """Athlete context passing every entry gate; a few athletes fail one or read YELLOW/RED"""
+    import random
+
+    rng = random.Random(seed * 100003 + k)
+    values = {}
+    for _, key, kind, threshold, _ in generator.gates:
+        values[key] = threshold
+    if rng.random() < 0.1:
+        _, key, kind, threshold, _ = rng.choice(generator.gates)
+        values[key] = None if kind == "eq" else threshold - 1 if kind == "min" else threshold + 1
+    return {
+        "population": rng.choice(sorted(generator.legal_populations & set(generator.contact_ceiling))),
+        "season_type": rng.choice(sorted(generator.legal_seasons)),
+        "readiness": rng.choice(("GREEN", "GREEN", "GREEN", "YELLOW", "RED")),
+        "movement_quality": values,
+    }
+
+
+def bench_specialization(n_athletes: int = 300, n_reference: int = 20, seed: int = 11) -> Dict:
+    """Specialization blocks: compiled session templates vs ranking the library per athlete block"""
+    from .generator_specialization import SPECIALIZATION_SPECS, SpecializationBlockGenerator
+
+    rows = []
+    results = {}
+    for project_id, spec_name in SPECIALIZATION_SPECS.items():
+        generator, build_s = _timed(SpecializationBlockGenerator, spec_name, None, LIBRARY_CSV)
+        athletes = [(f"{project_id[:5]}_{k:04d}", _specialization_context(generator, seed, k))
+                    for k in range(n_athletes)]
+
+        def blocks(subset):
+            return [generator.generate_block(client_id, "2026-06-01", context) for client_id, context in subset]
+
+        def uncompiled(subset):
+            sessions = []
+            for client_id, context in subset:
+                generator._pools.clear()
+                generator._sessions.clear()
+                sessions.append(generator.generate_block(client_id, "2026-06-01", context))
+            return sessions
+
+        reference, reference_s = _timed(uncompiled, athletes[:n_reference])
+        generator._pools.clear()
+        generator._sessions.clear()
+        compiled, first_s = _timed(blocks, athletes)
+        _, warm_s = _best_of(lambda: blocks(athletes), repeat=3)
+
+        def ids(block):
+            return [[ex["exercise_id"] for b in session["content_payload"]["session"]["blocks"] for ex in b["exercises"]]
+                    for session in block]
+
+        if any(ids(a) != ids(b) for a, b in zip(reference, compiled)):
+            raise AssertionError(f"{project_id}: compiled templates differ from per-session ranking")
+
+        # Gates: contact ceiling, Tier 3 cap, weekly range, readiness handling
+        n_sessions = 0
+        for (_, context), block in zip(athletes, compiled):
+            weekly: Dict[int, int] = {}
+            weekly_max: Dict[int, int] = {}
+            for artifact in block:
+                n_sessions += 1
+                proof, summary = artifact["cap_proof"], artifact["exposure_summary"]
+                week = artifact["legality_snapshot"]["block_week"]
+                weekly[week] = weekly.get(week, 0) + summary["total_contacts"]
+                weekly_max[week] = proof["weekly_contacts_range"][1]
+                if summary["total_contacts"] > proof["session_contacts_ceiling"]:
+                    raise AssertionError(f"{project_id}: session contact ceiling exceeded")
+                if summary["tier_3_pct"] > proof["tier_3_max_pct"]:
+                    raise AssertionError(f"{project_id}: Tier 3 share above cap")
+                if context["readiness"] == "RED" and artifact["header"]["eligible_for_training_today"]:
+                    raise AssertionError(f"{project_id}: RED readiness trained")
+                if (context["readiness"] == "YELLOW" and artifact["header"]["eligible_for_training_today"]
+                        and artifact["legality_snapshot"]["template_week"] == week
+                        and generator.weeks[week].yellow_week):
+                    raise AssertionError(f"{project_id}: YELLOW readiness not regressed")
+            for week, contacts in weekly.items():
+                if contacts > weekly_max[week]:
+                    raise AssertionError(f"{project_id}: weekly contact range exceeded in week {week}")
+
+        trained = sum(a["header"]["eligible_for_training_today"] for block in compiled for a in block)
+        per_reference = reference_s / sum(len(block) for block in reference)
+        per_session = warm_s / n_sessions
+        rows += [
+            (f"{project_id}: compile spec + library labels", f"{build_s * 1000:.0f}ms"),
+            (f"{project_id}: rank library per block (uncached)", f"{per_reference * 1e6:.0f}us/session"),
+            (f"{project_id}: template instantiation (first pass)", f"{first_s / n_sessions * 1e6:.0f}us/session"),
+            (f"{project_id}: template instantiation (warm)",
+             f"{per_session * 1e6:.0f}us/session  ({per_reference / per_session:.0f}x)"),
+            (f"{project_id}: sessions", f"{trained} training, {n_sessions - trained} held (gate, readiness)"),
+        ]
+        results[project_id] = {"build_s": build_s, "reference_session_s": per_reference, "session_s": per_session}
+
+    rows.append(("equivalence", "templates == per-session ranking; ceilings, Tier 3, weekly range, readiness hold"))
+    _report(f"Specialization blocks ({n_athletes} athletes per spec)", rows)
+    return results
+
+
+# ============================================================================
+# PROJECT PLUGIN ROUTER
+# ============================================================================
+
+def _fresh_interpreter(code: str) -> Dict:
+    """Run code in a new interpreter from the package's parent directory; returns its JSON output"""
+    import subprocess
+
+    package = Path(__file__).resolve().parent
+    out = subprocess.run([sys.executable, "-c", code], cwd=str(package.parent), check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def bench_plugin_router(n_calls: int = 200000) -> Dict:
+    """Registry-driven generator dispatch: alias normalization, cached resolution, lazy imports"""
+    from . import generator_adapter as adapter
+
+    projects = adapter.registered_projects()
+    if len(projects) != 14:
+        raise AssertionError(f"expected 14 registry projects, got {len(projects)}")
+    unknown = [p for p in adapter.GENERATOR_PLUGINS if p not in projects]
+    if unknown:
+        raise AssertionError(f"plugins bound to projects missing from the registry: {unknown}")
+    for alias, canonical in (("R2P-ACL", "R2P_ACL"), ("Court", "COURT_SPORT_FOUNDATIONS"),
+                             ("decel-specialization", "DECEL_SPECIALIZATION")):
+        if adapter.normalize_project_id(alias) != canonical:
+            raise AssertionError(f"{alias} does not normalize to {canonical}")
+    unbound = sorted(set(projects) - set(adapter.GENERATOR_PLUGINS))
+    for project_id in unbound[:1] + ["NOT_A_PROJECT"]:
+        try:
+            adapter.resolve_generator(project_id)
+        except ValueError:
+            continue
+        raise AssertionError(f"{project_id} resolved without a generator")
+
+    package = __package__ or Path(__file__).resolve().parent.name
+    cold = _fresh_interpreter(
+        "import json, sys, time\n"
+        f"from {package} import generator_adapter as adapter\n"
+        "t = time.perf_counter(); adapter.resolve_generator('R2P-ACL'); r2p = time.perf_counter() - t\n"
+        "t = time.perf_counter(); adapter.resolve_generator('R2P_ACL'); cached = time.perf_counter() - t\n"
+        "pandas_r2p = 'pandas' in sys.modules\n"
+        "t = time.perf_counter(); adapter.resolve_generator('Court'); court = time.perf_counter() - t\n"
+        "print(json.dumps({'r2p_s': r2p, 'cached_s': cached, 'court_s': court,\n"
+        "                  'pandas_r2p': pandas_r2p, 'pandas_court': 'pandas' in sys.modules}))\n")
+    if cold["pandas_r2p"] or cold["pandas_court"]:
+        raise AssertionError("resolving a generator loaded pandas")
+
+    spellings = ["R2P-ACL", "R2P_ACL", "Court", "COURT_SPORT_FOUNDATIONS", "ELASTIC_SPECIALIZATION",
+                 "DECEL_SPECIALIZATION"] * (n_calls // 6)
+
+    def if_elif():
+        # The former hardcoded routing, with its per-call function-level import
+        for project_id in spellings:
+            if project_id in ("R2P-ACL", "R2P_ACL"):
+                from .generator_r2p_acl import generate_r2p_acl_session
+            elif project_id in ("Court", "COURT_SPORT_FOUNDATIONS"):
+                from .generator_court import generate_court_sport_session
+            elif project_id in ("ELASTIC_SPECIALIZATION", "DECEL_SPECIALIZATION"):
+                from .generator_specialization import generate_specialization_session
+
+    def table():
+        for project_id in spellings:
+            adapter.resolve_generator(project_id)
+
+    if_elif()
+    table()
+    _, if_elif_s = _best_of(if_elif, repeat=3)
+    _, table_s = _best_of(table, repeat=3)
+
+    _report(f"Project plugin router ({len(projects)} registry projects, {len(adapter.GENERATOR_PLUGINS)} generators)", [
+        ("first resolve R2P-ACL (import, fresh interpreter)", f"{cold['r2p_s'] * 1000:.1f}ms  (pandas loaded: no)"),
+        ("first resolve Court (import, fresh interpreter)", f"{cold['court_s'] * 1000:.1f}ms  (pandas loaded: no)"),
+        ("cached resolve (alias spelling)", f"{cold['cached_s'] * 1e6:.1f}us"),
+        ("hardcoded if/elif + per-call import", f"{if_elif_s / len(spellings) * 1e9:.0f}ns/call"),
+        ("registry table (normalize + cached)", f"{table_s / len(spellings) * 1e9:.0f}ns/call"),
+        ("unbound registry projects", ", ".join(unbound)),
+    ])
+    return {"if_elif_s": if_elif_s, "table_s": table_s, "r2p_import_s": cold["r2p_s"], "court_import_s": cold["court_s"]}
+
+
+# ============================================================================
+# IMPORT TIME
+# ============================================================================
+
+def _import_profile(module: str) -> List[tuple]:
+    """(cumulative_us, self_us, module) per import from python -X importtime, in import order"""
+    import subprocess
+
+    package = Path(__file__).resolve().parent
+    err = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=str(package.parent),
+                         check=True, capture_output=True, text=True).stderr
+    profile = []
+    for line in err.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)", line)
+        if match:
+            profile.append((int(match.group(2)), int(match.group(1)), match.group(4), len(match.group(3)) // 2))
+    return profile
+
+
+def bench_import_time(n_queries: int = 200) -> Dict:
+    """Cold import of the request service and the pandas-free court exercise query path"""
+    import pandas as pd
+    from .court_sport_exercise_map import CourtSportExerciseMapper, _LIBRARY_ROWS, load_library_rows
+
+    package = __package__ or Path(__file__).resolve().parent.name
+    profile = _import_profile(f"{package}.requests")
+    total_us = next(cum for cum, _, name, _ in profile if name == f"{package}.requests")
+    heavy = sorted({name for _, _, name, _ in profile if name in ("pandas", "numpy")})
+    if heavy:
+        raise AssertionError(f"importing the request service loads {heavy}")
+    own = sorted(((cum, name) for cum, _, name, _ in profile if name.startswith(f"{package}.")), reverse=True)[:5]
+
+    state = _fresh_interpreter(
+        "import json, sys, time\n"
+        f"t = time.perf_counter(); from {package} import requests; imported = time.perf_counter() - t\n"
+        "denied = requests.process_request_session_generation('NO_SUCH_UID', {})['status']\n"
+        "after_denial = sorted(m for m in ('pandas', 'numpy') if m in sys.modules)\n"
+        "t = time.perf_counter()\n"
+        "coach = next(u['uid'] for u in requests.UID_REGISTRY['users'] if u['role'] == 'Coach')\n"
+        "r2p = requests.process_request_session_generation(coach,\n"
+        "    {'client_id': 'CLIENT_001', 'project_id': 'R2P-ACL', 'session_date': '2026-03-02'})['status']\n"
+        "first_session = time.perf_counter() - t\n"
+        f"from {package}.generator_court import generate_court_sport_session\n"
+        "print(json.dumps({'imported_s': imported, 'denied': denied, 'after_denial': after_denial,\n"
+        "                  'r2p': r2p, 'first_session_s': first_session,\n"
+        "                  'pandas_after_court': 'pandas' in sys.modules}))\n")
+    if state["denied"] != "DENIED" or state["after_denial"]:
+        raise AssertionError(f"denial path loaded {state['after_denial']}")
+    if state["r2p"] != "APPROVED" or state["pandas_after_court"]:
+        raise AssertionError("generation path loaded pandas")
+
+    # Court exercise queries: library frame vs plain rows, same records in the same order
+    df, frame_load_s = _timed(pd.read_csv, LIBRARY_CSV)
+    _LIBRARY_ROWS.clear()
+    rows, rows_load_s = _timed(load_library_rows, str(LIBRARY_CSV))
+    queries = [(pattern, band, enode)
+               for pattern in CourtSportExerciseMapper.PATTERN_MAP
+               for band in (None, 0, 1, 2)
+               for enode in (None, "E0", "E1", "E2")]
+    for pattern, band, enode in queries:
+        frame_ids = [r["exercise_id"] for r in CourtSportExerciseMapper.find_exercises(
+            df, pattern, readiness_band_override=band, readiness_enode_override=enode, limit=len(df))]
+        row_ids = [r["exercise_id"] for r in CourtSportExerciseMapper.find_exercises(
+            rows, pattern, readiness_band_override=band, readiness_enode_override=enode, limit=len(df))]
+        if frame_ids != row_ids:
+            raise AssertionError(f"row query differs from frame query for {pattern} band={band} enode={enode}")
+    # Keywords are literal on both paths, regex metacharacters included
+    CourtSportExerciseMapper.PATTERN_MAP["_LITERAL_KEYWORDS"] = {"name_include": ["(", "1/2", "+"],
+                                                                  "name_exclude": ["."]}
+    try:
+        frame_ids = [r["exercise_id"] for r in CourtSportExerciseMapper.find_exercises(
+            df, "_LITERAL_KEYWORDS", exclude_youth=False, limit=len(df))]
+        row_ids = [r["exercise_id"] for r in CourtSportExerciseMapper.find_exercises(
+            rows, "_LITERAL_KEYWORDS", exclude_youth=False, limit=len(df))]
+    finally:
+        del CourtSportExerciseMapper.PATTERN_MAP["_LITERAL_KEYWORDS"]
+    if frame_ids != row_ids:
+        raise AssertionError("row and frame queries match keywords with regex metacharacters differently")
+
+    session_queries = [(p, b, e) for p, b, e in queries if b in (None, 2) and e in (None, "E2")][:n_queries]
+
+    def run(library):
+        for pattern, band, enode in session_queries:
+            CourtSportExerciseMapper.find_exercises(library, pattern, readiness_band_override=band,
+                                                    readiness_enode_override=enode, limit=2)
+
+    _, frame_s = _best_of(lambda: run(df), repeat=3)
+    _, rows_s = _best_of(lambda: run(rows), repeat=3)
+
+    _report(f"Import time (python -X importtime, {package}.requests)", [
+        ("import requests (cumulative)", f"{total_us / 1000:.1f}ms  (pandas, numpy: not loaded)"),
+        *((f"  {name}", f"{cum / 1000:.1f}ms") for cum, name in own),
+        ("import in fresh interpreter (wall)", f"{state['imported_s'] * 1000:.1f}ms"),
+        ("denial path", f"{state['denied']}; heavy modules loaded: none"),
+        ("first R2P-ACL session (lazy generator import)", f"{state['first_session_s'] * 1000:.0f}ms"),
+        ("court library load: pandas frame / plain rows", f"{frame_load_s * 1000:.0f}ms / {rows_load_s * 1000:.0f}ms"),
+        ("court queries: frame / plain rows",
+         f"{frame_s / len(session_queries) * 1e6:.0f}us / {rows_s / len(session_queries) * 1e6:.0f}us per query"),
+        ("equivalence", f"{len(queries)} pattern/band/E-node queries identical"),
+    ])
+    return {"import_s": total_us / 1e6, "frame_query_s": frame_s, "rows_query_s": rows_s}
+
+
+# ============================================================================
+# CACHE MANAGER
+# ============================================================================
+
+def bench_cache_manager(n_ops: int = 200000, seed: int = 13) -> Dict:
+    """Named caches under one budget: eviction rules, sizing accuracy, lookup overhead, Zipf workload"""
+    from .cache_manager import CacheManager, approx_size
+    from .generator_r2p_acl import get_r2p_acl_generator
+
+    # Eviction rules on a manual clock
+    now = [0.0]
+    manager = CacheManager(budget_bytes=10_000, clock=lambda: now[0])
+    checks = []
+    lru = manager.register("lru", max_entries=3, sizer=lambda v: 100)
+    for key in "abcd":
+        lru[key] = key
+        now[0] += 1
+    lru.get("b")
+    lru["e"] = "e"
+    checks.append(("LRU keeps recently read entries", sorted(lru._entries) == ["b", "d", "e"]))
+    ttl = manager.register("ttl", ttl_s=5, sizer=lambda v: 100)
+    ttl["x"] = 1
+    now[0] += 6
+    checks.append(("TTL entries expire on read", ttl.get("x") is None and ttl.evictions["ttl"] == 1))
+    big = manager.register("big", max_bytes=6_000, sizer=lambda v: v)
+    big["huge"] = 7_000
+    checks.append(("entries larger than a budget are rejected", big.rejected == 1 and "huge" not in big))
+    now[0] += 1
+    big["one"] = 4_000
+    now[0] += 1
+    lru.get("b"), lru.get("d"), lru.get("e")
+    other = manager.register("other", sizer=lambda v: v)
+    other["two"] = 5_900
+    checks.append(("global budget evicts the least recently used entry of any cache",
+                   "one" not in big and big.evictions["global"] == 1 and "two" in other and len(lru) == 3))
+    snapshot = manager.snapshot()
+    checks.append(("snapshot totals match",
+                   snapshot["used_bytes"] == sum(c["bytes"] for c in snapshot["caches"].values())
+                   == manager.used_bytes <= manager.budget_bytes))
+    failed = [name for name, ok in checks if not ok]
+    if failed:
+        raise AssertionError(f"cache manager rules failed: {failed}")
+
+    # Sizing accuracy on real artifacts
+    generator = get_r2p_acl_generator()
+    context = {"stage": "S4", "readiness": "GREEN",
+               "provider_clearances": {"resistance": True, "running": True, "cod": True}}
+    artifact = generator.generate_session("C1", "2026-03-02", context)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    fresh = [generator.generate_session(f"C{k}", "2026-03-02", context) for k in range(200)]
+    measured = (tracemalloc.get_traced_memory()[0] - before) / len(fresh)
+    tracemalloc.stop()
+    estimated, size_s = _timed(approx_size, fresh[0])
+
+    # Zipf workload over five caches, budget well under the working set
+    rng = random.Random(seed)
+    names = ["library_snapshots", "mapper_masks", "candidate_pools", "epa_results", "artifacts"]
+    manager = CacheManager(budget_bytes=int(estimated * 400))
+    caches = [manager.register(name, max_entries=300 if name == "artifacts" else None) for name in names]
+    sizes = {}
+    keys = [(rng.randrange(len(names)), int(rng.paretovariate(1.1)) % 2000) for _ in range(n_ops)]
+
+    def workload():
+        for c, key in keys:
+            cache = caches[c]
+            if cache.get(key) is None:
+                cache.put(key, artifact, size=sizes.get(c) or sizes.setdefault(c, approx_size(artifact)))
+
+    manager.clear()
+    _, managed_s = _timed(workload)
+    plain = {}
+
+    def dict_workload():
+        for c, key in keys:
+            if plain.get((c, key)) is None:
+                plain[(c, key)] = artifact
+
+    _, dict_s = _timed(dict_workload)
+    snapshot = manager.snapshot()
+    if snapshot["used_bytes"] > manager.budget_bytes:
+        raise AssertionError("global budget exceeded")
+
+    _report(f"Cache manager ({len(names)} caches, {n_ops:,} Zipf lookups)", [
+        ("rules", f"{len(checks)} checks: LRU, TTL, per-cache + global budgets, snapshot"),
+        ("approx_size of a SESSION artifact", f"{estimated / 1024:.1f}KB est vs {measured / 1024:.1f}KB traced "
+                                              f"({estimated / measured:.2f}x), {size_s * 1e6:.0f}us"),
+        ("unbounded dict", f"{dict_s / n_ops * 1e9:.0f}ns/op, {len(plain)} entries, "
+                           f"~{len(plain) * estimated / 2**20:.1f}MB if each held its own artifact"),
+        ("managed caches", f"{managed_s / n_ops * 1e9:.0f}ns/op, {snapshot['entries']} entries, "
+                           f"{snapshot['used_bytes'] / 2**20:.1f}MB of {manager.budget_bytes / 2**20:.1f}MB"),
+        ("hit rate / evictions", f"{snapshot['hit_rate']:.1%} / {snapshot['evictions']:,}"),
+    ])
+    return {"managed_op_s": managed_s / n_ops, "dict_op_s": dict_s / n_ops, "hit_rate": snapshot["hit_rate"],
+            "size_ratio": estimated / measured}
+
+
+# ============================================================================
+# SHARED LIBRARY
+# ============================================================================
+
+def _smaps_kb() -> Dict[str, int]:
+    """Rss / Pss / Private_* of this process in kB (Linux smaps_rollup; empty elsewhere)"""
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            return {key: int(value.split()[0]) for key, value in
+                    (line.split(":", 1) for line in f if ":" in line and line.split(":", 1)[1].strip().endswith("kB"))}
+    except OSError:
+        return {}
+
+
+def _library_worker(mode: str, source: str, lock, barrier, results) -> None:
+    """Load or attach the library (one worker at a time), fault every page in, report time and memory delta"""
+    import csv
+    import numpy as np
+    from .shared_library import ColumnarLibrary, attach, open_mapped
+
+    lock.acquire()
+    before = _smaps_kb()
+    start = time.perf_counter()
+    if mode == "csv rows (private)":
+        with open(source, newline="", encoding="utf-8") as f:
+            library = list(csv.DictReader(f))
+        touched = sum(len(row["exercise_name"]) for row in library)
+    else:
+        if mode == "columnar (private)":
+            library = ColumnarLibrary.from_csv(source)
+        elif mode == "columnar (shared memory)":
+            library = attach(source)
+        else:
+            library = open_mapped(source)
+        touched = sum(int(library.array(name).view(np.uint8).sum()) for name in library.header["arrays"])
+    load_s = time.perf_counter() - start
+    after = _smaps_kb()
+    lock.release()
+    private = lambda m: m.get("Private_Clean", 0) + m.get("Private_Dirty", 0)
+    results.put((load_s, private(after) - private(before), touched))
+    barrier.wait()
+
+
+def bench_shared_library(n_workers: int = 32) -> Dict:
+    """Per-worker library copies vs one shared columnar buffer: attach time and worker memory"""
+    import csv
+    import multiprocessing
+    import tempfile
+    from .court_sport_exercise_map import CourtSportExerciseMapper
+    from .shared_library import ColumnarLibrary, attach, compile_library, open_mapped, publish, save
+
+    # The columnar views return exactly the CSV, and court selection over them matches the rows
+    with open(LIBRARY_CSV, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    buffer, compile_s = _timed(compile_library, LIBRARY_CSV)
+    shared = publish(LIBRARY_CSV)
+    path = save(str(Path(tempfile.gettempdir()) / f"efl_library_{shared.sha256[:12]}.col"), LIBRARY_CSV)
+    try:
+        for library in (ColumnarLibrary(buffer), attach(shared.name), open_mapped(path)):
+            if len(library) != len(rows) or any(library.row(i) != row for i, row in enumerate(rows)):
+                raise AssertionError("columnar library rows differ from the CSV")
+            if library.array("band").flags.writeable:
+                raise AssertionError("library views must be read-only")
+            for pattern in CourtSportExerciseMapper.PATTERN_MAP:
+                for band, enode in ((None, None), (0, None), (1, None), (2, None), (None, "E1"), (None, "E2")):
+                    if (CourtSportExerciseMapper.find_exercises(library, pattern, band, enode)
+                            != CourtSportExerciseMapper.find_rows(rows, pattern, band, enode)):
+                        raise AssertionError(f"columnar court selection differs from rows for {pattern}")
+            library.close()
+        del rows
+
+        context = multiprocessing.get_context("fork")
+        modes = [("csv rows (private)", str(LIBRARY_CSV)), ("columnar (private)", str(LIBRARY_CSV)),
+                 ("columnar (shared memory)", shared.name), ("columnar (mmapped file)", path)]
+        measured = {}
+        for mode, source in modes:
+            lock, barrier, results = context.Lock(), context.Barrier(n_workers), context.Queue()
+            workers = [context.Process(target=_library_worker, args=(mode, source, lock, barrier, results))
+                       for _ in range(n_workers)]
+            for worker in workers:
+                worker.start()
+            reports = [results.get(timeout=120) for _ in workers]
+            for worker in workers:
+                worker.join(timeout=60)
+            if len({touched for *_, touched in reports}) != 1:
+                raise AssertionError(f"{mode}: workers read different library contents")
+            measured[mode] = (sorted(r[0] for r in reports)[n_workers // 2], sum(r[1] for r in reports) / n_workers)
+    finally:
+        shared.close()
+        os.remove(path)
+
+    rows_out = [("compile columnar buffer", f"{compile_s * 1000:.1f}ms, {len(buffer) / 1024:.0f}KB")]
+    for mode, (load_s, private_kb) in measured.items():
+        rows_out.append((mode, f"load/attach {load_s * 1000:.2f}ms (median), private +{private_kb / 1024:.2f}MB "
+                               f"per worker"))
+    base = measured["csv rows (private)"][1]
+    shm = measured["columnar (shared memory)"][1]
+    rows_out.append((f"{n_workers} workers, private memory", f"{base * n_workers / 1024:.1f}MB as csv rows vs "
+                                                              f"{shm * n_workers / 1024:.1f}MB attached"))
+    rows_out.append(("equivalence", "rows == CSV via bytes, shared memory and mmapped file; views read-only; "
+                                    "court selection == rows"))
+    _report(f"Shared exercise library ({n_workers} forked workers)", rows_out)
+    return {mode: {"load_s": v[0], "private_kb": v[1]} for mode, v in measured.items()}
+
+
+# ============================================================================
+# PRE-FORK SERVER
+# ============================================================================
+
+_PREFORK_DEPLOY = """
+import json, os, signal, socket, tempfile, time
+start = time.perf_counter()
+from {package}.prefork_server import PreforkServer
+from {package}.registry import UID_REGISTRY
+coach = next(u["uid"] for u in UID_REGISTRY["users"] if u["role"] == "Coach")
+tmp = tempfile.mkdtemp()
+sock_path, ready_file = os.path.join(tmp, "efl.sock"), os.path.join(tmp, "efl.ready")
+segments = lambda: {{name for name in os.listdir("/dev/shm") if name.startswith("efl_library_")}}
+before = segments()
+pid = os.fork()
+if pid == 0:
+    os._exit(PreforkServer("unix:" + sock_path, workers=2, ready_file=ready_file).serve_forever())
+while not os.path.exists(ready_file):
+    time.sleep(0.002)
+ready_s = time.perf_counter() - start
+warm = json.load(open(ready_file))["warm"]
+first = {{}}
+for project_id in ("R2P_ACL", "ELASTIC_SPECIALIZATION", "COURT_SPORT_FOUNDATIONS"):
+    t0 = time.perf_counter()
+    client = socket.socket(socket.AF_UNIX)
+    client.connect(sock_path)
+    stream = client.makefile("rwb")
+    stream.write((json.dumps({{"intent_type": "REQUEST_SESSION_GENERATION", "requestor_uid": coach, "payload": {{
+        "client_id": "CLIENT_001", "project_id": project_id, "session_date": "2026-01-05"}}}}) + "\\n").encode())
+    stream.flush()
+    response = json.loads(stream.readline())
+    client.close()
+    first[project_id] = [time.perf_counter() - t0, response["status"]]
+    if project_id == "COURT_SPORT_FOUNDATIONS":
+        court = [ex["name"] for block in response["artifact"]["content_payload"]["session"]["blocks"]
+                 for ex in block["exercises"]]
+published = len(segments() - before)
+os.kill(pid, signal.SIGTERM)
+os.waitpid(pid, 0)
+print(json.dumps({{"ready_s": ready_s, "first": first, "warm": warm, "court": court,
+                  "published": published, "left": len(segments() - before)}}))
+"""
+
+_COLD_FIRST_REQUEST = """
+import json, time
+start = time.perf_counter()
+from {package} import requests
+coach = next(u["uid"] for u in requests.UID_REGISTRY["users"] if u["role"] == "Coach")
+first = {{}}
+for project_id in ("R2P_ACL", "ELASTIC_SPECIALIZATION", "COURT_SPORT_FOUNDATIONS"):
+    t0 = time.perf_counter()
+    response = requests.process_intent({{"intent_type": "REQUEST_SESSION_GENERATION", "requestor_uid": coach,
+        "payload": {{"client_id": "CLIENT_001", "project_id": project_id, "session_date": "2026-01-05"}}}})
+    first[project_id] = [time.perf_counter() - t0, response["status"]]
+court = [ex["name"] for block in response["artifact"]["content_payload"]["session"]["blocks"]
+         for ex in block["exercises"]]
+print(json.dumps({{"total_s": time.perf_counter() - start, "first": first, "court": court}}))
+"""
+
+
+def _prefork_call(path: str, message: dict) -> dict:
+    """One intent on a fresh Unix-socket connection"""
+    import socket
+
+    with socket.socket(socket.AF_UNIX) as client:
+        client.connect(path)
+        stream = client.makefile("rwb")
+        stream.write((json.dumps(message) + "\n").encode())
+        stream.flush()
+        return json.loads(stream.readline())
+
+
+def _start_prefork(tmp: str, **options):
+    """Fork a PreforkServer from this process (so UIDs match); returns (pid, socket path) once ready"""
+    import time
+    from .prefork_server import PreforkServer
+
+    sock_path, ready_file = os.path.join(tmp, "efl.sock"), os.path.join(tmp, "efl.ready")
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            code = PreforkServer(f"unix:{sock_path}", ready_file=ready_file, **options).serve_forever()
+        finally:
+            os._exit(code)
+    deadline = time.monotonic() + 60
+    while not os.path.exists(ready_file):
+        if time.monotonic() > deadline:
+            raise AssertionError("prefork server never became ready")
+        time.sleep(0.005)
+    return pid, sock_path
+
+
+def bench_prefork(n_requests: int = 300, max_requests: int = 25) -> Dict:
+    """Time-to-first-request of a fresh process vs a warm pre-fork deploy; recycling and graceful stop"""
+    import signal
+    import tempfile
+    import threading
+    import time
+    from .registry import UID_REGISTRY
+
+    package = __package__ or Path(__file__).resolve().parent.name
+    cold = _fresh_interpreter(_COLD_FIRST_REQUEST.format(package=package))
+    deploy = _fresh_interpreter(_PREFORK_DEPLOY.format(package=package))
+    for label, run in (("cold", cold), ("prefork", deploy)):
+        for project_id, (_, status) in run["first"].items():
+            if status != "APPROVED":
+                raise AssertionError(f"{label} first {project_id} request was {status}")
+    if deploy["warm"]["failed"]:
+        raise AssertionError(f"warm steps failed: {deploy['warm']['failed']}")
+    if (deploy["published"], deploy["left"]) != (1, 0):
+        raise AssertionError(f"expected one shared library segment while serving and none after, got "
+                             f"{deploy['published']} / {deploy['left']}")
+    if deploy["court"] != cold["court"]:
+        raise AssertionError("court exercises from the shared library differ from the private-rows session")
+
+    uid = {u["role"]: u["uid"] for u in UID_REGISTRY["users"]}
+    session = {"intent_type": "REQUEST_SESSION_GENERATION", "requestor_uid": uid["Coach"],
+               "payload": {"client_id": "CLIENT_001", "project_id": "R2P_ACL", "session_date": "2026-01-05"}}
+
+    # Recycling: every worker exits after max_requests (+ jitter) and is replaced warm
+    with tempfile.TemporaryDirectory() as tmp:
+        pid, path = _start_prefork(tmp, workers=2, max_requests=max_requests, max_requests_jitter=5)
+        try:
+            pids = set()
+            latencies = []
+            for i in range(n_requests):
+                t0 = time.perf_counter()
+                response = _prefork_call(path, session if i % 2 else {"intent_type": "PING"})
+                latencies.append(time.perf_counter() - t0)
+                if response["status"] not in ("APPROVED", "OK"):
+                    raise AssertionError(f"request {i} during recycling: {response}")
+                pids.add(response.get("pid"))
+            pids.discard(None)
+            if len(pids) < n_requests // 2 // (max_requests + 5):
+                raise AssertionError(f"workers did not recycle: {len(pids)} pids over {n_requests} requests")
+
+            # SIGHUP: a new generation replaces every worker without refusing requests
+            before = {_prefork_call(path, {"intent_type": "PING"})["pid"] for _ in range(20)}
+            os.kill(pid, signal.SIGHUP)
+            deadline = time.monotonic() + 30
+            after = before
+            while after & before:
+                if time.monotonic() > deadline:
+                    raise AssertionError("SIGHUP did not replace the workers")
+                after = {_prefork_call(path, {"intent_type": "PING"})["pid"] for _ in range(10)}
+        finally:
+            os.kill(pid, signal.SIGTERM)
+            os.waitpid(pid, 0)
+
+    # Graceful stop: a mesocycle in flight when SIGTERM lands still completes
+    with tempfile.TemporaryDirectory() as tmp:
+        pid, path = _start_prefork(tmp, workers=1)
+        result = {}
+        meso = {"intent_type": "REQUEST_MESOCYCLE_GENERATION", "requestor_uid": uid["Admin"],
+                "payload": {"client_id": "CLIENT_001", "project_id": "COURT_SPORT_FOUNDATIONS",
+                            "block_id": "SP_OFFSEASON_MULTI_13-17_12WK_v1", "meso_start_date": "2026-01-05"}}
+        client = threading.Thread(target=lambda: result.update(_prefork_call(path, meso)))
+        client.start()
+        time.sleep(0.05)
+        os.kill(pid, signal.SIGTERM)
+        client.join()
+        _, status = os.waitpid(pid, 0)
+        if result.get("status") != "APPROVED":
+            raise AssertionError(f"in-flight mesocycle not completed on SIGTERM: {result.get('status')}")
+        if os.waitstatus_to_exitcode(status) != 0 or os.path.exists(path):
+            raise AssertionError("server did not exit cleanly on SIGTERM")
+
+    latencies.sort()
+    warm_report = deploy["warm"]
+    rows = [("cold process: import + first requests", f"{cold['total_s'] * 1000:.1f}ms")]
+    for project_id in cold["first"]:
+        rows.append((f"first {project_id}", f"cold {cold['first'][project_id][0] * 1000:.2f}ms vs "
+                                            f"prefork {deploy['first'][project_id][0] * 1000:.2f}ms"))
+    rows.append(("deploy to ready (warm + fork 2 workers)", f"{deploy['ready_s'] * 1000:.1f}ms"))
+    rows.append(("warm steps", ", ".join(f"{k} {v:.0f}ms" for k, v in warm_report["steps"].items())))
+    rows.append((f"recycling ({n_requests} requests, max_requests {max_requests})",
+                 f"{len(pids)} worker pids, p50 {latencies[len(latencies) // 2] * 1000:.2f}ms, "
+                 f"max {latencies[-1] * 1000:.2f}ms, 0 failures"))
+    rows.append(("SIGHUP / SIGTERM", "rolling recycle replaced every worker; in-flight mesocycle completed, exit 0"))
+    _report("Pre-fork warm server", rows)
+    return {"cold": cold, "prefork": {"ready_s": deploy["ready_s"], "first": deploy["first"]},
+            "recycled_pids": len(pids)}
+
+
+# ============================================================================
+# INTENT SERVICE (HTTP)
+# ============================================================================
+
+MAX_HTTP_BATCH = 64
+
+
+async def _http_response(reader) -> tuple:
+    """(status, headers, parsed JSON body) of one HTTP response"""
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    headers = {}
+    for line in head[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers["content-length"]))
+    return int(head[0].split(" ")[1]), headers, json.loads(body)
+
+
+def _http_request(path: str, payload=None, close: bool = False, method: str = "POST") -> bytes:
+    body = json.dumps(payload).encode() if payload is not None else b""
+    head = f"{method} {path} HTTP/1.1\r\nHost: efl\r\nContent-Length: {len(body)}\r\n"
+    return (head + ("Connection: close\r\n" if close else "") + "\r\n").encode() + body
+
+
+async def _http_connect(address: str):
+    import asyncio
+
+    if address.startswith("unix:"):
+        return await asyncio.open_unix_connection(address[len("unix:"):])
+    host, _, port = address.rpartition(":")
+    return await asyncio.open_connection(host, int(port))
+
+
+async def _http_load(address: str, messages: List[dict], mode: str, concurrency: int, depth: int) -> tuple:
+    """
+    Send every message with concurrency clients; returns (elapsed_s, per-request latencies, responses in order).
+
+    mode: "close" (a connection per request), "keepalive" (one request in
+    flight per connection), "pipeline" (depth requests written before reading)
+    or "batch" (depth intents per /intents/batch request).
+    """
+    import asyncio
+    import time
+
+    responses: List = [None] * len(messages)
+    latencies: List[float] = []
+    step = 1 if mode in ("close", "keepalive") else depth
+    groups = [list(range(i, min(i + step, len(messages)))) for i in range(0, len(messages), step)]
+    queue = iter(groups)
+
+    async def client():
+        connection = None if mode == "close" else await _http_connect(address)
+        for group in queue:
+            reader, writer = connection or await _http_connect(address)
+            start = time.perf_counter()
+            if mode == "batch":
+                writer.write(_http_request("/intents/batch", [messages[i] for i in group]))
+                status, _, body = await _http_response(reader)
+                for i, response in zip(group, body):
+                    responses[i] = (status, response)
+                latencies.append(time.perf_counter() - start)
+            else:
+                writer.write(b"".join(_http_request("/intents", messages[i], close=mode == "close") for i in group))
+                for i in group:
+                    status, _, body = await _http_response(reader)
+                    responses[i] = (status, body)
+                    latencies.append(time.perf_counter() - start)
+            if mode == "close":
+                writer.close()
+        if connection:
+            connection[1].close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return time.perf_counter() - start, latencies, responses
+
+
+async def _http_protocol_checks(address: str, coach: str) -> List[str]:
+    """Error statuses, keep-alive after errors, Connection: close and HTTP/1.0 defaults"""
+    import asyncio
+
+    reader, writer = await _http_connect(address)
+    expected = [
+        (b"POST /intents HTTP/1.1\r\nContent-Length: 7\r\n\r\nnotjson", 400),
+        (_http_request("/nowhere", {}), 404),
+        (_http_request("/intents", method="GET"), 405),
+        (_http_request("/intents/batch", {"intent_type": "PING"}), 400),
+        (_http_request("/intents/batch", [{}] * (MAX_HTTP_BATCH + 1)), 413),
+        (_http_request("/health", method="GET"), 200),
+        (_http_request("/intents", {"intent_type": "NOT_AN_INTENT", "requestor_uid": coach}), 200),
+    ]
+    checked = []
+    for request, status in expected:
+        writer.write(request)
+        got, headers, _ = await _http_response(reader)
+        if got != status or headers.get("connection") != "keep-alive":
+            raise AssertionError(f"{request[:40]!r}: HTTP {got} ({headers.get('connection')}), expected {status}")
+        checked.append(str(status))
+    writer.write(b"POST /intents HTTP/1.1\r\n\r\n")
+    if (await _http_response(reader))[0] != 411 or await reader.read() != b"":
+        raise AssertionError("POST without Content-Length must answer 411 and close")
+    writer.close()
+
+    for request in (_http_request("/health", method="GET", close=True),
+                    b"GET /health HTTP/1.0\r\n\r\n"):
+        reader, writer = await _http_connect(address)
+        writer.write(request)
+        status, headers, _ = await _http_response(reader)
+        if status != 200 or headers.get("connection") != "close" or await asyncio.wait_for(reader.read(), 5) != b"":
+            raise AssertionError(f"{request[:30]!r} did not close the connection")
+        writer.close()
+    return checked + ["411", "close"]
+
+
+async def _http_offload_check(io_s: float = 0.3) -> str:
+    """Batches and mesocycle intents run off the event loop: /health on another connection answers meanwhile"""
+    import asyncio
+    import time
+    from .intent_service import IntentService
+
+    def slow(message):
+        time.sleep(io_s)
+        return {"status": "APPROVED"}
+
+    service = IntentService(handler=slow)
+    (address,) = await service.start("127.0.0.1", 0)
+    try:
+        for path, body in (("/intents/batch", [{"intent_type": "REQUEST_SESSION_GENERATION"}] * 2),
+                           ("/intents", {"intent_type": "REQUEST_MESOCYCLE_GENERATION"})):
+            slow_reader, slow_writer = await _http_connect(address)
+            # Client and server share this loop, so time from the slow request's send
+            t0 = time.perf_counter()
+            slow_writer.write(_http_request(path, body))
+            await asyncio.sleep(io_s / 10)
+            reader, writer = await _http_connect(address)
+            writer.write(_http_request("/health", method="GET"))
+            status, _, _ = await _http_response(reader)
+            waited = time.perf_counter() - t0
+            if status != 200 or waited > io_s / 2:
+                raise AssertionError(f"a slow {path} request held /health for {waited * 1000:.0f}ms")
+            if (await _http_response(slow_reader))[0] != 200:
+                raise AssertionError(f"slow {path} request failed")
+            writer.close()
+            slow_writer.close()
+    finally:
+        await service.close()
+    return "batch/mesocycle off the event loop"
+
+
+def bench_intent_service(n_requests: int = 4000, concurrency: int = 8, depth: int = 8, batch: int = 32) -> Dict:
+    """HTTP intent service load test: RPS and latency percentiles per transport and connection mode"""
+    import asyncio
+    import signal
+    import tempfile
+    from .registry import UID_REGISTRY
+
+    coach = next(u["uid"] for u in UID_REGISTRY["users"] if u["role"] == "Coach")
+    projects = ("R2P_ACL", "ELASTIC_SPECIALIZATION", "DECEL_SPECIALIZATION")
+    messages = []
+    for i in range(n_requests):
+        client_id = ("CLIENT_001", "CLIENT_002", "CLIENT_003")[i % 3]  # CLIENT_003 is not the coach's athlete
+        messages.append({"intent_type": "REQUEST_SESSION_GENERATION", "requestor_uid": coach, "payload": {
+            "client_id": client_id, "project_id": projects[i % len(projects)], "session_date": "2026-01-05"}})
+
+    def outcome(message, response):
+        """What a correct, in-order response to message looks like"""
+        if message["payload"]["client_id"] == "CLIENT_003":
+            return response.get("error_code") == "CLIENT_ACCESS_DENIED"
+        header = response.get("artifact", {}).get("header", {})
+        return (response.get("status") == "APPROVED" and header.get("client_id") == message["payload"]["client_id"]
+                and header.get("project_id") == message["payload"]["project_id"])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        unix_path = os.path.join(tmp, "efl-http.sock")
+        ready_r, ready_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                os.close(ready_r)
+                from .intent_service import IntentService
+                from .prefork_server import warm
+                warm()
+                service = IntentService(max_batch=MAX_HTTP_BATCH)
+                asyncio.run(service.serve_forever("127.0.0.1", 0, unix_path, on_ready=lambda addresses: os.write(
+                    ready_w, (json.dumps(addresses) + "\n").encode())))
+                code = 0
+            finally:
+                os._exit(code)
+        os.close(ready_w)
+        with os.fdopen(ready_r) as ready:
+            tcp, unix = json.loads(ready.readline())
+
+        try:
+            checked = asyncio.run(_http_protocol_checks(tcp, coach))
+            checked.append(asyncio.run(_http_offload_check()))
+            scenarios = [
+                ("tcp, connection per request", tcp, "close", 1),
+                ("tcp, keep-alive", tcp, "keepalive", 1),
+                (f"tcp, keep-alive, pipelined x{depth}", tcp, "pipeline", depth),
+                ("unix, keep-alive", unix, "keepalive", 1),
+                (f"unix, keep-alive, pipelined x{depth}", unix, "pipeline", depth),
+                (f"unix, batch x{batch}", unix, "batch", batch),
+            ]
+            results = {}
+            for label, address, mode, k in scenarios:
+                elapsed, latencies, responses = asyncio.run(_http_load(address, messages, mode, concurrency, k))
+                wrong = [i for i, (m, (status, r)) in enumerate(zip(messages, responses))
+                         if status != 200 or not outcome(m, r)]
+                if wrong:
+                    raise AssertionError(f"{label}: {len(wrong)} wrong or out-of-order responses (first #{wrong[0]})")
+                latencies.sort()
+                pct = {p: latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] for p in (50, 95, 99)}
+                results[label] = {"rps": n_requests / elapsed, **{f"p{p}_ms": v * 1000 for p, v in pct.items()}}
+        finally:
+            os.kill(pid, signal.SIGTERM)
+            _, status = os.waitpid(pid, 0)
+        if os.waitstatus_to_exitcode(status) != 0 or os.path.exists(unix_path):
+            raise AssertionError("intent service did not shut down cleanly on SIGTERM")
+
+    rows = [(label, f"{r['rps']:8.0f} intents/s   p50 {r['p50_ms']:.2f}ms  p95 {r['p95_ms']:.2f}ms  "
+                    f"p99 {r['p99_ms']:.2f}ms") for label, r in results.items()]
+    rows.append(("correctness", f"{n_requests} intents per mode answered in order; "
+                                f"HTTP {', '.join(checked)} checks passed"))
+    _report(f"Intent service ({concurrency} clients, server and load generator on one host)", rows)
+    return results
+
+
+# ============================================================================
+# REQUEST COALESCING
+# ============================================================================
+
+def bench_coalescing(callers_per_key: int = 8, io_ms: float = 20.0, rounds: int = 5) -> Dict:
+    """Roster-page bursts: identical in-flight session intents share one generation"""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from . import requests as pipeline
+
+    uid = {u["role"]: u["uid"] for u in pipeline.UID_REGISTRY["users"]}
+    keys = [(client_id, project_id) for client_id in ("CLIENT_001", "CLIENT_002")
+            for project_id in ("R2P_ACL", "ELASTIC_SPECIALIZATION", "NOT_A_PROJECT")]
+    roles = ("Coach", "SeniorCoach", "Admin", "MedicalProvider")
+    burst = [(roles[k % len(roles)], client_id, project_id)
+             for client_id, project_id in keys for k in range(callers_per_key)]
+    burst.append(("Coach", "CLIENT_003", "R2P_ACL"))  # not the coach's athlete
+
+    generator = pipeline._session_generator()
+    calls = []
+
+    def instrumented(client_id, project_id, session_date):
+        # The real generator behind a state store / library fetch of io_ms
+        calls.append((client_id, project_id, session_date))
+        time.sleep(io_ms / 1000)
+        return generator(client_id, project_id, session_date)
+
+    def run_burst(session_date):
+        barrier = threading.Barrier(len(burst))
+
+        def caller(request):
+            role, client_id, project_id = request
+            barrier.wait()
+            return pipeline.process_intent({"intent_type": "REQUEST_SESSION_GENERATION", "requestor_uid": uid[role],
+                                            "payload": {"client_id": client_id, "project_id": project_id,
+                                                        "session_date": session_date}})
+        with ThreadPoolExecutor(len(burst)) as pool:
+            return list(pool.map(caller, burst))
+
+    def expected(role, client_id, project_id):
+        if role == "MedicalProvider":
+            return "INTENT_ROLE_DENIED"
+        if role == "Coach" and client_id == "CLIENT_003":
+            return "CLIENT_ACCESS_DENIED"
+        return "INVALID_PROJECT_ID" if project_id == "NOT_A_PROJECT" else "APPROVED"
+
+    measured = {}
+    previous = pipeline.COALESCE_GENERATION
+    pipeline._GENERATOR = instrumented
+    try:
+        for coalesce in (False, True):
+            pipeline.COALESCE_GENERATION = coalesce
+            calls.clear()
+            start = time.perf_counter()
+            for r in range(rounds):
+                session_date = f"2026-02-{r + 1:02d}"
+                responses = run_burst(session_date)
+                for request, response in zip(burst, responses):
+                    got = response.get("error_code", response["status"])
+                    if got != expected(*request):
+                        raise AssertionError(f"{request}: {got}, expected {expected(*request)}")
+                if len({response["intent_id"] for response in responses}) != len(burst):
+                    raise AssertionError("callers shared an intent_id")
+                approved = [r["artifact"] for r in responses if r["status"] == "APPROVED"]
+                if len({id(a) for a in approved}) != len(approved):
+                    raise AssertionError("callers were handed the same artifact object")
+                if coalesce:
+                    by_key = {}
+                    for artifact in approved:
+                        header = artifact["header"]
+                        by_key.setdefault((header["client_id"], header["project_id"]), set()).add(header["artifact_id"])
+                    if any(len(ids) != 1 for ids in by_key.values()):
+                        raise AssertionError("coalesced callers received different artifacts")
+            elapsed = time.perf_counter() - start
+            authorized = sum(expected(*request) in ("APPROVED", "INVALID_PROJECT_ID") for request in burst)
+            distinct = len({c for c in calls})
+            measured["coalesced" if coalesce else "per caller"] = (len(calls), distinct, elapsed, authorized * rounds)
+        if pipeline._IN_FLIGHT:
+            raise AssertionError("in-flight table not emptied after the bursts")
+
+        # In flight only: the same key afterwards generates afresh
+        calls.clear()
+        again = [pipeline.process_intent({"intent_type": "REQUEST_SESSION_GENERATION", "requestor_uid": uid["Coach"],
+                                          "payload": {"client_id": "CLIENT_001", "project_id": "R2P_ACL",
+                                                      "session_date": "2026-02-01"}}) for _ in range(2)]
+        if len(calls) != 2 or again[0]["artifact"]["header"]["artifact_id"] == again[1]["artifact"]["header"]["artifact_id"]:
+            raise AssertionError("sequential identical requests must not be served from a cache")
+
+        # Spellings of one project share a key; unhashable inputs still make a key
+        def concurrently(fn, args_list):
+            barrier = threading.Barrier(len(args_list))
+
+            def call(args):
+                barrier.wait()
+                try:
+                    return fn(*args)
+                except BaseException as exc:
+                    return exc
+            with ThreadPoolExecutor(len(args_list)) as pool:
+                return list(pool.map(call, args_list))
+
+        def slow(result):
+            def generate(client_id, project_id, session_date):
+                calls.append((str(client_id), project_id, session_date))
+                time.sleep(io_ms / 1000)
+                if isinstance(result, BaseException):
+                    raise result
+                return {"header": {"project_id": project_id}}
+            return generate
+
+        calls.clear()
+        pipeline._GENERATOR = slow(None)
+        spellings = ("R2P_ACL", "r2p-acl", "R2P ACL", "r2p_acl")
+        concurrently(pipeline._call_generator, [("CLIENT_001", s, "2026-03-01") for s in spellings])
+        if len(calls) != 1:
+            raise AssertionError(f"project spellings generated {len(calls)} times, expected one shared generation")
+        results = concurrently(pipeline._call_generator, [(["CLIENT_001"], "R2P_ACL", "2026-03-01")] * 2)
+        if any(isinstance(r, BaseException) for r in results):
+            raise AssertionError(f"unhashable client_id failed to coalesce: {results}")
+
+        # Failures: waiters get a fresh exception of the leader's type raised from it,
+        # and an interrupted leader never hands waiters a None artifact
+        class Interrupted(BaseException):
+            pass
+
+        for error, waiter_type in ((ValueError("Unknown project"), ValueError), (Interrupted("stop"), RuntimeError)):
+            pipeline._GENERATOR = slow(error)
+            results = concurrently(pipeline._call_generator, [("CLIENT_001", "R2P_ACL", "2026-03-02")] * 4)
+            leaders = [r for r in results if r is error]
+            waiters = [r for r in results if r is not error]
+            if len(leaders) != 1 or not all(isinstance(r, waiter_type) and r.__cause__ is error for r in waiters):
+                raise AssertionError(f"{type(error).__name__} in the leader: waiters got {waiters!r}")
+        if pipeline._IN_FLIGHT:
+            raise AssertionError("in-flight table not emptied after failed generations")
+
+        # Spellings only share a key when the active generator accepts them alike:
+        # the fake generator takes 'Court' but rejects 'court', whatever the timing
+        from .generator_fake import fake_session_generator
+        use_fake = pipeline._USE_FAKE_GENERATOR
+        pipeline._USE_FAKE_GENERATOR, pipeline._GENERATOR = True, None
+        try:
+            pipeline._session_generator()
+
+            def slow_fake(client_id, project_id, session_date):
+                time.sleep(io_ms / 1000)
+                return fake_session_generator(client_id, project_id, session_date)
+            pipeline._GENERATOR = slow_fake
+            court, lower = concurrently(pipeline._call_generator, [("CLIENT_001", p, "2026-03-03")
+                                                                   for p in ("Court", "court")])
+            if isinstance(court, BaseException) or not isinstance(lower, ValueError):
+                raise AssertionError(f"fake generator: 'Court' -> {court!r}, 'court' -> {lower!r}")
+        finally:
+            pipeline._USE_FAKE_GENERATOR, pipeline._GENERATOR = use_fake, None
+    finally:
+        pipeline.COALESCE_GENERATION = previous
+        pipeline._GENERATOR = None
+
+    rows = []
+    for label, (n_calls, distinct, elapsed, authorized) in measured.items():
+        rows.append((label, f"{n_calls} generator runs for {authorized} authorized intents "
+                            f"({distinct} distinct keys, {n_calls - distinct} duplicate), "
+                            f"{elapsed / rounds * 1000:.1f}ms per burst"))
+    rows.append(("per caller", "own intent_id, own authorization decision, own artifact copy"))
+    _report(f"Request coalescing ({len(burst)} concurrent callers per burst, generator with {io_ms:.0f}ms I/O)",
+            rows)
+    duplicates = measured["coalesced"][0] - measured["coalesced"][1]
+    if duplicates:
+        raise AssertionError(f"{duplicates} duplicate generations with coalescing on")
+    return {label: {"generator_runs": v[0], "distinct": v[1], "burst_s": v[2] / rounds}
+            for label, v in measured.items()}
+
+
+# ============================================================================
+# MESOCYCLE ENGINE
+# ============================================================================
+
+def bench_mesocycle(block_id: str = "SP_OFFSEASON_MULTI_13-17_12WK_v1", workers: int = 4) -> Dict:
+    """A whole manifest block: one cold generator call per session vs the warm mesocycle engine"""
+    import os
+    from .efl_session_generator_v1_0 import EFLSessionGenerator
+    from .mesocycle_engine import MesocycleEngine
+
+    engine, init_s = _timed(MesocycleEngine, LIBRARY_CSV)
+    plans = engine.plan(block_id, "2026-01-05")
+    population, season_type = engine.client_profile(engine.block(block_id))
+    n_sessions = sum(len(week.slots) for week in plans)
+
+    def cold():
+        # Today's path: every session loads the library and generates on its own
+        return [
+            EFLSessionGenerator(str(LIBRARY_CSV)).generate_session(
+                "BENCH_CLIENT", population, "Multi-Sport", season_type,
+                target_zones=list(week.target_zones)
+            )
+            for week in plans for _ in week.slots
+        ]
+
+    def warm(executor=None):
+        return list(engine.stream("BENCH_CLIENT", block_id, "2026-01-05", executor=executor))
+
+    _, cold_s = _timed(cold)
+    sequential, warm_s = _best_of(warm, repeat=3)
+    workers = max(1, min(workers, os.cpu_count() or 1))
+    with engine.process_pool(workers) as pool:
+        warm(pool)
+        parallel, parallel_s = _best_of(lambda: warm(pool), repeat=3)
+
+    def content(artifacts):
+        return [artifact["content_payload"]["session"]["blocks"] for artifact in artifacts]
+
+    if content(parallel) != content(sequential):
+        raise AssertionError("parallel mesocycle differs from sequential generation")
+    weekly: Dict[int, List[int]] = {}
+    for artifact in sequential:
+        week = weekly.setdefault(artifact["content_payload"]["session"]["week"], [0, 0])
+        week[0] += artifact["exposure_summary"]["total_contacts"]
+        week[1] += artifact["exposure_summary"]["total_sprint_meters"]
+        if (week[0] > artifact["cap_proof"]["weekly_contacts_cap_applied"]
+                or week[1] > artifact["cap_proof"]["weekly_sprint_meters_cap_applied"]):
+            raise AssertionError(f"week {artifact['content_payload']['session']['week']} exceeds its weekly cap")
+    approved = sum(a["header"]["eligible_for_training_today"] for a in sequential)
+
+    _report(f"Mesocycle engine ({block_id}: {len(plans)} weeks, {n_sessions} sessions)", [
+        (f"{n_sessions} cold generator calls", f"{cold_s * 1000:.0f}ms"),
+        ("engine warm-up (once)", f"{init_s * 1000:.0f}ms"),
+        ("warm engine, sequential", f"{warm_s * 1000:.0f}ms  ({cold_s / warm_s:.1f}x)"),
+        (f"warm engine, {workers} worker(s)", f"{parallel_s * 1000:.0f}ms  ({cold_s / parallel_s:.1f}x)"),
+        ("sessions approved", f"{approved}/{n_sessions}"),
+        ("equivalence", "parallel == sequential; no weekly cap exceeded")
+    ])
+    return {"cold_s": cold_s, "warm_s": warm_s, "parallel_s": parallel_s}
+
+
+def bench_library_loader() -> Dict:
+    """Session routing before/after the loader reads Library v2.5 columns (load_band_primary, e_node, intensity_vmax)"""
+    import csv
+    import dataclasses
+    import tempfile
+    from .efl_session_generator_v1_0 import (
+        ClientStateEngine, ExerciseLibrary, ExerciseRouter, Population, ReadinessFlag, SeasonType, SessionType
+    )
+
+    def rows(path):
+        with open(path, newline="", encoding="utf-8") as f:
+            return {row["exercise_id"]: row for row in csv.DictReader(f)}
+
+    def legacy_loader(path):
+        # The loader as it was: legacy column names only
+        library = ExerciseLibrary(path)
+        for ex_id, row in rows(path).items():
+            library.exercises[ex_id] = dataclasses.replace(
+                library.exercises[ex_id],
+                load_standard_band=row["load_standard_band"],
+                e_node_classification=row.get("e_node_classification", ""),
+                intensity_percent_vmax=float(row.get("intensity_percent_vmax", 0) or 0)
+            )
+        return library
+
+    states = [
+        ClientStateEngine.compute_state(f"C{i:03d}", population, "Multi-Sport", season, readiness, [],
+                                        SessionType.FULL_SESSION)
+        for i, (population, season, readiness) in enumerate(
+            (p, s, r) for p in Population for s in SeasonType for r in ReadinessFlag
+        )
+    ]
+
+    def routing(library):
+        router = ExerciseRouter(library)
+        return [
+            {block: [ex.exercise_id for ex in pool] for block, pool in router.route(state).items()}
+            for state in states
+        ]
+
+    def over_ceiling(routed):
+        # Routed exercises above the state's ceilings as the v2.5 columns state them
+        over = 0
+        for state, pools in zip(states, routed):
+            max_band = ExerciseRouter.BAND_ORDER.get(state.max_band_allowed, 0)
+            max_e = ExerciseRouter.E_NODE_ORDER.get(state.max_e_node_allowed, 0)
+            for ex_id in {ex_id for pool in pools.values() for ex_id in pool}:
+                row = v25_rows[ex_id]
+                over += (ExerciseRouter.BAND_ORDER.get(row["load_band_primary"], 0) > max_band
+                         or ExerciseRouter.E_NODE_ORDER.get(row["e_node"], 0) > max_e)
+        return over
+
+    v25_rows = rows(LIBRARY_CSV)
+    before = routing(legacy_loader(LIBRARY_CSV))
+    library, load_s = _timed(ExerciseLibrary, str(LIBRARY_CSV))
+    after = routing(library)
+    if over_ceiling(after):
+        raise AssertionError(f"{over_ceiling(after)} exercises routed above their band/E-node ceilings")
+    if not any(pools["WORK"] for pools in after):
+        raise AssertionError("no client state routes a WORK pool from the v2.5 library")
+
+    # The same library under the legacy column names routes identically under both loaders
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_csv = str(Path(tmp) / "library_legacy_columns.csv")
+        with open(legacy_csv, "w", newline="", encoding="utf-8") as f:
+            fields = [c for c in next(iter(v25_rows.values())) if c not in ("load_band_primary", "e_node", "intensity_vmax")]
+            writer = csv.DictWriter(f, fields + ["e_node_classification", "intensity_percent_vmax"])
+            writer.writeheader()
+            for ex_id, row in v25_rows.items():
+                ex = library.exercises[ex_id]
+                writer.writerow({
+                    **{c: row[c] for c in fields},
+                    "load_standard_band": ex.load_standard_band,
+                    "e_node_classification": ex.e_node_classification,
+                    "intensity_percent_vmax": ex.intensity_percent_vmax
+                })
+        legacy_before = routing(legacy_loader(legacy_csv))
+        legacy_after = routing(ExerciseLibrary(legacy_csv))
+    if legacy_after != legacy_before:
+        raise AssertionError("legacy-column library routes differently under the v2.5-aware loader")
+    if after != legacy_before:
+        raise AssertionError("v2.5 library routes differently from the same library under legacy columns")
+
+    _report(f"Library loader ({len(library.exercises)} exercises, {len(states)} client states)", [
+        ("load", f"{load_s * 1000:.0f}ms"),
+        ("routed above ceiling, legacy loader", f"{over_ceiling(before)}"),
+        ("routed above ceiling, v2.5 loader", f"{over_ceiling(after)}"),
+        ("equivalence", "v2.5 == legacy columns; legacy-column routing unchanged; ceilings hold")
+    ])
+    return {"load_s": load_s}
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+BENCHMARKS: Dict[str, Callable[[], Dict]] = {
+    "batch_validation": bench_batch_validation,
+    "plan_objects": bench_plan_objects,
+    "router": bench_router,
+    "state_store": bench_state_store,
+    "incremental": bench_incremental,
+    "spec_registry": bench_spec_registry,
+    "weekly_planner": bench_weekly_planner,
+    "work_optimizer": bench_work_optimizer,
+    "zone_index": bench_zone_index,
+    "sport_scoring": bench_sport_scoring,
+    "block_selector": bench_block_selector,
+    "progression_law": bench_progression_law,
+    "r2p_acl": bench_r2p_acl,
+    "specialization": bench_specialization,
+    "plugin_router": bench_plugin_router,
+    "import_time": bench_import_time,
+    "cache_manager": bench_cache_manager,
+    "shared_library": bench_shared_library,
+    "prefork": bench_prefork,
+    "intent_service": bench_intent_service,
+    "coalescing": bench_coalescing,
+    "mesocycle": bench_mesocycle,
+    "library_loader": bench_library_loader,
+}
+
+
+def main(argv: List[str]) -> int:
+    names = argv or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"Unknown benchmarks: {unknown}. Available: {list(BENCHMARKS)}")
+        return 2
+
+    for name in names:
+        BENCHMARKS[name]()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
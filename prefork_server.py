@@ -0,0 +1,476 @@
+"""
+Pre-fork intent server: warm once in the parent, fork warm workers.
+
+The parent imports the generator stack and compiles everything a first
+request would otherwise pay for (spec registry, load-standard limits,
+library rows, R2P library bitsets, specialization pools and templates,
+block selector, progression law, mesocycle engine, plugin bindings), then
+freezes the heap out of the cyclic GC and forks the workers. Workers
+inherit the warm state copy-on-write, so a freshly forked worker serves
+its first request at steady-state latency. The exercise library is also
+published once to shared memory (shared_library) and court generation in
+every worker reads that one mapped copy instead of private row dicts.
+
+Protocol: newline-delimited JSON over TCP ("host:port") or a Unix socket
+("unix:/path"), one intent message per line, one response per line
+(requests.process_intent). {"intent_type": "PING"} answers with the
+worker's pid and request count.
+
+Process management:
+- Readiness: each worker reports over a pipe once it can accept; when all
+  initial workers are ready the parent writes the ready file (JSON: pid,
+  address, workers, warm timings) and notifies systemd (READY=1) if
+  NOTIFY_SOCKET is set.
+- Recycling: a worker exits after max_requests (+ random jitter, so workers
+  don't recycle together), finishing its current response; the parent
+  forks a replacement from the warm image.
+- SIGHUP: rolling recycle; a new generation is forked and each old worker
+  is stopped as a replacement reports ready.
+- SIGTERM / SIGINT: graceful stop; workers finish the request in hand and
+  exit, stragglers are killed after graceful_timeout.
+
+Usage:
+    python -m package.prefork_server --bind unix:/run/efl.sock --workers 4 --ready-file /run/efl.ready
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import select
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+
+DEFAULT_BIND = "127.0.0.1:8765"
+ACCEPT_POLL_S = 0.5
+MAX_LINE_BYTES = 1 << 20
+
+
+# ----------------------------------------------------------------------
+# Warm-up
+# ----------------------------------------------------------------------
+
+def _warm_spec_registry():
+    from .spec_registry import default_registry
+    default_registry().compile_all()
+
+
+def _warm_limits():
+    from .epa_v2_2_full import LimitManager
+    LimitManager.active_standard()
+
+
+def _warm_library():
+    from .generator_court import court_library
+    court_library()
+
+
+def _warm_r2p_acl():
+    from .generator_r2p_acl import get_r2p_acl_generator
+    get_r2p_acl_generator()
+
+
+def _warm_specialization():
+    from .generator_specialization import SPECIALIZATION_SPECS, get_specialization_generator
+    for project_id in SPECIALIZATION_SPECS:
+        generator = get_specialization_generator(project_id)
+        for week, plan in generator.weeks.items():
+            for population, volume in plan.volume.items():
+                for day in range(1, volume.session_count + 1):
+                    generator.template(week, population, day)
+
+
+def _warm_selection():
+    from .block_selector import default_block_selector
+    from .progression_law import default_progression_law
+    default_block_selector()
+    default_progression_law()
+
+
+def _warm_pipeline():
+    from . import requests
+    from .generator_adapter import GENERATOR_PLUGINS, resolve_generator
+    for project_id in GENERATOR_PLUGINS:
+        resolve_generator(project_id)
+    requests._session_generator()
+    requests._mesocycle_engine()
+
+
+WARM_STEPS: Tuple[Tuple[str, Callable[[], None]], ...] = (
+    ("spec_registry", _warm_spec_registry),
+    ("limits", _warm_limits),
+    ("library", _warm_library),
+    ("r2p_acl", _warm_r2p_acl),
+    ("specialization", _warm_specialization),
+    ("selection", _warm_selection),
+    ("pipeline", _warm_pipeline),
+)
+
+
+def warm() -> Dict:
+    """
+    Run every warm step in this process, then freeze the heap.
+
+    A failing step is recorded rather than raised: the workers still start,
+    and that path pays its cost (and fails the same way) on first use.
+
+    Returns:
+        dict: {"steps": {name: ms}, "failed": {name: error}, "total_ms"}
+    """
+    steps: Dict[str, float] = {}
+    failed: Dict[str, str] = {}
+    start = time.perf_counter()
+    for name, step in WARM_STEPS:
+        t0 = time.perf_counter()
+        try:
+            step()
+        except Exception as exc:  # a failed step is reported; workers still fork
+            failed[name] = f"{type(exc).__name__}: {exc}"
+        steps[name] = round((time.perf_counter() - t0) * 1000, 2)
+    # Keep the collector from touching (and so copying) the inherited objects
+    gc.collect()
+    gc.freeze()
+    return {"steps": steps, "failed": failed, "total_ms": round((time.perf_counter() - start) * 1000, 2)}
+
+
+# ----------------------------------------------------------------------
+# Server
+# ----------------------------------------------------------------------
+
+def _default_handler(message: dict) -> dict:
+    from .requests import process_intent
+    return process_intent(message)
+
+
+def sd_notify(state: str) -> bool:
+    """Send a systemd notification if NOTIFY_SOCKET is set; False otherwise"""
+    address = os.environ.get("NOTIFY_SOCKET")
+    if not address:
+        return False
+    if address.startswith("@"):
+        address = "\0" + address[1:]
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+        sock.connect(address)
+        sock.sendall(state.encode("utf-8"))
+    return True
+
+
+class PreforkServer:
+    """Warm parent process supervising forked intent workers"""
+
+    def __init__(self, address: str = DEFAULT_BIND, workers: int = 2, max_requests: int = 0,
+                 max_requests_jitter: int = 0, ready_file: Optional[str] = None,
+                 graceful_timeout: float = 10.0, handler: Optional[Callable[[dict], dict]] = None,
+                 preload: bool = True):
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if max_requests < 0 or max_requests_jitter < 0:
+            raise ValueError("max_requests and max_requests_jitter must not be negative")
+        self.address = address
+        self.n_workers = workers
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.ready_file = ready_file
+        self.graceful_timeout = graceful_timeout
+        self.handler = handler or _default_handler
+        self.preload = preload
+
+        self.warm_report: Optional[Dict] = None
+        self.shared_library = None
+        self.bound_address: Optional[str] = None
+        self.workers: Dict[int, int] = {}      # pid -> generation
+        self.ready: set = set()
+        self.generation = 0
+        self.spawned = 0
+        self._listener: Optional[socket.socket] = None
+        self._unix_path: Optional[str] = None
+        self._ready_r = self._ready_w = -1
+        self._wake_r = self._wake_w = -1
+        self._announced = False
+        self._stopping = False
+        self._reload = False
+
+    # ------------------------------------------------------------------
+    # Parent
+    # ------------------------------------------------------------------
+
+    def serve_forever(self) -> int:
+        """Warm, bind, fork the workers and supervise them until SIGTERM / SIGINT; returns the exit code"""
+        if self.preload:
+            self._publish_library()
+            self.warm_report = warm()
+        try:
+            return self._supervise()
+        finally:
+            self._unpublish_library()
+
+    def _supervise(self) -> int:
+        self._listener = self._bind()
+        self._ready_r, self._ready_w = os.pipe()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_w, False)
+        previous = {sig: signal.getsignal(sig) for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP, signal.SIGCHLD)}
+        previous_wakeup = signal.set_wakeup_fd(self._wake_w)
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+        signal.signal(signal.SIGHUP, self._on_reload)
+        signal.signal(signal.SIGCHLD, lambda signum, frame: None)  # wakes select via the wakeup fd
+        buffered = b""
+        try:
+            while not self._stopping:
+                if self._reload:
+                    self._reload = False
+                    self.generation += 1
+                self._reap()
+                self._spawn_missing()
+                readable, _, _ = select.select([self._ready_r, self._wake_r], [], [], 1.0)
+                if self._wake_r in readable:
+                    os.read(self._wake_r, 4096)
+                if self._ready_r in readable:
+                    buffered += os.read(self._ready_r, 4096)
+                    *lines, buffered = buffered.split(b"\n")
+                    for line in lines:
+                        self._on_worker_ready(int(line))
+            return self._shutdown()
+        finally:
+            signal.set_wakeup_fd(previous_wakeup)
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+            for fd in (self._ready_r, self._ready_w, self._wake_r, self._wake_w):
+                os.close(fd)
+
+    def _publish_library(self) -> None:
+        """Publish the columnar library for the workers (they read private rows if shared memory is unavailable)"""
+        from .shared_library import SHARED_LIBRARY_ENV, publish
+        try:
+            self.shared_library = publish()
+        except OSError:
+            return
+        os.environ[SHARED_LIBRARY_ENV] = self.shared_library.name
+
+    def _unpublish_library(self) -> None:
+        """Unlink the segment; workers still running keep their mappings"""
+        if self.shared_library is not None:
+            from .shared_library import SHARED_LIBRARY_ENV
+            os.environ.pop(SHARED_LIBRARY_ENV, None)
+            self.shared_library.close()
+            self.shared_library = None
+
+    def _bind(self) -> socket.socket:
+        if self.address.startswith("unix:"):
+            path = self.address[len("unix:"):]
+            if os.path.exists(path):
+                os.unlink(path)  # stale socket from an unclean exit
+            listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            listener.bind(path)
+            self._unix_path = path
+            self.bound_address = f"unix:{path}"
+        else:
+            host, _, port = self.address.rpartition(":")
+            if not host or not port.isdigit():
+                raise ValueError(f"Bind address must be 'host:port' or 'unix:/path', got '{self.address}'")
+            listener = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            listener.bind((host.strip("[]"), int(port)))
+            self.bound_address = f"{host}:{listener.getsockname()[1]}"
+        listener.listen(128)
+        # Workers poll accept so they notice SIGTERM while idle
+        listener.settimeout(ACCEPT_POLL_S)
+        return listener
+
+    def _spawn_missing(self) -> None:
+        current = sum(1 for generation in self.workers.values() if generation == self.generation)
+        for _ in range(self.n_workers - current):
+            pid = os.fork()
+            if pid == 0:
+                code = 1
+                try:
+                    code = self._run_worker()
+                finally:
+                    os._exit(code)
+            self.workers[pid] = self.generation
+            self.spawned += 1
+
+    def _on_worker_ready(self, pid: int) -> None:
+        if pid not in self.workers:
+            return
+        self.ready.add(pid)
+        # Rolling recycle: retire one old-generation worker per new worker ready
+        if self.workers[pid] == self.generation:
+            for old, generation in self.workers.items():
+                if generation < self.generation and old in self.ready:
+                    self.ready.discard(old)
+                    os.kill(old, signal.SIGTERM)
+                    break
+        if not self._announced and len(self.ready) >= self.n_workers:
+            self._announce()
+
+    def _announce(self) -> None:
+        self._announced = True
+        if self.ready_file:
+            target = Path(self.ready_file)
+            tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({
+                "pid": os.getpid(),
+                "address": self.bound_address,
+                "workers": sorted(self.ready),
+                "warm": self.warm_report,
+                "ready_at": time.time(),
+            }, indent=2))
+            os.replace(tmp, target)
+        sd_notify(f"READY=1\nMAINPID={os.getpid()}")
+
+    def _reap(self) -> Dict[int, int]:
+        """Collect exited workers; returns {pid: exit status}"""
+        exited = {}
+        while self.workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            if pid in self.workers:
+                del self.workers[pid]
+                self.ready.discard(pid)
+                exited[pid] = os.waitstatus_to_exitcode(status)
+        return exited
+
+    def _on_stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    def _on_reload(self, signum, frame) -> None:
+        self._reload = True
+
+    def _shutdown(self) -> int:
+        sd_notify("STOPPING=1")
+        for pid in self.workers:
+            os.kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.graceful_timeout
+        while self.workers and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.02)
+        for pid in self.workers:
+            os.kill(pid, signal.SIGKILL)
+        while self.workers:
+            pid, _ = os.waitpid(-1, 0)
+            self.workers.pop(pid, None)
+        self._listener.close()
+        if self._unix_path and os.path.exists(self._unix_path):
+            os.unlink(self._unix_path)
+        if self.ready_file and os.path.exists(self.ready_file):
+            os.unlink(self.ready_file)
+        return 0
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _run_worker(self) -> int:
+        signal.set_wakeup_fd(-1)
+        os.close(self._ready_r)
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)   # the parent owns Ctrl-C
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        random.seed()  # forked workers would otherwise share the parent's stream
+        limit = self.max_requests + random.randint(0, self.max_requests_jitter) if self.max_requests else 0
+        served = 0
+        os.write(self._ready_w, f"{os.getpid()}\n".encode())
+        os.close(self._ready_w)
+
+        while not self._stopping and not (limit and served >= limit):
+            try:
+                conn, _ = self._listener.accept()
+            except (socket.timeout, BlockingIOError, InterruptedError):
+                continue
+            with conn:
+                served = self._serve_connection(conn, served, limit)
+        return 0
+
+    def _serve_connection(self, conn: socket.socket, served: int, limit: int) -> int:
+        """
+        Answer request lines until the client closes, the worker is stopped or reaches its limit.
+
+        An accepted connection always gets its first request answered, and a
+        worker winding down still answers lines the client already sent:
+        closing over unread data would reset the connection under the client.
+        """
+        conn.settimeout(ACCEPT_POLL_S)
+        buffered = b""
+        answered = False
+        while True:
+            newline = buffered.find(b"\n")
+            if newline < 0:
+                winding_down = self._stopping or (limit and served >= limit)
+                if winding_down and answered:
+                    conn.setblocking(False)
+                try:
+                    chunk = conn.recv(65536)
+                except (socket.timeout, BlockingIOError):
+                    if winding_down:
+                        return served
+                    continue
+                except OSError:
+                    return served
+                if not chunk:
+                    return served
+                buffered += chunk
+                if len(buffered) > MAX_LINE_BYTES:
+                    conn.sendall(self._encode({"status": "FAILED", "error_code": "MALFORMED_REQUEST",
+                                               "error": f"Request line exceeds {MAX_LINE_BYTES} bytes"}))
+                    return served
+                continue
+            line, buffered = buffered[:newline], buffered[newline + 1:]
+            if not line.strip():
+                continue
+            served += 1
+            try:
+                conn.sendall(self._encode(self._respond(line, served)))
+            except OSError:
+                return served
+            answered = True
+
+    def _respond(self, line: bytes, served: int) -> dict:
+        try:
+            message = json.loads(line)
+        except ValueError as exc:
+            return {"status": "FAILED", "error_code": "MALFORMED_REQUEST", "error": str(exc)}
+        if isinstance(message, dict) and message.get("intent_type") == "PING":
+            return {"status": "OK", "pid": os.getpid(), "requests": served}
+        try:
+            return self.handler(message)
+        except Exception as exc:  # a failing intent must not take the worker down
+            return {"status": "FAILED", "error_code": "INTERNAL_ERROR", "error": f"{type(exc).__name__}: {exc}"}
+
+    @staticmethod
+    def _encode(response: dict) -> bytes:
+        return json.dumps(response, default=str).encode("utf-8") + b"\n"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Pre-fork EFL intent server")
+    parser.add_argument("--bind", default=DEFAULT_BIND, help="host:port or unix:/path")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-requests", type=int, default=0, help="recycle a worker after this many requests (0: never)")
+    parser.add_argument("--max-requests-jitter", type=int, default=0)
+    parser.add_argument("--graceful-timeout", type=float, default=10.0)
+    parser.add_argument("--ready-file", default=None)
+    args = parser.parse_args(argv)
+    server = PreforkServer(args.bind, workers=args.workers, max_requests=args.max_requests,
+                           max_requests_jitter=args.max_requests_jitter, ready_file=args.ready_file,
+                           graceful_timeout=args.graceful_timeout)
+    return server.serve_forever()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+"""
+Exercise Progression Law validator (EFL_EXERCISE_PROGRESSION_LAW_v1_0_1).
+
+ONE_AXIS_AT_A_TIME: between two consecutive exercises of a pattern, at
+most one of the five axes may increase. They are load_band,
+e_node_difficulty, stance_complexity, reactivity_level and
+direction_complexity. The progressed axis must stay within the
+population ceiling. There must be no active regression trigger or
+YELLOW/RED readiness. The athlete must have held the current level for
+the minimum legal consolidation (2 weeks).
+
+Every axis is compiled once into an ordinal lookup table (label -> level)
+and a population ceiling row. An exercise is then a vector of five small
+integers, with -1 meaning not applicable (e.g. reactivity for a
+non-plyometric lift). validate() checks one transition.
+check_history() checks every transition of a roster's history in one
+vectorized pass: entries are sorted into (client, pattern) chains by
+week, and consecutive rows are compared column-wise.
+
+Exercises can be given by their axis labels or by library exercise_id.
+For library exercises, load band and E-node come from the CSV. Stance,
+reactivity and direction are derived from the exercise name, since the
+library has no such fields (the spec's aether_field says "Derived from
+... exercise_name"). Labels given explicitly on an entry take precedence.
+
+Usage:
+    law = default_progression_law()
+    law.validate(current, proposed, "Youth_13_17", weeks_at_current=3)
+    report = law.check_history(entries)
+"""
+
+import csv
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .spec_registry import default_registry
+
+
+LAW_SPEC = "EFL_EXERCISE_PROGRESSION_LAW_v1_0_1"
+LIBRARY_CSV = Path(__file__).parent / "EFL_Exercise_Library_v2_5.csv"
+
+# Spec axis -> (field on exercises and history entries, key of the label in progression_sequence)
+AXES = {
+    "load_band": ("load_band", "band"),
+    "e_node_difficulty": ("e_node", "e_node"),
+    "stance_complexity": ("stance", "stance"),
+    "reactivity_level": ("reactivity", "reactivity"),
+    "direction_complexity": ("direction", "direction"),
+}
+
+# Population ceiling key per axis; axes without one are uncapped
+CEILING_KEYS = {"load_band": "max_band", "e_node_difficulty": "max_e_node", "direction_complexity": "max_direction"}
+
+POPULATIONS = ("Youth_8_12", "Youth_13_17", "Adult")
+
+# Transition codes, in validation-algorithm order of the rejections
+NO_PROGRESSION = 0
+APPROVED = 1
+MULTI_AXIS = 2
+POPULATION_CEILING = 3
+REGRESSION_TRIGGER = 4
+READINESS = 5
+PREMATURE = 6
+
+REASON_CODES = (
+    "NO_AXIS_PROGRESSED",
+    "PROGRESSION_APPROVED",
+    "PROGRESSION_REJECTED_MULTI_AXIS",
+    "PROGRESSION_REJECTED_POPULATION_CEILING",
+    "PROGRESSION_REJECTED_REGRESSION_TRIGGER",
+    "PROGRESSION_FORBIDDEN_READINESS",
+    "PROGRESSION_REJECTED_PREMATURE",
+)
+
+BLOCKED_READINESS = frozenset({"YELLOW", "RED"})
+
+# Name heuristics for library exercises (first match wins)
+_STANCE_RULES = (
+    ("Unilateral", re.compile(r"single[- ]leg|\b1 leg\b|\bSL\b|unilateral|pistol|skater|step[- ]?up", re.I)),
+    ("Split_Stance", re.compile(r"split|lunge|staggered|half[- ]kneeling|bulgarian", re.I)),
+)
+_DIRECTION_RULES = (
+    ("Multi_Directional_Combined",
+     re.compile(r"\bcut\b|\bCOD\b|zig ?zag|star drill|\d+ degree (bound|cut|hop|jump|turn)|multi-?directional|agility", re.I)),
+    ("Rotational_Transverse", re.compile(r"rotational|rotation|twist|chop|pivot|russian", re.I)),
+    ("Lateral_Frontal", re.compile(r"lateral|medial|crossover|shuffle|skater|side step|carioca", re.I)),
+)
+_REACTIVITY_RULES = (
+    ("Reactive_Minimal_Contact", re.compile(r"drop jump|depth|reactive|rebound|quick", re.I)),
+    ("Continuous_Rhythm", re.compile(r"continuous|pogo|repeat|rope|skip|bounds|hops\b", re.I)),
+    ("Stick_Landing", re.compile(r"stick|stabiliz|land", re.I)),
+)
+
+
+def _derive(rules, name: str, default: str) -> str:
+    return next((label for label, pattern in rules if pattern.search(name)), default)
+
+
+class ProgressionLaw:
+    """Compiled Progression Law: ordinal axis tables, population ceilings and transition checks"""
+
+    def __init__(self, registry=None, library_path: Optional[str] = None):
+        self.registry = registry or default_registry()
+        spec = self.registry.get(LAW_SPEC)
+        self.version = spec["meta"]["version"]
+
+        axes = spec["progression_axes"]
+        missing = [axis for axis in AXES if axis not in axes]
+        if missing:
+            raise ValueError(f"{LAW_SPEC} has no progression axes {missing}")
+        self.axes = tuple(AXES)
+        self.fields = tuple(AXES[axis][0] for axis in self.axes)
+
+        # Ordinal tables: label -> level; levels are the spec's own (load/e-node start at 0)
+        self.levels: List[Dict[str, int]] = []
+        for axis in self.axes:
+            key = AXES[axis][1]
+            self.levels.append({step[key]: int(step["level"]) for step in axes[axis]["progression_sequence"]})
+
+        # Ceiling matrix (population x axis); uncapped axes get the top level
+        self.ceilings = np.empty((len(POPULATIONS), len(self.axes)), dtype=np.int8)
+        for a, axis in enumerate(self.axes):
+            table = axes[axis].get("population_ceilings") or {}
+            for p, population in enumerate(POPULATIONS):
+                label = table.get(population, {}).get(CEILING_KEYS.get(axis, ""))
+                self.ceilings[p, a] = self.levels[a][label] if label else max(self.levels[a].values())
+        self.ceilings.flags.writeable = False
+
+        self.triggers = frozenset(t["trigger"] for axis in self.axes for t in axes[axis].get("regression_triggers", []))
+        algorithm = spec["progression_validation_algorithm"]["steps"]
+        self.min_weeks = next(int(step["minimum_weeks"]) for step in algorithm if "minimum_weeks" in step)
+        self.max_axes = next(int(step["threshold"]) for step in algorithm if "threshold" in step)
+        unknown = [code for code in REASON_CODES[1:] if code not in spec["reason_codes"]]
+        if unknown:
+            raise ValueError(f"{LAW_SPEC} does not define reason codes {unknown}")
+
+        self.library_path = str(library_path or LIBRARY_CSV)
+        self._library: Optional[Dict[str, Tuple[int, ...]]] = None
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def library_levels(self) -> Dict[str, Tuple[int, ...]]:
+        """exercise_id -> axis levels for every library exercise (compiled once)"""
+        if self._library is None:
+            library = {}
+            with open(self.library_path, newline="", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    library[row["exercise_id"]] = self.encode(self.derive(row))
+            self._library = library
+        return self._library
+
+    @staticmethod
+    def derive(row: Dict) -> Dict[str, Optional[str]]:
+        """Axis labels of a library row (name heuristics for stance, reactivity and direction)"""
+        name = row.get("exercise_name") or ""
+        plyometric = str(row.get("is_plyometric")).strip().lower() == "true"
+        return {
+            "load_band": row.get("load_band_primary") or None,
+            "e_node": row.get("e_node") or None,
+            "stance": _derive(_STANCE_RULES, name, "Bilateral"),
+            "reactivity": _derive(_REACTIVITY_RULES, name, "Stick_Landing") if plyometric else None,
+            "direction": _derive(_DIRECTION_RULES, name, "Linear_Sagittal"),
+        }
+
+    def encode(self, exercise: Dict) -> Tuple[int, ...]:
+        """Axis levels of an exercise given by labels; -1 where not applicable"""
+        if "exercise_id" in exercise and not all(field in exercise for field in self.fields):
+            base = self.library_levels().get(exercise["exercise_id"])
+            if base is None and not any(field in exercise for field in self.fields):
+                raise ValueError(f"Unknown exercise_id '{exercise['exercise_id']}' and no axis labels given")
+            base = base or (-1,) * len(self.fields)
+        else:
+            base = (-1,) * len(self.fields)
+        levels = []
+        for a, field in enumerate(self.fields):
+            label = exercise.get(field)
+            if field not in exercise:
+                levels.append(base[a])
+            elif label in (None, "", "N/A"):
+                levels.append(-1)
+            elif label in self.levels[a]:
+                levels.append(self.levels[a][label])
+            else:
+                raise ValueError(f"Unknown {field} '{label}' (expected one of {sorted(self.levels[a])})")
+        return tuple(levels)
+
+    @staticmethod
+    def population_code(population: str) -> int:
+        try:
+            return POPULATIONS.index(population)
+        except ValueError:
+            raise ValueError(f"Unknown population '{population}' (expected one of {list(POPULATIONS)})") from None
+
+    # ------------------------------------------------------------------
+    # Single transition
+    # ------------------------------------------------------------------
+
+    def validate(self, current: Dict, proposed: Dict, population: str,
+                 weeks_at_current: Optional[float] = None, triggers: Iterable[str] = (),
+                 readiness_flag: Optional[str] = None) -> Dict:
+        """
+        One progression step, checked in the spec's algorithm order.
+
+        weeks_at_current=None skips the consolidation check; triggers are the
+        regression triggers active on the current exercise.
+        """
+        before, after = self.encode(current), self.encode(proposed)
+        ceiling = self.ceilings[self.population_code(population)]
+        progressed = [a for a in range(len(self.axes)) if before[a] >= 0 and after[a] > before[a]]
+        if not progressed:
+            code = NO_PROGRESSION
+        elif len(progressed) > self.max_axes:
+            code = MULTI_AXIS
+        elif any(after[a] > ceiling[a] for a in progressed):
+            code = POPULATION_CEILING
+        elif any(t in self.triggers for t in triggers):
+            code = REGRESSION_TRIGGER
+        elif readiness_flag in BLOCKED_READINESS:
+            code = READINESS
+        elif weeks_at_current is not None and weeks_at_current < self.min_weeks:
+            code = PREMATURE
+        else:
+            code = APPROVED
+        return {
+            "legal": code in (NO_PROGRESSION, APPROVED),
+            "reason_code": REASON_CODES[code],
+            "axes_progressed": [self.axes[a] for a in progressed],
+        }
+
+    # ------------------------------------------------------------------
+    # Whole history
+    # ------------------------------------------------------------------
+
+    def encode_history(self, entries: Sequence[Dict]) -> Dict[str, np.ndarray]:
+        """
+        Columns for check_columns().
+
+        Each entry is one week's exercise for a (client_id, pattern) chain:
+        week, population, exercise_id and/or axis labels, and optionally
+        regression_triggers and readiness_flag.
+        """
+        n = len(entries)
+        chains: Dict[Tuple, int] = {}
+        chain = np.empty(n, dtype=np.int64)
+        week = np.empty(n, dtype=np.float64)
+        population = np.empty(n, dtype=np.int8)
+        levels = np.empty((n, len(self.axes)), dtype=np.int8)
+        triggered = np.zeros(n, dtype=bool)
+        blocked = np.zeros(n, dtype=bool)
+        library = self.library_levels()
+        population_codes = {p: i for i, p in enumerate(POPULATIONS)}
+        for i, entry in enumerate(entries):
+            chain[i] = chains.setdefault((entry.get("client_id"), entry.get("pattern")), len(chains))
+            week[i] = entry["week"]
+            code = population_codes.get(entry.get("population"))
+            population[i] = code if code is not None else self.population_code(entry.get("population"))
+            exercise_id = entry.get("exercise_id")
+            if exercise_id in library and not any(field in entry for field in self.fields):
+                levels[i] = library[exercise_id]
+            else:  # labels on the entry take precedence over the library row
+                levels[i] = self.encode(entry)
+            if entry.get("regression_triggers"):
+                triggered[i] = any(t in self.triggers for t in entry["regression_triggers"])
+            blocked[i] = entry.get("readiness_flag") in BLOCKED_READINESS
+        return {"chain": chain, "week": week, "population": population, "levels": levels,
+                "triggered": triggered, "blocked": blocked}
+
+    def check_columns(self, cols: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Every consecutive-week transition, vectorized.
+
+        Returns arrays over transitions: row (index of the proposed entry),
+        code (transition code) and progressed (axes-increased bitmask).
+        """
+        order = np.lexsort((cols["week"], cols["chain"]))
+        chain, week, levels = cols["chain"][order], cols["week"][order], cols["levels"][order]
+        n = len(order)
+        if n < 2:
+            empty = np.empty(0, dtype=np.int64)
+            return {"row": empty, "code": empty.astype(np.int8), "progressed": empty.astype(np.int16)}
+
+        same = chain[1:] == chain[:-1]
+        before, after = levels[:-1], levels[1:]
+        up = (before >= 0) & (after > before)
+        axes_up = up.sum(axis=1)
+
+        # First week of each run of an unchanged exercise level within a chain
+        changed = np.ones(n, dtype=bool)
+        changed[1:] = ~same | (levels[1:] != levels[:-1]).any(axis=1)
+        run_start = np.maximum.accumulate(np.where(changed, np.arange(n), 0))
+        weeks_at = week[1:] - week[run_start[:-1]]
+
+        ceiling = self.ceilings[cols["population"][order][1:]]
+        over = (up & (after > ceiling)).any(axis=1)
+
+        code = np.full(n - 1, APPROVED, dtype=np.int8)
+        # Reverse algorithm order so the earliest failing step wins
+        code[weeks_at < self.min_weeks] = PREMATURE
+        code[cols["blocked"][order][1:]] = READINESS
+        code[cols["triggered"][order][:-1]] = REGRESSION_TRIGGER
+        code[over] = POPULATION_CEILING
+        code[axes_up > self.max_axes] = MULTI_AXIS
+        code[axes_up == 0] = NO_PROGRESSION
+
+        bits = (up * (1 << np.arange(len(self.axes), dtype=np.int16))).sum(axis=1).astype(np.int16)
+        return {"row": order[1:][same], "code": code[same], "progressed": bits[same]}
+
+    def check_history(self, entries: Sequence[Dict]) -> Dict:
+        """Transition counts and every illegal transition of a history"""
+        result = self.check_columns(self.encode_history(entries))
+        codes = result["code"]
+        counts = np.bincount(codes, minlength=len(REASON_CODES))
+        violations = []
+        for i in np.flatnonzero(codes > APPROVED):
+            bits = int(result["progressed"][i])
+            entry = entries[int(result["row"][i])]
+            violations.append({
+                "client_id": entry.get("client_id"),
+                "pattern": entry.get("pattern"),
+                "week": entry["week"],
+                "reason_code": REASON_CODES[codes[i]],
+                "axes_progressed": [axis for a, axis in enumerate(self.axes) if bits >> a & 1],
+            })
+        return {
+            "transitions": int(len(codes)),
+            "counts": {REASON_CODES[c]: int(counts[c]) for c in range(len(REASON_CODES))},
+            "violations": violations,
+        }
+
+
+_DEFAULT: Optional[ProgressionLaw] = None
+
+
+def default_progression_law() -> ProgressionLaw:
+    """Process-wide Progression Law over the package's own spec and library"""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = ProgressionLaw()
+    return _DEFAULT
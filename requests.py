@@ -3,6 +3,8 @@ Request processing logic for EFL governance intents.
 Implements GATE → STRATA → SIGIL → THESIS → VERITAS flow.
 """
 
+import copy
+import threading
 import uuid
 import os
 from .authz import can_user_call_intent, INTENT_AUTHORIZATION_MATRIX
@@ -11,30 +13,112 @@ from .registry import UID_REGISTRY
 # GENERATOR SELECTION: Use fake for tests, adapter for production
 _USE_FAKE_GENERATOR = os.getenv("EFL_USE_FAKE_GENERATOR", "false").lower() == "true"
 
-if _USE_FAKE_GENERATOR:
-    from .generator_fake import fake_session_generator as _generator
-    def _call_generator(client_id, project_id, session_date):
-        return _generator(client_id, project_id, session_date)
-else:
-    from .generator_adapter import generate_session as _generator
-    def _call_generator(client_id, project_id, session_date):
-        return _generator(client_id, project_id, session_date, context={})
+# THESIS COALESCING: identical in-flight generations share one computation
+COALESCE_GENERATION = os.getenv("EFL_COALESCE_GENERATION", "true").lower() == "true"
 
+# Session generator, imported on first generation so that denials and
+# validation-only callers never load the generator stack
+_GENERATOR = None
+# project_id -> the project that generator runs, for coalescing keys
+_PROJECT_KEY = str
 
-def process_request_session_generation(requestor_uid: str, payload: dict) -> dict:
+
+def _session_generator():
+    global _GENERATOR, _PROJECT_KEY
+    if _GENERATOR is None:
+        if _USE_FAKE_GENERATOR:
+            from .generator_fake import fake_session_generator
+            _GENERATOR = lambda client_id, project_id, session_date: fake_session_generator(
+                client_id, project_id, session_date)
+            _PROJECT_KEY = str  # accepts exact spellings only ('Court', not 'court')
+        else:
+            from .generator_adapter import generate_session, normalize_project_id
+            _GENERATOR = lambda client_id, project_id, session_date: generate_session(
+                client_id, project_id, session_date, context={})
+            _PROJECT_KEY = normalize_project_id
+    return _GENERATOR
+
+
+class _Flight:
+    """One in-flight generation that identical concurrent calls wait on"""
+    __slots__ = ("done", "artifact", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.artifact = None
+        self.error = None
+        self.waiters = 0
+
+
+# (client_id, project_id, session_date) -> _Flight, only while generating
+_IN_FLIGHT = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+COALESCING_STATS = {"generations": 0, "coalesced": 0}
+
+
+def _waiter_error(error):
+    """A fresh exception for one waiter: the leader's type and args, or RuntimeError if it was interrupted"""
+    if isinstance(error, Exception):
+        try:
+            return copy.copy(error)
+        except Exception:
+            pass
+    return RuntimeError(f"Coalesced generation failed: {type(error).__name__}: {error}")
+
+
+def _call_generator(client_id, project_id, session_date):
     """
-    Simulate GATE → STRATA → SIGIL → THESIS → VERITAS flow for one intent.
+    Generate one session; concurrent identical calls share the computation.
     
-    Args:
-        requestor_uid: UID of user making request
-        payload: Request payload with client_id, project_id, session_date
+    The first caller for a key generates; callers arriving while it runs
+    wait and receive their own copy of its artifact, or a fresh exception
+    raised from the leader's. Project spellings share a key only when the
+    active generator runs them as the same project. Nothing is kept once the generation finishes, so a later
+    call always generates afresh.
+    """
+    generator = _session_generator()
+    if not COALESCE_GENERATION:
+        return generator(client_id, project_id, session_date)
     
-    Returns:
-        dict: Response with status, intent_id, and artifact (if approved)
+    key = (str(client_id), _PROJECT_KEY(project_id), str(session_date))
+    with _IN_FLIGHT_LOCK:
+        flight = _IN_FLIGHT.get(key)
+        if flight is None:
+            flight = _IN_FLIGHT[key] = _Flight()
+            COALESCING_STATS["generations"] += 1
+            leader = True
+        else:
+            flight.waiters += 1
+            COALESCING_STATS["coalesced"] += 1
+            leader = False
+    
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise _waiter_error(flight.error) from flight.error
+        return copy.deepcopy(flight.artifact)
+    
+    try:
+        flight.artifact = generator(client_id, project_id, session_date)
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _IN_FLIGHT_LOCK:
+            del _IN_FLIGHT[key]
+        flight.done.set()
+    # No caller can join once the key is removed, so waiters is final here
+    return copy.deepcopy(flight.artifact) if flight.waiters else flight.artifact
+
+
+def _authorize(requestor_uid: str, intent_type: str, payload: dict,
+               required_fields: list, intent_id: str):
     """
-    intent_type = "REQUEST_SESSION_GENERATION"
-    intent_id = str(uuid.uuid4())
+    GATE → STRATA → SIGIL for one intent.
     
+    Returns:
+        (user, None) if the request may proceed, else (None, denial response)
+    """
     # Find user in registry
     user = None
     for u in UID_REGISTRY["users"]:
@@ -43,7 +127,7 @@ def process_request_session_generation(requestor_uid: str, payload: dict) -> dic
             break
     
     if not user:
-        return {
+        return None, {
             "status": "DENIED",
             "error_code": "USER_NOT_FOUND",
             "intent_id": intent_id
@@ -53,7 +137,7 @@ def process_request_session_generation(requestor_uid: str, payload: dict) -> dic
     
     # GATE: Role-based authorization
     if not can_user_call_intent(user_role, intent_type):
-        return {
+        return None, {
             "status": "DENIED",
             "error_code": "INTENT_ROLE_DENIED",
             "intent_id": intent_id,
@@ -62,25 +146,44 @@ def process_request_session_generation(requestor_uid: str, payload: dict) -> dic
         }
     
     # STRATA: Input validation
-    required_fields = ["client_id", "project_id", "session_date"]
     if any(field not in payload for field in required_fields):
-        return {
+        return None, {
             "status": "DENIED",
             "error_code": "INTENT_INPUT_INVALID",
             "intent_id": intent_id,
             "missing_fields": [f for f in required_fields if f not in payload]
         }
     
-    client_id = payload["client_id"]
-    
     # SIGIL: Eligibility check (athlete access control)
-    if client_id not in user.get("assigned_athletes", []) and user_role == "Coach":
-        return {
+    if payload["client_id"] not in user.get("assigned_athletes", []) and user_role == "Coach":
+        return None, {
             "status": "DENIED",
             "error_code": "CLIENT_ACCESS_DENIED",
             "intent_id": intent_id
         }
     
+    return user, None
+
+
+def process_request_session_generation(requestor_uid: str, payload: dict) -> dict:
+    """
+    Simulate GATE → STRATA → SIGIL → THESIS → VERITAS flow for one intent.
+    
+    Args:
+        requestor_uid: UID of user making request
+        payload: Request payload with client_id, project_id, session_date
+    
+    Returns:
+        dict: Response with status, intent_id, and artifact (if approved)
+    """
+    intent_type = "REQUEST_SESSION_GENERATION"
+    intent_id = str(uuid.uuid4())
+    
+    user, denial = _authorize(requestor_uid, intent_type, payload,
+                              ["client_id", "project_id", "session_date"], intent_id)
+    if denial:
+        return denial
+    
     # THESIS: Generate artifact
     try:
         artifact = _call_generator(
@@ -109,3 +212,132 @@ def process_request_session_generation(requestor_uid: str, payload: dict) -> dic
         "intent_id": intent_id,
         "artifact": artifact
     }
+
+
+# Warm mesocycle engine, loaded on first mesocycle request
+_MESOCYCLE_ENGINE = None
+
+
+def _mesocycle_engine():
+    global _MESOCYCLE_ENGINE
+    if _MESOCYCLE_ENGINE is None:
+        from .mesocycle_engine import MesocycleEngine
+        _MESOCYCLE_ENGINE = MesocycleEngine()
+    return _MESOCYCLE_ENGINE
+
+
+def process_request_mesocycle_generation(requestor_uid: str, payload: dict,
+                                         on_session=None, executor=None) -> dict:
+    """
+    GATE → STRATA → SIGIL → THESIS → VERITAS for REQUEST_MESOCYCLE_GENERATION.
+    
+    Args:
+        requestor_uid: UID of user making request
+        payload: client_id, project_id, block_id (manifest block), meso_start_date,
+                 optional meso_duration_weeks (default: the whole block),
+                 sport, readiness_flag, injury_flags
+        on_session: Called with each SESSION artifact as it is generated
+        executor: Optional executor to generate weeks concurrently
+    
+    Returns:
+        dict: Response with status, intent_id, and MESOCYCLE artifact (if approved)
+    """
+    intent_type = "REQUEST_MESOCYCLE_GENERATION"
+    intent_id = str(uuid.uuid4())
+    
+    user, denial = _authorize(requestor_uid, intent_type, payload,
+                              ["client_id", "project_id", "block_id", "meso_start_date"], intent_id)
+    if denial:
+        return denial
+    
+    # STRATA: Block and duration
+    try:
+        engine = _mesocycle_engine()
+        block = engine.block(payload["block_id"])
+    except ValueError as e:
+        return {
+            "status": "DENIED",
+            "error_code": "INTENT_INPUT_INVALID",
+            "intent_id": intent_id,
+            "error": str(e)
+        }
+    weeks = payload.get("meso_duration_weeks", block["duration_weeks"])
+    if type(weeks) is not int or not 1 <= weeks <= block["duration_weeks"]:
+        return {
+            "status": "DENIED",
+            "error_code": "MESO_DURATION_INVALID",
+            "intent_id": intent_id,
+            "block_duration_weeks": block["duration_weeks"]
+        }
+    
+    # THESIS: Generate artifact
+    try:
+        artifact = engine.generate(
+            payload["client_id"],
+            payload["block_id"],
+            payload["meso_start_date"],
+            project_id=payload["project_id"],
+            on_session=on_session,
+            sport=payload.get("sport"),
+            readiness_flag=payload.get("readiness_flag", "GREEN"),
+            injury_flags=tuple(payload.get("injury_flags", ())),
+            weeks=weeks,
+            executor=executor
+        )
+    except ValueError as e:
+        return {
+            "status": "FAILED",
+            "error_code": "INTENT_INPUT_INVALID",
+            "intent_id": intent_id,
+            "error": str(e)
+        }
+    except Exception as e:
+        return {
+            "status": "FAILED",
+            "error_code": "GENERATOR_FAILURE",
+            "intent_id": intent_id,
+            "error": str(e)
+        }
+    
+    # VERITAS: Return success with artifact
+    return {
+        "status": "APPROVED",
+        "intent_id": intent_id,
+        "artifact": artifact
+    }
+
+
+# Intents this service executes, by intent_type
+INTENT_HANDLERS = {
+    "REQUEST_SESSION_GENERATION": process_request_session_generation,
+    "REQUEST_MESOCYCLE_GENERATION": process_request_mesocycle_generation,
+}
+
+
+def process_intent(message: dict) -> dict:
+    """
+    Route one intent message to its handler.
+    
+    Args:
+        message: {"intent_type", "requestor_uid", "payload"} as sent by a client
+    
+    Returns:
+        dict: The handler's response, or a DENIED response for unknown intents
+    """
+    if not isinstance(message, dict):
+        return {
+            "status": "DENIED",
+            "error_code": "INTENT_INPUT_INVALID",
+            "intent_id": str(uuid.uuid4()),
+            "error": "Intent message must be a JSON object"
+        }
+    handler = INTENT_HANDLERS.get(message.get("intent_type"))
+    if handler is None:
+        return {
+            "status": "DENIED",
+            "error_code": "INTENT_UNSUPPORTED",
+            "intent_id": str(uuid.uuid4()),
+            "supported_intents": list(INTENT_HANDLERS)
+        }
+    payload = message.get("payload")
+    return handler(message.get("requestor_uid"), payload if isinstance(payload, dict) else {})
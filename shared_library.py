@@ -0,0 +1,277 @@
+"""
+Exercise library compiled to one columnar buffer that processes share.
+
+The library CSV is compiled once into a flat buffer: categorical text
+columns as int16 codes (categories in the header), free text (ids, names)
+as a UTF-8 blob plus int64 offsets, and the numeric levels generators
+filter on (band, E-node, plyometric/sprint flags, contacts) as typed
+arrays. The buffer is published to POSIX shared memory (publish) or a
+file (save); workers map it read-only (attach / open_mapped) and read
+through NumPy views over the mapping, so N workers hold one copy of the
+library instead of N.
+
+Layout: MAGIC | uint64 header length | JSON header | 64-byte aligned
+column arrays. The header records every array's dtype, offset and length,
+plus the row count and the CSV's SHA-256.
+
+Usage:
+    shared = publish()                      # parent, before starting workers
+    library = attach(shared.name)           # worker
+    library = published_library()          # worker of a parent that set EFL_SHARED_LIBRARY
+    plyo = library.array("is_plyometric") & (library.array("band") <= 2)
+    names = [library.value("exercise_name", i) for i in np.flatnonzero(plyo)]
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import secrets
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+LIBRARY_CSV = Path(__file__).parent / "EFL_Exercise_Library_v2_5.csv"
+
+# Segment name a supervising parent (prefork_server) publishes for its workers
+SHARED_LIBRARY_ENV = "EFL_SHARED_LIBRARY"
+
+MAGIC = b"EFLCOL01"
+ALIGN = 64
+# Text columns with at most this many distinct values are stored as codes;
+# categories live in the header, which each process parses privately
+MAX_CATEGORIES = 256
+
+_BAND = re.compile(r"Band_(\d+)")
+_E_NODE = re.compile(r"E(\d+)")
+
+
+def _levels(values: List[str], pattern: re.Pattern) -> np.ndarray:
+    """'Band_2' / 'E3' style labels as int8 levels, -1 where absent"""
+    levels = np.full(len(values), -1, dtype=np.int8)
+    for i, value in enumerate(values):
+        match = pattern.search(value)
+        if match:
+            levels[i] = int(match.group(1))
+    return levels
+
+
+def compile_library(csv_path: Optional[str] = None) -> bytes:
+    """The columnar buffer for a library CSV"""
+    import csv
+    import io
+
+    raw = Path(csv_path or LIBRARY_CSV).read_bytes()
+    reader = csv.reader(io.StringIO(raw.decode("utf-8"), newline=""))
+    names = next(reader)
+    records = list(reader)
+    columns = {name: [record[i] if i < len(record) else "" for record in records] for i, name in enumerate(names)}
+
+    arrays: Dict[str, np.ndarray] = {}
+    header = {"rows": len(records), "sha256": hashlib.sha256(raw).hexdigest(), "fields": names,
+              "text": {}, "categorical": {}, "arrays": {}}
+    for name, values in columns.items():
+        categories = sorted(set(values))
+        if len(categories) <= MAX_CATEGORIES:
+            code = {value: i for i, value in enumerate(categories)}
+            arrays[f"{name}.codes"] = np.fromiter((code[v] for v in values), dtype=np.int16, count=len(values))
+            header["categorical"][name] = categories
+        else:
+            encoded = [v.encode("utf-8") for v in values]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(b) for b in encoded], out=offsets[1:])
+            arrays[f"{name}.offsets"] = offsets
+            arrays[f"{name}.blob"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+            header["text"][name] = True
+
+    arrays["band"] = _levels(columns["load_band_primary"], _BAND)
+    arrays["e_level"] = _levels(columns["e_node"], _E_NODE)
+    arrays["is_plyometric"] = np.array([v.strip().lower() == "true" for v in columns["is_plyometric"]], dtype=bool)
+    arrays["is_sprint"] = np.array([v.strip().lower() == "true" for v in columns["is_sprint"]], dtype=bool)
+    arrays["plyo_contacts"] = np.array([float(v) if v.strip() else np.nan for v in columns["plyo_contacts"]],
+                                       dtype=np.float64)
+
+    # Offsets are relative to the data section, which starts aligned after the header
+    offset = 0
+    for name, array in arrays.items():
+        header["arrays"][name] = {"dtype": array.dtype.str, "offset": offset, "count": int(array.size)}
+        offset += -(-array.nbytes // ALIGN) * ALIGN
+    encoded_header = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    data_start = -(-(len(MAGIC) + 8 + len(encoded_header)) // ALIGN) * ALIGN
+
+    buffer = bytearray(data_start + offset)
+    buffer[:len(MAGIC)] = MAGIC
+    struct.pack_into("<Q", buffer, len(MAGIC), len(encoded_header))
+    buffer[len(MAGIC) + 8:len(MAGIC) + 8 + len(encoded_header)] = encoded_header
+    for name, array in arrays.items():
+        start = data_start + header["arrays"][name]["offset"]
+        buffer[start:start + array.nbytes] = array.tobytes()
+    return bytes(buffer)
+
+
+class ColumnarLibrary:
+    """Read-only views over a compiled library buffer (bytes, mmap or shared memory)"""
+
+    def __init__(self, buffer, owner=None):
+        self._buffer = buffer
+        self._owner = owner
+        view = memoryview(buffer)
+        if bytes(view[:len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a compiled exercise library buffer")
+        (header_len,) = struct.unpack_from("<Q", view, len(MAGIC))
+        self.header = json.loads(bytes(view[len(MAGIC) + 8:len(MAGIC) + 8 + header_len]))
+        data_start = -(-(len(MAGIC) + 8 + header_len) // ALIGN) * ALIGN
+        self.n_rows: int = self.header["rows"]
+        self.sha256: str = self.header["sha256"]
+        self.fields: List[str] = self.header["fields"]
+        self._categories: Dict[str, Tuple[str, ...]] = {
+            name: tuple(values) for name, values in self.header["categorical"].items()}
+        self._arrays: Dict[str, np.ndarray] = {}
+        for name, spec in self.header["arrays"].items():
+            array = np.frombuffer(buffer, dtype=np.dtype(spec["dtype"]), count=spec["count"],
+                                  offset=data_start + spec["offset"])
+            array.flags.writeable = False
+            self._arrays[name] = array
+
+    @classmethod
+    def from_csv(cls, csv_path: Optional[str] = None) -> "ColumnarLibrary":
+        """Private in-process copy (what every worker builds without sharing)"""
+        return cls(compile_library(csv_path))
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def array(self, name: str) -> np.ndarray:
+        """Numeric column (band, e_level, is_plyometric, is_sprint, plyo_contacts) or '<field>.codes'"""
+        array = self._arrays.get(name)
+        if array is None:
+            raise ValueError(f"No array column '{name}' (have {sorted(self._arrays)})")
+        return array
+
+    def codes(self, field: str) -> Tuple[np.ndarray, Tuple[str, ...]]:
+        """(int16 codes, categories) of a categorical field"""
+        if field not in self._categories:
+            raise ValueError(f"'{field}' is not categorical (categorical: {sorted(self._categories)})")
+        return self._arrays[f"{field}.codes"], self._categories[field]
+
+    def mask(self, field: str, *values: str) -> np.ndarray:
+        """Rows whose categorical field is one of values"""
+        codes, categories = self.codes(field)
+        wanted = [categories.index(v) for v in values if v in categories]
+        return np.isin(codes, wanted)
+
+    def value(self, field: str, i: int) -> str:
+        """One cell as the CSV text"""
+        categories = self._categories.get(field)
+        if categories is not None:
+            return categories[self._arrays[f"{field}.codes"][i]]
+        if field not in self.header["text"]:
+            raise ValueError(f"Unknown field '{field}'")
+        offsets = self._arrays[f"{field}.offsets"]
+        return self._arrays[f"{field}.blob"][offsets[i]:offsets[i + 1]].tobytes().decode("utf-8")
+
+    def row(self, i: int) -> Dict[str, str]:
+        """One row as csv.DictReader would return it"""
+        return {field: self.value(field, i) for field in self.fields}
+
+    def rows(self, indices=None) -> Iterator[Dict[str, str]]:
+        for i in (range(self.n_rows) if indices is None else indices):
+            yield self.row(int(i))
+
+    def close(self) -> None:
+        """Drop the views and unmap (the arrays must not be used afterwards)"""
+        self._arrays.clear()
+        self._buffer = None
+        if self._owner is not None:
+            try:
+                self._owner.close()
+            except BufferError:  # arrays still referenced elsewhere; unmapped when they go
+                pass
+            self._owner = None
+
+
+class SharedLibrary:
+    """A compiled library published to POSIX shared memory by the owning process"""
+
+    def __init__(self, name: str, size: int, sha256: str, shm):
+        self.name = name
+        self.size = size
+        self.sha256 = sha256
+        self._shm = shm
+
+    def close(self, unlink: bool = True) -> None:
+        """Release the owner's mapping; unlink removes the segment (attached workers keep theirs)"""
+        if self._shm is not None:
+            self._shm.close()
+            if unlink:
+                self._shm.unlink()
+            self._shm = None
+
+
+def publish(csv_path: Optional[str] = None, name: Optional[str] = None) -> SharedLibrary:
+    """Compile the library into a new shared memory segment; workers attach(shared.name)"""
+    from multiprocessing import shared_memory
+
+    buffer = compile_library(csv_path)
+    shm = shared_memory.SharedMemory(name=name or f"efl_library_{secrets.token_hex(4)}", create=True,
+                                     size=len(buffer))
+    shm.buf[:len(buffer)] = buffer
+    sha256 = ColumnarLibrary(buffer).sha256
+    return SharedLibrary(shm.name, len(buffer), sha256, shm)
+
+
+def attach(name: str) -> ColumnarLibrary:
+    """
+    Map a published library read-only.
+
+    Opens the segment directly rather than through SharedMemory, which in
+    a worker would register it with the resource tracker and unlink it
+    when the worker exits.
+    """
+    try:
+        import _posixshmem
+    except ImportError:  # Windows: SharedMemory has no tracker to work around
+        from multiprocessing import shared_memory
+        shm = shared_memory.SharedMemory(name=name)
+        return ColumnarLibrary(shm.buf, owner=shm)
+
+    fd = _posixshmem.shm_open("/" + name.lstrip("/"), os.O_RDONLY, mode=0o600)
+    try:
+        mapping = mmap.mmap(fd, os.fstat(fd).st_size, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    return ColumnarLibrary(mapping, owner=mapping)
+
+
+def save(path: str, csv_path: Optional[str] = None) -> str:
+    """Write the compiled library to path (atomically) for open_mapped()"""
+    target = Path(path)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(compile_library(csv_path))
+    os.replace(tmp, target)
+    return str(target)
+
+
+def open_mapped(path: str) -> ColumnarLibrary:
+    """Map a saved library file read-only; the page cache holds the only copy"""
+    with open(path, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return ColumnarLibrary(mapping, owner=mapping)
+
+
+_PUBLISHED: Optional[Tuple[str, ColumnarLibrary]] = None
+
+
+def published_library() -> Optional[ColumnarLibrary]:
+    """The library named by EFL_SHARED_LIBRARY, attached once per process; None if nothing is published"""
+    global _PUBLISHED
+    name = os.environ.get(SHARED_LIBRARY_ENV)
+    if not name:
+        return None
+    if _PUBLISHED is None or _PUBLISHED[0] != name:
+        _PUBLISHED = (name, attach(name))
+    return _PUBLISHED[1]
@@ -0,0 +1,364 @@
+"""
+Governance spec registry: every *.json spec in the package, parsed once.
+
+Discovery content-hashes (SHA-256) each spec file. Parsing is lazy
+and per spec: the first access to a spec loads its compiled form from the
+pickle cache (one file per content hash) or, on a miss, parses and validates
+the JSON and writes the cache entry. A changed file gets a new hash and is
+recompiled; unchanged specs never hit the JSON parser again.
+
+Parsing tolerates concatenated JSON documents (EFL_MESOMACRO_BLOCK_MANIFEST
+ships one manifest document per block family back to back), which the
+standard json.load() rejects with "Extra data".
+
+Usage:
+    specs = default_registry()
+    selector = specs.get("EFL_BLOCK_SELECTOR_v1_3_2")
+    manifests = specs.documents("EFL_MESOMACRO_BLOCK_MANIFEST_v1.0")
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+SPEC_DIR = Path(__file__).parent
+
+# Bump when CompiledSpec or the parse/validate rules change
+_CACHE_FORMAT = 1
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_HEADER_KEYS = {"meta", "metadata", "$id", "schema_id"}
+_INDEX_NAME = f"index.v{_CACHE_FORMAT}.pickle"
+
+
+@dataclass(frozen=True, slots=True)
+class SpecFile:
+    """A discovered spec file and its content hash"""
+    name: str
+    path: str
+    sha256: str
+    size: int
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledSpec:
+    """Parsed and validated spec; errors make it unusable, warnings do not"""
+    name: str
+    sha256: str
+    spec_id: Optional[str]
+    version: Optional[str]
+    documents: Tuple[Any, ...]
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...]
+
+    @property
+    def value(self) -> Any:
+        """The document for single-document specs, the list of documents otherwise"""
+        return self.documents[0] if len(self.documents) == 1 else list(self.documents)
+
+
+# ============================================================================
+# PARSING AND VALIDATION
+# ============================================================================
+
+def _line_col(text: str, pos: int) -> str:
+    line = text.count("\n", 0, pos) + 1
+    return f"line {line} column {pos - text.rfind(chr(10), 0, pos)}"
+
+
+def parse_json_documents(text: str, duplicates: Optional[List[str]] = None) -> List[Any]:
+    """
+    Parse one or more concatenated JSON documents.
+
+    Raises ValueError (with line/column) on malformed input. If duplicates is
+    given, keys repeated within one object are appended to it; json keeps the
+    last value, which silently drops the first.
+    """
+    decoder = _DECODER
+    if duplicates is not None:
+        def object_pairs(pairs):
+            obj = dict(pairs)
+            if len(obj) != len(pairs):
+                seen = set()
+                duplicates.extend(k for k, _ in pairs if k in seen or seen.add(k))
+            return obj
+        decoder = json.JSONDecoder(object_pairs_hook=object_pairs)
+
+    documents = []
+    pos, end = 0, len(text)
+    if text.startswith("\ufeff"):
+        pos = 1
+    while True:
+        while pos < end and text[pos] in _WHITESPACE:
+            pos += 1
+        if pos == end:
+            return documents
+        try:
+            document, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{e.msg}: {_line_col(text, e.pos)}") from None
+        documents.append(document)
+
+
+def _identity(document: Dict) -> Tuple[Optional[str], Optional[str]]:
+    """(spec_id, version) from whichever header convention the spec uses"""
+    meta = document.get("meta") or document.get("metadata") or {}
+    spec_id = (document.get("schema_id") or document.get("$id") or meta.get("specid") or meta.get("document_id")
+               or meta.get("name") or meta.get("schema_version"))
+    version = meta.get("version") or document.get("manifest_version") or document.get("schema_version")
+    return spec_id, version
+
+
+def compile_spec(spec_file: SpecFile, data: bytes) -> CompiledSpec:
+    """Parse and validate one spec file's bytes"""
+    errors, warnings = [], []
+    documents: List[Any] = []
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        text = ""
+        errors.append(f"not UTF-8: {e}")
+
+    if not errors:
+        duplicates: List[str] = []
+        try:
+            documents = parse_json_documents(text, duplicates)
+        except ValueError as e:
+            errors.append(f"invalid JSON: {e}")
+        if duplicates:
+            warnings.append(f"duplicate keys (last value kept): {sorted(set(duplicates))}")
+        if not documents and not errors:
+            errors.append("empty file")
+
+    spec_id = version = None
+    for i, document in enumerate(documents):
+        if not isinstance(document, dict):
+            errors.append(f"document {i}: expected a JSON object, got {type(document).__name__}")
+            continue
+        doc_id, doc_version = _identity(document)
+        if not _HEADER_KEYS & document.keys():
+            warnings.append(f"document {i}: no meta/metadata/$id/schema_id header")
+        if i == 0:
+            spec_id, version = doc_id, doc_version
+        elif doc_id != spec_id:
+            errors.append(f"document {i}: spec id {doc_id!r} differs from document 0 ({spec_id!r})")
+    if len(documents) > 1:
+        warnings.append(f"{len(documents)} concatenated JSON documents")
+
+    return CompiledSpec(
+        name=spec_file.name,
+        sha256=spec_file.sha256,
+        spec_id=spec_id,
+        version=version,
+        documents=tuple(documents),
+        errors=tuple(errors),
+        warnings=tuple(warnings)
+    )
+
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+class SpecRegistry:
+    """
+    Content-hashed registry of the package's JSON specs with a compiled cache.
+
+    Specs are keyed by file stem (e.g. "EFL_PROJECT_REGISTRY_v1.0"). Compiled
+    specs are shared and must be treated as read-only.
+    """
+
+    def __init__(self, spec_dir: Optional[str] = None, cache_dir: Optional[str] = None,
+                 use_cache: bool = True):
+        self.spec_dir = Path(spec_dir or SPEC_DIR)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.spec_dir / "__pycache__" / "specs"
+        self.use_cache = use_cache
+        self.files: Dict[str, SpecFile] = {}
+        self._compiled: Dict[str, CompiledSpec] = {}
+        self._lock = threading.Lock()
+        self.discover()
+
+    def discover(self) -> Dict[str, SpecFile]:
+        """
+        (Re)scan spec_dir; specs whose hash changed are recompiled on next access.
+
+        Like .pyc validation, a file whose (mtime_ns, size) matches the hash
+        index in cache_dir is not re-read; anything else is read and hashed.
+        """
+        index = self._load_index()
+        fresh_index = {}
+        files = {}
+        for path in sorted(self.spec_dir.glob("*.json")):
+            stat = path.stat()
+            key = (str(path), stat.st_mtime_ns, stat.st_size)
+            sha256 = index.get(key)
+            if sha256 is None:
+                sha256 = hashlib.sha256(path.read_bytes()).hexdigest()
+            fresh_index[key] = sha256
+            files[path.stem] = SpecFile(name=path.stem, path=str(path), sha256=sha256, size=stat.st_size)
+        if fresh_index != index:
+            self._write_atomic(self.cache_dir / _INDEX_NAME, fresh_index)
+
+        with self._lock:
+            self.files = files
+            self._compiled = {name: spec for name, spec in self._compiled.items()
+                              if name in files and files[name].sha256 == spec.sha256}
+        return files
+
+    def names(self) -> List[str]:
+        return list(self.files)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.files
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def compiled(self, name: str) -> CompiledSpec:
+        """Compiled spec (memory, then pickle cache, then parse); KeyError for unknown names"""
+        spec = self._compiled.get(name)
+        if spec is not None:
+            return spec
+
+        spec_file = self.files[name]
+        with self._lock:
+            spec = self._compiled.get(name)
+            if spec is None:
+                spec = self._load_cached(spec_file)
+                if spec is None:
+                    spec = compile_spec(spec_file, Path(spec_file.path).read_bytes())
+                    self._store_cached(spec)
+                self._compiled[name] = spec
+        return spec
+
+    def get(self, name: str) -> Any:
+        """Spec value (see CompiledSpec.value); ValueError if the spec failed validation"""
+        spec = self.compiled(name)
+        if spec.errors:
+            raise ValueError(f"Spec {name} is invalid: {'; '.join(spec.errors)}")
+        return spec.value
+
+    def documents(self, name: str) -> List[Any]:
+        """Every JSON document in the spec, as a list"""
+        self.get(name)
+        return list(self._compiled[name].documents)
+
+    def latest(self, prefix: str) -> str:
+        """Name of the highest-versioned valid spec whose name starts with prefix"""
+        candidates = [name for name in self.files if name.startswith(prefix) and not self.compiled(name).errors]
+        if not candidates:
+            raise KeyError(prefix)
+        return max(candidates, key=lambda name: _version_key(self._compiled[name].version or ""))
+
+    def compile_all(self) -> Dict[str, CompiledSpec]:
+        """Compile (or load) every discovered spec, e.g. to warm a server before forking"""
+        return {name: self.compiled(name) for name in self.files}
+
+    def problems(self) -> Dict[str, Tuple[str, ...]]:
+        """name -> errors and warnings, for specs that have any"""
+        return {
+            name: spec.errors + spec.warnings
+            for name, spec in self.compile_all().items() if spec.errors or spec.warnings
+        }
+
+    def prune_cache(self) -> int:
+        """Delete cache entries that no current spec hashes to; returns the count removed"""
+        live = {self._cache_path(f).name for f in self.files.values()} | {_INDEX_NAME}
+        removed = 0
+        for path in self.cache_dir.glob("*.pickle"):
+            if path.name not in live:
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    # ------------------------------------------------------------------
+    # Pickle cache
+    # ------------------------------------------------------------------
+
+    def _cache_path(self, spec_file: SpecFile) -> Path:
+        return self.cache_dir / f"{spec_file.sha256}.v{_CACHE_FORMAT}.pickle"
+
+    def _load_cached(self, spec_file: SpecFile) -> Optional[CompiledSpec]:
+        if not self.use_cache:
+            return None
+        try:
+            with open(self._cache_path(spec_file), "rb") as f:
+                spec = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+            return None
+        if not isinstance(spec, CompiledSpec) or spec.sha256 != spec_file.sha256:
+            return None
+        if spec.name != spec_file.name:
+            # Same content under another file name
+            spec = CompiledSpec(spec_file.name, spec.sha256, spec.spec_id, spec.version,
+                                spec.documents, spec.errors, spec.warnings)
+        return spec
+
+    def _store_cached(self, spec: CompiledSpec):
+        self._write_atomic(self._cache_path(self.files[spec.name]), spec)
+
+    def _load_index(self) -> Dict[tuple, str]:
+        """(path, mtime_ns, size) -> sha256 from the last discovery"""
+        if not self.use_cache:
+            return {}
+        try:
+            with open(self.cache_dir / _INDEX_NAME, "rb") as f:
+                index = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _write_atomic(self, path: Path, obj: Any):
+        """Pickle obj via temp file + rename; a read-only cache dir just disables caching"""
+        if not self.use_cache:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass
+
+
+def _version_key(version: str) -> Tuple:
+    parts = []
+    for part in version.replace("-", ".").split("."):
+        parts.append((0, int(part), "") if part.isdigit() else (1, 0, part))
+    return tuple(parts)
+
+
+_DEFAULT: Optional[SpecRegistry] = None
+
+
+def default_registry() -> SpecRegistry:
+    """Process-wide registry over the package's own specs"""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = SpecRegistry()
+    return _DEFAULT
+
+
+if __name__ == "__main__":
+    registry = default_registry()
+    for name, spec in registry.compile_all().items():
+        status = "INVALID" if spec.errors else "ok"
+        print(f"{status:8} {name:60} {spec.version or '-':>8}  docs={len(spec.documents)}  {spec.sha256[:12]}")
+        for problem in spec.errors + spec.warnings:
+            print(f"         - {problem}")
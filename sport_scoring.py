@@ -0,0 +1,322 @@
+"""
+Sport-emphasis exercise scoring over a precomputed feature matrix.
+
+Every library row is described once by a fixed feature vector: movement
+family (the sport grid's eight keyMovementPatterns plus plyo direction),
+F-V zone, E-node, Aether node, injury-region prehab and sport priority
+keywords. Each sport in sport_demands_grid_v2.2.2 becomes a weight vector
+over the same features, built from the grid (pattern ratings, node and zone
+profiles, injury regions, priority modifiers) and, where a sport has one,
+its SPORT_PROFILES emphasis and exercise priorities.
+
+Ranking a sport is then one matrix-vector product (cached per sport) and a
+top-k over the rows a legality mask leaves. The masks reproduce
+CourtSportExerciseMapper.find_exercises (pattern rules, band ceiling,
+E-node, youth contraindications) as precomputed boolean arrays, so a ranked
+slot returns the same records the mapper would, ordered by sport fit.
+Engines are cached per library version in the process cache manager.
+
+Usage:
+    engine = engine_for(df)
+    records = engine.rank("Soccer", "unilateral_knee", k=5, band_max=2)
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .cache_manager import get_cache_manager
+from .court_sport_exercise_map import CourtSportExerciseMapper
+from .sport_profiles import SPORT_PROFILES
+from .spec_registry import default_registry
+
+
+SPORT_GRID_SPEC = "sport_demands_grid_v2.2.2_PATCHED"
+
+RATING = {"Low": 0.25, "Moderate": 0.5, "High": 0.75, "Very High": 1.0}
+NODE_TIER = {"primary": 1.0, "secondary": 0.5}
+ZONE_TIER = {"primaryZones": 1.0, "secondaryZones": 0.5, "recoveryZones": 0.25}
+REGION_WEIGHT = 0.5
+PRIORITY_WEIGHT = 0.5
+KEYWORD_WEIGHT = 1.0
+
+# Movement families (grid keyMovementPatterns + plyo direction): name/pattern regex
+FAMILIES = {
+    "hinge": r"hinge|deadlift|\brdl\b|good morning|swing|nordic",
+    "squat": r"squat",
+    "lunge": r"lunge|split|step up|step-up|bulgarian",
+    "push": r"push|press|bench",
+    "pull": r"pull|row|chin|\blat\b",
+    "rotation": r"rotat|chop|pallof|twist|throw",
+    "gait": r"\brun|sprint|skip|march|\bbound|gait",
+    "decel": r"decel|stick|land|stabiliz|snap down",
+}
+PLYO_DIRECTIONS = {
+    "plyo_vertical": r"jump|vertical|\bbox\b|hop",
+    "plyo_lateral": r"lateral|side|skater",
+}
+
+# Injury regions (grid commonRegions): prehab exercise regex
+REGIONS = {
+    "ankle": r"calf|ankle|heel raise|toe raise",
+    "knee": r"split|step up|terminal knee|spanish squat|single leg squat",
+    "hip": r"hip|glute|clam|monster walk",
+    "lumbar": r"bird dog|dead bug|back extension|mcgill|plank",
+    "groin": r"adductor|copenhagen|groin",
+    "hamstring": r"nordic|hamstring|\brdl\b|leg curl",
+    "shoulder": r"face pull|scap|external rotation|y-raise|pull apart|prone t",
+    "elbow": r"wrist|forearm|pronat|supinat",
+    "cervical": r"neck|cervical|shrug",
+    "hip-flexor": r"hip flexor|psoas|knee drive|march",
+    "achilles": r"calf|achilles|pogo|heel raise",
+}
+
+# Grid redFlagModifiers that raise a feature's weight
+PRIORITY_FEATURES = {
+    "decel-priority": ("decel",),
+    "vertical-jump-priority": ("plyo_vertical",),
+    "rotation-priority": ("rotation",),
+    "neck-strength-priority": ("region:cervical",),
+    "hamstring-health-priority": ("region:hamstring",),
+    "posture-priority": ("region:lumbar", "pull"),
+}
+
+# SPORT_PROFILES emphasis keys -> features
+STRENGTH_FEATURES = {
+    "squat_pattern": "squat", "hinge_pattern": "hinge", "unilateral": "lunge",
+    "upper_push": "push", "upper_pull": "pull",
+}
+PLYO_FEATURES = {"vertical": "plyo_vertical", "lateral": "plyo_lateral", "decel": "decel"}
+
+# Priority keywords the selector used to re-filter by, per sport
+SELECTOR_KEYWORDS = {
+    "Basketball": ["goblet", "trap", "split", "step up", "bulgarian", "lunge", "box", "vertical",
+                   "squat jump", "stick", "stabilize", "land"],
+    "Volleyball": ["front", "goblet", "high bar", "continuous", "repeated", "multiple", "approach",
+                   "rotation", "chop", "lift", "throw", "row", "retraction", "scap", "face pull"],
+}
+
+E_NODES = ("E0", "E1", "E2", "E3", "E4")
+AETHER_NODES = ("A", "B", "C", "D")
+ZONES = tuple(f"Zone_{n}" for n in range(1, 9))
+
+
+def sport_keywords(sport: str) -> List[str]:
+    """Priority keywords of a sport (SPORT_PROFILES exercise priorities + selector lists)"""
+    keywords = list(SELECTOR_KEYWORDS.get(sport, []))
+    for words in SPORT_PROFILES.get(sport, {}).get("exercise_priorities", {}).values():
+        keywords.extend(words)
+    return list(dict.fromkeys(k.lower() for k in keywords))
+
+
+def library_version(df: pd.DataFrame) -> Tuple[int, int]:
+    """Content key of a library frame: (rows, hash of its exercise ids in order)"""
+    return len(df), int(pd.util.hash_pandas_object(df["exercise_id"], index=False).sum())
+
+
+class SportScoringEngine:
+    """Feature matrix over one library frame plus cached per-sport weights and scores"""
+
+    def __init__(self, df: pd.DataFrame, grid: Optional[Dict] = None):
+        self.df = df
+        self.version = library_version(df)
+        self.grid = grid if grid is not None else default_registry().get(SPORT_GRID_SPEC)
+        self.sports = tuple(self.grid["sports"])
+        self.keywords = list(dict.fromkeys(k for sport in sorted(SPORT_PROFILES.keys() | SELECTOR_KEYWORDS.keys())
+                                           for k in sport_keywords(sport)))
+
+        self.features: List[str] = []
+        columns: List[np.ndarray] = []
+
+        def add(name: str, column) -> None:
+            self.features.append(name)
+            columns.append(np.asarray(column, dtype=np.float64))
+
+        name = df["exercise_name"].fillna("").str.lower()
+        text = name + " " + df["movement_pattern"].fillna("").str.lower() + " " + \
+            df["aether_pattern"].fillna("").str.lower()
+        plyometric = df["is_plyometric"].astype(str).str.lower() == "true"
+
+        for family, pattern in FAMILIES.items():
+            add(family, text.str.contains(pattern, regex=True))
+        for direction, pattern in PLYO_DIRECTIONS.items():
+            add(direction, plyometric & text.str.contains(pattern, regex=True))
+        zone_sets = df["fv_zones"].fillna("").map(lambda raw: {z.strip() for z in raw.split(",")})
+        for zone in ZONES:
+            add(zone, zone_sets.map(lambda zones, zone=zone: zone in zones))
+        for e_node in E_NODES:
+            add(e_node, df["e_node"] == e_node)
+        for node in AETHER_NODES:
+            add(f"node:{node}", df["aether_node"] == node)
+        for region, pattern in REGIONS.items():
+            add(f"region:{region}", text.str.contains(pattern, regex=True))
+        for keyword in self.keywords:
+            add(f"kw:{keyword}", name.str.contains(keyword, regex=False))
+
+        self.matrix = np.column_stack(columns)
+        self.index = {feature: i for i, feature in enumerate(self.features)}
+
+        # Legality inputs, as the mapper computes them
+        self.band = df["load_band_primary"].str.extract(r"Band_(\d+)")[0].astype("float64").to_numpy()
+        self.e_node = df["e_node"].to_numpy()
+        self.youth = df["contraindicated_populations"].str.contains("Youth", case=False, na=False).to_numpy()
+        self.plyometric = plyometric.to_numpy()
+        self._names = name
+        self._patterns = df["movement_pattern"]
+
+        self._weights: Dict[str, np.ndarray] = {}
+        self._scores: Dict[str, np.ndarray] = {}
+        self._pattern_masks: Dict[str, np.ndarray] = {}
+
+    # ------------------------------------------------------------------
+    # Weights and scores
+    # ------------------------------------------------------------------
+
+    def weights(self, sport: str) -> np.ndarray:
+        """Feature weight vector of a grid sport"""
+        cached = self._weights.get(sport)
+        if cached is not None:
+            return cached
+        if sport not in self.grid["sports"]:
+            raise ValueError(f"Unknown sport '{sport}' (grid sports: {', '.join(self.sports)})")
+        demands = self.grid["sports"][sport]
+        profile = SPORT_PROFILES.get(sport, {})
+        w = np.zeros(len(self.features))
+
+        def bump(feature: str, amount: float) -> None:
+            if feature in self.index:
+                w[self.index[feature]] += amount
+
+        for family, rating in demands["movementProfile"]["keyMovementPatterns"].items():
+            bump(family, RATING.get(rating, 0.0))
+        for key, emphasis in profile.get("strength_emphasis", {}).items():
+            feature = STRENGTH_FEATURES.get(key)
+            if feature:
+                w[self.index[feature]] *= 1.0 + emphasis
+        for key, emphasis in profile.get("plyo_emphasis", {}).items():
+            bump(PLYO_FEATURES.get(key, ""), emphasis)
+
+        nodes = demands["nodeProfile"]
+        for tier in ("primary", "secondary"):
+            for node in nodes.get(f"{tier}Nodes", []):
+                bump(node if node.startswith("E") else f"node:{node}", NODE_TIER[tier])
+        for tier, zones in nodes.get("fvZones", {}).items():
+            for zone in zones:
+                bump(f"Zone_{zone[1:]}", ZONE_TIER.get(tier, 0.0))
+
+        risk = demands.get("injuryRiskProfile", {})
+        for region in risk.get("commonRegions", []):
+            bump(f"region:{region}", REGION_WEIGHT)
+        for modifier in risk.get("redFlagModifiers", []):
+            for feature in PRIORITY_FEATURES.get(modifier, ()):
+                bump(feature, PRIORITY_WEIGHT)
+
+        for keyword in sport_keywords(sport):
+            bump(f"kw:{keyword}", KEYWORD_WEIGHT)
+
+        w.setflags(write=False)
+        self._weights[sport] = w
+        return w
+
+    def scores(self, sport: str) -> np.ndarray:
+        """Sport-fit score of every library row (one matrix-vector product, cached)"""
+        cached = self._scores.get(sport)
+        if cached is None:
+            cached = self._scores[sport] = self.matrix @ self.weights(sport)
+            cached.setflags(write=False)
+        return cached
+
+    def forbidden_mask(self, sport: str) -> np.ndarray:
+        """Rows whose E-node the sport's node profile forbids"""
+        forbidden = self.grid["sports"][sport]["nodeProfile"].get("forbiddenNodes", [])
+        return np.isin(self.e_node, [n for n in forbidden if n.startswith("E")])
+
+    # ------------------------------------------------------------------
+    # Legality masks
+    # ------------------------------------------------------------------
+
+    def pattern_mask(self, court_pattern: str, band_max: Optional[int] = None, enode: Optional[str] = None,
+                     exclude_youth: bool = True) -> np.ndarray:
+        """Rows CourtSportExerciseMapper.find_exercises would return (before its limit)"""
+        rules = CourtSportExerciseMapper.PATTERN_MAP.get(court_pattern)
+        if rules is None:
+            return np.zeros(len(self.df), dtype=bool)
+
+        mask = self._pattern_masks.get(court_pattern)
+        if mask is None:
+            mask = np.ones(len(self.df), dtype=bool)
+            if rules.get("movement_pattern"):
+                mask &= (self._patterns == rules["movement_pattern"]).to_numpy()
+            if rules.get("name_include"):
+                include = np.zeros(len(self.df), dtype=bool)
+                for keyword in rules["name_include"]:
+                    include |= self._names.str.contains(re.escape(keyword.lower()), regex=True).to_numpy()
+                mask &= include
+            for keyword in rules.get("name_exclude", []):
+                mask &= ~self._names.str.contains(re.escape(keyword.lower()), regex=True).to_numpy()
+            mask.setflags(write=False)
+            self._pattern_masks[court_pattern] = mask
+
+        mask = mask.copy()
+        band_max = band_max if band_max is not None else rules.get("band_max")
+        if band_max is not None:
+            with np.errstate(invalid="ignore"):
+                mask &= self.band <= band_max
+        enode = enode or rules.get("enode_required")
+        if enode:
+            mask &= self.e_node == enode
+        if exclude_youth:
+            mask &= ~self.youth
+        return mask
+
+    # ------------------------------------------------------------------
+    # Ranking
+    # ------------------------------------------------------------------
+
+    def top_k(self, sport: str, mask: np.ndarray, k: int) -> np.ndarray:
+        """Row indices of the k best-scoring rows in mask; ties keep library order"""
+        scores = self.scores(sport)
+        rows = np.flatnonzero(mask & ~self.forbidden_mask(sport))
+        if k <= 0 or not len(rows):
+            return rows[:0]
+        row_scores = scores[rows]
+        if k < len(rows):
+            kth = np.partition(row_scores, len(rows) - k)[len(rows) - k]
+            above = rows[row_scores > kth]
+            tied = rows[row_scores == kth][:k - len(above)]
+            rows = np.concatenate([above, tied])
+            row_scores = scores[rows]
+        return rows[np.lexsort((rows, -row_scores))]
+
+    def rank(self, sport: str, court_pattern: str, k: int, band_max: Optional[int] = None,
+             enode: Optional[str] = None, require: Optional[str] = None,
+             plyometric: Optional[bool] = None, exclude_youth: bool = True) -> List[Dict]:
+        """
+        Top-k mapper records for a court pattern by sport fit.
+
+        require names a feature the rows must have (e.g. "decel" to keep
+        landing/stick variants of a plyo pattern); plyometric, if given,
+        keeps only plyometric (True) or non-plyometric (False) rows.
+        """
+        mask = self.pattern_mask(court_pattern, band_max, enode, exclude_youth)
+        if require is not None:
+            mask &= self.matrix[:, self.index[require]] > 0
+        if plyometric is not None:
+            mask &= self.plyometric == plyometric
+        rows = self.top_k(sport, mask, k)
+        return self.df.iloc[rows].to_dict("records")
+
+
+# Engines per library version; a handful at most (a hot-swapped library)
+_ENGINES = get_cache_manager().register("sport_scoring.engines", max_entries=4)
+
+
+def engine_for(df: pd.DataFrame) -> SportScoringEngine:
+    """Scoring engine for a library frame, cached per library version"""
+    version = library_version(df)
+    engine = _ENGINES.get(version)
+    if engine is None:
+        engine = _ENGINES[version] = SportScoringEngine(df)
+    return engine